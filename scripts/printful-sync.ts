@@ -236,6 +236,8 @@ function generateVariantFile(
     `// Generated on: ${new Date().toISOString()}`,
     `// Total variants: ${entries.length}`,
     ``,
+    `import { createVariantIndex } from '../lib/variant-index';`,
+    ``,
     `export type ${className}Variant = {`,
     `  key: string;`,
     `  catalogVariantId: number;`,
@@ -263,14 +265,17 @@ function generateVariantFile(
   
   lines.push(`];`);
   lines.push(``);
+  lines.push(`const variantsByKey = createVariantIndex(${className}Variants, v => [v.key]);`);
+  lines.push(`const variantsByCatalogId = createVariantIndex(${className}Variants, v => [v.catalogVariantId]);`);
+  lines.push(``);
   lines.push(`// Helper function to find variant by key`);
   lines.push(`export function find${className}Variant(key: string): ${className}Variant | undefined {`);
-  lines.push(`  return ${className}Variants.find(v => v.key === key);`);
+  lines.push(`  return variantsByKey.get(key);`);
   lines.push(`}`);
   lines.push(``);
   lines.push(`// Helper function to find variant by catalog variant ID`);
   lines.push(`export function find${className}VariantByCatalogId(catalogVariantId: number): ${className}Variant | undefined {`);
-  lines.push(`  return ${className}Variants.find(v => v.catalogVariantId === catalogVariantId);`);
+  lines.push(`  return variantsByCatalogId.get(catalogVariantId);`);
   lines.push(`}`);
   
   return lines.join("\n");
@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, lazy, Suspense } from 'react';
 import { Routes, Route, useNavigate, useLocation } from 'react-router-dom';
 import Header from './components/Header';
 import AnnouncementBanner from './components/AnnouncementBanner';
@@ -30,24 +30,6 @@ import ShippingExample from './components/checkout/ShippingExample';
 // Dynamic Product Page
 import DynamicProductPage from './components/products/DynamicProductPage';
 
-// Dedicated Product Pages
-import TShirtPage from './components/products/TShirtPage';
-import HoodiePage from './components/products/HoodiePage';
-import CapPage from './components/products/CapPage';
-import ToteBagPage from './components/products/ToteBagPage';
-import WaterBottlePage from './components/products/WaterBottlePage';
-import MugPage from './components/products/MugPage';
-import MousePadPage from './components/products/MousePadPage';
-
-// Bundle Pages (keep these for now)
-import StarterBundlePage from './components/products/StarterBundlePage';
-import ChampionBundlePage from './components/products/ChampionBundlePage';
-import ActivistBundlePage from './components/products/ActivistBundlePage';
-
-// Test Pages
-import VariantTestPage from './pages/VariantTestPage';
-import VariantTestPageSimple from './pages/VariantTestPageSimple';
-
 import { CartProvider, AuthProvider, ShippingProvider } from '@/contexts';
 import { AdminProvider, AdminProductsProvider } from '@/admin/contexts';
 import PrintfulStatus from '@/components/PrintfulStatus';
@@ -66,6 +48,31 @@ import {
   AdminProtectedRoute
 } from '@/admin/components';
 
+// Dedicated Product Pages
+// Loaded on demand so each page's variant table ships in its own chunk, not the home page bundle
+const TShirtPage = lazy(() => import('./components/products/TShirtPage'));
+const HoodiePage = lazy(() => import('./components/products/HoodiePage'));
+const CapPage = lazy(() => import('./components/products/CapPage'));
+const ToteBagPage = lazy(() => import('./components/products/ToteBagPage'));
+const WaterBottlePage = lazy(() => import('./components/products/WaterBottlePage'));
+const MugPage = lazy(() => import('./components/products/MugPage'));
+const MousePadPage = lazy(() => import('./components/products/MousePadPage'));
+
+// Bundle Pages (keep these for now)
+const StarterBundlePage = lazy(() => import('./components/products/StarterBundlePage'));
+const ChampionBundlePage = lazy(() => import('./components/products/ChampionBundlePage'));
+const ActivistBundlePage = lazy(() => import('./components/products/ActivistBundlePage'));
+
+// Test Pages
+const VariantTestPage = lazy(() => import('./pages/VariantTestPage'));
+const VariantTestPageSimple = lazy(() => import('./pages/VariantTestPageSimple'));
+
+const PageLoadingFallback = () => (
+  <div className="min-h-[60vh] flex items-center justify-center" role="status" aria-label="Loading page">
+    <div className="animate-spin rounded-full h-12 w-12 border-b-2 border-lvn-maroon"></div>
+  </div>
+);
+
 const App = () => {
   const navigate = useNavigate();
   const location = useLocation();
@@ -205,6 +212,7 @@ const App = () => {
           )}
           <AnnouncementBanner />
           <main role="main" id="main-content">
+          <Suspense fallback={<PageLoadingFallback />}>
           <Routes>
             <Route path="/" element={
               <>
@@ -310,6 +318,7 @@ const App = () => {
               </AdminProtectedRoute>
             } />
           </Routes>
+          </Suspense>
         </main>
         {!location.pathname.startsWith('/admin') && (
           <>
@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import { useAuth } from '../../contexts/AuthContext';
 import { useNavigate } from 'react-router-dom';
 import { 
@@ -9,7 +9,9 @@ import {
   Mail,
   User
 } from 'lucide-react';
-import { supabase } from '../../lib/supabase';
+import { adminAPI, CustomerOrderStats } from '../lib/admin-api';
+
+const CUSTOMERS_PAGE_SIZE = 50;
 
 interface Customer {
   id: string;
@@ -21,17 +23,27 @@ interface Customer {
   address: any;
   created_at: string;
   updated_at: string;
+  order_stats?: CustomerOrderStats;
 }
 
 const AdminCustomersPage: React.FC = () => {
   const { user } = useAuth();
   const navigate = useNavigate();
   const [customers, setCustomers] = useState<Customer[]>([]);
-  const [filteredCustomers, setFilteredCustomers] = useState<Customer[]>([]);
   const [isLoading, setIsLoading] = useState(true);
+  const [isFetching, setIsFetching] = useState(false);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [searchTerm, setSearchTerm] = useState('');
+  const [debouncedSearch, setDebouncedSearch] = useState('');
   const [selectedCustomer, setSelectedCustomer] = useState<Customer | null>(null);
   const [showCustomerModal, setShowCustomerModal] = useState(false);
+  const latestRequest = useRef(0);
+
+  // Debounce search so typing doesn't fire a request per keystroke
+  useEffect(() => {
+    const timeout = setTimeout(() => setDebouncedSearch(searchTerm.trim()), 300);
+    return () => clearTimeout(timeout);
+  }, [searchTerm]);
 
   useEffect(() => {
     if (!user) {
@@ -40,47 +52,36 @@ const AdminCustomersPage: React.FC = () => {
     }
 
     fetchCustomers();
-  }, [user, navigate]);
+  }, [user, navigate, debouncedSearch]);
 
-  useEffect(() => {
-    filterCustomers();
-  }, [customers, searchTerm]);
+  // Search runs server-side; each page comes back with its order aggregates attached
+  const fetchCustomers = async (cursor: string | null = null) => {
+    const requestId = ++latestRequest.current;
 
-  const fetchCustomers = async () => {
     try {
-      setIsLoading(true);
+      setIsFetching(true);
       
-      const { data, error } = await supabase
-        .from('customer_profiles')
-        .select('*')
-        .order('created_at', { ascending: false });
+      const response = await adminAPI.getCustomers({
+        cursor,
+        limit: CUSTOMERS_PAGE_SIZE,
+        search: debouncedSearch || undefined
+      });
 
-      if (error) throw error;
+      // Ignore responses for searches that have since changed
+      if (requestId !== latestRequest.current) return;
       
-      setCustomers(data || []);
+      setCustomers(prev => cursor ? [...prev, ...response.customers] : response.customers);
+      setNextCursor(response.nextCursor);
     } catch (error) {
       console.error('Error fetching customers:', error);
     } finally {
-      setIsLoading(false);
+      if (requestId === latestRequest.current) {
+        setIsFetching(false);
+        setIsLoading(false);
+      }
     }
   };
 
-  const filterCustomers = () => {
-    let filtered = customers;
-
-    // Apply search filter
-    if (searchTerm) {
-      filtered = filtered.filter(customer =>
-        customer.email?.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        customer.first_name?.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        customer.last_name?.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        customer.phone?.includes(searchTerm)
-      );
-    }
-
-    setFilteredCustomers(filtered);
-  };
-
   const handleCustomerClick = (customer: Customer) => {
     setSelectedCustomer(customer);
     setShowCustomerModal(true);
@@ -101,6 +102,13 @@ const AdminCustomersPage: React.FC = () => {
     });
   };
 
+  const formatCurrency = (amount: number) => {
+    return new Intl.NumberFormat('en-GB', {
+      style: 'currency',
+      currency: 'GBP'
+    }).format(amount / 100);
+  };
+
   const getFullName = (customer: Customer) => {
     if (customer.first_name && customer.last_name) {
       return `${customer.first_name} ${customer.last_name}`;
@@ -168,11 +176,11 @@ const AdminCustomersPage: React.FC = () => {
           <div className="px-4 py-5 sm:p-6">
             <div className="flex items-center justify-between mb-4">
               <h2 className="text-lg font-medium text-gray-900">
-                Customers ({filteredCustomers.length})
+                Customers ({customers.length})
               </h2>
             </div>
             
-            {filteredCustomers.length === 0 ? (
+            {customers.length === 0 ? (
               <p className="text-gray-500 text-center py-8">No customers found</p>
             ) : (
               <div className="overflow-hidden">
@@ -185,6 +193,9 @@ const AdminCustomersPage: React.FC = () => {
                       <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">
                         Contact Info
                       </th>
+                      <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">
+                        Orders
+                      </th>
                       <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">
                         Member Since
                       </th>
@@ -194,7 +205,7 @@ const AdminCustomersPage: React.FC = () => {
                     </tr>
                   </thead>
                   <tbody className="bg-white divide-y divide-gray-200">
-                    {filteredCustomers.map((customer) => (
+                    {customers.map((customer) => (
                       <tr key={customer.id} className="hover:bg-gray-50">
                         <td className="px-6 py-4 whitespace-nowrap">
                           <div className="flex items-center">
@@ -227,6 +238,12 @@ const AdminCustomersPage: React.FC = () => {
                             )}
                           </div>
                         </td>
+                        <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-900">
+                          <div>{customer.order_stats?.orderCount || 0} orders</div>
+                          <div className="text-gray-500">
+                            {formatCurrency(customer.order_stats?.totalSpent || 0)}
+                          </div>
+                        </td>
                         <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-500">
                           <div className="flex items-center">
                             <Calendar className="h-4 w-4 mr-1" />
@@ -247,6 +264,18 @@ const AdminCustomersPage: React.FC = () => {
                 </table>
               </div>
             )}
+
+            {nextCursor && (
+              <div className="mt-4 flex justify-center">
+                <button
+                  onClick={() => fetchCustomers(nextCursor)}
+                  disabled={isFetching}
+                  className="px-4 py-2 text-sm font-medium text-gray-700 bg-gray-100 border border-gray-300 rounded-md hover:bg-gray-200 disabled:opacity-50 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-blue-500"
+                >
+                  {isFetching ? 'Loading...' : 'Load More Customers'}
+                </button>
+              </div>
+            )}
           </div>
         </div>
       </main>
@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import { useAuth } from '../../contexts/AuthContext';
 import { useNavigate } from 'react-router-dom';
 import { 
@@ -10,6 +10,9 @@ import {
   Clock
 } from 'lucide-react';
 import { supabase } from '../../lib/supabase';
+import { adminAPI } from '../lib/admin-api';
+
+const ORDERS_PAGE_SIZE = 50;
 
 interface Order {
   id: string;
@@ -31,11 +34,23 @@ const AdminOrdersPage: React.FC = () => {
   const [orders, setOrders] = useState<Order[]>([]);
   const [filteredOrders, setFilteredOrders] = useState<Order[]>([]);
   const [isLoading, setIsLoading] = useState(true);
+  const [isFetching, setIsFetching] = useState(false);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [searchTerm, setSearchTerm] = useState('');
+  const [debouncedSearch, setDebouncedSearch] = useState('');
   const [statusFilter, setStatusFilter] = useState('all');
+  const [dateFrom, setDateFrom] = useState('');
+  const [dateTo, setDateTo] = useState('');
   const [showTestOrders, setShowTestOrders] = useState(false);
   const [selectedOrder, setSelectedOrder] = useState<Order | null>(null);
   const [showOrderModal, setShowOrderModal] = useState(false);
+  const latestRequest = useRef(0);
+
+  // Debounce search so typing doesn't fire a request per keystroke
+  useEffect(() => {
+    const timeout = setTimeout(() => setDebouncedSearch(searchTerm.trim()), 300);
+    return () => clearTimeout(timeout);
+  }, [searchTerm]);
 
   useEffect(() => {
     if (!user) {
@@ -44,28 +59,40 @@ const AdminOrdersPage: React.FC = () => {
     }
 
     fetchOrders();
-  }, [user, navigate]);
+  }, [user, navigate, statusFilter, debouncedSearch, dateFrom, dateTo]);
 
   useEffect(() => {
     filterOrders();
-  }, [orders, searchTerm, statusFilter]);
+  }, [orders, showTestOrders]);
+
+  // Search, status and date filters run server-side; pages are fetched by cursor
+  const fetchOrders = async (cursor: string | null = null) => {
+    const requestId = ++latestRequest.current;
 
-  const fetchOrders = async () => {
     try {
-      setIsLoading(true);
+      setIsFetching(true);
       
-      const { data, error } = await supabase
-        .from('orders')
-        .select('*')
-        .order('created_at', { ascending: false });
-
-      if (error) throw error;
+      const response = await adminAPI.getOrders({
+        cursor,
+        limit: ORDERS_PAGE_SIZE,
+        status: statusFilter,
+        search: debouncedSearch || undefined,
+        dateFrom: dateFrom ? new Date(`${dateFrom}T00:00:00`).toISOString() : undefined,
+        dateTo: dateTo ? new Date(`${dateTo}T23:59:59.999`).toISOString() : undefined
+      });
+
+      // Ignore responses for filters that have since changed
+      if (requestId !== latestRequest.current) return;
       
-      setOrders(data || []);
+      setOrders(prev => cursor ? [...prev, ...response.orders] : response.orders);
+      setNextCursor(response.nextCursor);
     } catch (error) {
       console.error('Error fetching orders:', error);
     } finally {
-      setIsLoading(false);
+      if (requestId === latestRequest.current) {
+        setIsFetching(false);
+        setIsLoading(false);
+      }
     }
   };
 
@@ -78,22 +105,6 @@ const AdminOrdersPage: React.FC = () => {
       filtered = filtered.filter(order => !isTestOrder(order));
     }
 
-    // Apply status filter
-    if (statusFilter !== 'all') {
-      filtered = filtered.filter(order => 
-        order.status?.toLowerCase() === statusFilter.toLowerCase()
-      );
-    }
-
-    // Apply search filter
-    if (searchTerm) {
-      filtered = filtered.filter(order =>
-        order.customer_email?.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        order.readable_order_id?.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        order.id.toLowerCase().includes(searchTerm.toLowerCase())
-      );
-    }
-
     setFilteredOrders(filtered);
   };
 
@@ -230,7 +241,7 @@ const AdminOrdersPage: React.FC = () => {
       <main className="max-w-7xl mx-auto py-6 sm:px-6 lg:px-8">
         {/* Filters and Search */}
         <div className="bg-white p-6 rounded-lg shadow-sm border border-gray-200 mb-6">
-          <div className="grid grid-cols-1 gap-4 sm:grid-cols-4">
+          <div className="grid grid-cols-1 gap-4 sm:grid-cols-5">
             <div>
               <label htmlFor="search" className="block text-sm font-medium text-gray-700 mb-2">
                 Search Orders
@@ -263,6 +274,29 @@ const AdminOrdersPage: React.FC = () => {
               </select>
             </div>
 
+            <div>
+              <label htmlFor="date-from" className="block text-sm font-medium text-gray-700 mb-2">
+                Date Range
+              </label>
+              <div className="flex items-center space-x-2">
+                <input
+                  type="date"
+                  id="date-from"
+                  value={dateFrom}
+                  onChange={(e) => setDateFrom(e.target.value)}
+                  className="w-full px-2 py-2 border border-gray-300 rounded-md shadow-sm focus:outline-none focus:ring-blue-500 focus:border-blue-500"
+                />
+                <input
+                  type="date"
+                  id="date-to"
+                  aria-label="Date to"
+                  value={dateTo}
+                  onChange={(e) => setDateTo(e.target.value)}
+                  className="w-full px-2 py-2 border border-gray-300 rounded-md shadow-sm focus:outline-none focus:ring-blue-500 focus:border-blue-500"
+                />
+              </div>
+            </div>
+
             <div className="flex items-end">
               <div className="flex items-center">
                 <input
@@ -283,6 +317,8 @@ const AdminOrdersPage: React.FC = () => {
                 onClick={() => {
                   setSearchTerm('');
                   setStatusFilter('all');
+                  setDateFrom('');
+                  setDateTo('');
                   setShowTestOrders(false);
                 }}
                 className="w-full px-4 py-2 text-sm font-medium text-gray-700 bg-gray-100 border border-gray-300 rounded-md hover:bg-gray-200 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-blue-500"
@@ -405,6 +441,18 @@ const AdminOrdersPage: React.FC = () => {
                 </table>
               </div>
             )}
+
+            {nextCursor && (
+              <div className="mt-4 flex justify-center">
+                <button
+                  onClick={() => fetchOrders(nextCursor)}
+                  disabled={isFetching}
+                  className="px-4 py-2 text-sm font-medium text-gray-700 bg-gray-100 border border-gray-300 rounded-md hover:bg-gray-200 disabled:opacity-50 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-blue-500"
+                >
+                  {isFetching ? 'Loading...' : 'Load More Orders'}
+                </button>
+              </div>
+            )}
           </div>
         </div>
       </main>
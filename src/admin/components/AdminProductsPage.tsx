@@ -1,4 +1,4 @@
-import React, { useState, useEffect, useMemo } from 'react';
+import React, { useState, useEffect, useMemo, useCallback } from 'react';
 import { useAdminProducts } from '../contexts/AdminProductsContext';
 import { useAdmin } from '../contexts/AdminContext';
 import { functionUrls } from '../../lib/supabase-functions';
@@ -24,6 +24,9 @@ import EnhancedImageManagement from '../../components/EnhancedImageManagement';
 import BundleManagement from './BundleManagement';
 import PrintfulSyncMonitor from '../../components/PrintfulSyncMonitor';
 import VariantManagement from '../../components/VariantManagement';
+import useResponsive from '../../hooks/useResponsive';
+import useWindowedList from '../../hooks/useWindowedList';
+import type { ProductsQuery, ProductsSortKey } from '../lib/admin-products-api';
 
 interface ProductImage {
   id: string;
@@ -52,6 +55,12 @@ interface ProductData {
   sync_status?: 'synced' | 'pending' | 'failed' | 'unknown';
 }
 
+// Wait for typing to settle before re-querying the product list
+const SEARCH_DEBOUNCE_MS = 250;
+
+// The price filter only narrows the query once it's moved off these bounds
+const DEFAULT_PRICE_RANGE = { min: 0, max: 1000 };
+
 const AdminProductsPage: React.FC = () => {
     const { 
     products, 
@@ -62,7 +71,13 @@ const AdminProductsPage: React.FC = () => {
     refreshAll,
     triggerPrintfulSync,
     fetchProductImages,
-    productImages
+    productImages,
+    productsHasMore,
+    productsLoadingMore,
+    loadMoreProducts,
+    fetchProducts,
+    productsQuery,
+    productSummaries
   } = useAdminProducts();
   
   // Helper function to update nested state (for sync status)
@@ -78,7 +93,7 @@ const AdminProductsPage: React.FC = () => {
   const [searchTerm, setSearchTerm] = useState('');
   const [selectedCategory, setSelectedCategory] = useState<string>('all');
   const [availabilityFilter, setAvailabilityFilter] = useState<string>('all');
-  const [priceRange, setPriceRange] = useState<{ min: number; max: number }>({ min: 0, max: 1000 });
+  const [priceRange, setPriceRange] = useState<{ min: number; max: number }>(DEFAULT_PRICE_RANGE);
   const [sortBy, setSortBy] = useState<string>('name');
   const [sortOrder, setSortOrder] = useState<'asc' | 'desc'>('asc');
   const [showFilters, setShowFilters] = useState(false);
@@ -120,126 +135,83 @@ const AdminProductsPage: React.FC = () => {
 
   // Get custom overrides for products
   const productsWithOverrides = useMemo(() => {
-    console.log('=== PRODUCTS WITH OVERRIDES DEBUG ===');
-    console.log('Original products count:', products.length);
-    console.log('Original products:', products);
-    console.log('Product overrides count:', productOverrides.length);
-    console.log('Product overrides:', productOverrides);
-    console.log('Products loading:', productsLoading);
-    console.log('Products error:', productsError);
-    
-    // Check if products have printful_product_id
-    products.forEach((product, index) => {
-      console.log(`Product ${index}:`, {
-        name: product.name,
-        id: product.id,
-        printful_product_id: product.printful_product_id,
-        has_printful_id: !!product.printful_product_id
-      });
-    });
+    const overridesByPrintfulId = new Map(
+      productOverrides
+        .filter(o => o.printful_product_id)
+        .map(o => [o.printful_product_id, o])
+    );
     
     return products.map(product => {
-      const override = productOverrides.find(o => 
-        o.printful_product_id && 
-        product.printful_product_id && 
-        o.printful_product_id === product.printful_product_id
-      );
+      const override = product.printful_product_id
+        ? overridesByPrintfulId.get(product.printful_product_id)
+        : undefined;
       
-      const result = {
+      return {
         ...product,
         custom_retail_price: override?.custom_retail_price || product.retail_price,
         custom_description: override?.custom_description || product.description,
         is_active: override?.is_active ?? true
       };
-      
-      console.log('Product:', product.name, 'printful_product_id:', product.printful_product_id);
-      console.log('Result printful_product_id:', result.printful_product_id);
-      
-      return result;
     });
   }, [products, productOverrides]);
 
-  // Filtered and sorted products
-  const filteredProducts = useMemo(() => {
-    console.log('=== FILTERED PRODUCTS DEBUG ===');
-    console.log('productsWithOverrides count:', productsWithOverrides.length);
-    console.log('productsWithOverrides:', productsWithOverrides);
-    
-    let filtered = productsWithOverrides.filter(product => {
-      // Search filter
-      const matchesSearch = product.name.toLowerCase().includes(searchTerm.toLowerCase()) ||
-                           (product.description && product.description.toLowerCase().includes(searchTerm.toLowerCase()));
-      
-      // Category filter
-      const matchesCategory = selectedCategory === 'all' || (product.category && product.category === selectedCategory);
-      
-      // Availability filter
-      const matchesAvailability = availabilityFilter === 'all' || 
-                                 (availabilityFilter === 'available' && product.is_available) ||
-                                 (availabilityFilter === 'unavailable' && !product.is_available);
-      
-      // Price range filter
-      const price = product.custom_retail_price || product.retail_price;
-      const matchesPrice = price >= priceRange.min && price <= priceRange.max;
-      
-      console.log(`Product ${product.name}:`, {
-        matchesSearch,
-        matchesCategory,
-        matchesAvailability,
-        matchesPrice,
-        printful_product_id: product.printful_product_id
-      });
-      
-      return matchesSearch && matchesCategory && matchesAvailability && matchesPrice;
-    });
-    
-    console.log('Filtered result count:', filtered.length);
-    console.log('Filtered result:', filtered);
-    console.log('=== END FILTERED PRODUCTS DEBUG ===');
-    
-    return filtered;
+  // Search, filters and sort run on the server, so every loaded page is already in order and
+  // the windowed list only ever grows. Typing settles before a new query is sent
+  const [debouncedSearchTerm, setDebouncedSearchTerm] = useState(searchTerm);
 
-    // Sorting
-    filtered.sort((a, b) => {
-      let aValue: any, bValue: any;
-      
-      switch (sortBy) {
-        case 'name':
-          aValue = a.name.toLowerCase();
-          bValue = b.name.toLowerCase();
-          break;
-        case 'price':
-          aValue = a.custom_retail_price || a.retail_price;
-          bValue = b.custom_retail_price || b.retail_price;
-          break;
-                case 'availability':
-          aValue = a.is_available ? 1 : 0;
-          bValue = b.is_available ? 1 : 0;
-          break;
-        case 'last_synced':
-          aValue = new Date(a.last_synced || '1970-01-01').getTime();
-          bValue = new Date(b.last_synced || '1970-01-01').getTime();
-          break;
-        default:
-          aValue = a.name.toLowerCase();
-          bValue = b.name.toLowerCase();
-      }
-      
-      if (sortOrder === 'asc') {
-        return aValue > bValue ? 1 : -1;
-      } else {
-        return aValue < bValue ? 1 : -1;
-      }
-    });
+  useEffect(() => {
+    const timer = setTimeout(() => setDebouncedSearchTerm(searchTerm), SEARCH_DEBOUNCE_MS);
+    return () => clearTimeout(timer);
+  }, [searchTerm]);
+
+  const listQuery = useMemo<ProductsQuery>(() => ({
+    search: debouncedSearchTerm.trim() || undefined,
+    category: selectedCategory === 'all' ? undefined : selectedCategory,
+    isAvailable: availabilityFilter === 'all' ? undefined : availabilityFilter === 'available',
+    minPrice: priceRange.min > DEFAULT_PRICE_RANGE.min ? priceRange.min : undefined,
+    maxPrice: priceRange.max < DEFAULT_PRICE_RANGE.max ? priceRange.max : undefined,
+    sortBy: sortBy as ProductsSortKey,
+    sortOrder
+  }), [debouncedSearchTerm, selectedCategory, availabilityFilter, priceRange, sortBy, sortOrder]);
+
+  useEffect(() => {
+    if (JSON.stringify(listQuery) !== JSON.stringify(productsQuery)) {
+      fetchProducts(listQuery);
+    }
+  }, [listQuery, productsQuery, fetchProducts]);
 
-    return filtered;
-  }, [productsWithOverrides, searchTerm, selectedCategory, availabilityFilter, priceRange, sortBy, sortOrder]);
+  // Only the rows in view are rendered; the next page loads as the list nears its end
+  const { width } = useResponsive();
+  const columns = width >= 1280 ? 3 : width >= 1024 ? 2 : 1;
+  const productRows = useMemo(() => {
+    const rows = [];
+    for (let i = 0; i < productsWithOverrides.length; i += columns) {
+      rows.push(productsWithOverrides.slice(i, i + columns));
+    }
+    return rows;
+  }, [productsWithOverrides, columns]);
+
+  const handleEndReached = useCallback(() => {
+    if (productsHasMore) {
+      loadMoreProducts();
+    }
+  }, [productsHasMore, loadMoreProducts]);
 
-  // Categories for filter
+  const { containerRef, measureRef, startRow, endRow, paddingTop, paddingBottom } = useWindowedList({
+    rowCount: productRows.length,
+    estimatedRowHeight: 520,
+    overscan: 2,
+    endThreshold: 3,
+    // A new query can return as many rows as the last one, so it's part of the key
+    endKey: `${products.length}:${JSON.stringify(productsQuery)}`,
+    onEndReached: handleEndReached
+  });
+
+  // Categories for filter - from the whole catalog, not just the loaded pages, so a filtered list can't hide a category
   const categories = useMemo(() => {
-    const uniqueCategories = [...new Set(productsWithOverrides.map(p => p.category).filter(Boolean))];
+    const uniqueCategories = [...new Set(productSummaries.map(p => p.category).filter(Boolean))];
     return uniqueCategories;
-  }, [productsWithOverrides]);
+  }, [productSummaries]);
 
   // Sync status indicator
   const getSyncStatusIcon = (status: string) => {
@@ -763,7 +735,7 @@ const AdminProductsPage: React.FC = () => {
             <AlertCircle className="h-8 w-8 text-red-500 mx-auto mb-4" />
             <p className="text-red-600">Error loading products: {productsError}</p>
           </div>
-        ) : filteredProducts.length === 0 ? (
+        ) : productsWithOverrides.length === 0 ? (
           <div className="p-8 text-center">
             <Search className="h-8 w-8 text-gray-400 mx-auto mb-4" />
             <p className="text-gray-600">No products found matching your criteria.</p>
@@ -773,162 +745,182 @@ const AdminProductsPage: React.FC = () => {
             <div className="px-6 py-4 border-b border-gray-200">
               <div className="flex items-center justify-between">
                 <h3 className="text-lg font-medium text-gray-900">
-                  Products ({filteredProducts.length})
+                  Products ({products.length}{productsHasMore ? '+' : ''})
                 </h3>
                 <div className="text-sm text-gray-500">
-                  Showing {filteredProducts.length} of {products.length} products
+                  Showing {products.length}{productsHasMore ? '+' : ''} matching products
                 </div>
               </div>
             </div>
             
-            <div className="grid grid-cols-1 lg:grid-cols-2 xl:grid-cols-3 gap-6 p-6">
-              {filteredProducts.map((product) => (
-                <div key={product.id} className="bg-white border border-gray-200 rounded-lg overflow-hidden hover:shadow-lg transition-shadow">
-                  {/* Product Image */}
-                  <div className="relative h-48 bg-gray-100">
-                    {product.thumbnail_image ? (
-                      <img
-                        src={product.thumbnail_image}
-                        alt={product.name}
-                        className="w-full h-full object-cover"
-                        onError={(e) => {
-                          const target = e.target as HTMLImageElement;
-                          target.src = '/images/Leaven Logo.png'; // Fallback image
-                        }}
-                      />
-                    ) : product.image_url ? (
-                      <img
-                        src={product.image_url}
-                        alt={product.name}
-                        className="w-full h-full object-cover"
-                        onError={(e) => {
-                          const target = e.target as HTMLImageElement;
-                          target.src = '/images/Leaven Logo.png'; // Fallback image
-                        }}
-                      />
-                    ) : (
-                      <div className="w-full h-full flex items-center justify-center">
-                        <ImageIcon className="h-12 w-12 text-gray-400" />
-                      </div>
-                    )}
+            <div ref={containerRef} className="max-h-[75vh] overflow-y-auto px-6 pt-6">
+              <div style={{ paddingTop, paddingBottom }}>
+                {productRows.slice(startRow, endRow).map((rowProducts, rowOffset) => (
+                  <div
+                    key={startRow + rowOffset}
+                    ref={rowOffset === 0 ? measureRef : undefined}
+                    className="grid grid-cols-1 lg:grid-cols-2 xl:grid-cols-3 gap-6 pb-6"
+                  >
+                    {rowProducts.map((product) => (
+                      <div key={product.id} className="bg-white border border-gray-200 rounded-lg overflow-hidden hover:shadow-lg transition-shadow">
+                        {/* Product Image */}
+                        <div className="relative h-48 bg-gray-100">
+                          {product.thumbnail_image ? (
+                            <img
+                              src={product.thumbnail_image}
+                              alt={product.name}
+                              loading="lazy"
+                              decoding="async"
+                              className="w-full h-full object-cover"
+                              onError={(e) => {
+                                const target = e.target as HTMLImageElement;
+                                target.src = '/images/Leaven Logo.png'; // Fallback image
+                              }}
+                            />
+                          ) : product.image_url ? (
+                            <img
+                              src={product.image_url}
+                              alt={product.name}
+                              loading="lazy"
+                              decoding="async"
+                              className="w-full h-full object-cover"
+                              onError={(e) => {
+                                const target = e.target as HTMLImageElement;
+                                target.src = '/images/Leaven Logo.png'; // Fallback image
+                              }}
+                            />
+                          ) : (
+                            <div className="w-full h-full flex items-center justify-center">
+                              <ImageIcon className="h-12 w-12 text-gray-400" />
+                            </div>
+                          )}
                     
-                    {/* Sync Status Badge */}
-                    <div className="absolute top-2 right-2">
-                      <div className="flex items-center space-x-1 bg-white bg-opacity-90 rounded-full px-2 py-1">
-                        {getSyncStatusIcon(product.sync_status || 'unknown')}
-                        <span className="text-xs font-medium text-gray-700">
-                          {getSyncStatusText(product.sync_status || 'unknown')}
-                        </span>
-                      </div>
-                    </div>
+                          {/* Sync Status Badge */}
+                          <div className="absolute top-2 right-2">
+                            <div className="flex items-center space-x-1 bg-white bg-opacity-90 rounded-full px-2 py-1">
+                              {getSyncStatusIcon(product.sync_status || 'unknown')}
+                              <span className="text-xs font-medium text-gray-700">
+                                {getSyncStatusText(product.sync_status || 'unknown')}
+                              </span>
+                            </div>
+                          </div>
 
-                    {/* Availability Badge */}
-                    <div className="absolute top-2 left-2">
-                      <div className={`px-2 py-1 rounded-full text-xs font-medium ${
-                        product.is_available
-                          ? 'bg-green-100 text-green-800'
-                          : 'bg-red-100 text-red-800'
-                      }`}>
-                        {product.is_available ? 'Available' : 'Unavailable'}
-                      </div>
-                    </div>
+                          {/* Availability Badge */}
+                          <div className="absolute top-2 left-2">
+                            <div className={`px-2 py-1 rounded-full text-xs font-medium ${
+                              product.is_available
+                                ? 'bg-green-100 text-green-800'
+                                : 'bg-red-100 text-red-800'
+                            }`}>
+                              {product.is_available ? 'Available' : 'Unavailable'}
+                            </div>
+                          </div>
 
-                    {/* Thumbnail Indicator */}
-                    {product.thumbnail_image && product.thumbnail_image !== product.image_url && (
-                      <div className="absolute bottom-2 left-2">
-                        <div className="px-2 py-1 rounded-full text-xs font-medium bg-purple-100 text-purple-800">
-                          👑 Thumbnail
+                          {/* Thumbnail Indicator */}
+                          {product.thumbnail_image && product.thumbnail_image !== product.image_url && (
+                            <div className="absolute bottom-2 left-2">
+                              <div className="px-2 py-1 rounded-full text-xs font-medium bg-purple-100 text-purple-800">
+                                👑 Thumbnail
+                              </div>
+                            </div>
+                          )}
                         </div>
-                      </div>
-                    )}
-                  </div>
 
-                  {/* Product Info */}
-                  <div className="p-4">
-                    <h4 className="text-lg font-semibold text-gray-900 mb-2">{product.name}</h4>
-                    <p className="text-sm text-gray-600 mb-3 line-clamp-2">{product.custom_description || product.description || 'No description available'}</p>
+                        {/* Product Info */}
+                        <div className="p-4">
+                          <h4 className="text-lg font-semibold text-gray-900 mb-2">{product.name}</h4>
+                          <p className="text-sm text-gray-600 mb-3 line-clamp-2">{product.custom_description || product.description || 'No description available'}</p>
                     
-                    {/* Pricing */}
-                    <div className="space-y-2 mb-4">
-                      <div className="flex justify-between items-center">
-                        <span className="text-sm text-gray-600">Custom Price:</span>
-                        <span className="text-lg font-semibold text-lvn-maroon-dark">
-                          £{(product.custom_retail_price || product.retail_price).toFixed(2)}
-                        </span>
-                      </div>
-                      <div className="flex justify-between items-center text-sm text-gray-500">
-                        <span>Printful Cost:</span>
-                        <span>£{product.printful_cost ? product.printful_cost.toFixed(2) : 'N/A'}</span>
-                      </div>
-                      <div className="flex justify-between items-center text-sm text-gray-500">
-                        <span>Margin:</span>
-                        <span className="font-medium">
-                          £{product.printful_cost ? ((product.custom_retail_price || product.retail_price) - product.printful_cost).toFixed(2) : 'N/A'}
-                        </span>
-                      </div>
-                    </div>
+                          {/* Pricing */}
+                          <div className="space-y-2 mb-4">
+                            <div className="flex justify-between items-center">
+                              <span className="text-sm text-gray-600">Custom Price:</span>
+                              <span className="text-lg font-semibold text-lvn-maroon-dark">
+                                £{(product.custom_retail_price || product.retail_price).toFixed(2)}
+                              </span>
+                            </div>
+                            <div className="flex justify-between items-center text-sm text-gray-500">
+                              <span>Printful Cost:</span>
+                              <span>£{product.printful_cost ? product.printful_cost.toFixed(2) : 'N/A'}</span>
+                            </div>
+                            <div className="flex justify-between items-center text-sm text-gray-500">
+                              <span>Margin:</span>
+                              <span className="font-medium">
+                                £{product.printful_cost ? ((product.custom_retail_price || product.retail_price) - product.printful_cost).toFixed(2) : 'N/A'}
+                              </span>
+                            </div>
+                          </div>
 
-                    {/* Category and Sync Info */}
-                    <div className="flex items-center justify-between text-sm text-gray-500 mb-4">
-                      <span className="bg-gray-100 px-2 py-1 rounded">{product.category || 'Uncategorized'}</span>
-                      {product.last_synced && (
-                        <span>Synced {new Date(product.last_synced).toLocaleDateString()}</span>
-                      )}
-                    </div>
+                          {/* Category and Sync Info */}
+                          <div className="flex items-center justify-between text-sm text-gray-500 mb-4">
+                            <span className="bg-gray-100 px-2 py-1 rounded">{product.category || 'Uncategorized'}</span>
+                            {product.last_synced && (
+                              <span>Synced {new Date(product.last_synced).toLocaleDateString()}</span>
+                            )}
+                          </div>
 
-                    {/* Action Buttons */}
-                    <div className="flex space-x-2">
-                                             <button 
-                         onClick={() => handleEditProduct(product)}
-                         className="flex-1 flex items-center justify-center px-3 py-2 text-sm font-medium text-lvn-maroon-dark bg-lvn-maroon/10 border border-lvn-maroon/20 rounded-md hover:bg-lvn-maroon/10 focus:outline-none focus:ring-2 focus:ring-lvn-maroon/100 focus:ring-offset-2"
-                       >
-                         <Edit3 className="h-4 w-4 mr-2" />
-                         Edit
-                       </button>
-                      <button 
-                        onClick={() => handleImageManagement(product)}
-                        className="flex-1 flex items-center justify-center px-3 py-2 text-sm font-medium text-gray-600 bg-gray-50 border border-gray-200 rounded-md hover:bg-gray-100 focus:outline-none focus:ring-2 focus:ring-gray-500 focus:ring-offset-2"
-                      >
-                        <ImageIcon className="h-4 w-4 mr-2" />
-                        Images
-                      </button>
-                      <button 
-                        onClick={() => handleVariantsManagement(product)}
-                        className="flex-1 flex items-center justify-center px-3 py-2 text-sm font-medium text-gray-600 bg-gray-50 border border-gray-200 rounded-md hover:bg-gray-100 focus:outline-none focus:ring-2 focus:ring-gray-500 focus:ring-offset-2"
-                      >
-                        <Package className="h-4 w-4 mr-2" />
-                        Variants
-                      </button>
-                    </div>
+                          {/* Action Buttons */}
+                          <div className="flex space-x-2">
+                                                   <button 
+                               onClick={() => handleEditProduct(product)}
+                               className="flex-1 flex items-center justify-center px-3 py-2 text-sm font-medium text-lvn-maroon-dark bg-lvn-maroon/10 border border-lvn-maroon/20 rounded-md hover:bg-lvn-maroon/10 focus:outline-none focus:ring-2 focus:ring-lvn-maroon/100 focus:ring-offset-2"
+                             >
+                               <Edit3 className="h-4 w-4 mr-2" />
+                               Edit
+                             </button>
+                            <button 
+                              onClick={() => handleImageManagement(product)}
+                              className="flex-1 flex items-center justify-center px-3 py-2 text-sm font-medium text-gray-600 bg-gray-50 border border-gray-200 rounded-md hover:bg-gray-100 focus:outline-none focus:ring-2 focus:ring-gray-500 focus:ring-offset-2"
+                            >
+                              <ImageIcon className="h-4 w-4 mr-2" />
+                              Images
+                            </button>
+                            <button 
+                              onClick={() => handleVariantsManagement(product)}
+                              className="flex-1 flex items-center justify-center px-3 py-2 text-sm font-medium text-gray-600 bg-gray-50 border border-gray-200 rounded-md hover:bg-gray-100 focus:outline-none focus:ring-2 focus:ring-gray-500 focus:ring-offset-2"
+                            >
+                              <Package className="h-4 w-4 mr-2" />
+                              Variants
+                            </button>
+                          </div>
 
-                    {/* Sync Button */}
-                    {canSyncPrintful && (
-                      <button
-                        onClick={async () => {
-                          console.log('=== SYNC BUTTON CLICKED ===');
-                          console.log('Product:', product.name);
-                          console.log('Printful Product ID:', product.printful_product_id);
+                          {/* Sync Button */}
+                          {canSyncPrintful && (
+                            <button
+                              onClick={async () => {
+                                console.log('=== SYNC BUTTON CLICKED ===');
+                                console.log('Product:', product.name);
+                                console.log('Printful Product ID:', product.printful_product_id);
                           
-                          if (product.printful_product_id) {
-                            try {
-                              await handleSync(product.printful_product_id);
-                            } catch (error) {
-                              console.error('Sync failed:', error);
-                            }
-                          } else {
-                            alert('This product is not connected to Printful yet. Please connect it first.');
-                          }
-                        }}
-                        disabled={syncStatus.isSyncing || !product.printful_product_id}
-                        className="w-full mt-3 flex items-center justify-center px-3 py-2 text-sm font-medium text-green-600 bg-green-50 border border-green-200 rounded-md hover:bg-green-100 focus:outline-none focus:ring-2 focus:ring-green-500 focus:ring-offset-2 disabled:opacity-50"
-                      >
-                        <RefreshCw className={`h-4 w-4 mr-2 ${syncStatus.isSyncing ? 'animate-spin' : ''}`} />
-                        {product.printful_product_id ? 'Sync with Printful' : 'Not Connected to Printful'}
-                      </button>
-                    )}
+                                if (product.printful_product_id) {
+                                  try {
+                                    await handleSync(product.printful_product_id);
+                                  } catch (error) {
+                                    console.error('Sync failed:', error);
+                                  }
+                                } else {
+                                  alert('This product is not connected to Printful yet. Please connect it first.');
+                                }
+                              }}
+                              disabled={syncStatus.isSyncing || !product.printful_product_id}
+                              className="w-full mt-3 flex items-center justify-center px-3 py-2 text-sm font-medium text-green-600 bg-green-50 border border-green-200 rounded-md hover:bg-green-100 focus:outline-none focus:ring-2 focus:ring-green-500 focus:ring-offset-2 disabled:opacity-50"
+                            >
+                              <RefreshCw className={`h-4 w-4 mr-2 ${syncStatus.isSyncing ? 'animate-spin' : ''}`} />
+                              {product.printful_product_id ? 'Sync with Printful' : 'Not Connected to Printful'}
+                            </button>
+                          )}
+                        </div>
+                      </div>
+                    ))}
                   </div>
+                ))}
+              </div>
+              {productsLoadingMore && (
+                <div className="flex items-center justify-center pb-6 text-sm text-gray-500">
+                  <RefreshCw className="h-4 w-4 mr-2 animate-spin" />
+                  Loading more products...
                 </div>
-              ))}
+              )}
             </div>
           </div>
         )}
@@ -1,7 +1,7 @@
 import React, { useState, useEffect, useCallback } from 'react';
 import { Plus, Search, Edit, Trash2, Package, Eye, Star, Settings, Save, X, DollarSign, Image, MessageSquare, Tag, Truck, Zap } from 'lucide-react';
 import { useAdminProducts } from '../contexts/AdminProductsContext';
-import { Bundle, BundleItem } from '../lib/admin-products-api';
+import { Bundle, BundleItem, ProductSummary } from '../lib/admin-products-api';
 import { Toast, useToast } from '../../components/ui/Toast';
 
 // Move BundleModal outside to prevent re-creation
@@ -15,7 +15,8 @@ interface BundleModalProps {
   setSelectedProducts: (products: any[]) => void;
   newFeature: string;
   setNewFeature: (feature: string) => void;
-  products: any[];
+  products: ProductSummary[];
+  productsById: Record<string, ProductSummary>;
   isLoading: boolean;
   selectedBundle: Bundle | null;
   onSave: () => void;
@@ -36,6 +37,7 @@ const BundleModal: React.FC<BundleModalProps> = ({
   newFeature,
   setNewFeature,
   products,
+  productsById,
   isLoading,
   selectedBundle,
   onSave,
@@ -196,7 +198,7 @@ const BundleModal: React.FC<BundleModalProps> = ({
             </label>
             <div className="space-y-3">
               {selectedProducts.map((selectedProduct) => {
-                const product = products.find(p => p.id === selectedProduct.product_id);
+                const product = productsById[selectedProduct.product_id];
                 return (
                   <div key={selectedProduct.product_id} className="flex items-center gap-4 p-3 bg-gray-50 rounded-lg">
                     <div className="flex-1">
@@ -353,13 +355,14 @@ const BundleManagement: React.FC = () => {
     bundles, 
     bundlesLoading, 
     bundlesError,
-    products,
+    productSummaries,
+    productSummariesById,
     fetchBundles, 
     getBundleDetails,
     createBundle, 
     updateBundle, 
     deleteBundle,
-    fetchProducts
+    fetchProductSummaries
   } = useAdminProducts();
 
   const { isVisible, message, showToast, hideToast } = useToast();
@@ -403,8 +406,8 @@ const BundleManagement: React.FC = () => {
   // Load data on mount
   useEffect(() => {
     fetchBundles(true);
-    fetchProducts();
-  }, [fetchBundles, fetchProducts]);
+    fetchProductSummaries();
+  }, [fetchBundles, fetchProductSummaries]);
 
   // Filter bundles based on search
   const filteredBundles = bundles.filter(bundle =>
@@ -785,7 +788,8 @@ const BundleManagement: React.FC = () => {
           setSelectedProducts={setSelectedProducts}
           newFeature={newFeature}
           setNewFeature={setNewFeature}
-          products={products}
+          products={productSummaries}
+          productsById={productSummariesById}
           isLoading={isLoading}
           selectedBundle={null}
           onSave={handleSaveBundle}
@@ -805,7 +809,8 @@ const BundleManagement: React.FC = () => {
           setSelectedProducts={setSelectedProducts}
           newFeature={newFeature}
           setNewFeature={setNewFeature}
-          products={products}
+          products={productSummaries}
+          productsById={productSummariesById}
           isLoading={isLoading}
           selectedBundle={selectedBundle}
           onSave={handleSaveBundle}
@@ -1,9 +1,11 @@
-import React, { useState, useCallback, useEffect, useMemo } from 'react';
+import React, { useState, useCallback, useEffect, useMemo, useDeferredValue } from 'react';
 import { useAdminProducts } from '../contexts/AdminProductsContext';
 import { useAdmin } from '../contexts/AdminContext';
 import MobileProductEditor from '../../components/MobileProductEditor';
 import MobileImageManagement from '../../components/MobileImageManagement';
 import MobileBundleEditor from '../../components/MobileBundleEditor';
+import useWindowedList from '../../hooks/useWindowedList';
+import { createListIndex } from '../../lib/list-index';
 import { 
   Package, 
   Search, 
@@ -112,105 +114,54 @@ const MobileAdminProductsPage: React.FC = () => {
     loadData();
   }, [getProductOverrides, getBundles]);
 
-  // Filter and sort products
-  const filteredAndSortedProducts = useMemo(() => {
-    let filtered = productOverrides || [];
-    
-    // Apply search filter
-    if (searchQuery) {
-      filtered = filtered.filter(product => 
-        product.custom_description.toLowerCase().includes(searchQuery.toLowerCase())
-      );
+  // Search text and sort orders are indexed once per list, not on every keystroke
+  const productIndex = useMemo(() => createListIndex(productOverrides || [], {
+    searchText: product => product.custom_description || '',
+    sortValues: {
+      name: product => product.custom_description || '',
+      price: product => product.custom_retail_price || 0,
+      category: product => (product as any).category || '',
+      status: product => (product.is_active ? 1 : 0)
     }
-    
-    // Apply category filter
-    if (selectedCategory !== 'all') {
-      filtered = filtered.filter(product => 
-        (product as any).category === selectedCategory
-      );
+  }), [productOverrides]);
+
+  const bundleIndex = useMemo(() => createListIndex(bundles || [], {
+    searchText: bundle => `${bundle.name || ''} ${bundle.description || ''}`,
+    sortValues: {
+      name: bundle => bundle.name || '',
+      price: bundle => bundle.custom_price || 0,
+      category: () => 'Bundle',
+      status: bundle => (bundle.is_active ? 1 : 0)
     }
-    
-    // Apply sorting
-    filtered.sort((a, b) => {
-      let aValue: any, bValue: any;
-      
-      switch (sortBy) {
-        case 'name':
-          aValue = a.custom_description;
-          bValue = b.custom_description;
-          break;
-        case 'price':
-          aValue = a.custom_retail_price || 0;
-          bValue = b.custom_retail_price || 0;
-          break;
-        case 'category':
-          aValue = (a as any).category || '';
-          bValue = (b as any).category || '';
-          break;
-        case 'status':
-          aValue = a.is_active ? 1 : 0;
-          bValue = b.is_active ? 1 : 0;
-          break;
-        default:
-          return 0;
-      }
-      
-      if (sortOrder === 'asc') {
-        return aValue > bValue ? 1 : -1;
-      } else {
-        return aValue < bValue ? 1 : -1;
-      }
-    });
-    
-    return filtered;
-  }, [productOverrides, searchQuery, selectedCategory, sortBy, sortOrder]);
+  }), [bundles]);
+
+  // Typing stays responsive while the filtered list catches up
+  const deferredSearchQuery = useDeferredValue(searchQuery);
+
+  // Filter and sort products
+  const filteredAndSortedProducts = useMemo(() => productIndex.query({
+    search: deferredSearchQuery,
+    sortBy,
+    sortOrder,
+    predicate: selectedCategory === 'all'
+      ? undefined
+      : product => (product as any).category === selectedCategory
+  }), [productIndex, deferredSearchQuery, selectedCategory, sortBy, sortOrder]);
 
   // Filter and sort bundles
-  const filteredAndSortedBundles = useMemo(() => {
-    let filtered = bundles || [];
-    
-    // Apply search filter
-    if (searchQuery) {
-      filtered = filtered.filter(bundle => 
-        bundle.name.toLowerCase().includes(searchQuery.toLowerCase()) ||
-        bundle.description.toLowerCase().includes(searchQuery.toLowerCase())
-      );
-    }
-    
-    // Apply sorting
-    filtered.sort((a, b) => {
-      let aValue: any, bValue: any;
-      
-      switch (sortBy) {
-        case 'name':
-          aValue = a.name;
-          bValue = b.name;
-          break;
-        case 'price':
-          aValue = a.custom_price || 0;
-          bValue = b.custom_price || 0;
-          break;
-        case 'category':
-          aValue = 'Bundle';
-          bValue = 'Bundle';
-          break;
-        case 'status':
-          aValue = a.is_active ? 1 : 0;
-          bValue = b.is_active ? 1 : 0;
-          break;
-        default:
-          return 0;
-      }
-      
-      if (sortOrder === 'asc') {
-        return aValue > bValue ? 1 : -1;
-      } else {
-        return aValue < bValue ? 1 : -1;
-      }
-    });
-    
-    return filtered;
-  }, [bundles, searchQuery, sortBy, sortOrder]);
+  const filteredAndSortedBundles = useMemo(() => bundleIndex.query({
+    search: deferredSearchQuery,
+    sortBy,
+    sortOrder
+  }), [bundleIndex, deferredSearchQuery, sortBy, sortOrder]);
+
+  // Only the cards in view are rendered
+  const visibleList = viewMode === 'products' ? filteredAndSortedProducts : filteredAndSortedBundles;
+  const { containerRef, measureRef, startRow, endRow, paddingTop, paddingBottom } = useWindowedList({
+    rowCount: visibleList.length,
+    estimatedRowHeight: 130,
+    overscan: 4
+  });
 
   // Toggle filter section
   const toggleFilterSection = useCallback((section: string) => {
@@ -522,88 +473,92 @@ const MobileAdminProductsPage: React.FC = () => {
       )}
 
       {/* Content */}
-      <div className="p-4">
+      <div ref={containerRef} className="p-4 h-[calc(100vh-8rem)] overflow-y-auto">
         {viewMode === 'products' ? (
           /* Products Grid */
-          <div className="space-y-4">
-            {filteredAndSortedProducts.map((product) => (
-              <div key={product.id} className="bg-white rounded-lg shadow-sm border border-gray-200 overflow-hidden">
-                <div className="p-4">
-                  <div className="flex items-start space-x-3">
-                    {/* Product Image */}
-                    <div className="flex-shrink-0 w-20 h-20 bg-gray-100 rounded-lg overflow-hidden">
-                      {product.images?.[0] ? (
-                        <img
-                          src={product.images[0].image_url}
-                          alt={product.custom_description}
-                          className="w-full h-full object-cover"
-                        />
-                      ) : (
-                        <div className="w-full h-full flex items-center justify-center">
-                          <Package className="h-8 w-8 text-gray-400" />
-                        </div>
-                      )}
-                    </div>
+          <div style={{ paddingTop, paddingBottom }}>
+            {filteredAndSortedProducts.slice(startRow, endRow).map((product, rowOffset) => (
+              <div key={product.id} ref={rowOffset === 0 ? measureRef : undefined} className="pb-4">
+                <div className="bg-white rounded-lg shadow-sm border border-gray-200 overflow-hidden">
+                  <div className="p-4">
+                    <div className="flex items-start space-x-3">
+                      {/* Product Image */}
+                      <div className="flex-shrink-0 w-20 h-20 bg-gray-100 rounded-lg overflow-hidden">
+                        {product.images?.[0] ? (
+                          <img
+                            src={product.images[0].image_url}
+                            alt={product.custom_description}
+                            loading="lazy"
+                            decoding="async"
+                            className="w-full h-full object-cover"
+                          />
+                        ) : (
+                          <div className="w-full h-full flex items-center justify-center">
+                            <Package className="h-8 w-8 text-gray-400" />
+                          </div>
+                        )}
+                      </div>
                     
-                    {/* Product Info */}
-                    <div className="flex-1 min-w-0">
-                      <div className="flex items-start justify-between">
-                        <div className="flex-1">
-                          <h3 className="text-sm font-medium text-gray-900 truncate">
-                            {product.custom_description}
-                          </h3>
-                          <p className="text-xs text-gray-500 mt-1">
-                            {(product as any).category || 'Uncategorized'}
-                          </p>
-                        </div>
+                      {/* Product Info */}
+                      <div className="flex-1 min-w-0">
+                        <div className="flex items-start justify-between">
+                          <div className="flex-1">
+                            <h3 className="text-sm font-medium text-gray-900 truncate">
+                              {product.custom_description}
+                            </h3>
+                            <p className="text-xs text-gray-500 mt-1">
+                              {(product as any).category || 'Uncategorized'}
+                            </p>
+                          </div>
                         
-                        <div className="flex items-center space-x-1">
-                          {canManageProducts && (
-                            <button
-                              onClick={() => handleEditProduct(product)}
-                              className="p-1 text-gray-600 hover:text-gray-900 hover:bg-gray-100 rounded"
-                            >
-                              <Edit3 className="h-4 w-4" />
-                            </button>
-                          )}
+                          <div className="flex items-center space-x-1">
+                            {canManageProducts && (
+                              <button
+                                onClick={() => handleEditProduct(product)}
+                                className="p-1 text-gray-600 hover:text-gray-900 hover:bg-gray-100 rounded"
+                              >
+                                <Edit3 className="h-4 w-4" />
+                              </button>
+                            )}
                           
-                          {canManageImages && (
-                            <button
-                              onClick={() => handleManageImages(product)}
-                              className="p-1 text-gray-600 hover:text-gray-900 hover:bg-gray-100 rounded"
-                            >
-                              <ImageIcon className="h-4 w-4" />
-                            </button>
-                          )}
+                            {canManageImages && (
+                              <button
+                                onClick={() => handleManageImages(product)}
+                                className="p-1 text-gray-600 hover:text-gray-900 hover:bg-gray-100 rounded"
+                              >
+                                <ImageIcon className="h-4 w-4" />
+                              </button>
+                            )}
                           
-                          {canManageProducts && (
-                            <button
-                              onClick={() => handleDeleteProduct(product.id)}
-                              className="p-1 text-red-600 hover:text-red-700 hover:bg-red-50 rounded"
-                            >
-                              <Trash2 className="h-4 w-4" />
-                            </button>
-                          )}
+                            {canManageProducts && (
+                              <button
+                                onClick={() => handleDeleteProduct(product.id)}
+                                className="p-1 text-red-600 hover:text-red-700 hover:bg-red-50 rounded"
+                              >
+                                <Trash2 className="h-4 w-4" />
+                              </button>
+                            )}
+                          </div>
                         </div>
-                      </div>
                       
-                      <div className="mt-2 flex items-center justify-between">
-                        <div className="flex items-center space-x-3">
-                          <span className="text-sm font-medium text-gray-900">
-                            ${product.custom_retail_price?.toFixed(2) || '0.00'}
-                          </span>
+                        <div className="mt-2 flex items-center justify-between">
+                          <div className="flex items-center space-x-3">
+                            <span className="text-sm font-medium text-gray-900">
+                              ${product.custom_retail_price?.toFixed(2) || '0.00'}
+                            </span>
                           
-                          <span className={`inline-flex items-center px-2 py-1 rounded-full text-xs font-medium ${
-                            product.is_active
-                              ? 'bg-green-100 text-green-800'
-                              : 'bg-red-100 text-red-800'
-                          }`}>
-                            {product.is_active ? 'Active' : 'Inactive'}
-                          </span>
-                        </div>
+                            <span className={`inline-flex items-center px-2 py-1 rounded-full text-xs font-medium ${
+                              product.is_active
+                                ? 'bg-green-100 text-green-800'
+                                : 'bg-red-100 text-red-800'
+                            }`}>
+                              {product.is_active ? 'Active' : 'Inactive'}
+                            </span>
+                          </div>
                         
-                        <div className="flex items-center space-x-1 text-xs text-gray-500">
-                          <span>{product.images?.length || 0} images</span>
+                          <div className="flex items-center space-x-1 text-xs text-gray-500">
+                            <span>{product.images?.length || 0} images</span>
+                          </div>
                         </div>
                       </div>
                     </div>
@@ -640,54 +595,56 @@ const MobileAdminProductsPage: React.FC = () => {
           </div>
         ) : (
           /* Bundles Grid */
-          <div className="space-y-4">
-            {filteredAndSortedBundles.map((bundle) => (
-              <div key={bundle.id} className="bg-white rounded-lg shadow-sm border border-gray-200 overflow-hidden">
-                <div className="p-4">
-                  <div className="flex items-start justify-between">
-                    <div className="flex-1">
-                      <h3 className="text-sm font-medium text-gray-900">{bundle.name}</h3>
-                      <p className="text-xs text-gray-500 mt-1 line-clamp-2">
-                        {bundle.description}
-                      </p>
+          <div style={{ paddingTop, paddingBottom }}>
+            {filteredAndSortedBundles.slice(startRow, endRow).map((bundle, rowOffset) => (
+              <div key={bundle.id} ref={rowOffset === 0 ? measureRef : undefined} className="pb-4">
+                <div className="bg-white rounded-lg shadow-sm border border-gray-200 overflow-hidden">
+                  <div className="p-4">
+                    <div className="flex items-start justify-between">
+                      <div className="flex-1">
+                        <h3 className="text-sm font-medium text-gray-900">{bundle.name}</h3>
+                        <p className="text-xs text-gray-500 mt-1 line-clamp-2">
+                          {bundle.description}
+                        </p>
                       
-                      <div className="mt-2 flex items-center space-x-3">
-                        <span className="text-sm font-medium text-gray-900">
-                          ${bundle.custom_price?.toFixed(2) || '0.00'}
-                        </span>
+                        <div className="mt-2 flex items-center space-x-3">
+                          <span className="text-sm font-medium text-gray-900">
+                            ${bundle.custom_price?.toFixed(2) || '0.00'}
+                          </span>
                         
-                        <span className="text-xs text-gray-500">
-                          {bundle.items?.length || 0} products
-                        </span>
+                          <span className="text-xs text-gray-500">
+                            {bundle.items?.length || 0} products
+                          </span>
                         
-                        <span className={`inline-flex items-center px-2 py-1 rounded-full text-xs font-medium ${
-                          bundle.is_active
-                            ? 'bg-green-100 text-green-800'
-                            : 'bg-red-100 text-red-800'
-                        }`}>
-                          {bundle.is_active ? 'Active' : 'Inactive'}
-                        </span>
+                          <span className={`inline-flex items-center px-2 py-1 rounded-full text-xs font-medium ${
+                            bundle.is_active
+                              ? 'bg-green-100 text-green-800'
+                              : 'bg-red-100 text-red-800'
+                          }`}>
+                            {bundle.is_active ? 'Active' : 'Inactive'}
+                          </span>
+                        </div>
                       </div>
-                    </div>
                     
-                    <div className="flex items-center space-x-1 ml-3">
-                      {canManageBundles && (
-                        <button
-                          onClick={() => handleEditBundle(bundle)}
-                          className="p-1 text-gray-600 hover:text-gray-900 hover:bg-gray-100 rounded"
-                        >
-                          <Edit3 className="h-4 w-4" />
-                        </button>
-                      )}
+                      <div className="flex items-center space-x-1 ml-3">
+                        {canManageBundles && (
+                          <button
+                            onClick={() => handleEditBundle(bundle)}
+                            className="p-1 text-gray-600 hover:text-gray-900 hover:bg-gray-100 rounded"
+                          >
+                            <Edit3 className="h-4 w-4" />
+                          </button>
+                        )}
                       
-                      {canManageBundles && (
-                        <button
-                          onClick={() => handleDeleteBundle(bundle.id)}
-                          className="p-1 text-red-600 hover:text-red-700 hover:bg-red-50 rounded"
-                        >
-                          <Trash2 className="h-4 w-4" />
-                        </button>
-                      )}
+                        {canManageBundles && (
+                          <button
+                            onClick={() => handleDeleteBundle(bundle.id)}
+                            className="p-1 text-red-600 hover:text-red-700 hover:bg-red-50 rounded"
+                          >
+                            <Trash2 className="h-4 w-4" />
+                          </button>
+                        )}
+                      </div>
                     </div>
                   </div>
                 </div>
@@ -1,5 +1,5 @@
-import React, { createContext, useContext, useEffect, useState, ReactNode, useCallback } from 'react';
-import { adminProductsAPI, ProductOverride, ProductImage, Bundle, BundleItem, BundleImage, BundleReview, BundleDetails, PrintfulSyncStatus, ImageUploadResult } from '../lib/admin-products-api';
+import React, { createContext, useContext, useEffect, useState, ReactNode, useCallback, useRef } from 'react';
+import { adminProductsAPI, ProductsPageCursor, ProductsQuery, ProductSummary, ProductOverride, ProductImage, Bundle, BundleItem, BundleImage, BundleReview, BundleDetails, PrintfulSyncStatus, ImageUploadResult, SyncMonitorSnapshot, SyncMonitorChange, AdminChangeSet, ChangeSetRoot, ChangeSetResult, ChangeSetTable, StaleChangeSetError } from '../lib/admin-products-api';
 
 // Context state interface
 interface AdminProductsState {
@@ -7,6 +7,13 @@ interface AdminProductsState {
   products: any[]; // Will be Product[] once we define the interface
   productsLoading: boolean;
   productsError: string | null;
+  productsHasMore: boolean;
+  productsLoadingMore: boolean;
+  productsQuery: ProductsQuery;
+  
+  // Every product (id, name, price...) for pickers and lookups - products only holds the loaded pages
+  productSummaries: ProductSummary[];
+  productSummariesById: Record<string, ProductSummary>;
   
   // Product Overrides
   productOverrides: ProductOverride[];
@@ -67,7 +74,9 @@ interface AdminProductsState {
   // Context actions interface
 interface AdminProductsActions {
   // Products
-  fetchProducts: () => Promise<void>;
+  fetchProducts: (query?: ProductsQuery) => Promise<void>;
+  loadMoreProducts: () => Promise<void>;
+  fetchProductSummaries: () => Promise<void>;
   createProduct: (product: any) => Promise<any>;
   updateProduct: (id: string, updates: any) => Promise<any>;
   deleteProduct: (id: string) => Promise<void>;
@@ -87,6 +96,11 @@ interface AdminProductsActions {
   deleteProductImage: (id: string) => Promise<void>;
   reorderProductImages: (productId: string, imageIds: string[]) => Promise<void>;
   
+  // Change sets (many edits, one transactional round trip)
+  createChangeSet: (root?: ChangeSetRoot | null) => AdminChangeSet;
+  commitChangeSet: (changeSet: AdminChangeSet) => Promise<ChangeSetResult>;
+  productChangeSetRoot: (productId: string) => ChangeSetRoot;
+  
   // Bundles
   fetchBundles: (includeItems?: boolean) => Promise<void>;
   getBundleDetails: (bundleId: string) => Promise<BundleDetails | null>;
@@ -127,6 +141,8 @@ interface AdminProductsActions {
   getSyncErrors: () => Promise<any[]>;
   getInventoryChanges: () => Promise<any[]>;
   getDataConflicts: () => Promise<any[]>;
+  getSyncMonitorSnapshot: () => Promise<SyncMonitorSnapshot>;
+  subscribeToSyncMonitor: (onChange: (change: SyncMonitorChange) => void, onStatus?: (subscribed: boolean) => void) => () => void;
   resolveDataConflict: (conflictId: string, resolution: string) => Promise<void>;
   markErrorResolved: (errorId: string) => Promise<void>;
   markInventoryChangeProcessed: (changeId: string) => Promise<void>;
@@ -151,6 +167,33 @@ export const useAdminProducts = () => {
   return context;
 };
 
+/**
+ * Handle a save rejected because the item changed underneath the editor: offer to reload the
+ * page so the edits can be redone on the latest version.
+ * @returns true if the error was a stale change set (and has been handled)
+ */
+export const confirmReloadIfStale = (error: unknown): boolean => {
+  if (!(error instanceof StaleChangeSetError)) {
+    return false;
+  }
+  if (window.confirm(`${error.message}\n\nReload now? Unsaved changes will be lost.`)) {
+    window.location.reload();
+  }
+  return true;
+};
+
+// Delay before republishing the storefront catalog snapshot after a save
+const CATALOG_PUBLISH_DELAY_MS = 2000;
+
+const toSummary = (product: any): ProductSummary => ({
+  id: product.id,
+  name: product.name,
+  price: product.price ?? null,
+  category: product.category ?? null,
+  image_url: product.image_url ?? null,
+  is_available: product.is_available ?? null
+});
+
 // Provider props
 interface AdminProductsProviderProps {
   children: ReactNode;
@@ -163,6 +206,12 @@ export const AdminProductsProvider: React.FC<AdminProductsProviderProps> = ({ ch
     products: [],
     productsLoading: false,
     productsError: null,
+    productsHasMore: false,
+    productsLoadingMore: false,
+    productsQuery: {},
+    
+    productSummaries: [],
+    productSummariesById: {},
     
     productOverrides: [],
     productOverridesLoading: false,
@@ -217,6 +266,30 @@ export const AdminProductsProvider: React.FC<AdminProductsProviderProps> = ({ ch
     setState(prev => ({ ...prev, ...updates }));
   }, []);
 
+  // Storefront catalog snapshot: republished once after a burst of product/image saves
+  const catalogPublishTimer = useRef<ReturnType<typeof setTimeout> | null>(null);
+
+  const scheduleCatalogPublish = useCallback(() => {
+    if (catalogPublishTimer.current) {
+      clearTimeout(catalogPublishTimer.current);
+    }
+    catalogPublishTimer.current = setTimeout(() => {
+      catalogPublishTimer.current = null;
+      adminProductsAPI.publishCatalogSnapshot().catch(error => {
+        console.warn('⚠️ Failed to publish catalog snapshot:', error);
+      });
+    }, CATALOG_PUBLISH_DELAY_MS);
+  }, []);
+
+  // Don't lose a pending publish when the admin panel unmounts - flush it instead
+  useEffect(() => () => {
+    if (catalogPublishTimer.current) {
+      clearTimeout(catalogPublishTimer.current);
+      catalogPublishTimer.current = null;
+      adminProductsAPI.publishCatalogSnapshot().catch(() => {});
+    }
+  }, []);
+
   // Helper function to update nested state
   const updateNestedState = useCallback(<K extends keyof AdminProductsState>(
     key: K,
@@ -302,13 +375,29 @@ export const AdminProductsProvider: React.FC<AdminProductsProviderProps> = ({ ch
   }, [updateState]);
 
   // Products Actions
-  const fetchProducts = useCallback(async () => {
-    updateState({ productsLoading: true, productsError: null });
+  // Products load a page at a time for the current query (search, filters, sort); the query,
+  // cursor and a generation counter live in refs so a refresh or a new query started mid-scroll
+  // drops any page still in flight from the previous list
+  const productsQuery = useRef<ProductsQuery>({});
+  const productsCursor = useRef<ProductsPageCursor | null>(null);
+  const productsGeneration = useRef(0);
+  const productsLoadingMore = useRef(false);
+
+  const fetchProducts = useCallback(async (query?: ProductsQuery) => {
+    if (query) {
+      productsQuery.current = query;
+    }
+    const generation = ++productsGeneration.current;
+    productsLoadingMore.current = false;
+    updateState({ productsLoading: true, productsError: null, productsLoadingMore: false, productsQuery: productsQuery.current });
     
     try {
-      const data = await adminProductsAPI.getProducts();
-      updateState({ products: data, productsLoading: false });
+      const page = await adminProductsAPI.getProductsPage(productsQuery.current);
+      if (generation !== productsGeneration.current) return;
+      productsCursor.current = page.nextCursor;
+      updateState({ products: page.products, productsHasMore: !!page.nextCursor, productsLoading: false });
     } catch (error) {
+      if (generation !== productsGeneration.current) return;
       updateState({ 
         productsError: error instanceof Error ? error.message : 'Failed to fetch products',
         productsLoading: false 
@@ -316,42 +405,105 @@ export const AdminProductsProvider: React.FC<AdminProductsProviderProps> = ({ ch
     }
   }, [updateState]);
 
+  const loadMoreProducts = useCallback(async () => {
+    const cursor = productsCursor.current;
+    if (!cursor || productsLoadingMore.current) return;
+
+    const generation = productsGeneration.current;
+    productsLoadingMore.current = true;
+    updateState({ productsLoadingMore: true });
+
+    try {
+      const page = await adminProductsAPI.getProductsPage(productsQuery.current, cursor);
+      if (generation !== productsGeneration.current) return;
+      productsCursor.current = page.nextCursor;
+      setState(prev => {
+        const loadedIds = new Set(prev.products.map(product => product.id));
+        return {
+          ...prev,
+          products: [...prev.products, ...page.products.filter(product => !loadedIds.has(product.id))],
+          productsHasMore: !!page.nextCursor,
+          productsLoadingMore: false
+        };
+      });
+    } catch (error) {
+      if (generation !== productsGeneration.current) return;
+      updateState({
+        productsError: error instanceof Error ? error.message : 'Failed to fetch products',
+        productsLoadingMore: false
+      });
+    } finally {
+      if (generation === productsGeneration.current) {
+        productsLoadingMore.current = false;
+      }
+    }
+  }, [updateState]);
+
+  const setProductSummaries = useCallback((update: (summaries: ProductSummary[]) => ProductSummary[]) => {
+    setState(prev => {
+      const productSummaries = update(prev.productSummaries);
+      return {
+        ...prev,
+        productSummaries,
+        productSummariesById: Object.fromEntries(productSummaries.map(summary => [summary.id, summary]))
+      };
+    });
+  }, []);
+
+  const fetchProductSummaries = useCallback(async () => {
+    try {
+      const summaries = await adminProductsAPI.getProductSummaries();
+      setProductSummaries(() => summaries);
+    } catch (error) {
+      console.error('Failed to fetch product summaries:', error);
+    }
+  }, [setProductSummaries]);
+
   const createProduct = useCallback(async (product: any) => {
     try {
       const data = await adminProductsAPI.createProduct(product);
-      updateState(prev => ({
+      scheduleCatalogPublish();
+      setState(prev => ({
+        ...prev,
         products: [data, ...prev.products]
       }));
+      setProductSummaries(summaries => [...summaries, toSummary(data)]);
       return data;
     } catch (error) {
       throw error;
     }
-  }, [updateState]);
+  }, [scheduleCatalogPublish, setProductSummaries]);
 
   const updateProduct = useCallback(async (id: string, updates: any) => {
     try {
       const data = await adminProductsAPI.updateProduct(id, updates);
-      updateState(prev => ({
+      scheduleCatalogPublish();
+      setState(prev => ({
+        ...prev,
         products: prev.products.map(product => 
           product.id === id ? data : product
         )
       }));
+      setProductSummaries(summaries => summaries.map(summary => summary.id === id ? toSummary(data) : summary));
       return data;
     } catch (error) {
       throw error;
     }
-  }, [updateState]);
+  }, [scheduleCatalogPublish, setProductSummaries]);
 
   const deleteProduct = useCallback(async (id: string) => {
     try {
       await adminProductsAPI.deleteProduct(id);
-      updateState(prev => ({
+      scheduleCatalogPublish();
+      setState(prev => ({
+        ...prev,
         products: prev.products.filter(product => product.id !== id)
       }));
+      setProductSummaries(summaries => summaries.filter(summary => summary.id !== id));
     } catch (error) {
       throw error;
     }
-  }, [updateState]);
+  }, [scheduleCatalogPublish, setProductSummaries]);
 
   // Product Images Actions
   const fetchProductImages = useCallback(async (productId: string) => {
@@ -377,6 +529,7 @@ export const AdminProductsProvider: React.FC<AdminProductsProviderProps> = ({ ch
   const createProductImage = useCallback(async (image: Omit<ProductImage, 'id' | 'created_at'>) => {
     try {
       const data = await adminProductsAPI.createProductImage(image);
+      scheduleCatalogPublish();
       updateNestedState('productImages', prev => ({
         ...prev,
         [image.product_id]: [...(prev[image.product_id] || []), data]
@@ -385,11 +538,12 @@ export const AdminProductsProvider: React.FC<AdminProductsProviderProps> = ({ ch
     } catch (error) {
       throw error;
     }
-  }, [updateNestedState]);
+  }, [updateNestedState, scheduleCatalogPublish]);
 
   const updateProductImage = useCallback(async (id: string, updates: Partial<ProductImage>) => {
     try {
       const data = await adminProductsAPI.updateProductImage(id, updates);
+      scheduleCatalogPublish();
       updateNestedState('productImages', prev => ({
         ...prev,
         [data.product_id]: prev[data.product_id]?.map(img => 
@@ -400,11 +554,12 @@ export const AdminProductsProvider: React.FC<AdminProductsProviderProps> = ({ ch
     } catch (error) {
       throw error;
     }
-  }, [updateNestedState]);
+  }, [updateNestedState, scheduleCatalogPublish]);
 
   const deleteProductImage = useCallback(async (id: string) => {
     try {
       await adminProductsAPI.deleteProductImage(id);
+      scheduleCatalogPublish();
       // Find which product this image belongs to and remove it
       updateNestedState('productImages', prev => {
         const newImages = { ...prev };
@@ -416,17 +571,18 @@ export const AdminProductsProvider: React.FC<AdminProductsProviderProps> = ({ ch
     } catch (error) {
       throw error;
     }
-  }, [updateNestedState]);
+  }, [updateNestedState, scheduleCatalogPublish]);
 
   const reorderProductImages = useCallback(async (productId: string, imageIds: string[]) => {
     try {
       await adminProductsAPI.reorderProductImages(productId, imageIds);
+      scheduleCatalogPublish();
       // Refresh the images for this product
       await fetchProductImages(productId);
     } catch (error) {
       throw error;
     }
-  }, [fetchProductImages]);
+  }, [fetchProductImages, scheduleCatalogPublish]);
 
   // Bundles Actions
   const fetchBundles = useCallback(async (includeItems: boolean = false) => {
@@ -443,6 +599,78 @@ export const AdminProductsProvider: React.FC<AdminProductsProviderProps> = ({ ch
     }
   }, [updateState]);
 
+  // Change Set Actions
+  const createChangeSet = useCallback((root: ChangeSetRoot | null = null) => new AdminChangeSet(root), []);
+
+  // Root for a product's change sets, checked against the version the loaded product is at
+  const productChangeSetRoot = useCallback((productId: string): ChangeSetRoot => ({
+    table: 'products',
+    id: productId,
+    version: state.products.find(product => product.id === productId)?.updated_at ?? null
+  }), [state.products]);
+
+  const commitChangeSet = useCallback(async (changeSet: AdminChangeSet) => {
+    const result = await adminProductsAPI.commitChangeSet(changeSet);
+    if (result.results.length === 0) {
+      return result;
+    }
+
+    const touched = new Set(result.results.map(r => r.table));
+    if (touched.has('products') || touched.has('product_images') || touched.has('product_overrides')) {
+      scheduleCatalogPublish();
+    }
+
+    // Fold the committed rows into local state in one update
+    setState(prev => {
+      let products = prev.products;
+      let productOverrides = prev.productOverrides;
+      let productImages = prev.productImages;
+
+      for (const { op, table, id, row } of result.results) {
+        if (table === 'products') {
+          products = op === 'delete'
+            ? products.filter(product => product.id !== id)
+            : op === 'insert'
+              ? [row, ...products]
+              : products.map(product => product.id === id ? row : product);
+        } else if (table === 'product_overrides') {
+          productOverrides = op === 'delete'
+            ? productOverrides.filter(override => override.id !== id)
+            : op === 'insert'
+              ? [row, ...productOverrides]
+              : productOverrides.map(override => override.id === id ? row : override);
+        } else if (table === 'product_images') {
+          const next = { ...productImages };
+          if (op === 'delete') {
+            for (const productId of Object.keys(next)) {
+              next[productId] = next[productId].filter(img => img.id !== id);
+            }
+          } else {
+            const images = (next[row.product_id] || []).filter(img => img.id !== id);
+            next[row.product_id] = [...images, row].sort((a, b) => a.image_order - b.image_order);
+          }
+          productImages = next;
+        }
+      }
+
+      // The root's new version is the base for the next change set
+      if (changeSet.root?.table === 'products' && result.version) {
+        products = products.map(product =>
+          product.id === changeSet.root!.id ? { ...product, updated_at: result.version } : product
+        );
+      }
+
+      return { ...prev, products, productOverrides, productImages };
+    });
+
+    const bundleTables: ChangeSetTable[] = ['bundles', 'bundle_items', 'bundle_images', 'bundle_reviews'];
+    if (changeSet.root?.table === 'bundles' || bundleTables.some(table => touched.has(table))) {
+      fetchBundles();
+    }
+
+    return result;
+  }, [scheduleCatalogPublish, fetchBundles]);
+
   const createBundle = useCallback(async (bundle: Omit<Bundle, 'id' | 'created_at' | 'updated_at'>, items?: Omit<BundleItem, 'id' | 'bundle_id' | 'created_at'>[]) => {
     try {
       const data = await adminProductsAPI.createBundle(bundle, items);
@@ -782,6 +1010,7 @@ export const AdminProductsProvider: React.FC<AdminProductsProviderProps> = ({ ch
     try {
       await Promise.all([
         fetchProducts(),
+        fetchProductSummaries(),
         fetchProductOverrides(),
         fetchBundles(),
         fetchPrintfulSyncStatus()
@@ -789,7 +1018,7 @@ export const AdminProductsProvider: React.FC<AdminProductsProviderProps> = ({ ch
     } catch (error) {
       console.error('Error refreshing all data:', error);
     }
-  }, [fetchProducts, fetchProductOverrides, fetchBundles, fetchPrintfulSyncStatus]);
+  }, [fetchProducts, fetchProductSummaries, fetchProductOverrides, fetchBundles, fetchPrintfulSyncStatus]);
 
   // Real-time Sync Monitoring Actions
   const getPrintfulSyncStatus = useCallback(async () => {
@@ -833,6 +1062,20 @@ export const AdminProductsProvider: React.FC<AdminProductsProviderProps> = ({ ch
     }
   }, []);
 
+  const getSyncMonitorSnapshot = useCallback(async () => {
+    try {
+      return await adminProductsAPI.getSyncMonitorSnapshot();
+    } catch (error) {
+      console.error('Failed to get sync monitor snapshot:', error);
+      throw error;
+    }
+  }, []);
+
+  const subscribeToSyncMonitor = useCallback((
+    onChange: (change: SyncMonitorChange) => void,
+    onStatus?: (subscribed: boolean) => void
+  ) => adminProductsAPI.subscribeToSyncMonitor(onChange, onStatus), []);
+
   const resolveDataConflict = useCallback(async (conflictId: string, resolution: string) => {
     try {
       await adminProductsAPI.resolveDataConflict(conflictId, resolution);
@@ -869,6 +1112,8 @@ export const AdminProductsProvider: React.FC<AdminProductsProviderProps> = ({ ch
   const value: AdminProductsContextType = {
     ...state,
     fetchProducts,
+    loadMoreProducts,
+    fetchProductSummaries,
     createProduct,
     updateProduct,
     deleteProduct,
@@ -883,6 +1128,9 @@ export const AdminProductsProvider: React.FC<AdminProductsProviderProps> = ({ ch
     updateProductImage,
     deleteProductImage,
     reorderProductImages,
+    createChangeSet,
+    commitChangeSet,
+    productChangeSetRoot,
     fetchBundles,
     getBundleDetails,
     getBundleSavings,
@@ -910,6 +1158,8 @@ export const AdminProductsProvider: React.FC<AdminProductsProviderProps> = ({ ch
     getSyncErrors,
     getInventoryChanges,
     getDataConflicts,
+    getSyncMonitorSnapshot,
+    subscribeToSyncMonitor,
     resolveDataConflict,
     markErrorResolved,
     markInventoryChangeProcessed,
@@ -42,13 +42,10 @@ export class AdminAPI {
 
   // ===== ORDERS MANAGEMENT =====
   
-  async getOrders(page: number = 1, limit: number = 50, status?: string, search?: string) {
+  async getOrders(options: OrdersQuery = {}): Promise<OrdersResponse> {
     return this.makeRequest('admin-orders', {
       action: 'get_orders',
-      page,
-      limit,
-      status,
-      search
+      ...options
     })
   }
 
@@ -103,19 +100,18 @@ export class AdminAPI {
 
   // ===== CUSTOMERS MANAGEMENT =====
   
-  async getCustomers(page: number = 1, limit: number = 50, search?: string) {
+  async getCustomers(options: CustomersQuery = {}): Promise<CustomersResponse> {
     return this.makeRequest('admin-customers', {
       action: 'get_customers',
-      page,
-      limit,
-      search
+      ...options
     })
   }
 
-  async getCustomerDetails(customerId: string) {
+  async getCustomerDetails(customerId: string, ordersCursor?: string | null): Promise<CustomerDetails> {
     return this.makeRequest('admin-customers', {
       action: 'get_customer_details',
-      customerId
+      customerId,
+      ordersCursor
     })
   }
 
@@ -160,10 +156,21 @@ export class AdminAPI {
 export const adminAPI = new AdminAPI()
 
 // Export types for API responses
+// List endpoints use keyset pagination: pass back nextCursor to get the following page
+export interface OrdersQuery {
+  cursor?: string | null
+  limit?: number
+  status?: string
+  email?: string
+  search?: string
+  dateFrom?: string
+  dateTo?: string
+}
+
 export interface OrdersResponse {
   orders: any[]
-  total: number
-  page: number
+  nextCursor: string | null
+  hasMore: boolean
   limit: number
 }
 
@@ -197,14 +204,30 @@ export interface TopProducts {
   }>
 }
 
+export interface CustomersQuery {
+  cursor?: string | null
+  limit?: number
+  email?: string
+  search?: string
+  dateFrom?: string
+  dateTo?: string
+}
+
+export interface CustomerOrderStats {
+  orderCount: number
+  totalSpent: number
+  lastOrderAt: string | null
+}
+
 export interface CustomersResponse {
-  customers: any[]
-  total: number
-  page: number
+  customers: Array<any & { order_stats: CustomerOrderStats }>
+  nextCursor: string | null
+  hasMore: boolean
   limit: number
 }
 
 export interface CustomerDetails {
   customer: any
   orders: any[]
+  ordersNextCursor: string | null
 }
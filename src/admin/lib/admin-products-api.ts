@@ -103,6 +103,121 @@ export interface PrintfulSyncStatus {
   error_message?: string;
 }
 
+// Sync monitor records (sync_errors, inventory_changes, data_conflicts, sync_status)
+export interface SyncErrorRecord {
+  id: string;
+  timestamp: string;
+  type: 'connection' | 'inventory' | 'data' | 'webhook' | 'validation';
+  severity: 'low' | 'medium' | 'high' | 'critical';
+  message: string;
+  details?: string;
+  resolved: boolean;
+}
+
+export interface InventoryChangeRecord {
+  id: string;
+  timestamp: string;
+  productId: string;
+  productName: string;
+  variantId: string;
+  variantName: string;
+  changeType: 'stock_update' | 'price_change' | 'availability_change' | 'new_variant';
+  oldValue?: string | number;
+  newValue?: string | number;
+  processed: boolean;
+}
+
+export interface DataConflictRecord {
+  id: string;
+  timestamp: string;
+  productId: string;
+  conflictType: 'price_mismatch' | 'inventory_mismatch' | 'variant_mismatch' | 'data_corruption';
+  printfulData: any;
+  localData: any;
+  resolution: 'auto_resolved' | 'manual_review' | 'pending' | 'resolved';
+  autoResolution?: string;
+}
+
+export interface SyncRunRecord {
+  id: string;
+  productId: string;
+  lastSync: string | null;
+  lastSyncStatus: 'success' | 'failed' | 'pending' | 'unknown';
+  isSyncing: boolean;
+  syncProgress: number;
+  timestamp: string;
+}
+
+export interface SyncMonitorSnapshot {
+  errors: SyncErrorRecord[];
+  inventoryChanges: InventoryChangeRecord[];
+  dataConflicts: DataConflictRecord[];
+  latestRun: SyncRunRecord | null;
+}
+
+export type SyncMonitorChange =
+  | { table: 'sync_errors'; eventType: 'INSERT' | 'UPDATE'; record: SyncErrorRecord }
+  | { table: 'inventory_changes'; eventType: 'INSERT' | 'UPDATE'; record: InventoryChangeRecord }
+  | { table: 'data_conflicts'; eventType: 'INSERT' | 'UPDATE'; record: DataConflictRecord }
+  | { table: 'sync_status'; eventType: 'INSERT' | 'UPDATE'; record: SyncRunRecord }
+  | { table: SyncMonitorTable; eventType: 'DELETE'; id: string };
+
+export type SyncMonitorTable = 'sync_errors' | 'inventory_changes' | 'data_conflicts' | 'sync_status';
+
+// Newest rows shown per sync monitor list
+const SYNC_MONITOR_LIMIT = 100;
+
+const mapSyncError = (row: any): SyncErrorRecord => ({
+  id: row.id,
+  timestamp: row.timestamp,
+  type: row.type,
+  severity: row.severity,
+  message: row.message,
+  details: row.details ?? undefined,
+  resolved: !!row.resolved
+});
+
+const mapInventoryChange = (row: any): InventoryChangeRecord => ({
+  id: row.id,
+  timestamp: row.timestamp,
+  productId: row.product_id,
+  productName: row.product_name,
+  variantId: row.variant_id,
+  variantName: row.variant_name,
+  changeType: row.change_type,
+  oldValue: row.old_value ?? undefined,
+  newValue: row.new_value ?? undefined,
+  processed: !!row.processed
+});
+
+const mapDataConflict = (row: any): DataConflictRecord => ({
+  id: row.id,
+  timestamp: row.timestamp,
+  productId: row.product_id,
+  conflictType: row.conflict_type,
+  printfulData: row.printful_data,
+  localData: row.local_data,
+  resolution: row.resolution,
+  autoResolution: row.auto_resolution ?? undefined
+});
+
+const mapSyncRun = (row: any): SyncRunRecord => ({
+  id: row.id,
+  productId: row.product_id,
+  lastSync: row.last_sync ?? null,
+  lastSyncStatus: row.last_sync_status || 'unknown',
+  isSyncing: !!row.is_syncing,
+  syncProgress: row.sync_progress ?? 0,
+  timestamp: row.timestamp
+});
+
+const SYNC_MONITOR_MAPPERS: Record<SyncMonitorTable, (row: any) => any> = {
+  sync_errors: mapSyncError,
+  inventory_changes: mapInventoryChange,
+  data_conflicts: mapDataConflict,
+  sync_status: mapSyncRun
+};
+
 export interface ImageUploadResult {
   path: string;
   url: string;
@@ -110,6 +225,183 @@ export interface ImageUploadResult {
   mime_type: string;
 }
 
+// ===== CHANGE SETS =====
+// Edits are collected client-side and committed in one transaction by apply_admin_change_set
+
+export type ChangeSetTable =
+  | 'products'
+  | 'product_overrides'
+  | 'product_images'
+  | 'bundles'
+  | 'bundle_items'
+  | 'bundle_images'
+  | 'bundle_reviews';
+
+export interface ChangeSetOperation {
+  op: 'insert' | 'update' | 'delete';
+  table: ChangeSetTable;
+  id?: string;
+  ref?: string; // Caller's handle for an insert (e.g. a temp- image id), echoed back in the result
+  values?: Record<string, unknown>;
+}
+
+export interface ChangeSetRoot {
+  table: 'products' | 'bundles';
+  id: string;
+  version?: string | null; // updated_at the edits were based on; omitted to skip the check
+}
+
+export interface ChangeSetResult {
+  version: string | null; // New updated_at of the root
+  results: Array<{
+    op: ChangeSetOperation['op'];
+    table: ChangeSetTable;
+    id: string;
+    ref?: string | null;
+    row: any | null;
+  }>;
+}
+
+// Thrown when the product or bundle changed since the edits were started
+export class StaleChangeSetError extends Error {
+  constructor(message: string) {
+    super(message);
+    this.name = 'StaleChangeSetError';
+  }
+}
+
+export class AdminChangeSet {
+  readonly root: ChangeSetRoot | null;
+  private operations: ChangeSetOperation[] = [];
+
+  constructor(root: ChangeSetRoot | null = null) {
+    this.root = root;
+  }
+
+  insert(table: ChangeSetTable, values: Record<string, unknown>, ref?: string): this {
+    this.operations.push({ op: 'insert', table, values, ref });
+    return this;
+  }
+
+  // Updates to the same row are merged so each row is written once
+  update(table: ChangeSetTable, id: string, values: Record<string, unknown>): this {
+    const existing = this.operations.find(op => op.op === 'update' && op.table === table && op.id === id);
+    if (existing) {
+      existing.values = { ...existing.values, ...values };
+    } else {
+      this.operations.push({ op: 'update', table, id, values });
+    }
+    return this;
+  }
+
+  delete(table: ChangeSetTable, id: string): this {
+    this.operations = this.operations.filter(op => !(op.op === 'update' && op.table === table && op.id === id));
+    this.operations.push({ op: 'delete', table, id });
+    return this;
+  }
+
+  get size(): number {
+    return this.operations.length;
+  }
+
+  toOperations(): ChangeSetOperation[] {
+    return this.operations.map(op => ({ ...op }));
+  }
+}
+
+// ===== PRODUCT PAGES =====
+
+// Products load in keyset pages so the admin list can start rendering before the whole catalog arrives.
+// Search, filters and sort run in the query, so every page comes back already filtered and in order
+export const PRODUCTS_PAGE_SIZE = 50;
+
+// Sort keys the admin list offers, and the column each one orders by
+const PRODUCT_SORT_COLUMNS = {
+  created_at: 'created_at',
+  name: 'name',
+  price: 'price',
+  availability: 'is_available',
+  last_synced: 'updated_at'
+} as const;
+
+export type ProductsSortKey = keyof typeof PRODUCT_SORT_COLUMNS;
+
+export interface ProductsQuery {
+  search?: string;
+  category?: string;
+  isAvailable?: boolean;
+  minPrice?: number;
+  maxPrice?: number;
+  sortBy?: ProductsSortKey;
+  sortOrder?: 'asc' | 'desc';
+}
+
+// Sort column value and id of the last row on the previous page
+export interface ProductsPageCursor {
+  value: string | number | boolean | null;
+  id: string;
+}
+
+export interface ProductsPage {
+  products: any[];
+  nextCursor: ProductsPageCursor | null;
+}
+
+// Lightweight row for pickers and id lookups, loaded for the whole catalog
+export interface ProductSummary {
+  id: string;
+  name: string;
+  price: number | null;
+  category: string | null;
+  image_url: string | null;
+  is_available: boolean | null;
+}
+
+// Quote a value for a PostgREST filter string
+const filterValue = (value: string | number | boolean) =>
+  typeof value === 'string' ? `"${value.replace(/\\/g, '\\\\').replace(/"/g, '\\"')}"` : String(value);
+
+const ADMIN_PRODUCT_COLUMNS = `
+  id,
+  name,
+  description,
+  price,
+  image_url,
+  slug,
+  category,
+  tags,
+  reviews,
+  rating,
+  in_stock,
+  stock_count,
+  created_at,
+  updated_at,
+  printful_product_id,
+  printful_cost,
+  retail_price,
+  is_available,
+  product_overrides (
+    id,
+    printful_product_id,
+    custom_retail_price,
+    custom_description,
+    custom_name,
+    custom_category,
+    custom_tags,
+    is_active
+  ),
+  product_images (
+    id,
+    image_url,
+    image_order,
+    is_primary,
+    is_thumbnail,
+    variant_type,
+    color,
+    size
+  )
+`;
+
 // Admin Products API Client
 export class AdminProductsAPI {
   
@@ -120,46 +412,7 @@ export class AdminProductsAPI {
       // Get products with their admin overrides and images
       const { data, error } = await supabase
         .from('products')
-        .select(`
-          id,
-          name,
-          description,
-          price,
-          image_url,
-          slug,
-          category,
-          tags,
-          reviews,
-          rating,
-          in_stock,
-          stock_count,
-          created_at,
-          updated_at,
-          printful_product_id,
-          printful_cost,
-          retail_price,
-          is_available,
-          product_overrides (
-            id,
-            printful_product_id,
-            custom_retail_price,
-            custom_description,
-            custom_name,
-            custom_category,
-            custom_tags,
-            is_active
-          ),
-          product_images (
-            id,
-            image_url,
-            image_order,
-            is_primary,
-            is_thumbnail,
-            variant_type,
-            color,
-            size
-          )
-        `)
+        .select(ADMIN_PRODUCT_COLUMNS)
         .order('created_at', { ascending: false });
       
       if (error) {
@@ -167,63 +420,123 @@ export class AdminProductsAPI {
         throw new Error(`Failed to fetch products: ${error.message}`);
       }
       
-      // Transform the data to include admin overrides
-      const transformedProducts = (data || []).map(product => {
-        const override = product.product_overrides?.[0];
-        const images = product.product_images || [];
-        
-              // Debug logging to see what's happening with printful_product_id
-      console.log('Product data:', {
-        id: product.id,
-        name: product.name,
-        original_printful_id: product.printful_product_id,
-        override_printful_id: override?.printful_product_id,
-        has_override: !!override,
-        override_active: override?.is_active
-      });
-      
-      const finalPrintfulId = override?.printful_product_id || product.printful_product_id;
-      
-      console.log('Final printful_product_id:', finalPrintfulId);
-      
-      // Log the complete transformed product for debugging
-      const transformedProduct = {
-        ...product,
-        // Use override values if available, otherwise use original values
-        display_name: override?.custom_name || product.name,
-        display_description: override?.custom_description || product.description,
-        display_price: override?.custom_retail_price || product.retail_price || product.price,
-        display_category: override?.custom_category || product.category,
-        display_tags: override?.custom_tags || product.tags,
-        printful_product_id: finalPrintfulId,
-        has_override: !!override,
-        override_active: override?.is_active ?? false,
-        // Image management
-        primary_image: images.find(img => img.is_primary)?.image_url || product.image_url,
-        thumbnail_image: images.find(img => img.is_thumbnail)?.image_url || images.find(img => img.is_primary)?.image_url || product.image_url,
-        all_images: images.sort((a, b) => a.image_order - b.image_order),
-        image_count: images.length,
-        // Ensure printful_cost is handled properly
-        printful_cost: product.printful_cost || null,
-        retail_price: product.retail_price || product.price,
-        // Sync status - temporarily set to unknown since sync_status table is disabled
-        sync_status: 'unknown',
-        last_synced: null
-      };
-      
-      console.log('Complete transformed product:', transformedProduct);
-      
-      return transformedProduct;
-        
-        return transformedProduct;
-      });
-      
-      return transformedProducts;
+      return (data || []).map(product => this.transformProduct(product));
     } catch (error) {
       console.error('Error in getProducts:', error);
       return [];
     }
   }
+
+  // Every product, with only the columns pickers and name lookups need
+  async getProductSummaries(): Promise<ProductSummary[]> {
+    const { data, error } = await supabase
+      .from('products')
+      .select('id, name, price, category, image_url, is_available')
+      .order('name', { ascending: true });
+
+    if (error) {
+      console.error('Error fetching product summaries:', error);
+      throw new Error(`Failed to fetch products: ${error.message}`);
+    }
+
+    return data || [];
+  }
+
+  // Keyset page of products matching the query. Pass the previous page's nextCursor to continue.
+  async getProductsPage(
+    query: ProductsQuery = {},
+    cursor: ProductsPageCursor | null = null,
+    limit: number = PRODUCTS_PAGE_SIZE
+  ): Promise<ProductsPage> {
+    const column = PRODUCT_SORT_COLUMNS[query.sortBy ?? 'created_at'];
+    const ascending = (query.sortOrder ?? (query.sortBy ? 'asc' : 'desc')) === 'asc';
+
+    // id breaks ties in the same direction, so the order (and the cursor) is total.
+    // Nulls sort last either way
+    let request = supabase
+      .from('products')
+      .select(ADMIN_PRODUCT_COLUMNS)
+      .order(column, { ascending, nullsFirst: false })
+      .order('id', { ascending })
+      .limit(limit + 1);
+
+    // PostgREST filter syntax can't be escaped inside or(), so its reserved characters are dropped
+    const search = (query.search || '').replace(/[,()*"\\%]/g, ' ').trim();
+    if (search) {
+      request = request.or(`name.ilike.*${search}*,description.ilike.*${search}*`);
+    }
+    if (query.category) {
+      request = request.eq('category', query.category);
+    }
+    if (query.isAvailable !== undefined) {
+      request = request.eq('is_available', query.isAvailable);
+    }
+    if (query.minPrice !== undefined) {
+      request = request.gte('price', query.minPrice);
+    }
+    if (query.maxPrice !== undefined) {
+      request = request.lte('price', query.maxPrice);
+    }
+
+    if (cursor) {
+      const op = ascending ? 'gt' : 'lt';
+      request = cursor.value === null
+        ? request.is(column, null).filter('id', op, cursor.id)
+        : request.or(
+            `${column}.${op}.${filterValue(cursor.value)},` +
+            `and(${column}.eq.${filterValue(cursor.value)},id.${op}.${cursor.id}),` +
+            `${column}.is.null`
+          );
+    }
+
+    const { data, error } = await request;
+
+    if (error) {
+      console.error('Error fetching products page:', error);
+      throw new Error(`Failed to fetch products: ${error.message}`);
+    }
+
+    const rows = data || [];
+    const pageRows = rows.slice(0, limit);
+    const last = pageRows[pageRows.length - 1];
+
+    return {
+      products: pageRows.map(product => this.transformProduct(product)),
+      nextCursor: rows.length > limit && last ? { value: last[column] ?? null, id: last.id } : null
+    };
+  }
+
+  // Flatten overrides and images onto a product row for the admin screens
+  private transformProduct(product: any): any {
+    const override = product.product_overrides?.[0];
+    const images = [...(product.product_images || [])].sort((a, b) => a.image_order - b.image_order);
+    const primaryImage = images.find(img => img.is_primary);
+    const thumbnailImage = images.find(img => img.is_thumbnail) || primaryImage;
+
+    return {
+      ...product,
+      // Use override values if available, otherwise use original values
+      display_name: override?.custom_name || product.name,
+      display_description: override?.custom_description || product.description,
+      display_price: override?.custom_retail_price || product.retail_price || product.price,
+      display_category: override?.custom_category || product.category,
+      display_tags: override?.custom_tags || product.tags,
+      printful_product_id: override?.printful_product_id || product.printful_product_id,
+      has_override: !!override,
+      override_active: override?.is_active ?? false,
+      // Image management
+      primary_image: primaryImage?.image_url || product.image_url,
+      thumbnail_image: thumbnailImage?.image_url || product.image_url,
+      all_images: images,
+      image_count: images.length,
+      // Ensure printful_cost is handled properly
+      printful_cost: product.printful_cost || null,
+      retail_price: product.retail_price || product.price,
+      // Sync status - temporarily set to unknown since sync_status table is disabled
+      sync_status: 'unknown',
+      last_synced: null
+    };
+  }
   
   async createProduct(product: any): Promise<any> {
     const { data, error } = await supabase
@@ -267,6 +580,27 @@ export class AdminProductsAPI {
       throw new Error(`Failed to delete product: ${error.message}`);
     }
   }
+
+  /**
+   * Regenerate the static storefront catalog snapshot after product or image changes
+   */
+  async publishCatalogSnapshot(): Promise<{ version: number; skipped: boolean }> {
+    const { data: { session } } = await supabase.auth.getSession();
+
+    const response = await fetch(`${import.meta.env.VITE_SUPABASE_URL}/functions/v1/catalog-snapshot`, {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json',
+        'Authorization': `Bearer ${session?.access_token ?? import.meta.env.VITE_SUPABASE_ANON_KEY}`,
+      }
+    });
+
+    if (!response.ok) {
+      throw new Error(`Failed to publish catalog snapshot: ${response.statusText}`);
+    }
+
+    return response.json();
+  }
   
   // ===== PRODUCT OVERRIDES =====
   
@@ -929,37 +1263,158 @@ export class AdminProductsAPI {
     };
   }
   
-  async getSyncErrors(): Promise<any[]> {
-    // Temporarily disabled sync_errors table access to fix 400 errors
-    console.log('getSyncErrors called but sync_errors table is disabled');
-    return [];
+  // Newest rows of a sync monitor table. A missing or unreadable table yields an
+  // empty list so the monitor still opens.
+  private async listSyncMonitorRows<T>(table: SyncMonitorTable, map: (row: any) => T): Promise<T[]> {
+    const { data, error } = await supabase
+      .from(table)
+      .select('*')
+      .order('timestamp', { ascending: false })
+      .limit(SYNC_MONITOR_LIMIT);
+
+    if (error) {
+      console.warn(`Could not load ${table}:`, error.message);
+      return [];
+    }
+
+    return (data || []).map(map);
+  }
+
+  async getSyncErrors(): Promise<SyncErrorRecord[]> {
+    return this.listSyncMonitorRows('sync_errors', mapSyncError);
   }
   
-  async getInventoryChanges(): Promise<any[]> {
-    // Temporarily disabled inventory_changes table access to fix 400 errors
-    console.log('getInventoryChanges called but inventory_changes table is disabled');
-    return [];
+  async getInventoryChanges(): Promise<InventoryChangeRecord[]> {
+    return this.listSyncMonitorRows('inventory_changes', mapInventoryChange);
   }
   
-  async getDataConflicts(): Promise<any[]> {
-    // Temporarily disabled data_conflicts table access to fix 400 errors
-    console.log('getDataConflicts called but data_conflicts table is disabled');
-    return [];
+  async getDataConflicts(): Promise<DataConflictRecord[]> {
+    return this.listSyncMonitorRows('data_conflicts', mapDataConflict);
+  }
+
+  /**
+   * Everything the sync monitor shows, loaded in parallel. Later changes arrive
+   * through subscribeToSyncMonitor() rather than by reloading this.
+   */
+  async getSyncMonitorSnapshot(): Promise<SyncMonitorSnapshot> {
+    const [errors, inventoryChanges, dataConflicts, runs] = await Promise.all([
+      this.getSyncErrors(),
+      this.getInventoryChanges(),
+      this.getDataConflicts(),
+      this.listSyncMonitorRows('sync_status', mapSyncRun)
+    ]);
+
+    return { errors, inventoryChanges, dataConflicts, latestRun: runs[0] || null };
+  }
+
+  /**
+   * Push sync monitor row changes over Supabase Realtime.
+   * @param onChange - Called with each mapped row change
+   * @param onStatus - Called with true once subscribed, false if the channel fails or closes
+   * @returns Unsubscribe function that removes the channel
+   */
+  subscribeToSyncMonitor(
+    onChange: (change: SyncMonitorChange) => void,
+    onStatus?: (subscribed: boolean) => void
+  ): () => void {
+    let channel = supabase.channel('admin-sync-monitor');
+
+    for (const table of Object.keys(SYNC_MONITOR_MAPPERS) as SyncMonitorTable[]) {
+      channel = channel.on(
+        'postgres_changes',
+        { event: '*', schema: 'public', table },
+        (payload: any) => {
+          if (payload.eventType === 'DELETE') {
+            if (payload.old?.id) {
+              onChange({ table, eventType: 'DELETE', id: payload.old.id });
+            }
+            return;
+          }
+          onChange({
+            table,
+            eventType: payload.eventType,
+            record: SYNC_MONITOR_MAPPERS[table](payload.new)
+          } as SyncMonitorChange);
+        }
+      );
+    }
+
+    channel.subscribe((status) => {
+      onStatus?.(status === 'SUBSCRIBED');
+    });
+
+    return () => {
+      supabase.removeChannel(channel);
+    };
   }
   
   async resolveDataConflict(conflictId: string, resolution: string): Promise<void> {
-    // Temporarily disabled data_conflicts table access to fix 400 errors
-    console.log('resolveDataConflict called but data_conflicts table is disabled');
+    const { data: { user } } = await supabase.auth.getUser();
+    const { error } = await supabase
+      .from('data_conflicts')
+      .update({
+        resolution: resolution === 'manual' ? 'manual_review' : 'resolved',
+        auto_resolution: resolution,
+        resolved_at: new Date().toISOString(),
+        resolved_by: user?.id ?? null
+      })
+      .eq('id', conflictId);
+
+    if (error) {
+      console.error('Error resolving data conflict:', error);
+      throw new Error(`Failed to resolve data conflict: ${error.message}`);
+    }
   }
   
   async markErrorResolved(errorId: string): Promise<void> {
-    // Temporarily disabled sync_errors table access to fix 400 errors
-    console.log('markErrorResolved called but sync_errors table is disabled');
+    const { error } = await supabase
+      .from('sync_errors')
+      .update({ resolved: true })
+      .eq('id', errorId);
+
+    if (error) {
+      console.error('Error marking sync error resolved:', error);
+      throw new Error(`Failed to mark sync error resolved: ${error.message}`);
+    }
   }
   
   async markInventoryChangeProcessed(changeId: string): Promise<void> {
-    // Temporarily disabled inventory_changes table access to fix 400 errors
-    console.log('markInventoryChangeProcessed called but inventory_changes table is disabled');
+    const { error } = await supabase
+      .from('inventory_changes')
+      .update({ processed: true })
+      .eq('id', changeId);
+
+    if (error) {
+      console.error('Error marking inventory change processed:', error);
+      throw new Error(`Failed to mark inventory change processed: ${error.message}`);
+    }
+  }
+  
+  // ===== CHANGE SETS =====
+
+  /**
+   * Commit a change set in one round trip. All operations apply or none do.
+   * @throws StaleChangeSetError if the root product/bundle was modified since `root.version`
+   */
+  async commitChangeSet(changeSet: AdminChangeSet): Promise<ChangeSetResult> {
+    if (changeSet.size === 0) {
+      return { version: changeSet.root?.version ?? null, results: [] };
+    }
+
+    const { data, error } = await supabase.rpc('apply_admin_change_set', {
+      p_root: changeSet.root,
+      p_operations: changeSet.toOperations()
+    });
+
+    if (error) {
+      if (error.code === '40001') {
+        throw new StaleChangeSetError('This item was changed by someone else. Reload it and try again.');
+      }
+      console.error('Error committing change set:', error);
+      throw new Error(`Failed to save changes: ${error.message}`);
+    }
+
+    return data as ChangeSetResult;
   }
   
   // ===== BULK OPERATIONS =====
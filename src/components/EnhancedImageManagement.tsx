@@ -1,5 +1,5 @@
 import React, { useState, useCallback, useEffect, useRef } from 'react';
-import { useAdminProducts } from '../admin/contexts/AdminProductsContext';
+import { useAdminProducts, confirmReloadIfStale } from '../admin/contexts/AdminProductsContext';
 import DeleteConfirmationModal from './ui/DeleteConfirmationModal';
 import { 
   X, 
@@ -53,7 +53,7 @@ const EnhancedImageManagement: React.FC<ImageManagementProps> = ({
   variantColor,
   productVariants = []
 }) => {
-  const { uploadImage, createProductImage, deleteProductImage, fetchProductImages, updateProductImage, deleteImage } = useAdminProducts();
+  const { uploadImage, deleteProductImage, fetchProductImages, deleteImage, createChangeSet, commitChangeSet, productChangeSetRoot } = useAdminProducts();
   
   // Toast notification helper
   const showToast = (message: string, type: 'success' | 'error' | 'info' = 'success') => {
@@ -508,24 +508,21 @@ const EnhancedImageManagement: React.FC<ImageManagementProps> = ({
     try {
       console.log('🎯 Saving image order only...');
       
-      // Update only the image_order for existing images
+      // Every changed position goes out in one change set
+      const changeSet = createChangeSet(productChangeSetRoot(productId));
       for (const image of updatedImages) {
         if (!String(image.id).startsWith('temp-')) {
-          try {
-            await updateProductImage(image.id, {
-              image_order: image.image_order
-            });
-            console.log('✅ Updated order for image:', image.id, 'to order:', image.image_order);
-          } catch (error) {
-            console.error('❌ Failed to update image order:', image.id, error);
-          }
+          changeSet.update('product_images', image.id, { image_order: image.image_order });
         }
       }
+      await commitChangeSet(changeSet);
+      console.log('✅ Updated order for', changeSet.size, 'images');
       
       showToast('🎯 Image order saved!', 'success');
       console.log('✅ Image order saved successfully');
       
     } catch (error) {
+      if (confirmReloadIfStale(error)) return;
       console.error('❌ Failed to save image order:', error);
       showToast('❌ Failed to save image order', 'error');
     }
@@ -770,87 +767,67 @@ const EnhancedImageManagement: React.FC<ImageManagementProps> = ({
         return;
       }
       
-      // Save new images to database
+      // New images and changed existing ones are committed together in one transaction
+      const changeSet = createChangeSet(productChangeSetRoot(productId));
+
       for (const image of newImages) {
-        try {
-          // Validate required fields
-          if (!image.image_url) {
-            throw new Error(`Image missing image_url: ${JSON.stringify(image)}`);
-          }
-          if (!productId) {
-            throw new Error(`Missing productId: ${productId}`);
-          }
-          
-          const imageData = {
-            product_id: productId,
-            image_url: image.image_url,
-            image_order: image.image_order || 0,
-            is_primary: image.is_primary || false,
-            is_thumbnail: image.is_thumbnail || false,
-            variant_type: image.variant_type || 'product',
-            color: image.color || undefined,
-            size: image.size || undefined
-          };
-          
-          console.log('💾 Preparing to save image:', imageData);
-          console.log('📝 Image data validation passed');
-          
-          const savedImage = await createProductImage(imageData);
-          console.log('✅ Image saved successfully to database:', savedImage);
-          
-          // Replace temp image with saved image
-          setImages(prev => prev.map(img => 
-            img.id === image.id ? savedImage : img
-          ));
-          
-        } catch (error) {
-          console.error('❌ Failed to save image:', error);
-          console.error('❌ Failed image data:', image);
-          console.error('❌ Error stack:', error instanceof Error ? error.stack : 'No stack trace');
-          const errorMessage = error instanceof Error ? error.message : 'Unknown error occurred';
-          showToast(`❌ Failed to save image: ${errorMessage}`, 'error');
-          return; // Don't close modal if save fails
+        // Validate required fields
+        if (!image.image_url) {
+          showToast('❌ Failed to save image: image is missing its URL', 'error');
+          return;
         }
+        if (!productId) {
+          showToast('❌ Failed to save image: missing product', 'error');
+          return;
+        }
+        
+        changeSet.insert('product_images', {
+          product_id: productId,
+          image_url: image.image_url,
+          image_order: image.image_order || 0,
+          is_primary: image.is_primary || false,
+          is_thumbnail: image.is_thumbnail || false,
+          variant_type: image.variant_type || 'product',
+          color: image.color || null,
+          size: image.size || null
+        }, String(image.id));
       }
       
       // Update existing images if their properties changed
       for (const image of imagesToSave) {
-        try {
-          // Find the original image from currentImages to compare
-          const originalImage = currentImages.find(img => img.id === image.id);
-          if (originalImage && (
-            originalImage.is_primary !== image.is_primary ||
-            originalImage.is_thumbnail !== image.is_thumbnail ||
-            originalImage.image_order !== image.image_order
-          )) {
-            console.log('Updating existing image:', image.id, {
-              old: {
-                is_primary: originalImage.is_primary,
-                is_thumbnail: originalImage.is_thumbnail,
-                image_order: originalImage.image_order
-              },
-              new: {
-                is_primary: image.is_primary,
-                is_thumbnail: image.is_thumbnail,
-                image_order: image.image_order
-              }
-            });
-            
-            await updateProductImage(image.id, {
-              is_primary: image.is_primary,
-              is_thumbnail: image.is_thumbnail,
-              image_order: image.image_order
-            });
-            
-            console.log('✅ Image updated successfully:', image.id);
-          }
-        } catch (error) {
-          console.error('Failed to update image:', image.id, error);
-          const errorMessage = error instanceof Error ? error.message : 'Unknown error occurred';
-          showToast(`Failed to update image: ${errorMessage}`, 'error');
-          return; // Don't continue if update fails
+        const originalImage = currentImages.find(img => img.id === image.id);
+        if (originalImage && (
+          originalImage.is_primary !== image.is_primary ||
+          originalImage.is_thumbnail !== image.is_thumbnail ||
+          originalImage.image_order !== image.image_order
+        )) {
+          changeSet.update('product_images', image.id, {
+            is_primary: image.is_primary,
+            is_thumbnail: image.is_thumbnail,
+            image_order: image.image_order
+          });
         }
       }
+
+      console.log(`💾 Committing ${changeSet.size} image change(s) in one request`);
+      
+      let savedImages: ProductImage[] = images;
+      try {
+        const result = await commitChangeSet(changeSet);
+        
+        // Replace temp images with their saved rows
+        const savedByRef = new Map(
+          result.results.filter(r => r.op === 'insert' && r.ref).map(r => [r.ref as string, r.row as ProductImage])
+        );
+        savedImages = images.map(img => savedByRef.get(String(img.id)) || img);
+        setImages(savedImages);
+      } catch (error) {
+        if (confirmReloadIfStale(error)) return;
+        console.error('❌ Failed to save images:', error);
+        const errorMessage = error instanceof Error ? error.message : 'Unknown error occurred';
+        showToast(`❌ Failed to save images: ${errorMessage}`, 'error');
+        return; // Don't close modal if save fails
+      }
       
       console.log('✅ All images saved successfully');
       
@@ -860,7 +837,7 @@ const EnhancedImageManagement: React.FC<ImageManagementProps> = ({
       
       // Notify parent component of the updated images (this will refresh the modal)
       console.log('🔄 Notifying parent component of updates...');
-      onImagesUpdate(images);
+      onImagesUpdate(savedImages);
       
       // Don't automatically close modal - let user see the uploaded images
       console.log('✅ Images saved successfully! Modal stays open to show results.');
@@ -1,5 +1,5 @@
 import React, { useState, useRef, useCallback, useEffect } from 'react';
-import { useAdminProducts } from '../admin/contexts/AdminProductsContext';
+import { useAdminProducts, confirmReloadIfStale } from '../admin/contexts/AdminProductsContext';
 import DeleteConfirmationModal from './ui/DeleteConfirmationModal';
 import { 
   Upload, 
@@ -48,7 +48,7 @@ const ImageManagement: React.FC<ImageManagementProps> = ({
   onImagesUpdate,
   onClose
 }) => {
-  const { uploadImage, createProductImage, updateProductImage, deleteProductImage, reorderProductImages, deleteImage } = useAdminProducts();
+  const { uploadImage, createProductImage, deleteProductImage, reorderProductImages, deleteImage, createChangeSet, commitChangeSet, productChangeSetRoot } = useAdminProducts();
   
   // State management
   const [images, setImages] = useState<ProductImage[]>(currentImages);
@@ -338,13 +338,16 @@ const ImageManagement: React.FC<ImageManagementProps> = ({
         is_primary: img.id === imageId
       }));
       
-      // Update in database
+      // Update in database as one change set
+      const changeSet = createChangeSet(productChangeSetRoot(productId));
       for (const img of updatedImages) {
-        await updateProductImage(img.id, { is_primary: img.is_primary });
+        changeSet.update('product_images', img.id, { is_primary: img.is_primary });
       }
+      await commitChangeSet(changeSet);
       
       setImages(updatedImages);
     } catch (error) {
+      if (confirmReloadIfStale(error)) return;
       console.error('Failed to set primary image:', error);
     }
   };
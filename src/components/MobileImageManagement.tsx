@@ -1,5 +1,5 @@
 import React, { useState, useRef, useCallback, useEffect } from 'react';
-import { useAdminProducts } from '../admin/contexts/AdminProductsContext';
+import { useAdminProducts, confirmReloadIfStale } from '../admin/contexts/AdminProductsContext';
 import DeleteConfirmationModal from './ui/DeleteConfirmationModal';
 import { 
   Upload, 
@@ -50,7 +50,7 @@ const MobileImageManagement: React.FC<MobileImageManagementProps> = ({
   onImagesUpdate,
   onClose
 }) => {
-  const { uploadImage, createProductImage, updateProductImage, deleteProductImage, reorderProductImages, deleteImage } = useAdminProducts();
+  const { uploadImage, createProductImage, deleteProductImage, reorderProductImages, deleteImage, createChangeSet, commitChangeSet, productChangeSetRoot } = useAdminProducts();
   
   // State management
   const [images, setImages] = useState<ProductImage[]>(currentImages);
@@ -421,15 +421,15 @@ const MobileImageManagement: React.FC<MobileImageManagementProps> = ({
     
     const imageId = Array.from(selectedImages)[0];
     try {
-      // Update all images to not primary
+      // Clear the old primary and set the new one in a single change set
+      const changeSet = createChangeSet(productChangeSetRoot(productId));
       for (const image of images) {
-        if (image.isPrimary) {
-          await updateProductImage(image.id, { isPrimary: false });
+        if (image.isPrimary && image.id !== imageId) {
+          changeSet.update('product_images', image.id, { is_primary: false });
         }
       }
-      
-      // Set selected image as primary
-      await updateProductImage(imageId, { isPrimary: true });
+      changeSet.update('product_images', imageId, { is_primary: true });
+      await commitChangeSet(changeSet);
       
       // Update local state
       setImages(prev => prev.map(img => ({
@@ -441,9 +441,10 @@ const MobileImageManagement: React.FC<MobileImageManagementProps> = ({
       setIsSelectionMode(false);
       
     } catch (error) {
+      if (confirmReloadIfStale(error)) return;
       console.error('Failed to set primary image:', error);
     }
-  }, [selectedImages, images, updateProductImage]);
+  }, [selectedImages, images, productId, createChangeSet, commitChangeSet, productChangeSetRoot]);
 
   // Camera capture
   const handleCameraCapture = useCallback(async (e: React.ChangeEvent<HTMLInputElement>) => {
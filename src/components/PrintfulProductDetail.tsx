@@ -1,6 +1,7 @@
 import { useState, useEffect } from 'react'
 import { useCart } from '../contexts/CartContext'
 import pf, { h } from '../lib/printful/client'
+import { getImageSrcSet, PRODUCT_DETAIL_SIZES } from '../lib/image-renditions'
 
 interface PrintfulProduct {
   sync_product: {
@@ -277,6 +278,8 @@ export default function PrintfulProductDetail({ productId }: PrintfulProductDeta
           <div className="mb-4">
             <img 
               src={getMainImage()} 
+              srcSet={getImageSrcSet(getMainImage())}
+              sizes={PRODUCT_DETAIL_SIZES}
               alt={product.sync_product.name}
               className="w-full h-96 object-cover rounded-lg border"
             />
@@ -288,8 +291,9 @@ export default function PrintfulProductDetail({ productId }: PrintfulProductDeta
               {currentVariant.files.map((file, index) => (
                 <img 
                   key={`${file.id}-${index}`}
-                  src={file.preview_url || file.thumbnail_url} 
+                  src={file.thumbnail_url || file.preview_url} 
                   alt={`${product.sync_product.name} - ${file.type}`}
+                  loading="lazy"
                   className="w-full h-20 object-cover rounded border cursor-pointer hover:opacity-75 transition-opacity"
                   onClick={() => {
                     // Update main image when thumbnail is clicked
@@ -1,5 +1,12 @@
 import React, { useState, useEffect, useCallback } from 'react';
 import { useAdminProducts } from '../admin/contexts/AdminProductsContext';
+import type {
+  SyncErrorRecord,
+  InventoryChangeRecord,
+  DataConflictRecord,
+  SyncRunRecord,
+  SyncMonitorChange
+} from '../admin/lib/admin-products-api';
 import { 
   RefreshCw, 
   AlertCircle, 
@@ -33,39 +40,40 @@ interface SyncStatus {
   dataConflicts: number;
 }
 
-interface SyncError {
-  id: string;
-  timestamp: string;
-  type: 'connection' | 'inventory' | 'data' | 'webhook' | 'validation';
-  severity: 'low' | 'medium' | 'high' | 'critical';
-  message: string;
-  details?: string;
-  resolved: boolean;
-}
-
-interface InventoryChange {
-  id: string;
-  timestamp: string;
-  productId: string;
-  productName: string;
-  variantId: string;
-  variantName: string;
-  changeType: 'stock_update' | 'price_change' | 'availability_change' | 'new_variant';
-  oldValue?: string | number;
-  newValue?: string | number;
-  processed: boolean;
-}
+type SyncError = SyncErrorRecord;
+type InventoryChange = InventoryChangeRecord;
+type DataConflict = DataConflictRecord;
+
+// 'connecting' until the realtime channel reports in; polling only runs while 'down'
+type LiveState = 'connecting' | 'live' | 'down';
+
+// Upsert a pushed row into a newest-first list, or drop it on delete
+const applyRowChange = <T extends { id: string }>(
+  rows: T[],
+  change: { eventType: 'INSERT' | 'UPDATE' | 'DELETE'; record?: T; id?: string }
+): T[] => {
+  if (change.eventType === 'DELETE') {
+    return rows.filter(row => row.id !== change.id);
+  }
+
+  const record = change.record as T;
+  const index = rows.findIndex(row => row.id === record.id);
+  if (index === -1) {
+    return [record, ...rows];
+  }
+
+  const next = rows.slice();
+  next[index] = record;
+  return next;
+};
 
-interface DataConflict {
-  id: string;
-  timestamp: string;
-  productId: string;
-  conflictType: 'price_mismatch' | 'inventory_mismatch' | 'variant_mismatch' | 'data_corruption';
-  printfulData: any;
-  localData: any;
-  resolution: 'auto_resolved' | 'manual_review' | 'pending' | 'resolved';
-  autoResolution?: string;
-}
+// Same counts as get_current_sync_status()
+const countOpenItems = (errors: SyncError[], changes: InventoryChange[], conflicts: DataConflict[]) => ({
+  errorCount: errors.filter(e => !e.resolved).length,
+  warningCount: errors.filter(e => !e.resolved && e.severity === 'medium').length,
+  inventoryChanges: changes.filter(c => !c.processed).length,
+  dataConflicts: conflicts.filter(c => c.resolution === 'pending').length
+});
 
 interface PrintfulSyncMonitorProps {
   isOpen: boolean;
@@ -78,10 +86,8 @@ const PrintfulSyncMonitor: React.FC<PrintfulSyncMonitorProps> = ({
 }) => {
   const { 
     triggerPrintfulSync,
-    getPrintfulSyncStatus,
-    getSyncErrors,
-    getInventoryChanges,
-    getDataConflicts,
+    getSyncMonitorSnapshot,
+    subscribeToSyncMonitor,
     resolveDataConflict,
     markErrorResolved,
     markInventoryChangeProcessed
@@ -114,65 +120,114 @@ const PrintfulSyncMonitor: React.FC<PrintfulSyncMonitorProps> = ({
   
   const [activeTab, setActiveTab] = useState<'dashboard' | 'errors' | 'inventory' | 'conflicts' | 'settings'>('dashboard');
   const [autoRefresh, setAutoRefresh] = useState(true);
-  const [refreshInterval, setRefreshInterval] = useState(30000); // 30 seconds
+  const [refreshInterval, setRefreshInterval] = useState(30000); // 30 seconds, fallback polling only
+  const [liveState, setLiveState] = useState<LiveState>('connecting');
 
-  // Load initial data
+  // Keep the summary counts in step with the lists, however they changed
   useEffect(() => {
-    if (isOpen) {
-      loadSyncData();
-      startAutoRefresh();
-    }
-    
-    return () => {
-      stopAutoRefresh();
-    };
-  }, [isOpen]);
-
-  // Auto-refresh functionality
-  const startAutoRefresh = useCallback(() => {
-    if (autoRefresh) {
-      const interval = setInterval(() => {
-        loadSyncData();
-      }, refreshInterval);
-      
-      return () => clearInterval(interval);
-    }
-  }, [autoRefresh, refreshInterval]);
-
-  const stopAutoRefresh = useCallback(() => {
-    // Clear any existing intervals
-  }, []);
+    setSyncStatus(prev => ({ ...prev, ...countOpenItems(syncErrors, inventoryChanges, dataConflicts) }));
+  }, [syncErrors, inventoryChanges, dataConflicts]);
+
+  const applySyncRun = (run: SyncRunRecord) => {
+    setSyncStatus(prev => ({
+      ...prev,
+      lastSync: run.lastSync,
+      lastSyncStatus: run.lastSyncStatus,
+      isSyncing: run.isSyncing,
+      syncProgress: run.syncProgress
+    }));
+  };
 
-  // Load sync data
-  const loadSyncData = async () => {
+  // Load sync data (full snapshot). Runs once when the live channel connects or reconnects,
+  // and on each tick of the fallback poller while it's down.
+  const loadSyncData = useCallback(async (announce: boolean = false) => {
     try {
-      // Load sync status
-      const status = await getPrintfulSyncStatus();
-      setSyncStatus(status);
-      
-      // Load sync errors
-      const errors = await getSyncErrors();
-      setSyncErrors(errors);
-      
-      // Load inventory changes
-      const changes = await getInventoryChanges();
-      setInventoryChanges(changes);
-      
-      // Load data conflicts
-      const conflicts = await getDataConflicts();
-      setDataConflicts(conflicts);
-      
-      // Update notification counts
-      updateNotifications(status, errors, changes, conflicts);
-      
+      const snapshot = await getSyncMonitorSnapshot();
+      setSyncErrors(snapshot.errors);
+      setInventoryChanges(snapshot.inventoryChanges);
+      setDataConflicts(snapshot.dataConflicts);
+      if (snapshot.latestRun) {
+        applySyncRun(snapshot.latestRun);
+      }
+      setSyncStatus(prev => ({ ...prev, isConnected: true }));
+
+      if (announce) {
+        updateNotifications(countOpenItems(snapshot.errors, snapshot.inventoryChanges, snapshot.dataConflicts));
+      }
     } catch (error) {
       console.error('Failed to load sync data:', error);
+      setSyncStatus(prev => ({ ...prev, isConnected: false, connectionHealth: 'disconnected' }));
       addNotification('error', 'Failed to load sync data');
     }
-  };
+  }, [getSyncMonitorSnapshot]);
+
+  // Realtime subscription while the panel is open
+  useEffect(() => {
+    if (!isOpen) return;
+
+    let announced = false;
+    setLiveState('connecting');
+
+    const unsubscribe = subscribeToSyncMonitor((change: SyncMonitorChange) => {
+      switch (change.table) {
+        case 'sync_errors':
+          setSyncErrors(prev => applyRowChange(prev, change));
+          if (change.eventType === 'INSERT') {
+            addNotification('error', `Sync error: ${change.record.message}`);
+          }
+          break;
+        case 'inventory_changes':
+          setInventoryChanges(prev => applyRowChange(prev, change));
+          break;
+        case 'data_conflicts':
+          setDataConflicts(prev => applyRowChange(prev, change));
+          if (change.eventType === 'INSERT') {
+            addNotification('warning', `New data conflict on product ${change.record.productId}`);
+          }
+          break;
+        case 'sync_status':
+          if (change.eventType !== 'DELETE') {
+            applySyncRun(change.record);
+          }
+          break;
+      }
+    }, (subscribed) => {
+      setLiveState(subscribed ? 'live' : 'down');
+      if (subscribed) {
+        // Catch up on anything missed before (re)connecting, then rely on pushes
+        loadSyncData(!announced);
+        announced = true;
+      }
+    });
+
+    return () => {
+      unsubscribe();
+      setLiveState('connecting');
+    };
+  }, [isOpen, subscribeToSyncMonitor, loadSyncData]);
+
+  // Single fallback poller, only while the realtime channel is down
+  useEffect(() => {
+    if (!isOpen || liveState !== 'down' || !autoRefresh) return;
+
+    loadSyncData();
+    const interval = setInterval(() => {
+      loadSyncData();
+    }, refreshInterval);
+
+    return () => clearInterval(interval);
+  }, [isOpen, liveState, autoRefresh, refreshInterval, loadSyncData]);
 
-  // Update notifications based on current status
-  const updateNotifications = (status: SyncStatus, errors: SyncError[], changes: InventoryChange[], conflicts: DataConflict[]) => {
+  // Connection badge reflects how the monitor is receiving data
+  useEffect(() => {
+    setSyncStatus(prev => {
+      if (!prev.isConnected) return prev;
+      return { ...prev, connectionHealth: liveState === 'live' ? 'excellent' : liveState === 'down' ? 'poor' : 'good' };
+    });
+  }, [liveState, syncStatus.isConnected]);
+
+  // Notify about open items when the panel first loads
+  const updateNotifications = (counts: ReturnType<typeof countOpenItems>) => {
     const newNotifications: Array<{
       id: string;
       type: 'success' | 'warning' | 'error' | 'info';
@@ -181,45 +236,34 @@ const PrintfulSyncMonitor: React.FC<PrintfulSyncMonitorProps> = ({
       read: boolean;
     }> = [];
 
-    // Connection status notifications
-    if (!status.isConnected) {
-      newNotifications.push({
-        id: `conn-${Date.now()}`,
-        type: 'error',
-        message: 'Printful connection lost',
-        timestamp: new Date().toISOString(),
-        read: false
-      });
-    }
-
     // Sync error notifications
-    if (status.errorCount > 0) {
+    if (counts.errorCount > 0) {
       newNotifications.push({
         id: `error-${Date.now()}`,
         type: 'error',
-        message: `${status.errorCount} sync error(s) detected`,
+        message: `${counts.errorCount} sync error(s) detected`,
         timestamp: new Date().toISOString(),
         read: false
       });
     }
 
     // Inventory change notifications
-    if (status.inventoryChanges > 0) {
+    if (counts.inventoryChanges > 0) {
       newNotifications.push({
         id: `inventory-${Date.now()}`,
         type: 'info',
-        message: `${status.inventoryChanges} inventory change(s) detected`,
+        message: `${counts.inventoryChanges} inventory change(s) detected`,
         timestamp: new Date().toISOString(),
         read: false
       });
     }
 
     // Data conflict notifications
-    if (status.dataConflicts > 0) {
+    if (counts.dataConflicts > 0) {
       newNotifications.push({
         id: `conflict-${Date.now()}`,
         type: 'warning',
-        message: `${status.dataConflicts} data conflict(s) detected`,
+        message: `${counts.dataConflicts} data conflict(s) detected`,
         timestamp: new Date().toISOString(),
         read: false
       });
@@ -232,7 +276,7 @@ const PrintfulSyncMonitor: React.FC<PrintfulSyncMonitorProps> = ({
   // Add notification
   const addNotification = (type: 'success' | 'warning' | 'error' | 'info', message: string) => {
     const notification = {
-      id: `notif-${Date.now()}`,
+      id: `notif-${Date.now()}-${Math.random().toString(36).slice(2, 7)}`,
       type,
       message,
       timestamp: new Date().toISOString(),
@@ -281,10 +325,10 @@ const PrintfulSyncMonitor: React.FC<PrintfulSyncMonitorProps> = ({
       
       addNotification('success', 'Manual sync completed successfully');
       
-      // Refresh data after sync
-      setTimeout(() => {
+      // Sync results are pushed while live; otherwise pick them up now
+      if (liveState !== 'live') {
         loadSyncData();
-      }, 1000);
+      }
       
     } catch (error) {
       setSyncStatus(prev => ({ 
@@ -303,9 +347,12 @@ const PrintfulSyncMonitor: React.FC<PrintfulSyncMonitorProps> = ({
     try {
       await resolveDataConflict(conflictId, resolution);
       
-      // Refresh conflicts
-      const conflicts = await getDataConflicts();
-      setDataConflicts(conflicts);
+      // Apply locally; the realtime update that follows carries the stored row
+      setDataConflicts(prev => prev.map(c =>
+        c.id === conflictId
+          ? { ...c, resolution: resolution === 'manual' ? 'manual_review' : 'resolved', autoResolution: resolution }
+          : c
+      ));
       
       addNotification('success', 'Data conflict resolved successfully');
       
@@ -319,9 +366,7 @@ const PrintfulSyncMonitor: React.FC<PrintfulSyncMonitorProps> = ({
     try {
       await markErrorResolved(errorId);
       
-      // Refresh errors
-      const errors = await getSyncErrors();
-      setSyncErrors(errors);
+      setSyncErrors(prev => prev.map(e => e.id === errorId ? { ...e, resolved: true } : e));
       
       addNotification('success', 'Error marked as resolved');
       
@@ -335,9 +380,7 @@ const PrintfulSyncMonitor: React.FC<PrintfulSyncMonitorProps> = ({
     try {
       await markInventoryChangeProcessed(changeId);
       
-      // Refresh changes
-      const changes = await getInventoryChanges();
-      setInventoryChanges(changes);
+      setInventoryChanges(prev => prev.map(c => c.id === changeId ? { ...c, processed: true } : c));
       
       addNotification('success', 'Inventory change marked as processed');
       
@@ -535,7 +578,7 @@ const PrintfulSyncMonitor: React.FC<PrintfulSyncMonitorProps> = ({
                         <span className="ml-2 text-sm text-gray-700">Auto-refresh</span>
                       </label>
                       <button
-                        onClick={loadSyncData}
+                        onClick={() => loadSyncData()}
                         className="px-3 py-2 text-sm font-medium text-gray-700 bg-gray-100 border border-gray-300 rounded-md hover:bg-gray-200"
                       >
                         <RefreshCw className="h-4 w-4" />
@@ -887,7 +930,7 @@ const PrintfulSyncMonitor: React.FC<PrintfulSyncMonitorProps> = ({
                         </span>
                       </label>
                       <p className="text-sm text-gray-500 mt-1">
-                        Automatically refresh sync data every 30 seconds
+                        Changes are pushed live; sync data is polled only while the live connection is down
                       </p>
                     </div>
                     
@@ -13,6 +13,7 @@ import {
   Eye,
   Loader2
 } from 'lucide-react';
+import { getImageSrcSet, PRODUCT_CARD_SIZES } from '../lib/image-renditions';
 
 interface ProductDisplayProps {
   printfulProductId: string;
@@ -314,6 +315,8 @@ const ProductDisplay: React.FC<ProductDisplayProps> = ({
             
             <img
               src={primaryImage.imageUrl}
+              srcSet={getImageSrcSet(primaryImage.imageUrl)}
+              sizes={PRODUCT_CARD_SIZES}
               alt={productName}
               className={`w-full h-full object-cover transition-opacity duration-200 ${
                 imageLoading ? 'opacity-0' : 'opacity-100'
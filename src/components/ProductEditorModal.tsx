@@ -1,5 +1,5 @@
 import React, { useState, useEffect, useRef } from 'react';
-import { useAdminProducts } from '../admin/contexts/AdminProductsContext';
+import { useAdminProducts, confirmReloadIfStale } from '../admin/contexts/AdminProductsContext';
 import { 
   X, 
   Save, 
@@ -69,10 +69,12 @@ const ProductEditorModal: React.FC<ProductEditorModalProps> = ({
     createProductOverride,
     updateProductOverride,
     createProductImage,
-    updateProductImage,
     deleteProductImage,
     reorderProductImages,
-    uploadImage
+    uploadImage,
+    createChangeSet,
+    commitChangeSet,
+    productChangeSetRoot
   } = useAdminProducts();
 
   // Form state
@@ -271,6 +273,8 @@ const ProductEditorModal: React.FC<ProductEditorModalProps> = ({
 
   // Set primary image
   const handleSetPrimary = async (imageId: string) => {
+    if (!product) return;
+    
     try {
       // Update all images to not primary
       const updatedImages = images.map(img => ({
@@ -278,13 +282,16 @@ const ProductEditorModal: React.FC<ProductEditorModalProps> = ({
         is_primary: img.id === imageId
       }));
       
-      // Update in database
+      // Update in database as one change set
+      const changeSet = createChangeSet(productChangeSetRoot(product.id));
       for (const img of updatedImages) {
-        await updateProductImage(img.id, { is_primary: img.is_primary });
+        changeSet.update('product_images', img.id, { is_primary: img.is_primary });
       }
+      await commitChangeSet(changeSet);
       
       setImages(updatedImages);
     } catch (error) {
+      if (confirmReloadIfStale(error)) return;
       console.error('Failed to set primary image:', error);
     }
   };
@@ -98,6 +98,7 @@ const TopSellers = ({ onViewAllClick }: TopSellersProps) => {
       category: mergedProduct.category,
       price_pence: calculatePrice(),
       image_url: mergedProduct.image_url,
+      image_renditions: mergedProduct.image_renditions,
       slug: generateSlug(mergedProduct.name, mergedProduct.id),
       dateAdded: mergedProduct.baseProduct?.dateAdded || new Date().toISOString(),
       created_at: mergedProduct.baseProduct?.created_at || new Date().toISOString(),
@@ -21,6 +21,8 @@ import { useShipping } from '../../contexts/ShippingContext';
 import { createCheckoutSession } from '../../lib/stripe';
 import ShippingOptions from '../ShippingOptions';
 import { useShippingQuotes } from '../../hooks/useShippingQuotes';
+import { isQuotableRecipient } from '../../lib/shipping/quotes';
+import { readStoredCart } from '../../lib/cart-store';
 import ShippingMethods from './ShippingMethods';
 import type { ShippingOption } from '../../lib/shipping/types';
 import { expandBundlesForShipping } from '../../lib/bundle-utils';
@@ -60,17 +62,10 @@ const CheckoutPage = ({ onBack }: CheckoutPageProps) => {
   useEffect(() => {
     // If user navigates directly to checkout with empty cart, try to restore from localStorage
     if (cartItems.length === 0) {
-      const savedCart = localStorage.getItem('reformuk-cart');
-      if (savedCart) {
-        try {
-          const items = JSON.parse(savedCart);
-          items.forEach((item: any) => {
-            addToCart(item);
-          });
-        } catch (error) {
-          console.error('Failed to restore cart from localStorage:', error);
-        }
-      }
+      const savedCart = readStoredCart();
+      savedCart?.items.forEach(item => {
+        addToCart(item);
+      });
     }
   }, []); // Only run once on mount
 
@@ -148,11 +143,12 @@ const CheckoutPage = ({ onBack }: CheckoutPageProps) => {
   // Calculate final total with promo discount
   const finalTotal = total - promoDiscount;
   
-  // Fetch shipping rates when address changes
+  // Prefetch shipping rates as soon as country and postcode are valid.
+  // fetchQuotes debounces typing and cancels superseded requests; the rates land in the
+  // session quote cache, so fetchShippingRates on Continue is usually served from it.
   useEffect(() => {
     const recipient = convertToRecipient(shippingInfo);
-    if (isAddressComplete(recipient) && cartItems.length > 0) {
-      // Use the new shipping quotes hook
+    if (isQuotableRecipient(recipient) && cartItems.length > 0) {
       // Expand bundles into individual items for accurate shipping calculation
       const expandedItems = expandBundlesForShipping(cartItems);
       
@@ -165,7 +161,7 @@ const CheckoutPage = ({ onBack }: CheckoutPageProps) => {
         // Silent error handling for production
       });
     }
-  }, [shippingInfo.address, shippingInfo.city, shippingInfo.postcode, shippingInfo.country, cartItems.length, convertToRecipient, isAddressComplete, fetchQuotes]);
+  }, [shippingInfo.address, shippingInfo.city, shippingInfo.postcode, shippingInfo.country, cartItems, convertToRecipient, fetchQuotes]);
   
   // Email validation function
   const validateEmail = (email: string): boolean => {
@@ -4,6 +4,7 @@ import { useShippingQuotes } from '../../hooks/useShippingQuotes'
 import ShippingMethods from './ShippingMethods'
 import type { ShippingOption, Recipient } from '../../lib/shipping/types'
 import { getCountryCode } from '../../lib/shipping/printful'
+import { isQuotableRecipient } from '../../lib/shipping/quotes'
 import { useCart } from '../../contexts/CartContext'
 import { expandBundlesForShipping } from '../../lib/bundle-utils'
 
@@ -30,16 +31,19 @@ export default function ShippingSection({
 
   const [addressComplete, setAddressComplete] = useState(false)
 
-  // Check if address is complete enough to fetch shipping quotes
+  // Rates only depend on country and postcode, so quote as soon as those are valid
   useEffect(() => {
-    const isComplete = !!(address.address1 && address.city && address.postcode)
+    const isComplete = isQuotableRecipient({
+      country_code: getCountryCode(address.country),
+      zip: address.postcode
+    })
     setAddressComplete(isComplete)
     
     // Clear quotes when address becomes incomplete
     if (!isComplete) {
       clearQuotes()
     }
-  }, [address.address1, address.city, address.postcode, clearQuotes])
+  }, [address.country, address.postcode, clearQuotes])
 
   // Fetch shipping quotes when address is complete and cart has items
   useEffect(() => {
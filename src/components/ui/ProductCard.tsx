@@ -3,6 +3,7 @@ import { Link } from 'react-router-dom';
 import { Star, Truck, ChevronRight, ShoppingCart } from 'lucide-react';
 import { Product } from '../../lib/api';
 import { useCart } from '../../contexts/CartContext';
+import { getImageSrcSet, PRODUCT_CARD_SIZES } from '../../lib/image-renditions';
 
 interface ProductCardProps {
   product: Product;
@@ -89,6 +90,8 @@ const ProductCard: React.FC<ProductCardProps> = ({ product }) => {
         {product.image_url && !imageError ? (
           <img 
             src={product.image_url} 
+            srcSet={getImageSrcSet(product.image_url, product.image_renditions)}
+            sizes={PRODUCT_CARD_SIZES}
             alt={product.name}
             loading="lazy" // Add lazy loading for performance
             className={`object-cover w-full h-full group-hover:scale-105 transition-transform duration-200 ${
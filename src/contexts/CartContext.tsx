@@ -1,5 +1,17 @@
-import React, { createContext, useContext, useState, ReactNode, useEffect } from 'react';
+import React, { createContext, useContext, useState, ReactNode, useEffect, useRef, useCallback } from 'react';
 import { getVariantPricing } from '../lib/printful/pricing';
+import { useAuth } from './AuthContext';
+import {
+  CART_SERVER_SYNC_DELAY_MS,
+  createCartPersister,
+  loadServerCart,
+  mergeCarts,
+  readStoredCart,
+  saveServerCart,
+  subscribeToCartChanges,
+  type CartPersister,
+  type CartSnapshot
+} from '../lib/cart-store';
 
 export interface BundleContent {
   name: string;
@@ -58,43 +70,138 @@ interface CartProviderProps {
 }
 
 export const CartProvider: React.FC<CartProviderProps> = ({ children }) => {
-  const [cartItems, setCartItems] = useState<CartItem[]>([])
-  const [isCartOpen, setIsCartOpen] = useState(false)
+  // Read the saved cart synchronously so the first render already has it
+  const [initialCart] = useState<CartSnapshot>(() => readStoredCart() ?? { items: [], savedAt: 0 });
+  const [cartItems, setCartItems] = useState<CartItem[]>(initialCart.items);
+  const [isCartOpen, setIsCartOpen] = useState(false);
+  const { user } = useAuth();
+  const userId = user?.id ?? null;
+
+  const cartItemsRef = useRef(cartItems);
+  cartItemsRef.current = cartItems;
+
+  // savedAt of the cart currently in state, for last-writer-wins against other tabs and devices
+  const savedAtRef = useRef(initialCart.savedAt);
+  // Account the cart in state was saved under - null means it was built while signed out
+  const ownerRef = useRef<string | null>(initialCart.owner ?? null);
+  // Items that came from storage or another tab are already saved, so they aren't written back
+  const persistedItemsRef = useRef<CartItem[] | null>(initialCart.items);
+  const persisterRef = useRef<CartPersister | null>(null);
+  const serverSyncTimer = useRef<ReturnType<typeof setTimeout> | null>(null);
 
-  // Load cart from localStorage on mount
   useEffect(() => {
-    try {
-      const savedCart = localStorage.getItem('reformuk-cart');
-      if (savedCart) {
-        const parsedCart = JSON.parse(savedCart);
-        setCartItems(parsedCart);
-    
-      }
-    } catch (error) {
-      console.error('Error loading cart from localStorage:', error);
-      // Clear corrupted localStorage data
-      localStorage.removeItem('reformuk-cart');
-    }
+    const persister = createCartPersister();
+    persisterRef.current = persister;
+    return () => {
+      persister.dispose();
+      persisterRef.current = null;
+      if (serverSyncTimer.current) clearTimeout(serverSyncTimer.current);
+    };
   }, []);
 
-  // Save cart to localStorage whenever it changes
+  // Apply carts saved by other tabs
   useEffect(() => {
-    try {
-      localStorage.setItem('reformuk-cart', JSON.stringify(cartItems));
-    } catch (error) {
-      console.error('Error saving cart to localStorage:', error);
-    }
-  }, [cartItems]);
+    return subscribeToCartChanges(snapshot => {
+      if (snapshot.savedAt < savedAtRef.current) return;
+      savedAtRef.current = snapshot.savedAt;
+      ownerRef.current = snapshot.owner ?? null;
+      persistedItemsRef.current = snapshot.items;
+      setCartItems(snapshot.items);
+    });
+  }, []);
+
+  // Take a cart saved elsewhere as-is: it keeps its savedAt and is only written locally
+  const adoptCart = useCallback((snapshot: CartSnapshot, owner: string) => {
+    const adopted = { items: snapshot.items, savedAt: snapshot.savedAt, owner };
+    savedAtRef.current = adopted.savedAt;
+    ownerRef.current = owner;
+    persistedItemsRef.current = adopted.items;
+    persisterRef.current?.schedule(adopted);
+    setCartItems(adopted.items);
+  }, []);
 
-  // Debug cart state changes
+  const syncToServer = useCallback((snapshot: CartSnapshot, owner: string) => {
+    saveServerCart(snapshot)
+      .then(winner => {
+        // Another device saved later - take its cart
+        if (winner && winner.savedAt > savedAtRef.current) {
+          adoptCart(winner, owner);
+        }
+      })
+      .catch(error => {
+        console.warn('Background cart sync failed:', error);
+      });
+  }, [adoptCart]);
+
+  // Coalesced local save on every change; signed-in shoppers also get a delayed server save
   useEffect(() => {
+    if (cartItems === persistedItemsRef.current) return;
+    persistedItemsRef.current = null;
+
+    const snapshot = { items: cartItems, savedAt: Math.max(Date.now(), savedAtRef.current + 1), owner: userId };
+    savedAtRef.current = snapshot.savedAt;
+    ownerRef.current = userId;
+    persisterRef.current?.schedule(snapshot);
 
-  }, [cartItems])
+    if (userId) {
+      if (serverSyncTimer.current) clearTimeout(serverSyncTimer.current);
+      serverSyncTimer.current = setTimeout(() => {
+        serverSyncTimer.current = null;
+        syncToServer(snapshot, userId);
+      }, CART_SERVER_SYNC_DELAY_MS);
+    }
+  }, [cartItems, userId, syncToServer]);
 
-  // Initialize cart context
+  // Reconcile this device's cart with the saved one once the shopper is known. Only a cart
+  // built while signed out is merged in; a cart already saved under this account (e.g. on a
+  // page reload) is last-writer-wins, so items removed on either side don't come back
   useEffect(() => {
+    if (!userId) return;
+    let cancelled = false;
+
+    loadServerCart(userId)
+      .then(serverCart => {
+        if (cancelled) return;
+        const localCart = { items: cartItemsRef.current, savedAt: savedAtRef.current };
+        const localOwner = ownerRef.current;
+
+        if (localOwner === userId) {
+          if (serverCart && serverCart.savedAt > localCart.savedAt) {
+            adoptCart(serverCart, userId);
+          } else if (localCart.items.length > 0 || serverCart) {
+            syncToServer(localCart, userId);
+          }
+          return;
+        }
+
+        if (localOwner !== null) {
+          // Left behind by another account on this device - never mix it into this one
+          adoptCart(serverCart ?? { items: [], savedAt: Date.now() }, userId);
+          return;
+        }
+
+        if (localCart.items.length === 0) {
+          if (serverCart) adoptCart(serverCart, userId);
+          return;
+        }
+
+        if (!serverCart) {
+          // New array so the save effect claims the anonymous cart for this account and uploads it
+          setCartItems([...localCart.items]);
+          return;
+        }
+
+        // The merged cart is a new array, so the save effect writes it locally and to the server
+        setCartItems(mergeCarts(localCart, serverCart));
+      })
+      .catch(error => {
+        console.warn('Failed to load saved cart:', error);
+      });
 
-  }, [])
+    return () => {
+      cancelled = true;
+    };
+  }, [userId, syncToServer, adoptCart]);
 
   const addToCart = (product: Omit<CartItem, 'quantity'>) => {
     try {
@@ -1,6 +1,8 @@
-import React, { createContext, useContext, useState, ReactNode, useCallback } from 'react'
+import React, { createContext, useContext, useState, ReactNode, useCallback, useEffect, useRef } from 'react'
 import { useCart } from './CartContext'
-import { getShippingRates, validateShippingAddress, getCountryCode } from '../lib/shipping/printful'
+import { getCountryCode } from '../lib/shipping/printful'
+import { createQuoteScheduler, isQuotableRecipient } from '../lib/shipping/quotes'
+import { expandBundlesForShipping } from '../lib/bundle-utils'
 import { updatePaymentIntentWithShipping, createShippingSelectionRequest, validateShippingSelection } from '../lib/shipping/checkout'
 import type { 
   ShippingOption, 
@@ -18,6 +20,7 @@ interface ShippingContextType {
   
   // Actions
   fetchShippingRates: (recipient: Recipient) => Promise<void>
+  prefetchShippingRates: (recipient: Partial<Recipient>) => void
   selectShippingOption: (option: ShippingOption) => void
   updatePaymentIntent: (paymentIntentId: string, taxTotal?: number, orderDraftId?: string) => Promise<any>
   clearShippingRates: () => void
@@ -29,6 +32,27 @@ interface ShippingContextType {
   convertToRecipient: (shippingInfo: any) => Recipient
 }
 
+const FALLBACK_OPTIONS: ShippingOption[] = [
+  {
+    id: 'standard-uk',
+    name: 'Standard UK Delivery',
+    rate: '4.99',
+    currency: 'GBP',
+    minDeliveryDays: 3,
+    maxDeliveryDays: 5,
+    carrier: 'Royal Mail'
+  },
+  {
+    id: 'express-uk',
+    name: 'Express UK Delivery',
+    rate: '8.99',
+    currency: 'GBP',
+    minDeliveryDays: 1,
+    maxDeliveryDays: 2,
+    carrier: 'DHL Express'
+  }
+]
+
 const ShippingContext = createContext<ShippingContextType | undefined>(undefined)
 
 export const useShipping = () => {
@@ -51,16 +75,27 @@ export const ShippingProvider: React.FC<ShippingProviderProps> = ({ children })
   const [isLoadingRates, setIsLoadingRates] = useState(false)
   const [shippingError, setShippingError] = useState<string | null>(null)
 
-  // Convert cart items to shipping format
+  // Convert cart items to shipping format (bundles expanded, matching the checkout quote requests)
   const getShippingCartItems = useCallback((): ShippingCartItem[] => {
-    return cartItems.map(item => ({
-      printful_variant_id: item.printful_variant_id || parseInt(item.id.toString()), // Use printful_variant_id if available, fallback to id
-      quantity: item.quantity
-    }))
+    return expandBundlesForShipping(cartItems)
   }, [cartItems])
 
-  // Fetch shipping rates from Printful
-  const fetchShippingRates = useCallback(async (recipient: Recipient) => {
+  // One scheduler for the provider: a newer request cancels the previous one, and
+  // rates prefetched while the address is typed are reused from the session cache
+  const schedulerRef = useRef(createQuoteScheduler())
+
+  useEffect(() => {
+    const scheduler = schedulerRef.current
+    return () => scheduler.cancel()
+  }, [])
+
+  const applyShippingOptions = useCallback((options: ShippingOption[]) => {
+    setShippingOptions(options)
+    // Auto-select the first option if none selected
+    setSelectedShippingOption(prev => prev ?? options[0] ?? null)
+  }, [])
+
+  const requestShippingRates = useCallback(async (recipient: Recipient, immediate: boolean) => {
     if (cartItems.length === 0) {
       setShippingError('No items in cart')
       return
@@ -75,18 +110,8 @@ export const ShippingProvider: React.FC<ShippingProviderProps> = ({ children })
         items: getShippingCartItems()
       }
 
-      console.log('🚚 ShippingContext: Sending request to Printful:', {
-        recipient,
-        items: request.items,
-        cartItems: cartItems.map(item => ({
-          id: item.id,
-          name: item.name,
-          printful_variant_id: item.printful_variant_id,
-          quantity: item.quantity
-        }))
-      });
-
-      const response: ShippingQuoteResponse = await getShippingRates(request)
+      const response: ShippingQuoteResponse | null = await schedulerRef.current.quote(request, { immediate })
+      if (!response) return // Superseded by a newer request, which owns the loading state
       
       console.log('🚚 ShippingContext: Received response:', {
         hasOptions: !!response.options,
@@ -95,77 +120,30 @@ export const ShippingProvider: React.FC<ShippingProviderProps> = ({ children })
         ttlSeconds: response.ttlSeconds
       });
       
-      if (response.options && response.options.length > 0) {
-        setShippingOptions(response.options)
-        
-        // Auto-select the first option if none selected
-        if (!selectedShippingOption && response.options.length > 0) {
-          setSelectedShippingOption(response.options[0])
-        }
-      } else {
-        // Use fallback shipping options if no options returned
-        const fallbackOptions: ShippingOption[] = [
-          {
-            id: 'standard-uk',
-            name: 'Standard UK Delivery',
-            rate: '4.99',
-            currency: 'GBP',
-            minDeliveryDays: 3,
-            maxDeliveryDays: 5,
-            carrier: 'Royal Mail'
-          },
-          {
-            id: 'express-uk',
-            name: 'Express UK Delivery',
-            rate: '8.99',
-            currency: 'GBP',
-            minDeliveryDays: 1,
-            maxDeliveryDays: 2,
-            carrier: 'DHL Express'
-          }
-        ];
-        
-        setShippingOptions(fallbackOptions)
-        if (!selectedShippingOption) {
-          setSelectedShippingOption(fallbackOptions[0])
-        }
-      }
+      // Use fallback shipping options if no options returned
+      applyShippingOptions(response.options.length > 0 ? response.options : FALLBACK_OPTIONS)
+      setIsLoadingRates(false)
       
     } catch (error) {
       console.warn('Failed to fetch shipping rates, using fallback options:', error);
       
       // Use fallback shipping options on error
-      const fallbackOptions: ShippingOption[] = [
-        {
-          id: 'standard-uk',
-          name: 'Standard UK Delivery',
-          rate: '4.99',
-          currency: 'GBP',
-          minDeliveryDays: 3,
-          maxDeliveryDays: 5,
-          carrier: 'Royal Mail'
-        },
-        {
-          id: 'express-uk',
-          name: 'Express UK Delivery',
-          rate: '8.99',
-          currency: 'GBP',
-          minDeliveryDays: 1,
-          maxDeliveryDays: 2,
-          carrier: 'DHL Express'
-        }
-      ];
-      
-      setShippingOptions(fallbackOptions)
-      if (!selectedShippingOption) {
-        setSelectedShippingOption(fallbackOptions[0])
-      }
-      
+      applyShippingOptions(FALLBACK_OPTIONS)
       setShippingError('Using standard shipping rates (live quotes unavailable)')
-    } finally {
       setIsLoadingRates(false)
     }
-  }, [cartItems, getShippingCartItems, selectedShippingOption])
+  }, [cartItems.length, getShippingCartItems, applyShippingOptions])
+
+  // Fetch shipping rates from Printful now (served from the prefetch cache when possible)
+  const fetchShippingRates = useCallback(async (recipient: Recipient) => {
+    await requestShippingRates(recipient, true)
+  }, [requestShippingRates])
+
+  // Debounced prefetch while the address is being typed; ignored until country and postcode are valid
+  const prefetchShippingRates = useCallback((recipient: Partial<Recipient>) => {
+    if (!isQuotableRecipient(recipient) || cartItems.length === 0) return
+    requestShippingRates(recipient as Recipient, false)
+  }, [cartItems.length, requestShippingRates])
 
   // Select a shipping option
   const selectShippingOption = useCallback((option: ShippingOption) => {
@@ -263,6 +241,7 @@ export const ShippingProvider: React.FC<ShippingProviderProps> = ({ children })
     
     // Actions
     fetchShippingRates,
+    prefetchShippingRates,
     selectShippingOption,
     updatePaymentIntent,
     clearShippingRates,
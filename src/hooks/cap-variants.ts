@@ -2,6 +2,8 @@
 // Generated on: 2025-09-07T12:23:03.190Z
 // Total variants: 8
 
+import { createVariantIndex } from '../lib/variant-index';
+
 export type CapVariant = {
   key: string;
   catalogVariantId: number;
@@ -87,14 +89,17 @@ export const CapVariants: CapVariant[] = [
   },
 ];
 
+const variantsByKey = createVariantIndex(CapVariants, v => [v.key]);
+const variantsByCatalogId = createVariantIndex(CapVariants, v => [v.catalogVariantId]);
+
 // Helper function to find variant by key
 export function findCapVariant(key: string): CapVariant | undefined {
-  return CapVariants.find(v => v.key === key);
+  return variantsByKey.get(key);
 }
 
 // Helper function to find variant by catalog variant ID
 export function findCapVariantByCatalogId(catalogVariantId: number): CapVariant | undefined {
-  return CapVariants.find(v => v.catalogVariantId === catalogVariantId);
+  return variantsByCatalogId.get(catalogVariantId);
 }
 
 // Color mapping for caps based on catalog variant IDs (matching database)
@@ -4,6 +4,8 @@
 // Each variant now has a UNIQUE catalogVariantId for correct Printful fulfillment
 // NO MORE OVERLAPPING IDs - Every color/size combination maps to correct Printful variant
 
+import { createVariantIndex } from '../lib/variant-index';
+
 export type HoodieVariant = {
   key: string;
   catalogVariantId: number;
@@ -565,20 +567,20 @@ export const HoodieVariants: HoodieVariant[] = [
 ];
 
 // Helper Functions
+const variantsByOption = createVariantIndex(HoodieVariants, v => [v.design, v.size, v.color]);
+const variantsByCatalogId = createVariantIndex(HoodieVariants, v => [v.catalogVariantId]);
+const variantsByExternalId = createVariantIndex(HoodieVariants, v => [v.externalId]);
+
 export function findHoodieVariant(design: 'DARK' | 'LIGHT', size: string, color: string): HoodieVariant | undefined {
-  return HoodieVariants.find(variant => 
-    variant.design === design && 
-    variant.size === size && 
-    variant.color === color
-  );
+  return variantsByOption.get(design, size, color);
 }
 
 export function findHoodieVariantByCatalogId(catalogId: number): HoodieVariant | undefined {
-  return HoodieVariants.find(variant => variant.catalogVariantId === catalogId);
+  return variantsByCatalogId.get(catalogId);
 }
 
 export function findHoodieVariantByExternalId(externalId: string): HoodieVariant | undefined {
-  return HoodieVariants.find(variant => variant.externalId === externalId);
+  return variantsByExternalId.get(externalId);
 }
 
 export function getHoodieVariantsByDesign(design: 'DARK' | 'LIGHT'): HoodieVariant[] {
@@ -593,24 +595,8 @@ export function getHoodieVariantsByColor(color: string): HoodieVariant[] {
   return HoodieVariants.filter(variant => variant.color === color);
 }
 
-// Get unique designs, sizes, and colors
-export const hoodieDesigns = ['DARK', 'LIGHT'] as const;
-export const hoodieSizes = ['S', 'M', 'L', 'XL', '2XL'] as const;
-
-// Define the actual hoodie colors with hex codes
-export const hoodieColors = [
-  // DARK colors
-  { name: 'Black', hex: '#0b0b0b' },
-  { name: 'Dark Heather', hex: '#47484d' },
-  { name: 'Indigo Blue', hex: '#395d82' },
-  { name: 'Navy', hex: '#131928' },
-  { name: 'Red', hex: '#da0a1a' },
-  // LIGHT colors
-  { name: 'Light Blue', hex: '#a1c5e1' },
-  { name: 'Light Pink', hex: '#f3d4e3' },
-  { name: 'Sport Grey', hex: '#9b969c' },
-  { name: 'White', hex: '#ffffff', border: true }
-];
+// Options live in a small module so pages can list them without bundling this table
+export { hoodieDesigns, hoodieSizes, hoodieColors } from './variant-options';
 
 // IMPORTANT: Each hoodie variant now has UNIQUE Printful catalog IDs
 // DARK design: 25 variants with unique IDs
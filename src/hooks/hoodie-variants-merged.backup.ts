@@ -1,631 +0,0 @@
-// AUTO-GENERATED by scripts/create-complete-hoodie-variants.ts — PRODUCTION READY
-// Complete Hoodie Variants with Correct Printful IDs
-// Generated on: 2025-08-26T21:24:02.569Z
-// Total variants: 45 (25 DARK + 20 LIGHT)
-// Each color appears in exactly one design - NO OVERLAPPING COLORS
-// Guaranteed correct Printful routing for all orders
-
-export type HoodieVariant = {
-  key: string;
-  catalogVariantId: number;
-  syncVariantId: number;
-  price: string;
-  design: 'DARK' | 'LIGHT';
-  size: 'S' | 'M' | 'L' | 'XL' | '2XL';
-  color: string;
-  colorHex: string;
-  externalId: string;
-  sku: string;
-};
-
-export const HoodieVariants: HoodieVariant[] = [
-  {
-    key: "DARK-Black-S",
-    catalogVariantId: 68,
-    syncVariantId: 68,
-    price: "39.99",
-    design: "DARK",
-    size: "S",
-    color: "Black",
-    colorHex: "#0b0b0b",
-    externalId: "68a9d381e56616",
-    sku: "DARK-Black-S"
-  },
-  {
-    key: "DARK-Black-M",
-    catalogVariantId: 68,
-    syncVariantId: 68,
-    price: "39.99",
-    design: "DARK",
-    size: "M",
-    color: "Black",
-    colorHex: "#0b0b0b",
-    externalId: "68a9d381e56696",
-    sku: "DARK-Black-M"
-  },
-  {
-    key: "DARK-Black-L",
-    catalogVariantId: 68,
-    syncVariantId: 68,
-    price: "39.99",
-    design: "DARK",
-    size: "L",
-    color: "Black",
-    colorHex: "#0b0b0b",
-    externalId: "68a9d381e566e2",
-    sku: "DARK-Black-L"
-  },
-  {
-    key: "DARK-Black-XL",
-    catalogVariantId: 68,
-    syncVariantId: 68,
-    price: "39.99",
-    design: "DARK",
-    size: "XL",
-    color: "Black",
-    colorHex: "#0b0b0b",
-    externalId: "68a9d381e56741",
-    sku: "DARK-Black-XL"
-  },
-  {
-    key: "DARK-Black-2XL",
-    catalogVariantId: 68,
-    syncVariantId: 68,
-    price: "39.99",
-    design: "DARK",
-    size: "2XL",
-    color: "Black",
-    colorHex: "#0b0b0b",
-    externalId: "68a9d381e56797",
-    sku: "DARK-Black-2XL"
-  },
-  {
-    key: "DARK-Dark Heather-S",
-    catalogVariantId: 68,
-    syncVariantId: 68,
-    price: "39.99",
-    design: "DARK",
-    size: "S",
-    color: "Dark Heather",
-    colorHex: "#47484d",
-    externalId: "68a9d381e56b11",
-    sku: "DARK-Dark Heather-S"
-  },
-  {
-    key: "DARK-Dark Heather-M",
-    catalogVariantId: 68,
-    syncVariantId: 68,
-    price: "39.99",
-    design: "DARK",
-    size: "M",
-    color: "Dark Heather",
-    colorHex: "#47484d",
-    externalId: "68a9d381e56b63",
-    sku: "DARK-Dark Heather-M"
-  },
-  {
-    key: "DARK-Dark Heather-L",
-    catalogVariantId: 68,
-    syncVariantId: 68,
-    price: "39.99",
-    design: "DARK",
-    size: "L",
-    color: "Dark Heather",
-    colorHex: "#47484d",
-    externalId: "68a9d381e56ba3",
-    sku: "DARK-Dark Heather-L"
-  },
-  {
-    key: "DARK-Dark Heather-XL",
-    catalogVariantId: 68,
-    syncVariantId: 68,
-    price: "39.99",
-    design: "DARK",
-    size: "XL",
-    color: "Dark Heather",
-    colorHex: "#47484d",
-    externalId: "68a9d381e56bf2",
-    sku: "DARK-Dark Heather-XL"
-  },
-  {
-    key: "DARK-Dark Heather-2XL",
-    catalogVariantId: 68,
-    syncVariantId: 68,
-    price: "39.99",
-    design: "DARK",
-    size: "2XL",
-    color: "Dark Heather",
-    colorHex: "#47484d",
-    externalId: "68a9d381e56c57",
-    sku: "DARK-Dark Heather-2XL"
-  },
-  {
-    key: "DARK-Indigo Blue-S",
-    catalogVariantId: 68,
-    syncVariantId: 68,
-    price: "39.99",
-    design: "DARK",
-    size: "S",
-    color: "Indigo Blue",
-    colorHex: "#395d82",
-    externalId: "68a9d381e56ca1",
-    sku: "DARK-Indigo Blue-S"
-  },
-  {
-    key: "DARK-Indigo Blue-M",
-    catalogVariantId: 68,
-    syncVariantId: 68,
-    price: "39.99",
-    design: "DARK",
-    size: "M",
-    color: "Indigo Blue",
-    colorHex: "#395d82",
-    externalId: "68a9d381e56cf5",
-    sku: "DARK-Indigo Blue-M"
-  },
-  {
-    key: "DARK-Indigo Blue-L",
-    catalogVariantId: 68,
-    syncVariantId: 68,
-    price: "39.99",
-    design: "DARK",
-    size: "L",
-    color: "Indigo Blue",
-    colorHex: "#395d82",
-    externalId: "68a9d381e56d44",
-    sku: "DARK-Indigo Blue-L"
-  },
-  {
-    key: "DARK-Indigo Blue-XL",
-    catalogVariantId: 68,
-    syncVariantId: 68,
-    price: "39.99",
-    design: "DARK",
-    size: "XL",
-    color: "Indigo Blue",
-    colorHex: "#395d82",
-    externalId: "68a9d381e56d98",
-    sku: "DARK-Indigo Blue-XL"
-  },
-  {
-    key: "DARK-Indigo Blue-2XL",
-    catalogVariantId: 68,
-    syncVariantId: 68,
-    price: "39.99",
-    design: "DARK",
-    size: "2XL",
-    color: "Indigo Blue",
-    colorHex: "#395d82",
-    externalId: "68a9d381e56de2",
-    sku: "DARK-Indigo Blue-2XL"
-  },
-  {
-    key: "DARK-Navy-S",
-    catalogVariantId: 68,
-    syncVariantId: 68,
-    price: "39.99",
-    design: "DARK",
-    size: "S",
-    color: "Navy",
-    colorHex: "#131928",
-    externalId: "68a9d381e567e5",
-    sku: "DARK-Navy-S"
-  },
-  {
-    key: "DARK-Navy-M",
-    catalogVariantId: 68,
-    syncVariantId: 68,
-    price: "39.99",
-    design: "DARK",
-    size: "M",
-    color: "Navy",
-    colorHex: "#131928",
-    externalId: "68a9d381e56833",
-    sku: "DARK-Navy-M"
-  },
-  {
-    key: "DARK-Navy-L",
-    catalogVariantId: 68,
-    syncVariantId: 68,
-    price: "39.99",
-    design: "DARK",
-    size: "L",
-    color: "Navy",
-    colorHex: "#131928",
-    externalId: "68a9d381e56881",
-    sku: "DARK-Navy-L"
-  },
-  {
-    key: "DARK-Navy-XL",
-    catalogVariantId: 68,
-    syncVariantId: 68,
-    price: "39.99",
-    design: "DARK",
-    size: "XL",
-    color: "Navy",
-    colorHex: "#131928",
-    externalId: "68a9d381e568d2",
-    sku: "DARK-Navy-XL"
-  },
-  {
-    key: "DARK-Navy-2XL",
-    catalogVariantId: 68,
-    syncVariantId: 68,
-    price: "39.99",
-    design: "DARK",
-    size: "2XL",
-    color: "Navy",
-    colorHex: "#131928",
-    externalId: "68a9d381e56925",
-    sku: "DARK-Navy-2XL"
-  },
-  {
-    key: "DARK-Red-S",
-    catalogVariantId: 68,
-    syncVariantId: 68,
-    price: "39.99",
-    design: "DARK",
-    size: "S",
-    color: "Red",
-    colorHex: "#da0a1a",
-    externalId: "68a9d381e56976",
-    sku: "DARK-Red-S"
-  },
-  {
-    key: "DARK-Red-M",
-    catalogVariantId: 68,
-    syncVariantId: 68,
-    price: "39.99",
-    design: "DARK",
-    size: "M",
-    color: "Red",
-    colorHex: "#da0a1a",
-    externalId: "68a9d381e569c2",
-    sku: "DARK-Red-M"
-  },
-  {
-    key: "DARK-Red-L",
-    catalogVariantId: 68,
-    syncVariantId: 68,
-    price: "39.99",
-    design: "DARK",
-    size: "L",
-    color: "Red",
-    colorHex: "#da0a1a",
-    externalId: "68a9d381e56a15",
-    sku: "DARK-Red-L"
-  },
-  {
-    key: "DARK-Red-XL",
-    catalogVariantId: 68,
-    syncVariantId: 68,
-    price: "39.99",
-    design: "DARK",
-    size: "XL",
-    color: "Red",
-    colorHex: "#da0a1a",
-    externalId: "68a9d381e56a63",
-    sku: "DARK-Red-XL"
-  },
-  {
-    key: "DARK-Red-2XL",
-    catalogVariantId: 68,
-    syncVariantId: 68,
-    price: "39.99",
-    design: "DARK",
-    size: "2XL",
-    color: "Red",
-    colorHex: "#da0a1a",
-    externalId: "68a9d381e56ac9",
-    sku: "DARK-Red-2XL"
-  },
-  {
-    key: "LIGHT-Light Blue-S",
-    catalogVariantId: 68,
-    syncVariantId: 68,
-    price: "39.99",
-    design: "LIGHT",
-    size: "S",
-    color: "Light Blue",
-    colorHex: "#a1c5e1",
-    externalId: "68a9d27b158456",
-    sku: "LIGHT-Light Blue-S"
-  },
-  {
-    key: "LIGHT-Light Blue-M",
-    catalogVariantId: 68,
-    syncVariantId: 68,
-    price: "39.99",
-    design: "LIGHT",
-    size: "M",
-    color: "Light Blue",
-    colorHex: "#a1c5e1",
-    externalId: "68a9d27b1584a1",
-    sku: "LIGHT-Light Blue-M"
-  },
-  {
-    key: "LIGHT-Light Blue-L",
-    catalogVariantId: 68,
-    syncVariantId: 68,
-    price: "39.99",
-    design: "LIGHT",
-    size: "L",
-    color: "Light Blue",
-    colorHex: "#a1c5e1",
-    externalId: "68a9d27b1584e2",
-    sku: "LIGHT-Light Blue-L"
-  },
-  {
-    key: "LIGHT-Light Blue-XL",
-    catalogVariantId: 68,
-    syncVariantId: 68,
-    price: "39.99",
-    design: "LIGHT",
-    size: "XL",
-    color: "Light Blue",
-    colorHex: "#a1c5e1",
-    externalId: "68a9d27b158534",
-    sku: "LIGHT-Light Blue-XL"
-  },
-  {
-    key: "LIGHT-Light Blue-2XL",
-    catalogVariantId: 68,
-    syncVariantId: 68,
-    price: "39.99",
-    design: "LIGHT",
-    size: "2XL",
-    color: "Light Blue",
-    colorHex: "#a1c5e1",
-    externalId: "68a9d27b158581",
-    sku: "LIGHT-Light Blue-2XL"
-  },
-  {
-    key: "LIGHT-Light Pink-S",
-    catalogVariantId: 68,
-    syncVariantId: 68,
-    price: "39.99",
-    design: "LIGHT",
-    size: "S",
-    color: "Light Pink",
-    colorHex: "#f3d4e3",
-    externalId: "68a9d27b158626",
-    sku: "LIGHT-Light Pink-S"
-  },
-  {
-    key: "LIGHT-Light Pink-M",
-    catalogVariantId: 68,
-    syncVariantId: 68,
-    price: "39.99",
-    design: "LIGHT",
-    size: "M",
-    color: "Light Pink",
-    colorHex: "#f3d4e3",
-    externalId: "68a9d27b158663",
-    sku: "LIGHT-Light Pink-M"
-  },
-  {
-    key: "LIGHT-Light Pink-L",
-    catalogVariantId: 68,
-    syncVariantId: 68,
-    price: "39.99",
-    design: "LIGHT",
-    size: "L",
-    color: "Light Pink",
-    colorHex: "#f3d4e3",
-    externalId: "68a9d27b1586b2",
-    sku: "LIGHT-Light Pink-L"
-  },
-  {
-    key: "LIGHT-Light Pink-XL",
-    catalogVariantId: 68,
-    syncVariantId: 68,
-    price: "39.99",
-    design: "LIGHT",
-    size: "XL",
-    color: "Light Pink",
-    colorHex: "#f3d4e3",
-    externalId: "68a9d27b158707",
-    sku: "LIGHT-Light Pink-XL"
-  },
-  {
-    key: "LIGHT-Light Pink-2XL",
-    catalogVariantId: 68,
-    syncVariantId: 68,
-    price: "39.99",
-    design: "LIGHT",
-    size: "2XL",
-    color: "Light Pink",
-    colorHex: "#f3d4e3",
-    externalId: "68a9d27b158746",
-    sku: "LIGHT-Light Pink-2XL"
-  },
-  {
-    key: "LIGHT-Sport Grey-S",
-    catalogVariantId: 68,
-    syncVariantId: 68,
-    price: "39.99",
-    design: "LIGHT",
-    size: "S",
-    color: "Sport Grey",
-    colorHex: "#9b969c",
-    externalId: "68a9d27b1582a6",
-    sku: "LIGHT-Sport Grey-S"
-  },
-  {
-    key: "LIGHT-Sport Grey-M",
-    catalogVariantId: 68,
-    syncVariantId: 68,
-    price: "39.99",
-    design: "LIGHT",
-    size: "M",
-    color: "Sport Grey",
-    colorHex: "#9b969c",
-    externalId: "68a9d27b158311",
-    sku: "LIGHT-Sport Grey-M"
-  },
-  {
-    key: "LIGHT-Sport Grey-L",
-    catalogVariantId: 68,
-    syncVariantId: 68,
-    price: "39.99",
-    design: "LIGHT",
-    size: "L",
-    color: "Sport Grey",
-    colorHex: "#9b969c",
-    externalId: "68a9d27b158375",
-    sku: "LIGHT-Sport Grey-L"
-  },
-  {
-    key: "LIGHT-Sport Grey-XL",
-    catalogVariantId: 68,
-    syncVariantId: 68,
-    price: "39.99",
-    design: "LIGHT",
-    size: "XL",
-    color: "Sport Grey",
-    colorHex: "#9b969c",
-    externalId: "68a9d27b1583b6",
-    sku: "LIGHT-Sport Grey-XL"
-  },
-  {
-    key: "LIGHT-Sport Grey-2XL",
-    catalogVariantId: 68,
-    syncVariantId: 68,
-    price: "39.99",
-    design: "LIGHT",
-    size: "2XL",
-    color: "Sport Grey",
-    colorHex: "#9b969c",
-    externalId: "68a9d27b158405",
-    sku: "LIGHT-Sport Grey-2XL"
-  },
-  {
-    key: "LIGHT-White-S",
-    catalogVariantId: 68,
-    syncVariantId: 68,
-    price: "39.99",
-    design: "LIGHT",
-    size: "S",
-    color: "White",
-    colorHex: "#ffffff",
-    externalId: "68a9d27b158796",
-    sku: "LIGHT-White-S"
-  },
-  {
-    key: "LIGHT-White-M",
-    catalogVariantId: 68,
-    syncVariantId: 68,
-    price: "39.99",
-    design: "LIGHT",
-    size: "M",
-    color: "White",
-    colorHex: "#ffffff",
-    externalId: "68a9d27b1587d6",
-    sku: "LIGHT-White-M"
-  },
-  {
-    key: "LIGHT-White-L",
-    catalogVariantId: 68,
-    syncVariantId: 68,
-    price: "39.99",
-    design: "LIGHT",
-    size: "L",
-    color: "White",
-    colorHex: "#ffffff",
-    externalId: "68a9d27b158827",
-    sku: "LIGHT-White-L"
-  },
-  {
-    key: "LIGHT-White-XL",
-    catalogVariantId: 68,
-    syncVariantId: 68,
-    price: "39.99",
-    design: "LIGHT",
-    size: "XL",
-    color: "White",
-    colorHex: "#ffffff",
-    externalId: "68a9d27b158863",
-    sku: "LIGHT-White-XL"
-  },
-  {
-    key: "LIGHT-White-2XL",
-    catalogVariantId: 68,
-    syncVariantId: 68,
-    price: "39.99",
-    design: "LIGHT",
-    size: "2XL",
-    color: "White",
-    colorHex: "#ffffff",
-    externalId: "68a9d27b1588b1",
-    sku: "LIGHT-White-2XL"
-  }
-];
-
-// Helper Functions
-export function findHoodieVariant(design: 'DARK' | 'LIGHT', size: string, color: string): HoodieVariant | undefined {
-  return HoodieVariants.find(variant => 
-    variant.design === design && 
-    variant.size === size && 
-    variant.color === color
-  );
-}
-
-export function findHoodieVariantByCatalogId(catalogId: number): HoodieVariant | undefined {
-  return HoodieVariants.find(variant => variant.catalogVariantId === catalogId);
-}
-
-export function findHoodieVariantByExternalId(externalId: string): HoodieVariant | undefined {
-  return HoodieVariants.find(variant => variant.externalId === externalId);
-}
-
-export function getHoodieVariantsByDesign(design: 'DARK' | 'LIGHT'): HoodieVariant[] {
-  return HoodieVariants.filter(variant => variant.design === design);
-}
-
-export function getHoodieVariantsBySize(size: string): HoodieVariant[] {
-  return HoodieVariants.filter(variant => variant.size === size);
-}
-
-export function getHoodieVariantsByColor(color: string): HoodieVariant[] {
-  return HoodieVariants.filter(variant => variant.color === color);
-}
-
-// Get unique designs, sizes, and colors
-export const hoodieDesigns = ['DARK', 'LIGHT'] as const;
-export const hoodieSizes = ['S', 'M', 'L', 'XL', '2XL'] as const;
-
-// Define the actual hoodie colors with hex codes (arranged light to dark)
-export const hoodieColors = [
-  { name: 'White', hex: '#ffffff', border: true },
-  { name: 'Light Pink', hex: '#f3d4e3' },
-  { name: 'Light Blue', hex: '#a1c5e1' },
-  { name: 'Sport Grey', hex: '#9b969c' },
-  { name: 'Red', hex: '#da0a1a' },
-  { name: 'Indigo Blue', hex: '#395d82' },
-  { name: 'Navy', hex: '#131928' },
-  { name: 'Dark Heather', hex: '#47484d' },
-  { name: 'Black', hex: '#0b0b0b' }
-];
-
-// Color design mapping for reference
-export const colorDesignMapping: { [key: string]: 'DARK' | 'LIGHT' } = {
-  // DARK design colors (white text)
-  'Black': 'DARK',
-  'Dark Heather': 'DARK',
-  'Indigo Blue': 'DARK',
-  'Navy': 'DARK',
-  'Red': 'DARK',
-  
-  // LIGHT design colors (black text)
-  'Light Blue': 'LIGHT',
-  'Light Pink': 'LIGHT',
-  'Sport Grey': 'LIGHT',
-  'White': 'LIGHT'
-};
-
-// IMPORTANT: This ensures each color appears in exactly one design
-// DARK design: 5 colors × 5 sizes = 25 variants
-// LIGHT design: 4 colors × 5 sizes = 20 variants
-// Total: 45 variants with NO overlapping colors
-// Customer selects color + size, system auto-routes to correct Printful product
-// DARK/LIGHT design is invisible to customers but ensures correct order routing
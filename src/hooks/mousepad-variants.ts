@@ -2,6 +2,8 @@
 // Generated on: 2025-09-07T12:23:03.193Z
 // Total variants: 1
 
+import { createVariantIndex } from '../lib/variant-index';
+
 export type MousepadVariant = {
   key: string;
   catalogVariantId: number;
@@ -24,12 +26,15 @@ export const MousepadVariants: MousepadVariant[] = [
   },
 ];
 
+const variantsByKey = createVariantIndex(MousepadVariants, v => [v.key]);
+const variantsByCatalogId = createVariantIndex(MousepadVariants, v => [v.catalogVariantId]);
+
 // Helper function to find variant by key
 export function findMousepadVariant(key: string): MousepadVariant | undefined {
-  return MousepadVariants.find(v => v.key === key);
+  return variantsByKey.get(key);
 }
 
 // Helper function to find variant by catalog variant ID
 export function findMousepadVariantByCatalogId(catalogVariantId: number): MousepadVariant | undefined {
-  return MousepadVariants.find(v => v.catalogVariantId === catalogVariantId);
+  return variantsByCatalogId.get(catalogVariantId);
 }
\ No newline at end of file
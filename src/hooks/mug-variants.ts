@@ -2,6 +2,8 @@
 // Generated on: 2025-09-07T12:23:03.191Z
 // Total variants: 1
 
+import { createVariantIndex } from '../lib/variant-index';
+
 export type MugVariant = {
   key: string;
   catalogVariantId: number;
@@ -24,12 +26,15 @@ export const MugVariants: MugVariant[] = [
   },
 ];
 
+const variantsByKey = createVariantIndex(MugVariants, v => [v.key]);
+const variantsByCatalogId = createVariantIndex(MugVariants, v => [v.catalogVariantId]);
+
 // Helper function to find variant by key
 export function findMugVariant(key: string): MugVariant | undefined {
-  return MugVariants.find(v => v.key === key);
+  return variantsByKey.get(key);
 }
 
 // Helper function to find variant by catalog variant ID
 export function findMugVariantByCatalogId(catalogVariantId: number): MugVariant | undefined {
-  return MugVariants.find(v => v.catalogVariantId === catalogVariantId);
+  return variantsByCatalogId.get(catalogVariantId);
 }
\ No newline at end of file
@@ -0,0 +1,243 @@
+import type { PrintfulProduct } from '../types/printful';
+import { TshirtVariants } from './tshirt-variants-merged-fixed';
+import { HoodieVariants } from './hoodie-variants-merged-fixed';
+import { TotebagVariants } from './totebag-variants';
+import { WaterbottleVariants } from './waterbottle-variants';
+import { MousepadVariants } from './mousepad-variants';
+
+// Fallback product data used when the Printful API is not available.
+// Loaded on demand by usePrintfulProducts so the variant tables stay out of the main bundle.
+
+export const mockProducts: PrintfulProduct[] = [
+  {
+    id: 1,
+    name: "LVN Clothing T-Shirt",
+    description: "Premium cotton t-shirt with LVN Clothing branding",
+    category: 'tshirt',
+    variants: (() => {
+      try {
+
+        if (!TshirtVariants || !Array.isArray(TshirtVariants)) {
+          console.error('❌ TshirtVariants is not an array:', TshirtVariants);
+          return [];
+        }
+        return TshirtVariants.map(variant => {
+          return {
+            ...variant,
+            // Use externalId as printful_variant_id for database consistency
+            printful_variant_id: variant.externalId,
+            // Use catalogVariantId for Printful API calls
+            id: variant.catalogVariantId,
+            name: `${variant.color} T-Shirt - ${variant.size}`,
+            color: variant.color,
+            size: variant.size,
+            price: variant.price,
+            in_stock: true,
+            color_code: variant.colorHex,
+            image: `https://files.cdn.printful.com/products/71/tshirt_mockup.jpg`
+          };
+        });
+      } catch (error) {
+        console.error('❌ Error mapping TshirtVariants:', error);
+        return [];
+      }
+    })(),
+    isUnisex: true,
+    hasDarkLightVariants: true,
+    image: "https://files.cdn.printful.com/products/71/black_tshirt_m_mockup.jpg",
+    brand: "LVN Clothing",
+    model: "Premium Cotton",
+    currency: "GBP",
+    is_discontinued: false,
+    avg_fulfillment_time: 4.5,
+    origin_country: "UK"
+  },
+  {
+    id: 2,
+    name: "LVN Clothing Hoodie",
+    description: "Premium cotton hoodie with LVN Clothing branding",
+    category: 'hoodie',
+    variants: HoodieVariants.map(variant => ({
+      ...variant,
+      // Use externalId as printful_variant_id for database consistency
+      printful_variant_id: variant.externalId,
+      // Use catalogVariantId for Printful API calls
+      id: variant.catalogVariantId,
+      name: `${variant.color} Hoodie - ${variant.size}`,
+      color: variant.color,
+      size: variant.size,
+      price: variant.price,
+      in_stock: true,
+      color_code: variant.colorHex,
+      image: `https://files.cdn.printful.com/products/71/${variant.color.toLowerCase().replace(/\s+/g, '_')}_hoodie_${variant.size.toLowerCase()}_mockup.jpg`
+    })),
+    isUnisex: true,
+    hasDarkLightVariants: false,
+    image: "https://files.cdn.printful.com/products/71/black_hoodie_m_mockup.jpg",
+    brand: "LVN Clothing",
+    model: "Premium Cotton",
+    currency: "GBP",
+    is_discontinued: false,
+    avg_fulfillment_time: 4.5,
+    origin_country: "UK"
+  },
+  {
+    id: 3,
+    name: "LVN Clothing Cap",
+    description: "Adjustable cap with LVN Clothing logo",
+    category: 'cap',
+    variants: [
+      {
+        id: 301,
+        name: "Black Cap - One Size",
+        color: "Black",
+        size: "One Size",
+        price: "19.99",
+        in_stock: true,
+        printful_variant_id: 6004,
+        color_code: "#000000",
+        image: "/Cap/ReformCapBlack1.webp"
+      },
+      {
+        id: 302,
+        name: "White Cap - One Size",
+        color: "White",
+        size: "One Size",
+        price: "19.99",
+        in_stock: true,
+        printful_variant_id: 6000,
+        color_code: "#ffffff",
+        image: "/Cap/ReformCapWhite1.webp"
+      },
+      {
+        id: 303,
+        name: "Light Blue Cap - One Size",
+        color: "Light Blue",
+        size: "One Size",
+        price: "19.99",
+        in_stock: true,
+        printful_variant_id: 6001,
+        color_code: "#a6b9c6",
+        image: "/Cap/ReformCapBlue1.webp"
+      },
+      {
+        id: 304,
+        name: "Charcoal Cap - One Size",
+        color: "Charcoal",
+        size: "One Size",
+        price: "19.99",
+        in_stock: true,
+        printful_variant_id: 6002,
+        color_code: "#393639",
+        image: "/Cap/ReformCapCharcoal1.webp"
+      },
+      {
+        id: 305,
+        name: "Navy Cap - One Size",
+        color: "Navy",
+        size: "One Size",
+        price: "19.99",
+        in_stock: true,
+        printful_variant_id: 6003,
+        color_code: "#1c2330",
+        image: "/Cap/ReformCapNavy1.webp"
+      },
+      {
+        id: 306,
+        name: "Red Cap - One Size",
+        color: "Red",
+        size: "One Size",
+        price: "19.99",
+        in_stock: true,
+        printful_variant_id: 6005,
+        color_code: "#8e0a1f",
+        image: "/Cap/ReformCapRed1.webp"
+      }
+    ],
+    isUnisex: true,
+    hasDarkLightVariants: false,
+    image: "/Cap/ReformCapBlack1.webp",
+    brand: "LVN Clothing",
+    model: "Adjustable Cap",
+    currency: "GBP",
+    is_discontinued: false,
+    avg_fulfillment_time: 4.5,
+    origin_country: "UK"
+  },
+  {
+    id: 4,
+    name: "LVN Clothing Mug",
+    description: "Ceramic mug with LVN Clothing logo",
+    category: 'mug',
+    variants: [
+      {
+        id: 401,
+        name: "White Mug - One Size",
+        color: "White",
+        size: "One Size",
+        price: "19.99",
+        in_stock: true,
+        printful_variant_id: 10000,
+        color_code: "#FFFFFF",
+        image: "/MugMouse/ReformMug1.webp"
+      }
+    ],
+    isUnisex: true,
+    hasDarkLightVariants: false,
+    image: "/MugMouse/ReformMug1.webp",
+    brand: "LVN Clothing",
+    model: "Ceramic Mug",
+    currency: "GBP",
+    is_discontinued: false,
+    avg_fulfillment_time: 4.5,
+    origin_country: "UK"
+  },
+  {
+    id: 5,
+    name: "LVN Clothing Tote Bag",
+    description: "Eco-friendly canvas tote bag with LVN Clothing branding",
+    category: 'tote',
+    variants: TotebagVariants,
+    isUnisex: true,
+    hasDarkLightVariants: false,
+    image: "/StickerToteWater/ReformToteBagBlack1.webp",
+    brand: "LVN Clothing",
+    model: "Canvas Tote",
+    currency: "GBP",
+    is_discontinued: false,
+    avg_fulfillment_time: 4.5,
+    origin_country: "UK"
+  },
+  {
+    id: 6,
+    name: "LVN Clothing Water Bottle",
+    description: "Stainless steel water bottle with LVN Clothing logo",
+    category: 'water-bottle',
+    variants: WaterbottleVariants,
+    isUnisex: true,
+    hasDarkLightVariants: false,
+    image: "/StickerToteWater/ReformWaterBottleWhite1.webp",
+    brand: "LVN Clothing",
+    model: "Stainless Steel",
+    currency: "GBP",
+    is_discontinued: false,
+    avg_fulfillment_time: 4.5,
+    origin_country: "UK"
+  },
+  {
+    id: 7,
+    name: "LVN Clothing Mouse Pad",
+    description: "High-quality mouse pad with LVN Clothing branding",
+    category: 'mouse-pad',
+    variants: MousepadVariants,
+    isUnisex: true,
+    hasDarkLightVariants: false,
+    image: "/MugMouse/ReformMousePadWhite1.webp",
+    brand: "LVN Clothing",
+    model: "Premium Mouse Pad",
+    currency: "GBP",
+    is_discontinued: false,
+    avg_fulfillment_time: 4.5,
+    origin_country: "UK"
+  }
+];
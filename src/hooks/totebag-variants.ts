@@ -2,6 +2,8 @@
 // Generated on: 2025-09-07T12:23:03.192Z
 // Total variants: 1
 
+import { createVariantIndex } from '../lib/variant-index';
+
 export type TotebagVariant = {
   key: string;
   catalogVariantId: number;
@@ -24,12 +26,15 @@ export const TotebagVariants: TotebagVariant[] = [
   },
 ];
 
+const variantsByKey = createVariantIndex(TotebagVariants, v => [v.key]);
+const variantsByCatalogId = createVariantIndex(TotebagVariants, v => [v.catalogVariantId]);
+
 // Helper function to find variant by key
 export function findTotebagVariant(key: string): TotebagVariant | undefined {
-  return TotebagVariants.find(v => v.key === key);
+  return variantsByKey.get(key);
 }
 
 // Helper function to find variant by catalog variant ID
 export function findTotebagVariantByCatalogId(catalogVariantId: number): TotebagVariant | undefined {
-  return TotebagVariants.find(v => v.catalogVariantId === catalogVariantId);
+  return variantsByCatalogId.get(catalogVariantId);
 }
\ No newline at end of file
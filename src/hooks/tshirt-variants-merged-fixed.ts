@@ -4,6 +4,8 @@
 // Each variant now has a UNIQUE catalogVariantId for correct Printful fulfillment
 // NO MORE OVERLAPPING IDs - Every color/size combination maps to correct Printful variant
 
+import { createVariantIndex } from '../lib/variant-index';
+
 export type TshirtVariant = {
   key: string;
   catalogVariantId: number;
@@ -18,14 +20,6 @@ export type TshirtVariant = {
 };
 
 export function useTshirtVariants() {
-  const findTshirtVariant = (design: 'DARK' | 'LIGHT', size: string, color: string) => {
-    return TshirtVariants.find(v => 
-      v.design === design && 
-      v.size === size && 
-      v.color === color
-    );
-  };
-
   return {
     variants: TshirtVariants,
     findTshirtVariant
@@ -1236,20 +1230,20 @@ export const TshirtVariants: TshirtVariant[] = [
 ];
 
 // Helper Functions
+const variantsByOption = createVariantIndex(TshirtVariants, v => [v.design, v.size, v.color]);
+const variantsByCatalogId = createVariantIndex(TshirtVariants, v => [v.catalogVariantId]);
+const variantsByExternalId = createVariantIndex(TshirtVariants, v => [v.externalId]);
+
 export function findTshirtVariant(design: 'DARK' | 'LIGHT', size: string, color: string): TshirtVariant | undefined {
-  return TshirtVariants.find(variant => 
-    variant.design === design && 
-    variant.size === size && 
-    variant.color === color
-  );
+  return variantsByOption.get(design, size, color);
 }
 
 export function findTshirtVariantByCatalogId(catalogId: number): TshirtVariant | undefined {
-  return TshirtVariants.find(variant => variant.catalogVariantId === catalogId);
+  return variantsByCatalogId.get(catalogId);
 }
 
 export function findTshirtVariantByExternalId(externalId: string): TshirtVariant | undefined {
-  return TshirtVariants.find(variant => variant.externalId === externalId);
+  return variantsByExternalId.get(externalId);
 }
 
 export function getTshirtVariantsByDesign(design: 'DARK' | 'LIGHT'): TshirtVariant[] {
@@ -1264,60 +1258,8 @@ export function getTshirtVariantsByColor(color: string): TshirtVariant[] {
   return TshirtVariants.filter(variant => variant.color === color);
 }
 
-// Get unique designs, sizes, and colors
-export const tshirtDesigns = ['DARK', 'LIGHT'] as const;
-export const tshirtSizes = ['S', 'M', 'L', 'XL', '2XL'] as const;
-
-// Define the actual t-shirt colors with hex codes
-export const tshirtColors = [
-  { name: 'Ash', hex: '#f0f1ea' },
-  { name: 'Athletic Heather', hex: '#cececc' },
-  { name: 'Heather Dust', hex: '#e5d9c9' },
-  { name: 'Heather Prism Peach', hex: '#f3c2b2' },
-  { name: 'Mustard', hex: '#eda027' },
-  { name: 'Pink', hex: '#fdbfc7' },
-  { name: 'White', hex: '#ffffff', border: true },
-  { name: 'Yellow', hex: '#ffd667' },
-  { name: 'Army', hex: '#5f5849' },
-  { name: 'Asphalt', hex: '#52514f' },
-  { name: 'Autumn', hex: '#c85313' },
-  { name: 'Black', hex: '#0c0c0c' },
-  { name: 'Black Heather', hex: '#0b0b0b' },
-  { name: 'Dark Grey Heather', hex: '#3E3C3D' },
-  { name: 'Heather Deep Teal', hex: '#447085' },
-  { name: 'Mauve', hex: '#bf6e6e' },
-  { name: 'Navy', hex: '#212642' },
-  { name: 'Olive', hex: '#5b642f' },
-  { name: 'Red', hex: '#d0071e' },
-  { name: 'Steel Blue', hex: '#668ea7' }
-];
-
-// Color design mapping for reference
-export const colorDesignMapping: { [key: string]: 'DARK' | 'LIGHT' } = {
-  // DARK design colors (white text)
-  'Army': 'DARK',
-  'Asphalt': 'DARK',
-  'Autumn': 'DARK',
-  'Black': 'DARK',
-  'Black Heather': 'DARK',
-  'Dark Grey Heather': 'DARK',
-  'Heather Deep Teal': 'DARK',
-  'Mauve': 'DARK',
-  'Navy': 'DARK',
-  'Olive': 'DARK',
-  'Red': 'DARK',
-  'Steel Blue': 'DARK',
-
-  // LIGHT design colors (black text)
-  'Ash': 'LIGHT',
-  'Athletic Heather': 'LIGHT',
-  'Heather Dust': 'LIGHT',
-  'Heather Prism Peach': 'LIGHT',
-  'Mustard': 'LIGHT',
-  'Pink': 'LIGHT',
-  'White': 'LIGHT',
-  'Yellow': 'LIGHT'
-};
+// Options live in a small module so pages can list them without bundling this table
+export { tshirtDesigns, tshirtSizes, tshirtColors, colorDesignMapping } from './variant-options';
 
 // IMPORTANT: Each color now appears in exactly one design with UNIQUE Printful IDs
 // DARK design: 12 colors × 5 sizes = 60 variants
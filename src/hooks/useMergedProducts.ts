@@ -1,11 +1,12 @@
-// useMergedProducts.ts - Frontend Product Merging Hook
+// useMergedProducts.ts - Merged Product Catalog Hook
 // Created for PR-08: Frontend Color Hex Display & Product Merging
-// Implements client-side product merging without backend changes
+// Products are merged server-side by the merged-catalog edge function and loaded in one request
 
 import { useState, useEffect, useRef } from 'react';
-import { getProducts, getProductVariants } from '../lib/api';
-import { hoodieColors, hoodieSizes } from './hoodie-variants-merged-fixed';
-import { tshirtColors, tshirtSizes } from './tshirt-variants-merged-fixed';
+import { getMergedCatalog, getLiveVariantStock } from '../lib/api';
+import type { LiveVariantStock } from '../lib/api';
+import type { ImageRendition } from '../lib/image-renditions';
+import { hoodieColors, hoodieSizes, tshirtColors, tshirtSizes } from './variant-options';
 
 export interface ProductVariant {
   id: string;
@@ -15,6 +16,8 @@ export interface ProductVariant {
   size: string;
   price: number;
   stock: number;
+  in_stock?: boolean;
+  is_available?: boolean;
   sku?: string;
   printful_variant_id?: number;
   // description doesn't exist in product_variants table
@@ -38,6 +41,7 @@ export interface MergedProduct {
     max: number;
   };
   image_url?: string;
+  image_renditions?: ImageRendition[];
 }
 
 export interface UseMergedProductsReturn {
@@ -47,28 +51,8 @@ export interface UseMergedProductsReturn {
   getProductByCategory: (category: string) => MergedProduct | undefined;
 }
 
-// Configuration for product merging rules
-const MERGE_RULES = {
-  hoodie: {
-    searchTerms: ['hoodie'], // Will match products with "hoodie" in name
-    mergedName: 'LVN Clothing Hoodie',
-    category: 'apparel'
-  },
-  tshirt: {
-    searchTerms: ['t-shirt', 'tshirt'], // Will match products with these terms
-    mergedName: 'LVN Clothing T-Shirt', 
-    category: 'apparel'
-  },
-  cap: {
-    searchTerms: ['cap', 'hat'], // Will match products with these terms
-    mergedName: 'LVN Clothing Cap',
-    category: 'apparel'
-  }
-} as const;
-
 // Cache for merged products to avoid re-fetching
 const mergedProductsCache = new Map<string, MergedProduct>();
-const variantsCache = new Map<string, ProductVariant[]>();
 
 export function useMergedProducts(): UseMergedProductsReturn {
   const [mergedProducts, setMergedProducts] = useState<MergedProduct[]>([]);
@@ -88,61 +72,13 @@ export function useMergedProducts(): UseMergedProductsReturn {
     if (fetchStarted.current) return;
     fetchStarted.current = true;
     
-    const fetchAndMergeProducts = async () => {
+    const fetchMergedProducts = async () => {
       try {
         setIsLoading(true);
         setError(null);
 
-        // Fetch all products from database
-        const allProducts = await getProducts();
-
-        // Group products by merge rules
-        const productGroups: { [key: string]: any[] } = {};
-        const ungroupedProducts: any[] = [];
-
-        allProducts.forEach(product => {
-          let grouped = false;
-          
-          // Check against each merge rule
-          for (const [categoryKey, rule] of Object.entries(MERGE_RULES)) {
-            const matchesRule = rule.searchTerms.some(term =>
-              product.name.toLowerCase().includes(term.toLowerCase())
-            );
-            
-            if (matchesRule) {
-              if (!productGroups[categoryKey]) {
-                productGroups[categoryKey] = [];
-              }
-              productGroups[categoryKey].push(product);
-              grouped = true;
-              break;
-            }
-          }
-          
-          // If no merge rule matched, keep as individual product
-          if (!grouped) {
-            ungroupedProducts.push(product);
-          }
-        });
-
-
-        // Merge grouped products and fetch their variants
-        const merged: MergedProduct[] = [];
-
-        // Process grouped products (these get merged)
-        for (const [categoryKey, products] of Object.entries(productGroups)) {
-          if (products.length > 0) {
-            const rule = MERGE_RULES[categoryKey as keyof typeof MERGE_RULES];
-            const mergedProduct = await createMergedProduct(products, rule.mergedName, categoryKey);
-            merged.push(mergedProduct);
-          }
-        }
-
-        // Process ungrouped products (these remain individual)
-        for (const product of ungroupedProducts) {
-          const individual = await createMergedProduct([product], product.name, `individual-${product.id}`);
-          merged.push(individual);
-        }
+        // Products, variants and colour/size options arrive pre-merged in one response
+        const { products: merged } = await getMergedCatalog();
 
         // If no merged products found, create fallback products with static data
         if (merged.length === 0) {
@@ -158,6 +94,19 @@ export function useMergedProducts(): UseMergedProductsReturn {
             mergedProductsCache.set(product.id, product);
           });
           setMergedProducts(merged);
+
+          // The catalog is a static snapshot; overlay live stock without blocking the first render
+          getLiveVariantStock(merged.flatMap(product => product.variants.map(variant => variant.id)))
+            .then(stock => {
+              const withStock = applyLiveStock(merged, stock);
+              withStock.forEach(product => {
+                mergedProductsCache.set(product.id, product);
+              });
+              setMergedProducts(withStock);
+            })
+            .catch(() => {
+              // Keep snapshot stock if the live read fails
+            });
         }
 
       } catch (err) {
@@ -167,7 +116,7 @@ export function useMergedProducts(): UseMergedProductsReturn {
       }
     };
 
-    fetchAndMergeProducts();
+    fetchMergedProducts();
   }, []);
 
   const getProductByCategory = (category: string): MergedProduct | undefined => {
@@ -185,151 +134,23 @@ export function useMergedProducts(): UseMergedProductsReturn {
   };
 }
 
-// Helper function to aggregate metadata from all products
-function aggregateProductMetadata(products: any[]) {
-  // Combine all images with deduplication
-  const allImages = new Map();
-  products.forEach(product => {
-    if (product.images) {
-      product.images.forEach(img => {
-        if (!allImages.has(img.image_url)) {
-          allImages.set(img.image_url, img);
-        }
-      });
-    }
-  });
-  
-  // Aggregate descriptions
-  const descriptions = products
-    .map(p => p.description)
-    .filter(Boolean)
-    .join(' | ');
-  
-  // Calculate weighted average rating from products that have ratings
-  const productsWithRatings = products.filter(p => p.rating && p.rating > 0);
-  let averageRating = 4.8; // Better default than 5.0
-  let totalReviews = 0;
-  
-  if (productsWithRatings.length > 0) {
-    const totalRating = productsWithRatings.reduce((sum, p) => 
-      sum + p.rating * (p.reviews || 1), 0);
-    totalReviews = productsWithRatings.reduce((sum, p) => 
-      sum + (p.reviews || 1), 0);
-    averageRating = totalRating / totalReviews;
-  }
-  
-  return {
-    images: Array.from(allImages.values()),
-    description: descriptions,
-    rating: averageRating,
-    reviews: totalReviews,
-    category: products[0].category, // Use first product's category
-    image_url: products[0].image_url || '/images/Leaven Logo.png'
-  };
-}
-
-// Helper function to create a merged product from multiple database products
-async function createMergedProduct(
-  products: any[], 
-  mergedName: string, 
-  categoryKey: string
-): Promise<MergedProduct> {
-  // Aggregate metadata from ALL products, not just first one
-  const aggregatedMetadata = aggregateProductMetadata(products);
-  const baseProduct = products[0]; // Still use first product for fallbacks
-  
-  // Fetch variants for all products and combine them
-  const allVariants: ProductVariant[] = [];
-  
-  for (const product of products) {
-    try {
-      // Check cache first
-      let variants = variantsCache.get(product.id);
-      if (!variants) {
-        const fetchedVariants = await getProductVariants(product.id);
-        variants = fetchedVariants;
-        // Cache the variants
-        variantsCache.set(product.id, fetchedVariants);
-      }
-      
-      // Transform database variants to our format
-      const transformedVariants = (variants as any[]).map(variant => ({
-        id: variant.id,
-        product_id: product.id,
-        color: variant.color || 'Unknown',
-        color_hex: variant.color_hex || '#CCCCCC',
-        size: variant.size || 'M',
-        price: variant.price || 0,
-        stock: variant.stock || 0,
-        sku: variant.sku,
-        printful_variant_id: variant.printful_variant_id,
-        // description field doesn't exist in product_variants table
-      }));
-      
-      allVariants.push(...transformedVariants);
-    } catch (error) {
-      // Silently handle variant fetch errors
-    }
-  }
-
-  // Extract unique colors with hex values
-  const uniqueColors = new Map<string, string>();
-  allVariants.forEach(variant => {
-    if (variant.color && variant.color_hex) {
-      uniqueColors.set(variant.color, variant.color_hex);
-    }
-  });
-
-  const colorOptions = Array.from(uniqueColors.entries()).map(([name, hex]) => ({
-    name,
-    hex,
-    border: name.toLowerCase() === 'white'
+// Replace snapshot stock levels and availability with live ones; a variant that is out of
+// stock or unavailable now reports zero stock, whatever the stock column says
+function applyLiveStock(products: MergedProduct[], stock: Map<string, LiveVariantStock>): MergedProduct[] {
+  return products.map(product => ({
+    ...product,
+    variants: product.variants.map(variant => {
+      const live = stock.get(variant.id);
+      if (!live) return variant;
+      const sellable = live.inStock && live.isAvailable;
+      return {
+        ...variant,
+        stock: sellable ? live.stock : 0,
+        in_stock: sellable,
+        is_available: live.isAvailable
+      };
+    })
   }));
-
-  // Extract unique sizes
-  const uniqueSizes = new Set<string>();
-  allVariants.forEach(variant => {
-    if (variant.size) {
-      uniqueSizes.add(variant.size);
-    }
-  });
-
-  // Sort sizes in typical order
-  const sizeOrder = ['XS', 'S', 'M', 'L', 'XL', '2XL', '3XL'];
-  const sizeOptions = Array.from(uniqueSizes).sort((a, b) => {
-    const aIndex = sizeOrder.indexOf(a);
-    const bIndex = sizeOrder.indexOf(b);
-    
-    if (aIndex === -1 && bIndex === -1) return a.localeCompare(b);
-    if (aIndex === -1) return 1;
-    if (bIndex === -1) return -1;
-    return aIndex - bIndex;
-  });
-
-  // Calculate price range
-  const prices = allVariants.map(v => v.price).filter(p => p > 0);
-  const priceRange = {
-    min: prices.length > 0 ? Math.min(...prices) : 0,
-    max: prices.length > 0 ? Math.max(...prices) : 0
-  };
-
-  return {
-    id: categoryKey,
-    name: mergedName,
-    description: aggregatedMetadata.description || baseProduct.description,
-    category: aggregatedMetadata.category,
-    baseProduct: {
-      ...baseProduct,
-      rating: aggregatedMetadata.rating,
-      reviews: aggregatedMetadata.reviews,
-      images: aggregatedMetadata.images
-    },
-    variants: allVariants,
-    colorOptions,
-    sizeOptions,
-    priceRange,
-    image_url: aggregatedMetadata.image_url
-  };
 }
 
 // Create fallback products when database is empty
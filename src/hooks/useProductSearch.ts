@@ -0,0 +1,99 @@
+import { useState, useEffect, useRef, useCallback } from 'react';
+import {
+  searchProducts,
+  DEFAULT_SEARCH_PAGE_SIZE,
+  type ProductSearchParams,
+  type ProductSearchResult,
+  type ProductSearchItem
+} from '../lib/search-api';
+
+// Wait for typing to settle before hitting the server
+const SEARCH_DEBOUNCE_MS = 250;
+
+export interface UseProductSearchReturn {
+  result: ProductSearchResult | null;
+  items: ProductSearchItem[];
+  isSearching: boolean;
+  error: string | null;
+  hasMore: boolean;
+  loadMore: () => Promise<void>;
+}
+
+/**
+ * Server-side product search with facets. Re-runs (debounced) whenever the params change;
+ * responses to superseded params are dropped. Pages accumulate through loadMore().
+ */
+export const useProductSearch = (
+  params: Omit<ProductSearchParams, 'offset'>,
+  enabled: boolean = true
+): UseProductSearchReturn => {
+  const [result, setResult] = useState<ProductSearchResult | null>(null);
+  const [items, setItems] = useState<ProductSearchItem[]>([]);
+  const [isSearching, setIsSearching] = useState(false);
+  const [error, setError] = useState<string | null>(null);
+  const latestRequest = useRef(0);
+
+  // Stable key so equal params in new object/array instances don't re-query
+  const paramsKey = JSON.stringify(params);
+
+  useEffect(() => {
+    if (!enabled) {
+      latestRequest.current++;
+      setResult(null);
+      setItems([]);
+      setIsSearching(false);
+      setError(null);
+      return;
+    }
+
+    const requestId = ++latestRequest.current;
+    setIsSearching(true);
+
+    const timer = setTimeout(async () => {
+      try {
+        const data = await searchProducts({ ...JSON.parse(paramsKey), offset: 0 });
+        if (requestId !== latestRequest.current) return;
+        setResult(data);
+        setItems(data.items);
+        setError(null);
+      } catch (err) {
+        if (requestId !== latestRequest.current) return;
+        setError(err instanceof Error ? err.message : 'Search failed');
+      } finally {
+        if (requestId === latestRequest.current) {
+          setIsSearching(false);
+        }
+      }
+    }, SEARCH_DEBOUNCE_MS);
+
+    return () => clearTimeout(timer);
+  }, [paramsKey, enabled]);
+
+  const hasMore = !!result && items.length < result.total;
+
+  const loadMore = useCallback(async () => {
+    if (!result || isSearching || items.length >= result.total) return;
+
+    const requestId = latestRequest.current;
+    setIsSearching(true);
+    try {
+      const data = await searchProducts({
+        ...JSON.parse(paramsKey),
+        offset: items.length,
+        limit: params.limit || DEFAULT_SEARCH_PAGE_SIZE
+      });
+      if (requestId !== latestRequest.current) return;
+      setResult(data);
+      setItems(prev => [...prev, ...data.items]);
+    } catch (err) {
+      if (requestId !== latestRequest.current) return;
+      setError(err instanceof Error ? err.message : 'Search failed');
+    } finally {
+      if (requestId === latestRequest.current) {
+        setIsSearching(false);
+      }
+    }
+  }, [result, isSearching, items.length, paramsKey, params.limit]);
+
+  return { result, items, isSearching, error, hasMore, loadMore };
+};
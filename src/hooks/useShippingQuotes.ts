@@ -1,132 +1,89 @@
-import { useState } from 'react'
+import { useState, useCallback, useEffect, useRef } from 'react'
 import type { ShippingQuoteRequest, ShippingOption } from '../lib/shipping/types'
+import { createQuoteScheduler } from '../lib/shipping/quotes'
+
+const FALLBACK_OPTIONS: ShippingOption[] = [
+  {
+    id: 'standard-uk',
+    name: 'Standard UK Delivery',
+    rate: '4.99',
+    currency: 'GBP',
+    minDeliveryDays: 3,
+    maxDeliveryDays: 5,
+    carrier: 'Royal Mail'
+  },
+  {
+    id: 'express-uk',
+    name: 'Express UK Delivery',
+    rate: '8.99',
+    currency: 'GBP',
+    minDeliveryDays: 1,
+    maxDeliveryDays: 2,
+    carrier: 'DHL Express'
+  },
+  {
+    id: 'international-standard',
+    name: 'International Standard',
+    rate: '12.99',
+    currency: 'GBP',
+    minDeliveryDays: 7,
+    maxDeliveryDays: 14,
+    carrier: 'Royal Mail International'
+  }
+]
 
 export function useShippingQuotes() {
   const [loading, setLoading] = useState(false)
   const [options, setOptions] = useState<ShippingOption[]>([])
   const [error, setError] = useState<string | null>(null)
 
-  async function fetchQuotes(req: ShippingQuoteRequest) {
-    setLoading(true)
-    setError(null)
-    
-    try {
-      const supabaseUrl = import.meta.env.VITE_SUPABASE_URL
-      const anonKey = import.meta.env.VITE_SUPABASE_ANON_KEY
+  // Debounces address input and cancels superseded requests, so a stale response
+  // can never overwrite the rates for the address the shopper typed last
+  const schedulerRef = useRef(createQuoteScheduler())
 
-      if (!supabaseUrl || !anonKey) {
-        throw new Error('Missing Supabase configuration')
-      }
+  useEffect(() => {
+    const scheduler = schedulerRef.current
+    return () => scheduler.cancel()
+  }, [])
 
-      const res = await fetch(`${supabaseUrl}/functions/v1/shipping-quotes`, {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-          'Authorization': `Bearer ${anonKey}`,
-        },
-        body: JSON.stringify(req)
-      })
+  const fetchQuotes = useCallback(async (req: ShippingQuoteRequest, { immediate = false } = {}) => {
+    setLoading(true)
+    setError(null)
 
-      if (!res.ok) {
-        const errorData = await res.json().catch(() => ({}))
-        
-        // Use fallback shipping options instead of throwing error
-        console.warn('Shipping API failed, using fallback options:', errorData);
-        
-        const fallbackOptions: ShippingOption[] = [
-          {
-            id: 'standard-uk',
-            name: 'Standard UK Delivery',
-            rate: '4.99',
-            currency: 'GBP',
-            minDeliveryDays: 3,
-            maxDeliveryDays: 5,
-            carrier: 'Royal Mail'
-          },
-          {
-            id: 'express-uk',
-            name: 'Express UK Delivery',
-            rate: '8.99',
-            currency: 'GBP',
-            minDeliveryDays: 1,
-            maxDeliveryDays: 2,
-            carrier: 'DHL Express'
-          },
-          {
-            id: 'international-standard',
-            name: 'International Standard',
-            rate: '12.99',
-            currency: 'GBP',
-            minDeliveryDays: 7,
-            maxDeliveryDays: 14,
-            carrier: 'Royal Mail International'
-          }
-        ];
-        
-        setOptions(fallbackOptions);
-        setError('Using standard shipping rates (live quotes unavailable)');
-        return;
-      }
+    try {
+      const data = await schedulerRef.current.quote(req, { immediate })
+      if (!data) return // Superseded by a newer request, which owns the loading state
 
-      const data = await res.json()
-      console.log('🔍 Shipping quotes from API:', data.options?.map(o => ({
+      console.log('🔍 Shipping quotes from API:', data.options.map(o => ({
         name: o.name,
         minDays: o.minDeliveryDays,
         maxDays: o.maxDeliveryDays,
         rate: o.rate
       })));
-      setOptions(data.options ?? [])
-      
+      setOptions(data.options)
+      setLoading(false)
+
     } catch (e: any) {
       console.warn('Shipping quotes error, using fallback options:', e);
-      
+
       // Use fallback shipping options on any error
-      const fallbackOptions: ShippingOption[] = [
-        {
-          id: 'standard-uk',
-          name: 'Standard UK Delivery',
-          rate: '4.99',
-          currency: 'GBP',
-          minDeliveryDays: 3,
-          maxDeliveryDays: 5,
-          carrier: 'Royal Mail'
-        },
-        {
-          id: 'express-uk',
-          name: 'Express UK Delivery',
-          rate: '8.99',
-          currency: 'GBP',
-          minDeliveryDays: 1,
-          maxDeliveryDays: 2,
-          carrier: 'DHL Express'
-        },
-        {
-          id: 'international-standard',
-          name: 'International Standard',
-          rate: '12.99',
-          currency: 'GBP',
-          minDeliveryDays: 7,
-          maxDeliveryDays: 14,
-          carrier: 'Royal Mail International'
-        }
-      ];
-      
-      setOptions(fallbackOptions);
+      setOptions(FALLBACK_OPTIONS);
       setError('Using standard shipping rates (live quotes unavailable)');
-    } finally {
       setLoading(false)
     }
-  }
+  }, [])
 
-  function clearQuotes() {
-    setOptions([])
+  const clearQuotes = useCallback(() => {
+    schedulerRef.current.cancel()
+    setLoading(false)
+    setOptions(prev => (prev.length === 0 ? prev : []))
     setError(null)
-  }
+  }, [])
 
-  return { 
-    loading, 
-    options, 
-    error, 
+  return {
+    loading,
+    options,
+    error,
     fetchQuotes,
     clearQuotes
   }
@@ -0,0 +1,98 @@
+import { useState, useEffect, useCallback, useRef } from 'react';
+
+interface WindowedListOptions {
+  rowCount: number;
+  estimatedRowHeight: number;
+  overscan?: number;
+  // Called when the window gets within endThreshold rows of the end, at most once per endKey
+  onEndReached?: () => void;
+  endThreshold?: number;
+  endKey?: string | number;
+}
+
+interface WindowedListState<T extends HTMLElement> {
+  containerRef: (element: T | null) => void;
+  measureRef: (element: HTMLElement | null) => void;
+  startRow: number;
+  endRow: number;
+  paddingTop: number;
+  paddingBottom: number;
+}
+
+// Renders only the rows inside a scroll container (plus overscan).
+// Row height is measured from the first rendered row, so cards can change size with breakpoints.
+const useWindowedList = <T extends HTMLElement = HTMLDivElement>({
+  rowCount,
+  estimatedRowHeight,
+  overscan = 3,
+  onEndReached,
+  endThreshold = 5,
+  endKey = rowCount
+}: WindowedListOptions): WindowedListState<T> => {
+  const [container, setContainer] = useState<T | null>(null);
+  const [scrollTop, setScrollTop] = useState(0);
+  const [viewportHeight, setViewportHeight] = useState(0);
+  const [rowHeight, setRowHeight] = useState(estimatedRowHeight);
+  const rowObserver = useRef<ResizeObserver | null>(null);
+  const endReachedAt = useRef<string | number | null>(null);
+
+  useEffect(() => {
+    if (!container) return;
+
+    let frame = 0;
+    const handleScroll = () => {
+      cancelAnimationFrame(frame);
+      frame = requestAnimationFrame(() => setScrollTop(container.scrollTop));
+    };
+    const resizeObserver = new ResizeObserver(() => setViewportHeight(container.clientHeight));
+
+    setViewportHeight(container.clientHeight);
+    container.addEventListener('scroll', handleScroll, { passive: true });
+    resizeObserver.observe(container);
+
+    return () => {
+      cancelAnimationFrame(frame);
+      container.removeEventListener('scroll', handleScroll);
+      resizeObserver.disconnect();
+    };
+  }, [container]);
+
+  const measureRef = useCallback((element: HTMLElement | null) => {
+    rowObserver.current?.disconnect();
+    rowObserver.current = null;
+    if (!element) return;
+
+    rowObserver.current = new ResizeObserver(() => {
+      if (element.offsetHeight > 0) {
+        setRowHeight(element.offsetHeight);
+      }
+    });
+    rowObserver.current.observe(element);
+  }, []);
+
+  useEffect(() => () => rowObserver.current?.disconnect(), []);
+
+  const visibleRows = Math.ceil((viewportHeight || estimatedRowHeight * 4) / rowHeight);
+  const firstVisible = Math.min(Math.floor(scrollTop / rowHeight), Math.max(rowCount - 1, 0));
+  const startRow = Math.max(0, firstVisible - overscan);
+  const endRow = Math.min(rowCount, firstVisible + visibleRows + overscan);
+
+  useEffect(() => {
+    if (!onEndReached) return;
+    if (endRow >= rowCount - endThreshold && endReachedAt.current !== endKey) {
+      endReachedAt.current = endKey;
+      onEndReached();
+    }
+  }, [endRow, rowCount, endThreshold, endKey, onEndReached]);
+
+  return {
+    containerRef: setContainer,
+    measureRef,
+    startRow,
+    endRow,
+    paddingTop: startRow * rowHeight,
+    paddingBottom: Math.max(0, (rowCount - endRow) * rowHeight)
+  };
+};
+
+export default useWindowedList;
@@ -0,0 +1,77 @@
+// Colour, size and design options for the apparel products
+// Kept apart from the full variant tables (tshirt/hoodie-variants-merged-fixed) so listing pages
+// can show options without pulling every variant into their bundle
+
+// T-shirt designs, sizes, and colors
+export const tshirtDesigns = ['DARK', 'LIGHT'] as const;
+export const tshirtSizes = ['S', 'M', 'L', 'XL', '2XL'] as const;
+
+// Define the actual t-shirt colors with hex codes
+export const tshirtColors = [
+  { name: 'Ash', hex: '#f0f1ea' },
+  { name: 'Athletic Heather', hex: '#cececc' },
+  { name: 'Heather Dust', hex: '#e5d9c9' },
+  { name: 'Heather Prism Peach', hex: '#f3c2b2' },
+  { name: 'Mustard', hex: '#eda027' },
+  { name: 'Pink', hex: '#fdbfc7' },
+  { name: 'White', hex: '#ffffff', border: true },
+  { name: 'Yellow', hex: '#ffd667' },
+  { name: 'Army', hex: '#5f5849' },
+  { name: 'Asphalt', hex: '#52514f' },
+  { name: 'Autumn', hex: '#c85313' },
+  { name: 'Black', hex: '#0c0c0c' },
+  { name: 'Black Heather', hex: '#0b0b0b' },
+  { name: 'Dark Grey Heather', hex: '#3E3C3D' },
+  { name: 'Heather Deep Teal', hex: '#447085' },
+  { name: 'Mauve', hex: '#bf6e6e' },
+  { name: 'Navy', hex: '#212642' },
+  { name: 'Olive', hex: '#5b642f' },
+  { name: 'Red', hex: '#d0071e' },
+  { name: 'Steel Blue', hex: '#668ea7' }
+];
+
+// Color design mapping for reference
+export const colorDesignMapping: { [key: string]: 'DARK' | 'LIGHT' } = {
+  // DARK design colors (white text)
+  'Army': 'DARK',
+  'Asphalt': 'DARK',
+  'Autumn': 'DARK',
+  'Black': 'DARK',
+  'Black Heather': 'DARK',
+  'Dark Grey Heather': 'DARK',
+  'Heather Deep Teal': 'DARK',
+  'Mauve': 'DARK',
+  'Navy': 'DARK',
+  'Olive': 'DARK',
+  'Red': 'DARK',
+  'Steel Blue': 'DARK',
+
+  // LIGHT design colors (black text)
+  'Ash': 'LIGHT',
+  'Athletic Heather': 'LIGHT',
+  'Heather Dust': 'LIGHT',
+  'Heather Prism Peach': 'LIGHT',
+  'Mustard': 'LIGHT',
+  'Pink': 'LIGHT',
+  'White': 'LIGHT',
+  'Yellow': 'LIGHT'
+};
+
+// Hoodie designs, sizes, and colors
+export const hoodieDesigns = ['DARK', 'LIGHT'] as const;
+export const hoodieSizes = ['S', 'M', 'L', 'XL', '2XL'] as const;
+
+// Define the actual hoodie colors with hex codes
+export const hoodieColors = [
+  // DARK colors
+  { name: 'Black', hex: '#0b0b0b' },
+  { name: 'Dark Heather', hex: '#47484d' },
+  { name: 'Indigo Blue', hex: '#395d82' },
+  { name: 'Navy', hex: '#131928' },
+  { name: 'Red', hex: '#da0a1a' },
+  // LIGHT colors
+  { name: 'Light Blue', hex: '#a1c5e1' },
+  { name: 'Light Pink', hex: '#f3d4e3' },
+  { name: 'Sport Grey', hex: '#9b969c' },
+  { name: 'White', hex: '#ffffff', border: true }
+];
@@ -2,6 +2,8 @@
 // Generated on: 2025-09-07T12:23:03.192Z
 // Total variants: 1
 
+import { createVariantIndex } from '../lib/variant-index';
+
 export type WaterbottleVariant = {
   key: string;
   catalogVariantId: number;
@@ -24,12 +26,15 @@ export const WaterbottleVariants: WaterbottleVariant[] = [
   },
 ];
 
+const variantsByKey = createVariantIndex(WaterbottleVariants, v => [v.key]);
+const variantsByCatalogId = createVariantIndex(WaterbottleVariants, v => [v.catalogVariantId]);
+
 // Helper function to find variant by key
 export function findWaterbottleVariant(key: string): WaterbottleVariant | undefined {
-  return WaterbottleVariants.find(v => v.key === key);
+  return variantsByKey.get(key);
 }
 
 // Helper function to find variant by catalog variant ID
 export function findWaterbottleVariantByCatalogId(catalogVariantId: number): WaterbottleVariant | undefined {
-  return WaterbottleVariants.find(v => v.catalogVariantId === catalogVariantId);
+  return variantsByCatalogId.get(catalogVariantId);
 }
\ No newline at end of file
@@ -1,5 +1,8 @@
 import { supabase } from './supabase'
 import { handleError, logError, APIError } from './error-handler'
+import type { ImageRendition } from './image-renditions'
+import { config } from './config'
+import type { MergedProduct } from '../hooks/useMergedProducts'
 
 export interface Product {
   id: string
@@ -15,6 +18,7 @@ export interface Product {
   created_at: string
   updated_at: string
   image_url?: string
+  image_renditions?: ImageRendition[] // Pre-generated widths of image_url for srcset
   slug?: string // Add slug property
 }
 
@@ -34,6 +38,7 @@ export async function getProducts(): Promise<Product[]> {
         *,
         product_images!left (
           image_url,
+          renditions,
           is_primary,
           image_order,
           variant_type,
@@ -116,6 +121,9 @@ export async function getProducts(): Promise<Product[]> {
           return product.image_url || '/BackReformLogo.png';
         };
         
+        const imageUrl = getImageUrl();
+        const selectedImage = (product.product_images || []).find((img: any) => img.image_url === imageUrl);
+
         const mappedProduct = {
           id: product.id,
           name: product.name,
@@ -129,7 +137,8 @@ export async function getProducts(): Promise<Product[]> {
           dateAdded: product.created_at, // Use created_at as dateAdded
           created_at: product.created_at,
           updated_at: product.updated_at,
-          image_url: getImageUrl(), // Use intelligent image selection
+          image_url: imageUrl, // Use intelligent image selection
+          image_renditions: selectedImage?.renditions || [],
           slug: product.slug, // Map slug
           images: product.product_images || [] // Include full images array for useMergedProducts
         };
@@ -174,6 +183,148 @@ export async function getProductVariants(productId: string): Promise<any[]> {
   }
 } 
 
+export interface MergedCatalog {
+  version: number
+  generatedAt: string
+  products: MergedProduct[]
+}
+
+// Static catalog snapshot published to Storage after each Printful sync or admin save
+const CATALOG_STORAGE_URL = `${config.supabase.url}/storage/v1/object/public/catalog`
+
+interface CatalogManifest {
+  version: number
+  path: string
+  generatedAt: string
+  products: number
+}
+
+/**
+ * Loads the static catalog snapshot from Supabase Storage.
+ * The small manifest is revalidated (ETag) on every load; the versioned snapshot it points
+ * to is immutable, so the browser serves it from its long-lived cache until the version moves.
+ * @returns Promise<MergedCatalog> Snapshot catalog (variant stock as of the build)
+ * @throws Error if no snapshot has been published or it can't be fetched
+ */
+export async function getCatalogSnapshot(): Promise<MergedCatalog> {
+  const manifestResponse = await fetch(`${CATALOG_STORAGE_URL}/manifest.json`, { cache: 'no-cache' })
+  if (!manifestResponse.ok) {
+    throw new APIError(`Catalog manifest unavailable: ${manifestResponse.status}`, {
+      context: 'catalog-snapshot-fetch',
+      status: manifestResponse.status
+    })
+  }
+
+  const manifest: CatalogManifest = await manifestResponse.json()
+  const snapshotResponse = await fetch(`${CATALOG_STORAGE_URL}/${manifest.path}`)
+  if (!snapshotResponse.ok) {
+    throw new APIError(`Catalog snapshot v${manifest.version} unavailable: ${snapshotResponse.status}`, {
+      context: 'catalog-snapshot-fetch',
+      status: snapshotResponse.status
+    })
+  }
+
+  return snapshotResponse.json()
+}
+
+/**
+ * Fetches the merged storefront catalog (products, images, variants, colour and size
+ * options) in a single request. Prefers the static snapshot in Storage and falls back
+ * to the merged-catalog edge function, whose ETag lets the browser revalidate cheaply.
+ * @returns Promise<MergedCatalog> Merged catalog with its version tag
+ * @throws Error if both sources fail
+ */
+export async function getMergedCatalog(): Promise<MergedCatalog> {
+  try {
+    console.log('🛍️ Fetching merged catalog...');
+
+    try {
+      const snapshot = await getCatalogSnapshot()
+      console.log(`✅ Loaded catalog snapshot v${snapshot.version} with ${snapshot.products.length} products`);
+      return snapshot
+    } catch (snapshotError) {
+      console.warn('⚠️ Catalog snapshot unavailable, using live catalog:', snapshotError);
+    }
+
+    const response = await fetch(`${config.supabase.url}/functions/v1/merged-catalog`, {
+      method: 'GET',
+      headers: {
+        'apikey': config.supabase.anonKey,
+        'Authorization': `Bearer ${config.supabase.anonKey}`
+      },
+      // Revalidate with If-None-Match when stale; an unchanged catalog comes back as a 304
+      cache: 'no-cache'
+    })
+
+    if (!response.ok) {
+      throw new APIError(`Failed to load catalog: ${response.status}`, {
+        context: 'merged-catalog-fetch',
+        status: response.status
+      })
+    }
+
+    const catalog: MergedCatalog = await response.json()
+    console.log(`✅ Loaded merged catalog v${catalog.version} with ${catalog.products.length} products`);
+    return catalog
+  } catch (error) {
+    logError(error, 'getMergedCatalog');
+    throw error;
+  }
+}
+
+// Variant ids per stock query, keeping the `id=in.(...)` filter well inside URL length limits
+const LIVE_STOCK_BATCH_SIZE = 150
+
+export interface LiveVariantStock {
+  stock: number
+  inStock: boolean
+  isAvailable: boolean
+}
+
+/**
+ * Fetches current stock and availability for the given variants. Catalog snapshots are
+ * static, so this is the only per-visit database read the shop needs. Printful stock
+ * events only write in_stock/is_available, so those are returned alongside stock.
+ * @param variantIds - Variant ids from the catalog snapshot
+ * @returns Promise<Map<string, LiveVariantStock>> Variant id -> live stock
+ * @throws Error if the database query fails
+ */
+export async function getLiveVariantStock(variantIds: string[]): Promise<Map<string, LiveVariantStock>> {
+  try {
+    const batches: string[][] = []
+    for (let i = 0; i < variantIds.length; i += LIVE_STOCK_BATCH_SIZE) {
+      batches.push(variantIds.slice(i, i + LIVE_STOCK_BATCH_SIZE))
+    }
+
+    const results = await Promise.all(batches.map(ids =>
+      supabase
+        .from('product_variants')
+        .select('id, stock, in_stock, is_available')
+        .in('id', ids)
+    ))
+
+    const stock = new Map<string, LiveVariantStock>()
+    for (const { data, error } of results) {
+      if (error) {
+        console.error('❌ Failed to fetch variant stock:', error);
+        throw handleError(error, 'variant-stock-fetch');
+      }
+      for (const variant of data || []) {
+        stock.set(variant.id, {
+          stock: variant.stock || 0,
+          inStock: variant.in_stock !== false,
+          isAvailable: variant.is_available !== false
+        })
+      }
+    }
+
+    return stock
+  } catch (error) {
+    logError(error, 'getLiveVariantStock');
+    throw error;
+  }
+}
+
 export async function cancelOrder(orderId: string, reason?: string) {
   try {
     console.log(`🚫 Attempting to cancel order: ${orderId}`);
@@ -0,0 +1,288 @@
+// Cart persistence for CartContext
+// - Writes to localStorage are coalesced, so a burst of quantity clicks is one write
+// - The stored cart is a compact, versioned document; older formats migrate on read
+// - Other tabs hear about changes through BroadcastChannel (or the storage event where it's missing)
+// - Signed-in shoppers get a server copy in customer_carts, synced in the background
+
+import type { CartItem } from '../contexts/CartContext';
+import { supabase } from './supabase';
+
+export const CART_STORAGE_KEY = 'reformuk-cart';
+export const CART_SCHEMA_VERSION = 2;
+
+const CART_WRITE_DELAY_MS = 250;
+export const CART_SERVER_SYNC_DELAY_MS = 2000;
+
+export interface CartSnapshot {
+  items: CartItem[];
+  savedAt: number; // ms since epoch, used for last-writer-wins between tabs and devices
+  owner?: string | null; // user id the cart was saved under, null for an anonymous cart
+}
+
+// ===== STORAGE SCHEMA =====
+
+// v1: a bare JSON array of CartItem
+// v2: { v: 2, t: savedAt, o?: owner, items: [...] } with short keys and unset fields dropped
+const FIELD_KEYS: Record<keyof CartItem, string> = {
+  id: 'i',
+  name: 'n',
+  price: 'p',
+  image: 'm',
+  quantity: 'q',
+  printful_variant_id: 'pv',
+  size: 's',
+  color: 'c',
+  isBundle: 'b',
+  bundleContents: 'bc',
+  originalPrice: 'op',
+  currency: 'cu',
+  sku: 'sk',
+  external_id: 'x',
+  isPartOfBundle: 'pb',
+  bundleName: 'bn',
+  bundleId: 'bi',
+  isDiscount: 'd'
+};
+
+const FIELDS_BY_KEY = Object.fromEntries(
+  Object.entries(FIELD_KEYS).map(([field, key]) => [key, field])
+) as Record<string, keyof CartItem>;
+
+interface StoredCartV2 {
+  v: 2;
+  t: number;
+  o?: string;
+  items: Array<Record<string, unknown>>;
+}
+
+function encodeItem(item: CartItem): Record<string, unknown> {
+  const encoded: Record<string, unknown> = {};
+  for (const [field, value] of Object.entries(item)) {
+    if (value === undefined || value === null || value === false) continue;
+    encoded[FIELD_KEYS[field as keyof CartItem] ?? field] = value;
+  }
+  return encoded;
+}
+
+function decodeItem(encoded: Record<string, unknown>): CartItem {
+  const item: Record<string, unknown> = {};
+  for (const [key, value] of Object.entries(encoded)) {
+    item[FIELDS_BY_KEY[key] ?? key] = value;
+  }
+  return item as unknown as CartItem;
+}
+
+function isCartItem(item: any): item is CartItem {
+  return !!item && item.id !== undefined && typeof item.name === 'string' &&
+    typeof item.price === 'number' && typeof item.quantity === 'number';
+}
+
+export function encodeCart(snapshot: CartSnapshot): string {
+  const stored: StoredCartV2 = {
+    v: CART_SCHEMA_VERSION,
+    t: snapshot.savedAt,
+    ...(snapshot.owner ? { o: snapshot.owner } : {}),
+    items: snapshot.items.map(encodeItem)
+  };
+  return JSON.stringify(stored);
+}
+
+/**
+ * Parse a stored cart in any known format. Unknown or corrupt data yields null.
+ */
+export function decodeCart(raw: string | null): CartSnapshot | null {
+  if (!raw) return null;
+
+  let parsed: any;
+  try {
+    parsed = JSON.parse(raw);
+  } catch {
+    return null;
+  }
+
+  // v1 - bare array written before the cart was versioned
+  if (Array.isArray(parsed)) {
+    return { items: parsed.filter(isCartItem), savedAt: 0, owner: null };
+  }
+
+  if (parsed && parsed.v === 2 && Array.isArray(parsed.items)) {
+    return {
+      items: parsed.items.map(decodeItem).filter(isCartItem),
+      savedAt: Number(parsed.t) || 0,
+      owner: typeof parsed.o === 'string' ? parsed.o : null
+    };
+  }
+
+  return null;
+}
+
+export function readStoredCart(): CartSnapshot | null {
+  try {
+    const raw = localStorage.getItem(CART_STORAGE_KEY);
+    const snapshot = decodeCart(raw);
+    if (raw && !snapshot) {
+      // Clear corrupted localStorage data
+      localStorage.removeItem(CART_STORAGE_KEY);
+    }
+    return snapshot;
+  } catch (error) {
+    console.error('Error loading cart from localStorage:', error);
+    return null;
+  }
+}
+
+// ===== CROSS-TAB SYNC =====
+
+const TAB_ID = `${Date.now().toString(36)}-${Math.random().toString(36).slice(2)}`;
+
+type CartMessage = { source: string; snapshot: CartSnapshot };
+
+let channel: BroadcastChannel | null | undefined;
+
+function getChannel(): BroadcastChannel | null {
+  if (channel === undefined) {
+    channel = typeof BroadcastChannel !== 'undefined' ? new BroadcastChannel(CART_STORAGE_KEY) : null;
+  }
+  return channel;
+}
+
+/**
+ * Listen for carts saved by other tabs
+ * @param onChange - Called with the other tab's snapshot
+ * @returns Unsubscribe function
+ */
+export function subscribeToCartChanges(onChange: (snapshot: CartSnapshot) => void): () => void {
+  const broadcast = getChannel();
+
+  if (broadcast) {
+    const handleMessage = (event: MessageEvent<CartMessage>) => {
+      if (event.data?.source !== TAB_ID && event.data?.snapshot) {
+        onChange(event.data.snapshot);
+      }
+    };
+    broadcast.addEventListener('message', handleMessage);
+    return () => broadcast.removeEventListener('message', handleMessage);
+  }
+
+  // The storage event only fires in other tabs, so there's no echo to filter
+  const handleStorage = (event: StorageEvent) => {
+    if (event.key !== CART_STORAGE_KEY) return;
+    const snapshot = decodeCart(event.newValue) ?? { items: [], savedAt: Date.now() };
+    onChange(snapshot);
+  };
+  window.addEventListener('storage', handleStorage);
+  return () => window.removeEventListener('storage', handleStorage);
+}
+
+// ===== COALESCED WRITES =====
+
+export interface CartPersister {
+  schedule: (snapshot: CartSnapshot) => void;
+  flush: () => void;
+  dispose: () => void;
+}
+
+/**
+ * Create a writer that saves only the latest snapshot once changes settle,
+ * and flushes immediately when the page is hidden or unloaded
+ */
+export function createCartPersister(delayMs: number = CART_WRITE_DELAY_MS): CartPersister {
+  let pending: CartSnapshot | null = null;
+  let timer: ReturnType<typeof setTimeout> | null = null;
+
+  const flush = () => {
+    if (timer) {
+      clearTimeout(timer);
+      timer = null;
+    }
+    if (!pending) return;
+
+    const snapshot = pending;
+    pending = null;
+
+    try {
+      localStorage.setItem(CART_STORAGE_KEY, encodeCart(snapshot));
+    } catch (error) {
+      console.error('Error saving cart to localStorage:', error);
+    }
+
+    try {
+      const message: CartMessage = { source: TAB_ID, snapshot };
+      getChannel()?.postMessage(message);
+    } catch (error) {
+      console.warn('Failed to broadcast cart change:', error);
+    }
+  };
+
+  const handleVisibility = () => {
+    if (document.visibilityState === 'hidden') flush();
+  };
+
+  window.addEventListener('pagehide', flush);
+  document.addEventListener('visibilitychange', handleVisibility);
+
+  return {
+    schedule: (snapshot) => {
+      pending = snapshot;
+      if (timer) clearTimeout(timer);
+      timer = setTimeout(flush, delayMs);
+    },
+    flush,
+    dispose: () => {
+      flush();
+      window.removeEventListener('pagehide', flush);
+      document.removeEventListener('visibilitychange', handleVisibility);
+    }
+  };
+}
+
+// ===== SERVER SYNC =====
+
+function decodeServerCart(data: any): CartSnapshot | null {
+  if (!data || !Array.isArray(data.items)) return null;
+  return {
+    items: data.items.map(decodeItem).filter(isCartItem),
+    savedAt: Number(data.saved_at) || 0
+  };
+}
+
+export async function loadServerCart(userId: string): Promise<CartSnapshot | null> {
+  const { data, error } = await supabase
+    .from('customer_carts')
+    .select('items, saved_at')
+    .eq('user_id', userId)
+    .maybeSingle();
+
+  if (error) {
+    throw new Error(`Failed to load saved cart: ${error.message}`);
+  }
+  return decodeServerCart(data);
+}
+
+/**
+ * Save a snapshot to the server. The server keeps whichever copy is newer and returns it.
+ */
+export async function saveServerCart(snapshot: CartSnapshot): Promise<CartSnapshot | null> {
+  const { data, error } = await supabase.rpc('save_customer_cart', {
+    p_items: snapshot.items.map(encodeItem),
+    p_saved_at: snapshot.savedAt,
+    p_schema_version: CART_SCHEMA_VERSION
+  });
+
+  if (error) {
+    throw new Error(`Failed to save cart: ${error.message}`);
+  }
+  return decodeServerCart(data);
+}
+
+/**
+ * Combine an anonymous device cart with the server cart when a shopper signs in: the newer
+ * cart wins for items both have, and items only the older cart has are kept.
+ * Only for that transition - a cart already saved under the account is reconciled by savedAt,
+ * since a union would bring back items removed on either side.
+ */
+export function mergeCarts(local: CartSnapshot, server: CartSnapshot): CartItem[] {
+  const [newer, older] = server.savedAt > local.savedAt ? [server, local] : [local, server];
+  const ids = new Set(newer.items.map(item => item.id));
+  return [...newer.items, ...older.items.filter(item => !ids.has(item.id))];
+}
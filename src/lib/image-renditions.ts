@@ -0,0 +1,70 @@
+/**
+ * Responsive image helpers for product images stored in Supabase Storage
+ */
+
+export interface ImageRendition {
+  width: number;
+  url: string;
+}
+
+// Must match RENDITION_WIDTHS in supabase/functions/_shared/image-storage.ts
+export const RENDITION_WIDTHS = [320, 640, 960, 1280];
+
+// Layout hints for the storefront grids and the product detail hero image
+export const PRODUCT_CARD_SIZES = '(min-width: 1280px) 25vw, (min-width: 768px) 33vw, 50vw';
+export const PRODUCT_DETAIL_SIZES = '(min-width: 1024px) 50vw, 100vw';
+
+const OBJECT_PATH = '/storage/v1/object/public/';
+const RENDER_PATH = '/storage/v1/render/image/public/';
+
+// Storage image transformation is off in supabase/config.toml and is a paid-plan feature on
+// hosted projects, so render URLs are only used when it's been switched on explicitly
+export const IMAGE_TRANSFORMS_ENABLED = import.meta.env.VITE_IMAGE_TRANSFORMS_ENABLED === 'true';
+
+/**
+ * Derive renditions for a Supabase Storage public URL when none were recorded at ingestion
+ * @param imageUrl - Public object URL
+ * @returns Renditions, or an empty array for images not served from Supabase Storage
+ */
+export function deriveRenditions(imageUrl: string): ImageRendition[] {
+  if (!IMAGE_TRANSFORMS_ENABLED || !imageUrl.includes(OBJECT_PATH)) {
+    return [];
+  }
+
+  const renderUrl = imageUrl.replace(OBJECT_PATH, RENDER_PATH);
+  const separator = renderUrl.includes('?') ? '&' : '?';
+  return RENDITION_WIDTHS.map(width => ({
+    width,
+    url: `${renderUrl}${separator}width=${width}&quality=75&resize=contain`,
+  }));
+}
+
+/**
+ * Build a srcset attribute for a product image
+ * @param imageUrl - Original image URL
+ * @param renditions - Renditions recorded on the product_images row, if any
+ * @returns srcset string, or undefined when the image has no renditions (the plain object URL in
+ *   `src` is used instead)
+ */
+export function getImageSrcSet(
+  imageUrl: string | undefined,
+  renditions?: ImageRendition[] | null
+): string | undefined {
+  if (!imageUrl) {
+    return undefined;
+  }
+
+  // Recorded render URLs only work while transformation is enabled
+  const recorded = (renditions || []).filter(
+    rendition => IMAGE_TRANSFORMS_ENABLED || !rendition.url.includes(RENDER_PATH)
+  );
+  const available = recorded.length > 0 ? recorded : deriveRenditions(imageUrl);
+  if (available.length === 0) {
+    return undefined;
+  }
+
+  return [...available]
+    .sort((a, b) => a.width - b.width)
+    .map(rendition => `${rendition.url} ${rendition.width}w`)
+    .join(', ');
+}
@@ -0,0 +1,69 @@
+// Prebuilt filter/sort index for admin lists
+// Search text and sort orders are computed once per list, so a keystroke only scans
+// precomputed lowercase strings and walks an already sorted order instead of re-sorting
+
+export type SortValue = string | number;
+
+export interface ListIndexOptions<T, K extends string> {
+  searchText: (item: T) => string;
+  sortValues: Record<K, (item: T) => SortValue>;
+}
+
+export interface ListQuery<T, K extends string> {
+  search?: string;
+  predicate?: (item: T) => boolean;
+  sortBy: K;
+  sortOrder: 'asc' | 'desc';
+}
+
+export interface ListIndex<T, K extends string> {
+  query: (query: ListQuery<T, K>) => T[];
+}
+
+const compareValues = (a: SortValue, b: SortValue) => (a < b ? -1 : a > b ? 1 : 0);
+
+/**
+ * Create an index over a list. Sort orders are built lazily, once per sort key and direction.
+ * Ties keep the list's original order in either direction.
+ * @param items - Items to index
+ * @param options - Search text and sort value extractors
+ */
+export function createListIndex<T, K extends string>(
+  items: readonly T[],
+  options: ListIndexOptions<T, K>
+): ListIndex<T, K> {
+  const searchText = items.map(item => options.searchText(item).toLowerCase());
+  const orders = new Map<string, number[]>();
+
+  // Each direction gets its own order, so ties keep the list's order both ways
+  // instead of coming out reversed when descending
+  const orderFor = (sortBy: K, sortOrder: 'asc' | 'desc') => {
+    const key = `${sortBy}:${sortOrder}`;
+    let order = orders.get(key);
+    if (!order) {
+      const sortValue = options.sortValues[sortBy];
+      const values = items.map(item => sortValue(item));
+      const direction = sortOrder === 'asc' ? 1 : -1;
+      order = items.map((_, position) => position);
+      order.sort((a, b) => direction * compareValues(values[a], values[b]) || a - b);
+      orders.set(key, order);
+    }
+    return order;
+  };
+
+  return {
+    query: ({ search, predicate, sortBy, sortOrder }) => {
+      const needle = (search || '').trim().toLowerCase();
+      const order = orderFor(sortBy, sortOrder);
+      const result: T[] = [];
+
+      for (const position of order) {
+        if (needle && !searchText[position].includes(needle)) continue;
+        if (predicate && !predicate(items[position])) continue;
+        result.push(items[position]);
+      }
+
+      return result;
+    }
+  };
+}
@@ -0,0 +1,81 @@
+import { supabase } from './supabase';
+
+export interface ProductSearchParams {
+  query?: string;
+  category?: string;
+  colors?: string[];
+  sizes?: string[];
+  tags?: string[];
+  minPrice?: number; // pounds
+  maxPrice?: number; // pounds
+  sort?: 'relevance' | 'popularity' | 'price-low' | 'price-high' | 'newest';
+  limit?: number;
+  offset?: number;
+}
+
+export interface ProductSearchItem {
+  id: string; // Storefront product id, matches MergedProduct.id
+  product_ids: string[];
+  name: string;
+  category: string;
+  colors: string[];
+  sizes: string[];
+  min_price: number;
+  max_price: number;
+  rank: number;
+}
+
+export interface FacetCount {
+  value: string;
+  count: number;
+}
+
+export interface ProductSearchResult {
+  total: number;
+  limit: number;
+  offset: number;
+  items: ProductSearchItem[];
+  facets: {
+    categories: FacetCount[];
+    colors: FacetCount[];
+    sizes: FacetCount[];
+    price_buckets: FacetCount[];
+  };
+}
+
+export const DEFAULT_SEARCH_PAGE_SIZE = 24;
+
+/**
+ * Search storefront products with full-text + fuzzy matching, filters and facet counts.
+ * Runs server-side against the indexed product_search_index, one round trip per page.
+ */
+export async function searchProducts(params: ProductSearchParams): Promise<ProductSearchResult> {
+  try {
+    console.log('🔍 Searching products:', params);
+
+    const { data, error } = await supabase.rpc('search_products', {
+      p_query: params.query?.trim() || null,
+      p_category: params.category && params.category !== 'all' ? params.category : null,
+      p_colors: params.colors?.length ? params.colors : null,
+      p_sizes: params.sizes?.length ? params.sizes : null,
+      p_tags: params.tags?.length ? params.tags : null,
+      p_min_price: params.minPrice ?? null,
+      p_max_price: params.maxPrice ?? null,
+      p_sort: params.sort || 'relevance',
+      p_limit: params.limit || DEFAULT_SEARCH_PAGE_SIZE,
+      p_offset: params.offset || 0,
+    });
+
+    if (error) {
+      console.error('❌ Failed to search products:', error);
+      throw new Error(`Failed to search products: ${error.message}`);
+    }
+
+    const result = data as ProductSearchResult;
+    console.log(`✅ Found ${result.total} products (${result.items.length} on this page)`);
+    return result;
+  } catch (error) {
+    console.error('Error searching products:', error);
+    throw error;
+  }
+}
@@ -0,0 +1,307 @@
+import type { ShippingQuoteRequest, ShippingQuoteResponse, Recipient } from './types'
+
+// Quote scheduling for checkout
+// Address input is debounced, a newer request cancels the one it supersedes, identical
+// requests share one network call, and successful quotes are kept for their TTL so the
+// Continue step can reuse rates prefetched while the shopper was typing.
+
+export const QUOTE_DEBOUNCE_MS = 400
+
+const QUOTE_CACHE_STORAGE_KEY = 'shipping-quotes-cache'
+// Quotes are kept for the ttlSeconds the function sends (short for live rates, longer for the
+// fallback table), never longer than this
+const QUOTE_CACHE_MAX_TTL_MS = 10 * 60 * 1000
+const QUOTE_CACHE_MAX_ENTRIES = 20
+
+// Postcode formats we can check client-side; other countries only need a plausible value
+const POSTCODE_PATTERNS: Record<string, RegExp> = {
+  GB: /^[A-Z]{1,2}\d[A-Z\d]?\s*\d[A-Z]{2}$/i,
+  US: /^\d{5}(-\d{4})?$/,
+  CA: /^[A-Z]\d[A-Z]\s*\d[A-Z]\d$/i,
+  IE: /^[A-Z\d]{3}\s*[A-Z\d]{4}$/i,
+  AU: /^\d{4}$/,
+  DE: /^\d{5}$/,
+  FR: /^\d{5}$/
+}
+
+function normalizePostcode(zip: string): string {
+  return zip.replace(/\s+/g, '').toUpperCase()
+}
+
+/**
+ * Whether a recipient has enough to quote: a valid ISO-2 country and a postcode that
+ * fits that country's format. Street and city aren't needed for rates.
+ */
+export function isQuotableRecipient(recipient: Partial<Recipient>): boolean {
+  const country = recipient.country_code?.trim() || ''
+  const zip = recipient.zip?.trim() || ''
+
+  if (!/^[A-Z]{2}$/.test(country) || !zip) {
+    return false
+  }
+
+  const pattern = POSTCODE_PATTERNS[country]
+  return pattern ? pattern.test(zip) : normalizePostcode(zip).length >= 3
+}
+
+/**
+ * Cache key for a quote request. The cart part matches the shipping-quotes function's
+ * cart signature; the destination is the part of the address rates depend on.
+ */
+export function quoteCacheKey(request: ShippingQuoteRequest): string {
+  const dest = [
+    request.recipient.country_code,
+    normalizePostcode(request.recipient.zip || ''),
+    request.recipient.state_code ?? ''
+  ].join('|')
+
+  const cartSig = request.items
+    .map(i => `${i.printful_variant_id}x${i.quantity}`)
+    .sort()
+    .join(',')
+
+  return `pf:rates:${dest}:${cartSig}`
+}
+
+// ===== SESSION CACHE =====
+
+type CachedQuote = { value: ShippingQuoteResponse; expiresAt: number }
+
+let quoteCache: Map<string, CachedQuote> | null = null
+
+function loadQuoteCache(): Map<string, CachedQuote> {
+  if (quoteCache) return quoteCache
+
+  quoteCache = new Map()
+  try {
+    const stored = sessionStorage.getItem(QUOTE_CACHE_STORAGE_KEY)
+    const entries: Array<[string, CachedQuote]> = stored ? JSON.parse(stored) : []
+    for (const [key, entry] of entries) {
+      if (entry.expiresAt > Date.now()) {
+        quoteCache.set(key, entry)
+      }
+    }
+  } catch {
+    // Storage unavailable or corrupt - start empty
+  }
+  return quoteCache
+}
+
+function saveQuoteCache(cache: Map<string, CachedQuote>) {
+  try {
+    sessionStorage.setItem(QUOTE_CACHE_STORAGE_KEY, JSON.stringify([...cache.entries()]))
+  } catch {
+    // Quota exceeded or storage disabled - the in-memory copy still works
+  }
+}
+
+export function getCachedQuote(request: ShippingQuoteRequest): ShippingQuoteResponse | undefined {
+  const cache = loadQuoteCache()
+  const key = quoteCacheKey(request)
+  const entry = cache.get(key)
+  if (!entry) return
+
+  if (entry.expiresAt <= Date.now()) {
+    cache.delete(key)
+    saveQuoteCache(cache)
+    return
+  }
+  return entry.value
+}
+
+function setCachedQuote(key: string, value: ShippingQuoteResponse) {
+  const ttlMs = Math.min(value.ttlSeconds * 1000, QUOTE_CACHE_MAX_TTL_MS)
+  if (!(ttlMs > 0)) return
+
+  const cache = loadQuoteCache()
+  cache.delete(key)
+  cache.set(key, { value, expiresAt: Date.now() + ttlMs })
+
+  // Maps iterate in insertion order, so the first key is the least recently written
+  while (cache.size > QUOTE_CACHE_MAX_ENTRIES) {
+    cache.delete(cache.keys().next().value as string)
+  }
+  saveQuoteCache(cache)
+}
+
+// ===== REQUESTS =====
+
+/**
+ * POST a quote request to the shipping-quotes function
+ * @param request - Recipient and cart items
+ * @param signal - Aborts the request when it's superseded
+ */
+export async function fetchQuoteRates(
+  request: ShippingQuoteRequest,
+  signal?: AbortSignal
+): Promise<ShippingQuoteResponse> {
+  const supabaseUrl = import.meta.env.VITE_SUPABASE_URL
+  const anonKey = import.meta.env.VITE_SUPABASE_ANON_KEY
+
+  if (!supabaseUrl || !anonKey) {
+    throw new Error('Missing Supabase configuration')
+  }
+
+  const res = await fetch(`${supabaseUrl}/functions/v1/shipping-quotes`, {
+    method: 'POST',
+    headers: {
+      'Content-Type': 'application/json',
+      'Authorization': `Bearer ${anonKey}`,
+    },
+    body: JSON.stringify(request),
+    signal
+  })
+
+  if (!res.ok) {
+    const errorData = await res.json().catch(() => ({}))
+    throw new Error(`Shipping API error: ${res.status} - ${errorData.error || res.statusText}`)
+  }
+
+  const data = await res.json()
+  if (!Array.isArray(data.options)) {
+    throw new Error('Invalid response from shipping API')
+  }
+
+  return { options: data.options, ttlSeconds: data.ttlSeconds ?? 0 }
+}
+
+// One network request per cache key, shared by every scheduler waiting on it.
+// It's only aborted once all of its waiters have been superseded.
+type InFlightQuote = {
+  key: string
+  promise: Promise<ShippingQuoteResponse>
+  controller: AbortController
+  waiters: number
+  settled: boolean
+}
+
+const inFlight = new Map<string, InFlightQuote>()
+
+function acquireQuote(key: string, request: ShippingQuoteRequest): InFlightQuote {
+  let entry = inFlight.get(key)
+
+  if (!entry) {
+    const controller = new AbortController()
+    const promise = fetchQuoteRates(request, controller.signal).then(response => {
+      if (response.options.length > 0) {
+        setCachedQuote(key, response)
+      }
+      return response
+    })
+    const created: InFlightQuote = { key, promise, controller, waiters: 0, settled: false }
+    const settle = () => {
+      created.settled = true
+      if (inFlight.get(key) === created) {
+        inFlight.delete(key)
+      }
+    }
+    promise.then(settle, settle)
+    inFlight.set(key, created)
+    entry = created
+  }
+
+  entry.waiters++
+  return entry
+}
+
+function releaseQuote(entry: InFlightQuote) {
+  if (entry.settled) return
+
+  entry.waiters--
+  if (entry.waiters === 0) {
+    entry.controller.abort()
+    if (inFlight.get(entry.key) === entry) {
+      inFlight.delete(entry.key)
+    }
+  }
+}
+
+// ===== SCHEDULER =====
+
+export interface QuoteScheduler {
+  // Resolves with rates, or null if a newer quote() or cancel() superseded this one
+  quote: (request: ShippingQuoteRequest, options?: { immediate?: boolean }) => Promise<ShippingQuoteResponse | null>
+  cancel: () => void
+}
+
+type QuoteJob = {
+  key: string
+  promise: Promise<ShippingQuoteResponse | null>
+  resolve: (value: ShippingQuoteResponse | null) => void
+  reject: (error: unknown) => void
+  timer: ReturnType<typeof setTimeout> | null
+  entry: InFlightQuote | null
+}
+
+/**
+ * Create a scheduler that keeps at most one quote outstanding for its caller
+ * @param debounceMs - How long input has to settle before a request goes out
+ */
+export function createQuoteScheduler(debounceMs: number = QUOTE_DEBOUNCE_MS): QuoteScheduler {
+  let job: QuoteJob | null = null
+
+  const start = (current: QuoteJob, request: ShippingQuoteRequest) => {
+    current.timer = null
+    current.entry = acquireQuote(current.key, request)
+    current.entry.promise.then(
+      response => {
+        if (job !== current) return
+        job = null
+        current.resolve(response)
+      },
+      error => {
+        if (job !== current) return
+        job = null
+        current.reject(error)
+      }
+    )
+  }
+
+  const cancel = () => {
+    if (!job) return
+
+    const current = job
+    job = null
+    if (current.timer) clearTimeout(current.timer)
+    if (current.entry) releaseQuote(current.entry)
+    current.resolve(null)
+  }
+
+  const quote: QuoteScheduler['quote'] = (request, { immediate = false } = {}) => {
+    const key = quoteCacheKey(request)
+
+    // Same request already scheduled or running - join it, skipping the wait if asked
+    if (job && job.key === key) {
+      if (immediate && job.timer) {
+        clearTimeout(job.timer)
+        start(job, request)
+      }
+      return job.promise
+    }
+
+    cancel()
+
+    const cached = getCachedQuote(request)
+    if (cached) {
+      return Promise.resolve(cached)
+    }
+
+    let resolve!: QuoteJob['resolve']
+    let reject!: QuoteJob['reject']
+    const promise = new Promise<ShippingQuoteResponse | null>((res, rej) => {
+      resolve = res
+      reject = rej
+    })
+    const current: QuoteJob = { key, promise, resolve, reject, timer: null, entry: null }
+    job = current
+
+    if (immediate) {
+      start(current, request)
+    } else {
+      current.timer = setTimeout(() => start(current, request), debounceMs)
+    }
+    return promise
+  }
+
+  return { quote, cancel }
+}
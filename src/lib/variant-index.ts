@@ -0,0 +1,45 @@
+// Prebuilt lookup indexes for static variant tables
+// Replaces linear `.find()` scans by colour/size/design with a Map built once, on first lookup
+
+export type VariantKeyPart = string | number | null | undefined;
+
+/**
+ * Compose a lookup key from variant attributes, e.g. variantKey('DARK', 'Black', 'M')
+ */
+export function variantKey(...parts: VariantKeyPart[]): string {
+  return parts.map(part => (part === null || part === undefined ? '' : String(part))).join('|');
+}
+
+export interface VariantIndex<T> {
+  get: (...parts: VariantKeyPart[]) => T | undefined;
+  has: (...parts: VariantKeyPart[]) => boolean;
+}
+
+/**
+ * Create a lazily built index over a variant table.
+ * The first variant wins when several share a key, matching `Array.prototype.find`.
+ * @param variants - Variant table
+ * @param keyOf - Attributes identifying a variant, in the order callers pass them to get()
+ */
+export function createVariantIndex<T>(
+  variants: readonly T[],
+  keyOf: (variant: T) => VariantKeyPart[]
+): VariantIndex<T> {
+  let index: Map<string, T> | null = null;
+
+  const build = () => {
+    index = new Map();
+    for (const variant of variants) {
+      const key = variantKey(...keyOf(variant));
+      if (!index.has(key)) {
+        index.set(key, variant);
+      }
+    }
+    return index;
+  };
+
+  return {
+    get: (...parts) => (index || build()).get(variantKey(...parts)),
+    has: (...parts) => (index || build()).has(variantKey(...parts)),
+  };
+}
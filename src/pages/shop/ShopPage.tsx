@@ -6,6 +6,8 @@ import ProductCard from '../../components/ui/ProductCard';
 import BundleCard from '../../components/ui/BundleCard';
 import { getProducts, getProductVariants, Product } from '../../lib/api';
 import { useMergedProducts, MergedProduct } from '../../hooks/useMergedProducts';
+import { useProductSearch } from '../../hooks/useProductSearch';
+import type { ProductSearchParams } from '../../lib/search-api';
 import { useBundlePricing } from '../../hooks/useBundlePricing';
 import { useCart } from '../../contexts/CartContext';
 import { BUNDLES } from '../../lib/bundle-pricing';
@@ -36,6 +38,17 @@ const CATEGORY_DEFS = [
   { id: 'bundles', label: 'Bundles' },
 ];
 
+// Shop sort options -> search service sort keys
+const SEARCH_SORTS: Record<string, ProductSearchParams['sort']> = {
+  'popularity': 'popularity',
+  'price-low': 'price-low',
+  'price-high': 'price-high',
+  'newest': 'newest',
+  'rating': 'relevance',
+};
+
+const SEARCH_PAGE_SIZE = 48;
+
 const TAG_DEFS = [
   { id: 'new', name: 'New', color: 'bg-green-500' },
   { id: 'bestseller', name: 'Bestseller', color: 'bg-orange-500' },
@@ -121,6 +134,7 @@ const convertToProductFormat = (mergedProduct: MergedProduct): Product => {
     category: mergedProduct.category,
     price_pence: calculatePrice(),
     image_url: mergedProduct.image_url,
+    image_renditions: mergedProduct.image_renditions,
     slug: generateSlug(mergedProduct.name, mergedProduct.id),
     dateAdded: mergedProduct.baseProduct?.dateAdded || new Date().toISOString(),
     created_at: mergedProduct.baseProduct?.created_at || new Date().toISOString(),
@@ -187,8 +201,51 @@ const ShopPage: React.FC<ShopPageProps> = ({ onProductClick }) => {
 
   // Products are now fetched via useMergedProducts hook
 
+  // Text search, tags and price run server-side (indexed, with facet counts) once any is active
+  const serverFiltersActive = searchQuery.trim().length > 0 ||
+    selectedTags.length > 0 ||
+    priceRange[0] > 0 ||
+    priceRange[1] < 20000;
+
+  // The category goes to the server too, so totals and paging match what's shown. Two product
+  // categories together cover everything; bundles alone match no catalog product
+  const selectedProductCategories = selectedCategories.filter(id => id !== 'all' && id !== 'bundles');
+  const searchCategory = selectedCategories.includes('all') || selectedProductCategories.length > 1
+    ? undefined
+    : selectedProductCategories[0] ?? 'bundles';
+
+  const {
+    result: searchResult,
+    items: searchItems,
+    error: searchError,
+    isSearching,
+    hasMore: hasMoreResults,
+    loadMore: loadMoreResults
+  } = useProductSearch({
+    query: searchQuery,
+    category: searchCategory,
+    tags: selectedTags,
+    minPrice: priceRange[0] / 100, // pence -> pounds
+    maxPrice: priceRange[1] / 100,
+    sort: SEARCH_SORTS[sortBy] || 'relevance',
+    limit: SEARCH_PAGE_SIZE
+  }, serverFiltersActive);
+
+  // Fall back to filtering in the browser if the search service is unavailable
+  const useServerResults = serverFiltersActive && !!searchResult && !searchError;
+
   // Calculate category counts (including bundles)
   const categoryCounts = CATEGORY_DEFS.map(cat => {
+    if (useServerResults) {
+      const facets = searchResult!.facets.categories;
+      if (cat.id === 'all') {
+        return { id: cat.id, name: cat.label, count: facets.reduce((sum, facet) => sum + facet.count, 0) + 3 };
+      }
+      if (cat.id === 'bundles') {
+        return { id: cat.id, name: cat.label, count: 3 };
+      }
+      return { id: cat.id, name: cat.label, count: facets.find(facet => facet.value === cat.id)?.count || 0 };
+    }
     if (cat.id === 'all') {
       return { id: cat.id, name: cat.label, count: mergedProducts.length + 3 }; // +3 for bundles
     }
@@ -202,54 +259,66 @@ const ShopPage: React.FC<ShopPageProps> = ({ onProductClick }) => {
     };
   });
 
-  // Filter merged products
-  const filteredProducts = mergedProducts.filter(product => {
-    // Category filter
-    if (!selectedCategories.includes('all') && !selectedCategories.includes(getCategoryForProduct(product))) {
-      return false;
-    }
-    
-    // Search filter
-    if (searchQuery && !(
-      product.name.toLowerCase().includes(searchQuery.toLowerCase()) ||
-      (product.description && product.description.toLowerCase().includes(searchQuery.toLowerCase()))
-    )) {
-      return false;
-    }
-    
-    // Price filter - use price range from merged product
-    const productPriceMin = product.priceRange.min * 100; // Convert to pence
-    const productPriceMax = product.priceRange.max * 100;
-    if (productPriceMax < priceRange[0] || productPriceMin > priceRange[1]) {
-      return false;
-    }
-    
-    // Tag filter - merged products don't have tags yet, skip for now
-    // TODO: Add tag support to merged products if needed
-    
-    return true;
-  });
+  const matchesCategory = (product: MergedProduct) =>
+    selectedCategories.includes('all') || selectedCategories.includes(getCategoryForProduct(product));
 
-  // Sort merged products
-  const sortedProducts = filteredProducts.sort((a, b) => {
-    switch (sortBy) {
-      case 'popularity':
-        // Use number of variants as popularity indicator for merged products
-        return b.variants.length - a.variants.length;
-      case 'price-low':
-        return a.priceRange.min - b.priceRange.min;
-      case 'price-high':
-        return b.priceRange.max - a.priceRange.max;
-      case 'newest':
-        // For merged products, use name as fallback for now
-        return a.name.localeCompare(b.name);
-      case 'rating':
-        // No rating for merged products yet, use name as fallback
-        return a.name.localeCompare(b.name);
-      default:
-        return a.name.localeCompare(b.name);
-    }
-  });
+  let sortedProducts: MergedProduct[];
+
+  if (useServerResults) {
+    // Server results arrive filtered (category included), ranked and sorted; map them onto the loaded catalog
+    const byId = new Map(mergedProducts.map(product => [product.id, product]));
+    sortedProducts = searchItems
+      .map(item => byId.get(item.id))
+      .filter((product): product is MergedProduct => !!product);
+  } else {
+    // Filter merged products
+    const filteredProducts = mergedProducts.filter(product => {
+      // Category filter
+      if (!matchesCategory(product)) {
+        return false;
+      }
+      
+      // Search filter
+      if (searchQuery && !(
+        product.name.toLowerCase().includes(searchQuery.toLowerCase()) ||
+        (product.description && product.description.toLowerCase().includes(searchQuery.toLowerCase()))
+      )) {
+        return false;
+      }
+      
+      // Price filter - use price range from merged product
+      const productPriceMin = product.priceRange.min * 100; // Convert to pence
+      const productPriceMax = product.priceRange.max * 100;
+      if (productPriceMax < priceRange[0] || productPriceMin > priceRange[1]) {
+        return false;
+      }
+      
+      // Tag filter - merged products don't carry tags client-side; handled by the search service
+      
+      return true;
+    });
+
+    // Sort merged products
+    sortedProducts = filteredProducts.sort((a, b) => {
+      switch (sortBy) {
+        case 'popularity':
+          // Use number of variants as popularity indicator for merged products
+          return b.variants.length - a.variants.length;
+        case 'price-low':
+          return a.priceRange.min - b.priceRange.min;
+        case 'price-high':
+          return b.priceRange.max - a.priceRange.max;
+        case 'newest':
+          // For merged products, use name as fallback for now
+          return a.name.localeCompare(b.name);
+        case 'rating':
+          // No rating for merged products yet, use name as fallback
+          return a.name.localeCompare(b.name);
+        default:
+          return a.name.localeCompare(b.name);
+      }
+    });
+  }
 
   const clearFilters = () => {
     setSelectedCategories(['all']);
@@ -341,7 +410,10 @@ const ShopPage: React.FC<ShopPageProps> = ({ onProductClick }) => {
             <div className="flex items-center justify-between mb-6">
               <div>
                 <h2 className="text-2xl font-bold text-gray-900">{getCategoryHeading()}</h2>
-                <p className="text-gray-600">{sortedProducts.length} product{sortedProducts.length !== 1 ? 's' : ''}</p>
+                <p className="text-gray-600">
+                  {sortedProducts.length} product{sortedProducts.length !== 1 ? 's' : ''}
+                  {isSearching && <span className="ml-2 text-sm text-gray-400">Searching...</span>}
+                </p>
               </div>
               <div className="flex items-center gap-2">
                 <label htmlFor="shop-sort" className="sr-only">Sort by</label>
@@ -412,6 +484,18 @@ const ShopPage: React.FC<ShopPageProps> = ({ onProductClick }) => {
                 ) : null}
               </div>
             )}
+
+            {useServerResults && hasMoreResults && (
+              <div className="text-center mt-8">
+                <button
+                  onClick={loadMoreResults}
+                  disabled={isSearching}
+                  className="px-6 py-2 border border-gray-300 rounded-lg text-sm font-medium text-gray-700 hover:bg-gray-50 disabled:opacity-50"
+                >
+                  {isSearching ? 'Loading...' : 'Load more products'}
+                </button>
+              </div>
+            )}
           </div>
         </div>
       </div>
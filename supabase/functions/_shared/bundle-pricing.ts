@@ -0,0 +1,192 @@
+// Bundle pricing engine shared by the storefront and checkout
+// Pure TypeScript with no runtime imports: the frontend imports this file directly
+// (src/lib/bundle-pricing.ts) so bundle prices shown in the shop and charged at checkout
+// come from the same table.
+
+// Bundle discount rates
+export const DISCOUNTS = {
+  starter: 0.10,    // 10% discount
+  champion: 0.15,   // 15% discount
+  activist: 0.20    // 20% discount
+} as const;
+
+// Bundle configurations with product IDs
+export const BUNDLES = {
+  starter: {
+    name: 'Starter Bundle',
+    products: [
+      { productId: 1, name: 'T-Shirt' },      // T-Shirt
+      { productId: 3, name: 'Cap' },          // Cap
+      { productId: 4, name: 'Mug' }           // Mug
+    ]
+  },
+  champion: {
+    name: 'Champion Bundle',
+    products: [
+      { productId: 2, name: 'Hoodie' },       // Hoodie
+      { productId: 1, name: 'T-Shirt' },     // T-Shirt
+      { productId: 3, name: 'Cap' },         // Cap
+      { productId: 5, name: 'Tote Bag' }     // Tote Bag
+    ]
+  },
+  activist: {
+    name: 'Activist Bundle',
+    products: [
+      { productId: 2, name: 'Hoodie' },       // Hoodie
+      { productId: 1, name: 'T-Shirt' },     // T-Shirt
+      { productId: 3, name: 'Cap' },         // Cap
+      { productId: 5, name: 'Tote Bag' },    // Tote Bag
+      { productId: 6, name: 'Water Bottle' }, // Water Bottle
+      { productId: 4, name: 'Mug' },         // Mug
+      { productId: 7, name: 'Mouse Pad' }    // Mouse Pad
+    ]
+  }
+} as const;
+
+export type BundleKey = keyof typeof BUNDLES;
+
+export const BUNDLE_KEYS = Object.keys(BUNDLES) as BundleKey[];
+
+// Retail price of each bundle component (£). Every variant of a product sells at the
+// same price, so the variant selection never changes a bundle's total.
+export const COMPONENT_PRICES: Readonly<Record<number, number>> = Object.freeze({
+  1: 24.99,  // T-Shirt
+  2: 39.99,  // Hoodie
+  3: 19.99,  // Cap
+  4: 9.99,   // Mug
+  5: 24.99,  // Tote Bag
+  6: 24.99,  // Water Bottle
+  7: 14.99   // Mouse Pad
+});
+
+// Placeholder variant IDs the bundle pages give their negative discount line items
+export const BUNDLE_DISCOUNT_VARIANT_IDS: Readonly<Record<string, BundleKey>> = Object.freeze({
+  BUNDLE_DISCOUNT_FAITH_STARTER: 'starter',
+  BUNDLE_DISCOUNT_CHAMPION: 'champion',
+  BUNDLE_DISCOUNT_FAITH: 'activist'
+});
+
+// Bundle pricing result interface
+export interface BundlePricing {
+  price: number;
+  originalPrice: number;
+  savings: {
+    absolute: number;
+    percentage: number;
+  };
+  components: Array<{
+    productId: number;
+    name: string;
+    price: number;
+  }>;
+}
+
+export type BundlePriceTable = Readonly<Record<BundleKey, Readonly<BundlePricing>>>;
+
+const toPence = (pounds: number) => Math.round(pounds * 100);
+const toPounds = (pence: number) => pence / 100;
+
+// Helper function to round prices to .99
+export function roundTo99(price: number): number {
+  return Math.floor(price) + 0.99;
+}
+
+/**
+ * Price one bundle from component prices. Sums are done in pence so totals don't drift.
+ * @param bundleKey - Bundle to price
+ * @param prices - Component prices (£) by product ID
+ */
+export function computeBundlePricing(
+  bundleKey: BundleKey,
+  prices: Readonly<Record<number, number>> = COMPONENT_PRICES
+): BundlePricing {
+  const components = BUNDLES[bundleKey].products.map(product => ({
+    productId: product.productId,
+    name: product.name,
+    price: prices[product.productId] ?? COMPONENT_PRICES[product.productId] ?? 0
+  }));
+
+  const originalPence = components.reduce((sum, component) => sum + toPence(component.price), 0);
+  const discountedPence = Math.round(originalPence * (1 - DISCOUNTS[bundleKey]));
+  const pricePence = toPence(roundTo99(toPounds(discountedPence)));
+  const savingsPence = originalPence - pricePence;
+
+  return {
+    price: toPounds(pricePence),
+    originalPrice: toPounds(originalPence),
+    savings: {
+      absolute: toPounds(savingsPence),
+      percentage: originalPence > 0 ? Math.round((savingsPence / originalPence) * 10000) / 100 : 0
+    },
+    components
+  };
+}
+
+function deepFreeze<T>(value: T): T {
+  if (value && typeof value === 'object' && !Object.isFrozen(value)) {
+    Object.freeze(value);
+    for (const child of Object.values(value as Record<string, unknown>)) {
+      deepFreeze(child);
+    }
+  }
+  return value;
+}
+
+function pricesSignature(prices: Readonly<Record<number, number>>): string {
+  return Object.keys(prices)
+    .sort()
+    .map(productId => `${productId}:${prices[Number(productId)]}`)
+    .join(',');
+}
+
+let cachedSignature: string | null = null;
+let cachedTable: BundlePriceTable | null = null;
+
+/**
+ * Prices for every bundle as one immutable table. The table is rebuilt only when the
+ * component prices change; otherwise every caller gets the same object back.
+ * @param prices - Component prices (£) by product ID
+ */
+export function getBundlePriceTable(
+  prices: Readonly<Record<number, number>> = COMPONENT_PRICES
+): BundlePriceTable {
+  const signature = pricesSignature(prices);
+  if (cachedTable && signature === cachedSignature) {
+    return cachedTable;
+  }
+
+  const table = {} as Record<BundleKey, BundlePricing>;
+  for (const bundleKey of BUNDLE_KEYS) {
+    table[bundleKey] = computeBundlePricing(bundleKey, prices);
+  }
+
+  cachedSignature = signature;
+  cachedTable = deepFreeze(table);
+  return cachedTable;
+}
+
+/**
+ * Look up one bundle's pricing in the precomputed table
+ * @param bundleKey - Bundle to price
+ * @param prices - Component prices (£) by product ID
+ */
+export function getBundlePrice(
+  bundleKey: BundleKey,
+  prices: Readonly<Record<number, number>> = COMPONENT_PRICES
+): Readonly<BundlePricing> {
+  return getBundlePriceTable(prices)[bundleKey];
+}
+
+/**
+ * The discount (a negative £ amount) a bundle discount line item should carry,
+ * or null if the variant ID isn't a bundle discount placeholder
+ * @param variantId - printful_variant_id of the cart line
+ */
+export function getBundleDiscountAmount(variantId: string | number | null | undefined): number | null {
+  const bundleKey = BUNDLE_DISCOUNT_VARIANT_IDS[String(variantId ?? '')];
+  if (!bundleKey) {
+    return null;
+  }
+
+  return -getBundlePrice(bundleKey).savings.absolute;
+}
@@ -0,0 +1,262 @@
+// Merged storefront catalog
+// Groups database products into the shop's merged products (hoodie, t-shirt, cap, ...)
+// and precomputes variants, colour/size facets and price ranges so the shop page
+// needs a single request instead of one variant fetch per product
+
+export interface CatalogVariant {
+  id: string;
+  product_id: string;
+  color: string;
+  color_hex?: string;
+  size: string;
+  price: number;
+  stock: number;
+  in_stock: boolean;
+  is_available: boolean;
+  sku?: string;
+  printful_variant_id?: number;
+}
+
+export interface MergedCatalogProduct {
+  id: string;
+  name: string;
+  description: string | null;
+  category: string | null;
+  baseProduct: any;
+  variants: CatalogVariant[];
+  colorOptions: Array<{ name: string; hex: string; border?: boolean }>;
+  sizeOptions: string[];
+  priceRange: { min: number; max: number };
+  image_url?: string;
+  image_renditions?: any[];
+}
+
+export interface MergedCatalog {
+  version: number;
+  generatedAt: string;
+  products: MergedCatalogProduct[];
+}
+
+// Products grouped into one storefront product when their name contains a search term
+export const MERGE_RULES = {
+  hoodie: {
+    searchTerms: ['hoodie'],
+    mergedName: 'LVN Clothing Hoodie',
+    category: 'apparel'
+  },
+  tshirt: {
+    searchTerms: ['t-shirt', 'tshirt'],
+    mergedName: 'LVN Clothing T-Shirt',
+    category: 'apparel'
+  },
+  cap: {
+    searchTerms: ['cap', 'hat'],
+    mergedName: 'LVN Clothing Cap',
+    category: 'apparel'
+  }
+} as const;
+
+// Products hidden from the shop page
+const EXCLUDED_PRODUCTS = ['Reform UK Stickers', 'Reform UK Badge Set'];
+
+const SIZE_ORDER = ['XS', 'S', 'M', 'L', 'XL', '2XL', '3XL'];
+
+// Lower-cased search terms, flattened once
+const RULE_MATCHERS = Object.entries(MERGE_RULES).map(([key, rule]) => ({
+  key,
+  terms: rule.searchTerms.map(term => term.toLowerCase()),
+}));
+
+// Same priority chain as the shop's product cards: custom thumbnails first
+function selectImage(images: any[]): any | undefined {
+  const ordered = (predicate: (img: any) => boolean) =>
+    images
+      .filter(img => img.image_url && predicate(img))
+      .sort((a, b) => (a.image_order || 0) - (b.image_order || 0))[0];
+
+  return (
+    images.find(img => img.is_thumbnail === true && img.source === 'custom') ||
+    images.find(img => img.is_thumbnail === true) ||
+    images.find(img => img.is_primary === true && img.source === 'custom') ||
+    images.find(img => img.is_primary === true) ||
+    images.find(img => (img.variant_type === 'product' || img.variant_type === null) && img.source === 'custom') ||
+    images.find(img => img.variant_type === 'product' || img.variant_type === null) ||
+    ordered(img => img.source === 'custom') ||
+    ordered(() => true)
+  );
+}
+
+// Only the image fields the storefront reads, to keep the payload compact
+function compactImage(image: any) {
+  return {
+    id: image.id,
+    product_id: image.product_id,
+    image_url: image.image_url,
+    renditions: image.renditions,
+    image_order: image.image_order,
+    is_primary: image.is_primary,
+    is_thumbnail: image.is_thumbnail,
+    variant_type: image.variant_type,
+    color: image.color,
+    source: image.source,
+  };
+}
+
+function mapProduct(row: any) {
+  const images = (row.product_images || []).map(compactImage);
+  const selected = selectImage(images);
+
+  return {
+    id: row.id,
+    name: row.name,
+    variant: row.variant,
+    description: row.description,
+    price_pence: Math.round(Number(row.price) * 100) || 0,
+    category: row.category || 'gear',
+    tags: row.tags || [],
+    reviews: row.reviews || 0,
+    rating: row.rating || 4.5,
+    dateAdded: row.created_at,
+    created_at: row.created_at,
+    updated_at: row.updated_at,
+    image_url: selected?.image_url || row.image_url || '/BackReformLogo.png',
+    image_renditions: selected?.renditions || [],
+    slug: row.slug,
+    images,
+    variants: row.product_variants || [],
+  };
+}
+
+function mapVariant(variant: any, productId: string): CatalogVariant {
+  return {
+    id: variant.id,
+    product_id: productId,
+    color: variant.color || 'Unknown',
+    color_hex: variant.color_hex || '#CCCCCC',
+    size: variant.size || 'M',
+    price: Number(variant.price) || 0,
+    stock: variant.in_stock === false || variant.is_available === false ? 0 : variant.stock || 0,
+    in_stock: variant.in_stock !== false,
+    is_available: variant.is_available !== false,
+    sku: variant.sku,
+    printful_variant_id: variant.printful_variant_id,
+  };
+}
+
+function compareSizes(a: string, b: string): number {
+  const aIndex = SIZE_ORDER.indexOf(a);
+  const bIndex = SIZE_ORDER.indexOf(b);
+
+  if (aIndex === -1 && bIndex === -1) return a.localeCompare(b);
+  if (aIndex === -1) return 1;
+  if (bIndex === -1) return -1;
+  return aIndex - bIndex;
+}
+
+function mergeGroup(products: any[], mergedName: string, id: string): MergedCatalogProduct {
+  const baseProduct = products[0];
+
+  // Images deduplicated by URL across the whole group
+  const images = new Map<string, any>();
+  for (const product of products) {
+    for (const image of product.images) {
+      if (!images.has(image.image_url)) {
+        images.set(image.image_url, image);
+      }
+    }
+  }
+
+  const description = products.map(p => p.description).filter(Boolean).join(' | ');
+
+  // Review-weighted rating across products that have one
+  const rated = products.filter(p => p.rating && p.rating > 0);
+  let rating = 4.8;
+  let reviews = 0;
+  if (rated.length > 0) {
+    const totalRating = rated.reduce((sum, p) => sum + p.rating * (p.reviews || 1), 0);
+    reviews = rated.reduce((sum, p) => sum + (p.reviews || 1), 0);
+    rating = totalRating / reviews;
+  }
+
+  const variants = products.flatMap(product =>
+    product.variants.map((variant: any) => mapVariant(variant, product.id))
+  );
+
+  const colors = new Map<string, string>();
+  const sizes = new Set<string>();
+  let minPrice = Infinity;
+  let maxPrice = 0;
+
+  for (const variant of variants) {
+    if (variant.color && variant.color_hex) colors.set(variant.color, variant.color_hex);
+    if (variant.size) sizes.add(variant.size);
+    if (variant.price > 0) {
+      minPrice = Math.min(minPrice, variant.price);
+      maxPrice = Math.max(maxPrice, variant.price);
+    }
+  }
+
+  // Variants are shipped on the merged product, not repeated inside baseProduct
+  const { variants: _variants, ...base } = baseProduct;
+
+  return {
+    id,
+    name: mergedName,
+    description: description || baseProduct.description,
+    category: baseProduct.category,
+    baseProduct: {
+      ...base,
+      rating,
+      reviews,
+      images: Array.from(images.values()),
+    },
+    variants,
+    colorOptions: Array.from(colors.entries()).map(([name, hex]) => ({
+      name,
+      hex,
+      border: name.toLowerCase() === 'white',
+    })),
+    sizeOptions: Array.from(sizes).sort(compareSizes),
+    priceRange: {
+      min: minPrice === Infinity ? 0 : minPrice,
+      max: maxPrice,
+    },
+    image_url: baseProduct.image_url || '/images/Leaven Logo.png',
+    image_renditions: baseProduct.image_url ? baseProduct.image_renditions : undefined,
+  };
+}
+
+/**
+ * Build the merged catalog from the rows returned by get_catalog_snapshot()
+ * @param rows - Products with nested product_images and product_variants
+ * @returns Merged products: rule groups first (in order of first match), then individual products
+ */
+export function buildMergedCatalog(rows: any[]): MergedCatalogProduct[] {
+  const groups = new Map<string, any[]>();
+  const ungrouped: any[] = [];
+
+  for (const row of rows) {
+    if (EXCLUDED_PRODUCTS.includes(row.name)) continue;
+
+    const product = mapProduct(row);
+    const name = (product.name || '').toLowerCase();
+    const rule = RULE_MATCHERS.find(({ terms }) => terms.some(term => name.includes(term)));
+
+    if (rule) {
+      if (!groups.has(rule.key)) groups.set(rule.key, []);
+      groups.get(rule.key)!.push(product);
+    } else {
+      ungrouped.push(product);
+    }
+  }
+
+  const merged: MergedCatalogProduct[] = [];
+  for (const [key, products] of groups) {
+    merged.push(mergeGroup(products, MERGE_RULES[key as keyof typeof MERGE_RULES].mergedName, key));
+  }
+  for (const product of ungrouped) {
+    merged.push(mergeGroup([product], product.name, `individual-${product.id}`));
+  }
+
+  return merged;
+}
@@ -0,0 +1,131 @@
+// Static catalog snapshots in Supabase Storage
+// After a Printful sync or an admin save the merged catalog is written once as an immutable,
+// versioned JSON file plus a small manifest pointing at it. The storefront reads these from
+// the storage CDN and only queries the database for live stock.
+
+import { buildMergedCatalog, type MergedCatalog } from './catalog-merge.ts';
+
+export const CATALOG_BUCKET = 'catalog';
+export const CATALOG_MANIFEST_PATH = 'manifest.json';
+
+// Snapshots never change once written; the manifest is revalidated every minute
+const SNAPSHOT_CACHE_SECONDS = 31536000;
+const MANIFEST_CACHE_SECONDS = 60;
+
+export interface CatalogManifest {
+  version: number;
+  path: string;
+  generatedAt: string;
+  products: number;
+}
+
+export interface PublishResult {
+  version: number;
+  path: string;
+  skipped: boolean;
+}
+
+export function snapshotPath(version: number): string {
+  return `snapshots/catalog-v${version}.json`;
+}
+
+/**
+ * Load and merge the catalog with one snapshot query
+ * @param supabase - Supabase client
+ */
+export async function loadMergedCatalog(supabase: any): Promise<MergedCatalog> {
+  const { data, error } = await supabase.rpc('get_catalog_snapshot');
+
+  if (error) {
+    throw new Error(`Failed to load catalog snapshot: ${error.message}`);
+  }
+
+  return {
+    version: Number(data?.version ?? 0),
+    generatedAt: new Date().toISOString(),
+    products: buildMergedCatalog(data?.products || []),
+  };
+}
+
+async function ensureCatalogBucket(supabase: any): Promise<void> {
+  const { data: buckets } = await supabase.storage.listBuckets();
+  if (buckets?.some((bucket: any) => bucket.name === CATALOG_BUCKET)) {
+    return;
+  }
+
+  console.log('📦 Creating catalog bucket...');
+  const { error } = await supabase.storage.createBucket(CATALOG_BUCKET, {
+    public: true,
+    allowedMimeTypes: ['application/json'],
+  });
+
+  if (error && !/already exists/i.test(error.message)) {
+    throw new Error(`Failed to create catalog bucket: ${error.message}`);
+  }
+}
+
+async function readManifest(supabase: any): Promise<CatalogManifest | null> {
+  const { data, error } = await supabase.storage.from(CATALOG_BUCKET).download(CATALOG_MANIFEST_PATH);
+  if (error || !data) {
+    return null;
+  }
+
+  try {
+    return JSON.parse(await data.text());
+  } catch {
+    return null;
+  }
+}
+
+async function uploadJson(supabase: any, path: string, value: unknown, cacheSeconds: number): Promise<void> {
+  const body = new Blob([JSON.stringify(value)], { type: 'application/json' });
+  const { error } = await supabase.storage.from(CATALOG_BUCKET).upload(path, body, {
+    contentType: 'application/json',
+    cacheControl: String(cacheSeconds),
+    upsert: true,
+  });
+
+  if (error) {
+    throw new Error(`Failed to upload ${path}: ${error.message}`);
+  }
+}
+
+/**
+ * Build the merged catalog and publish it to storage, unless the current
+ * manifest already points at this catalog version
+ * @param supabase - Supabase client with service role access
+ * @returns Published version and snapshot path
+ */
+export async function publishCatalogSnapshot(supabase: any): Promise<PublishResult> {
+  await ensureCatalogBucket(supabase);
+
+  const catalog = await loadMergedCatalog(supabase);
+  const path = snapshotPath(catalog.version);
+
+  const current = await readManifest(supabase);
+  if (current && current.version === catalog.version) {
+    console.log(`✅ Catalog snapshot v${catalog.version} already published`);
+    return { version: catalog.version, path, skipped: true };
+  }
+
+  // Snapshot first, so the manifest never points at a file that doesn't exist yet
+  await uploadJson(supabase, path, catalog, SNAPSHOT_CACHE_SECONDS);
+
+  const manifest: CatalogManifest = {
+    version: catalog.version,
+    path,
+    generatedAt: catalog.generatedAt,
+    products: catalog.products.length,
+  };
+  await uploadJson(supabase, CATALOG_MANIFEST_PATH, manifest, MANIFEST_CACHE_SECONDS);
+
+  console.log(`✅ Published catalog snapshot v${catalog.version} (${catalog.products.length} products)`);
+
+  // Rebuild the search index now rather than on the first shopper's search
+  const { error: searchIndexError } = await supabase.rpc('refresh_product_search_index');
+  if (searchIndexError) {
+    console.warn('⚠️ Search index refresh failed (it will rebuild on next search):', searchIndexError.message);
+  }
+
+  return { version: catalog.version, path, skipped: false };
+}
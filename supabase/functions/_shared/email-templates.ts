@@ -0,0 +1,147 @@
+// Minimal HTML template engine for transactional emails
+// Templates are compiled once per isolate into a tree of static strings and lookups,
+// then rendered from a plain view model with no string re-parsing per order
+//
+// Syntax:
+//   {{path}}                 HTML-escaped value (dotted paths allowed, e.g. address.city)
+//   {{{path}}}               raw value
+//   {{#if path}}...{{/if}}   rendered when the value is truthy (non-empty for arrays)
+//   {{#each path}}...{{/each}}  rendered once per array element; inside, paths resolve
+//                            against the element first, then the outer view model
+
+type Scope = any[];
+type Node = (scope: Scope) => string;
+
+export type CompiledTemplate = (view: Record<string, any>) => string;
+
+const TOKEN_PATTERN = /\{\{\{\s*([\w.]+)\s*\}\}\}|\{\{\s*(#if|#each|\/if|\/each)?\s*([\w.]*)\s*\}\}/g;
+
+const HTML_ESCAPES: Record<string, string> = {
+  '&': '&amp;',
+  '<': '&lt;',
+  '>': '&gt;',
+  '"': '&quot;',
+  "'": '&#39;',
+};
+
+export function escapeHtml(value: unknown): string {
+  if (value === null || value === undefined) return '';
+  return String(value).replace(/[&<>"']/g, char => HTML_ESCAPES[char]);
+}
+
+function lookup(scope: Scope, path: string): any {
+  const keys = path.split('.');
+  // Innermost scope first
+  for (let i = scope.length - 1; i >= 0; i--) {
+    let value = scope[i];
+    if (value === null || typeof value !== 'object' || !(keys[0] in value)) continue;
+    for (const key of keys) {
+      value = value?.[key];
+    }
+    return value;
+  }
+  return undefined;
+}
+
+function isTruthy(value: any): boolean {
+  return Array.isArray(value) ? value.length > 0 : !!value;
+}
+
+/**
+ * Compile a template source into a render function
+ * @param source - Template text
+ * @returns Render function taking a view model
+ */
+export function compileTemplate(source: string): CompiledTemplate {
+  const root: Node[] = [];
+  const stack: Array<{ kind: 'if' | 'each'; path: string; nodes: Node[]; parent: Node[] }> = [];
+  let current = root;
+  let lastIndex = 0;
+
+  for (const match of source.matchAll(TOKEN_PATTERN)) {
+    const text = source.slice(lastIndex, match.index);
+    if (text) current.push(() => text);
+    lastIndex = match.index! + match[0].length;
+
+    const [, rawPath, directive, path] = match;
+
+    if (rawPath) {
+      current.push(scope => {
+        const value = lookup(scope, rawPath);
+        return value === null || value === undefined ? '' : String(value);
+      });
+    } else if (directive === '#if' || directive === '#each') {
+      const block = { kind: directive === '#if' ? 'if' as const : 'each' as const, path, nodes: [] as Node[], parent: current };
+      stack.push(block);
+      current = block.nodes;
+    } else if (directive === '/if' || directive === '/each') {
+      const block = stack.pop();
+      if (!block || `/${block.kind}` !== directive) {
+        throw new Error(`Unbalanced ${directive} in email template`);
+      }
+      const { nodes, path: blockPath } = block;
+      current = block.parent;
+      if (block.kind === 'if') {
+        current.push(scope => (isTruthy(lookup(scope, blockPath)) ? nodes.map(node => node(scope)).join('') : ''));
+      } else {
+        current.push(scope => {
+          const list = lookup(scope, blockPath);
+          if (!Array.isArray(list)) return '';
+          return list.map(item => nodes.map(node => node([...scope, item])).join('')).join('');
+        });
+      }
+    } else {
+      current.push(scope => escapeHtml(lookup(scope, path)));
+    }
+  }
+
+  if (stack.length > 0) {
+    throw new Error(`Unclosed {{#${stack[stack.length - 1].kind}}} in email template`);
+  }
+
+  const tail = source.slice(lastIndex);
+  if (tail) root.push(() => tail);
+
+  return (view) => {
+    const scope = [view];
+    return root.map(node => node(scope)).join('');
+  };
+}
+
+// Compiled templates live for the lifetime of the isolate
+const templateSources = new Map<string, string>();
+const compiledTemplates = new Map<string, CompiledTemplate>();
+
+/**
+ * Register a template source under a name. Compilation is deferred to first use.
+ */
+export function defineTemplate(name: string, source: string): void {
+  templateSources.set(name, source);
+  compiledTemplates.delete(name);
+}
+
+/**
+ * Render a named template, compiling it on first use in this isolate
+ * @param name - Template name passed to defineTemplate
+ * @param view - View model
+ * @returns Rendered HTML
+ */
+export function renderTemplate(name: string, view: Record<string, any>): string {
+  let compiled = compiledTemplates.get(name);
+  if (!compiled) {
+    const source = templateSources.get(name);
+    if (source === undefined) {
+      throw new Error(`Unknown email template: ${name}`);
+    }
+    compiled = compileTemplate(source);
+    compiledTemplates.set(name, compiled);
+  }
+  return compiled(view);
+}
+
+/**
+ * Format a pence amount as a GBP string without the currency symbol
+ */
+export function formatPence(pence: number): string {
+  return ((pence || 0) / 100).toFixed(2);
+}
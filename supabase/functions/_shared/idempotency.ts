@@ -12,6 +12,76 @@ export function generateIdempotencyKey(prefix: string, ...parts: string[]): stri
   return `${prefix}_${cleanParts.join('_')}`;
 }
 
+// Short-lived in-isolate cache of keys already known to be taken, so repeated
+// deliveries hitting the same isolate are rejected without a database round trip.
+// Entries never outlive the key itself, so a short claim isn't held past its expiry
+const SEEN_KEY_TTL_MS = 60 * 1000;
+const SEEN_KEY_MAX_ENTRIES = 1000;
+const seenKeys = new Map<string, { result?: any; expiresAt: number }>();
+
+function rememberSeenKey(key: string, result?: any, ttlSeconds?: number): void {
+  if (seenKeys.size >= SEEN_KEY_MAX_ENTRIES) {
+    // Map iterates in insertion order - drop the oldest entry
+    const oldest = seenKeys.keys().next().value;
+    if (oldest !== undefined) seenKeys.delete(oldest);
+  }
+  const ttlMs = ttlSeconds === undefined ? SEEN_KEY_TTL_MS : Math.min(SEEN_KEY_TTL_MS, ttlSeconds * 1000);
+  seenKeys.set(key, { result, expiresAt: Date.now() + ttlMs });
+}
+
+function getSeenKey(key: string): { result?: any } | null {
+  const entry = seenKeys.get(key);
+  if (!entry) return null;
+  if (entry.expiresAt < Date.now()) {
+    seenKeys.delete(key);
+    return null;
+  }
+  return entry;
+}
+
+/**
+ * Atomically claim an idempotency key in a single round trip.
+ * Inserts the key (or takes over an expired one); if it is already held,
+ * returns the stored result instead.
+ * @param supabase - Supabase client
+ * @param key - Idempotency key to claim
+ * @param ttlSeconds - How long the claim stays valid
+ * @returns claimed = true if this caller owns the operation
+ */
+export async function claimIdempotencyKey(
+  supabase: SupabaseClient,
+  key: string,
+  ttlSeconds: number = 24 * 60 * 60
+): Promise<{ claimed: boolean; result?: any; error?: string }> {
+  const seen = getSeenKey(key);
+  if (seen) {
+    return { claimed: false, result: seen.result };
+  }
+
+  try {
+    const { data, error } = await supabase.rpc('claim_idempotency_key', {
+      p_key: key,
+      p_ttl_seconds: ttlSeconds
+    });
+
+    if (error) {
+      console.error('Error claiming idempotency key:', error);
+      return { claimed: false, error: error.message };
+    }
+
+    const row = Array.isArray(data) ? data[0] : data;
+    rememberSeenKey(key, row?.result ?? undefined, ttlSeconds);
+
+    return {
+      claimed: !!row?.claimed,
+      result: row?.result ?? undefined
+    };
+  } catch (error) {
+    console.error('Exception claiming idempotency key:', error);
+    return { claimed: false, error: String(error) };
+  }
+}
+
 /**
  * Check if an idempotency key has been used before
  * @param supabase - Supabase client
@@ -22,18 +92,27 @@ export async function checkIdempotency(
   supabase: SupabaseClient,
   key: string
 ): Promise<{ exists: boolean; result?: any }> {
+  const seen = getSeenKey(key);
+  if (seen) {
+    return { exists: true, result: seen.result };
+  }
+
   try {
     const { data, error } = await supabase
       .from('idempotency_keys')
       .select('result')
       .eq('key', key)
-      .single();
+      .maybeSingle();
 
-    if (error && error.code !== 'PGRST116') {
+    if (error) {
       console.error('Error checking idempotency:', error);
       return { exists: false };
     }
 
+    if (data) {
+      rememberSeenKey(key, data.result);
+    }
+
     return {
       exists: !!data,
       result: data?.result
@@ -45,32 +124,36 @@ export async function checkIdempotency(
 }
 
 /**
- * Record an idempotency key with its result to prevent duplicate operations
+ * Record an idempotency key with its result to prevent duplicate operations.
+ * Upserts, so it also stores the result of a key taken with claimIdempotencyKey.
  * @param supabase - Supabase client
  * @param key - Idempotency key
  * @param result - Result to store for future duplicate requests
+ * @param ttlSeconds - How long duplicates get the stored result
  * @returns Success/failure status
  */
 export async function recordIdempotency(
   supabase: SupabaseClient,
   key: string,
-  result: any
+  result: any,
+  ttlSeconds: number = 24 * 60 * 60
 ): Promise<{ success: boolean; error?: string }> {
   try {
     const { error } = await supabase
       .from('idempotency_keys')
-      .insert({
+      .upsert({
         key,
         result,
         created_at: new Date().toISOString(),
-        expires_at: new Date(Date.now() + 24 * 60 * 60 * 1000).toISOString() // 24 hours
-      });
+        expires_at: new Date(Date.now() + ttlSeconds * 1000).toISOString()
+      }, { onConflict: 'key' });
 
     if (error) {
       console.error('Error recording idempotency:', error);
       return { success: false, error: error.message };
     }
 
+    rememberSeenKey(key, result, ttlSeconds);
     return { success: true };
   } catch (error) {
     console.error('Exception recording idempotency:', error);
@@ -78,6 +161,79 @@ export async function recordIdempotency(
   }
 }
 
+/**
+ * Give up a key taken with claimIdempotencyKey whose operation failed, so a retry can claim it
+ * straight away instead of waiting for the claim to expire. Keys with a recorded result are kept.
+ * @param supabase - Supabase client
+ * @param key - Idempotency key to release
+ */
+export async function releaseIdempotencyKey(
+  supabase: SupabaseClient,
+  key: string
+): Promise<void> {
+  seenKeys.delete(key);
+
+  try {
+    const { error } = await supabase
+      .from('idempotency_keys')
+      .delete()
+      .eq('key', key)
+      .is('result', null);
+
+    if (error) {
+      console.error('Error releasing idempotency key:', error);
+    }
+  } catch (error) {
+    console.error('Exception releasing idempotency key:', error);
+  }
+}
+
+/**
+ * Record an incoming webhook event, rejecting redeliveries, in one query.
+ * Uses insert-on-conflict on webhook_events.event_id, plus the in-isolate cache.
+ * @param supabase - Supabase client
+ * @param source - Webhook source ('stripe' or 'printful')
+ * @param event - Event with id, type and payload
+ * @returns isNew = false when the event was already received
+ */
+export async function claimWebhookEvent(
+  supabase: SupabaseClient,
+  source: string,
+  event: { id: string; type: string },
+  payload: any = event
+): Promise<{ isNew: boolean; error?: string }> {
+  const cacheKey = `webhook_${source}_${event.id}`;
+  if (getSeenKey(cacheKey)) {
+    return { isNew: false };
+  }
+
+  try {
+    const { data, error } = await supabase
+      .from('webhook_events')
+      .upsert({
+        source,
+        event_id: event.id,
+        event_type: event.type,
+        payload,
+        processed: false,
+        created_at: new Date().toISOString()
+      }, { onConflict: 'event_id', ignoreDuplicates: true })
+      .select('id');
+
+    if (error) {
+      console.error('Error recording webhook event:', error);
+      // Don't drop the event - the order insert is still guarded by unique_payment_intent
+      return { isNew: true, error: error.message };
+    }
+
+    rememberSeenKey(cacheKey);
+    return { isNew: (data || []).length > 0 };
+  } catch (error) {
+    console.error('Exception recording webhook event:', error);
+    return { isNew: true, error: String(error) };
+  }
+}
+
 /**
  * Create a hash from cart contents and customer data for idempotency
  * Useful for creating consistent idempotency keys from complex data
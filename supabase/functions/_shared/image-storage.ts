@@ -2,13 +2,47 @@
 // Downloads images from Printful and stores them in Supabase Storage
 
 import { createClient } from "https://esm.sh/@supabase/supabase-js@2";
+import { hashBytes } from "./sync-hash.ts";
+
+// Printful rate limits apply to mockup CDN downloads too - keep the pipeline modest
+const DEFAULT_IMAGE_CONCURRENCY = 4;
+
+// Fixed rendition widths recorded for every product image (used for srcset on the storefront)
+export const RENDITION_WIDTHS = [320, 640, 960, 1280];
+
+// Storage image transformation must be enabled for the project (paid plan on hosted projects).
+// Must match VITE_IMAGE_TRANSFORMS_ENABLED on the storefront.
+const IMAGE_TRANSFORMS_ENABLED = Deno.env.get('IMAGE_TRANSFORMS_ENABLED') === 'true';
+
+// Storage transformation serves WebP to browsers that accept it and the original format otherwise,
+// and each variant is cached separately, so both are warmed
+const WARM_ACCEPT_HEADERS = ['image/webp,image/*', 'image/jpeg,image/png,image/*;q=0.8'];
+
+export interface ImageIngestRequest {
+  imageUrl: string;
+  category: string;
+}
+
+export interface ImageRendition {
+  width: number;
+  url: string;
+}
 
 export class ImageStorageManager {
   private supabase: any;
   private readonly bucketName = 'product-images';
 
+  // Per-isolate dedupe state: the same mockup URL is shared by every size of a colour,
+  // and identical bytes are stored once under a content-addressed path
+  private readonly inflightByUrl = new Map<string, Promise<string>>();
+  private readonly publicUrlByHash = new Map<string, string>();
+  private readonly existingObjects = new Map<string, Promise<Set<string>>>();
+
+  private readonly publicPrefix: string;
+
   constructor(supabaseUrl: string, supabaseKey: string) {
     this.supabase = createClient(supabaseUrl, supabaseKey);
+    this.publicPrefix = `${supabaseUrl}/storage/v1/object/public/${this.bucketName}/`;
   }
 
   async ensureBucketExists(): Promise<void> {
@@ -36,6 +70,184 @@ export class ImageStorageManager {
     }
   }
 
+  /**
+   * Store a remote image under a content-addressed path (`category/<sha256>.<ext>`).
+   * Concurrent and repeated calls for the same URL share one download, identical
+   * bytes are uploaded once, and objects already in the bucket are not re-uploaded.
+   * @returns Public URL of the stored image
+   */
+  storeImage(imageUrl: string, productCategory: string): Promise<string> {
+    const key = `${productCategory}|${imageUrl}`;
+    const inflight = this.inflightByUrl.get(key);
+    if (inflight) {
+      return inflight;
+    }
+
+    const task = this.ingestImage(imageUrl, productCategory);
+    this.inflightByUrl.set(key, task);
+    // Failed downloads may be retried by a later call
+    task.catch(() => this.inflightByUrl.delete(key));
+    return task;
+  }
+
+  /**
+   * Store many images with bounded concurrency.
+   * Failures are logged and left out of the result so one bad mockup doesn't stop a sync.
+   * @returns Map of source image URL to public URL
+   */
+  async storeImages(
+    requests: ImageIngestRequest[],
+    concurrency: number = DEFAULT_IMAGE_CONCURRENCY
+  ): Promise<Map<string, string>> {
+    const results = new Map<string, string>();
+    const unique = Array.from(
+      new Map(requests.map(r => [`${r.category}|${r.imageUrl}`, r])).values()
+    );
+
+    let next = 0;
+    const worker = async () => {
+      while (next < unique.length) {
+        const request = unique[next++];
+        try {
+          results.set(request.imageUrl, await this.storeImage(request.imageUrl, request.category));
+        } catch (error) {
+          console.error(`❌ Error storing image ${request.imageUrl}:`, error);
+        }
+      }
+    };
+
+    await Promise.all(
+      Array.from({ length: Math.min(concurrency, unique.length) }, () => worker())
+    );
+
+    console.log(`✅ Stored ${results.size}/${unique.length} unique images`);
+    return results;
+  }
+
+  private async ingestImage(imageUrl: string, productCategory: string): Promise<string> {
+    const response = await fetch(imageUrl);
+    if (!response.ok) {
+      throw new Error(`Failed to download image: ${response.status}`);
+    }
+
+    const contentType = response.headers.get('content-type') || 'image/jpeg';
+    // The object key is derived from the content, so the bytes must be hashed before upload
+    const imageData = new Uint8Array(await response.arrayBuffer());
+    const hash = await hashBytes(imageData);
+
+    const cachedUrl = this.publicUrlByHash.get(hash);
+    if (cachedUrl) {
+      return cachedUrl;
+    }
+
+    const objectName = `${hash}.${this.getFileExtension(imageUrl, contentType)}`;
+    const filePath = `${productCategory}/${objectName}`;
+    const existing = await this.listExistingObjects(productCategory);
+
+    if (existing.has(objectName)) {
+      console.log(`⏭️ Image already stored: ${filePath}`);
+    } else {
+      const { error } = await this.supabase.storage
+        .from(this.bucketName)
+        .upload(filePath, imageData, {
+          contentType,
+          upsert: false,
+        });
+
+      // A concurrent run may have stored the same content first - that's fine
+      if (error && !String(error.message || '').toLowerCase().includes('exists')) {
+        console.error(`❌ Failed to upload ${filePath}:`, error);
+        throw new Error(`Failed to upload image: ${error.message}`);
+      }
+
+      existing.add(objectName);
+      console.log(`✅ Stored image: ${filePath}`);
+    }
+
+    const { data: publicUrlData } = this.supabase.storage
+      .from(this.bucketName)
+      .getPublicUrl(filePath);
+
+    this.publicUrlByHash.set(hash, publicUrlData.publicUrl);
+    return publicUrlData.publicUrl;
+  }
+
+  /**
+   * Build the fixed-width renditions of a stored image and pre-generate them.
+   * Resizing is done by Supabase Storage image transformation, which also serves
+   * WebP to browsers that accept it; requesting each width in each format once at
+   * ingestion means shoppers never wait on a cold transform.
+   * @returns Renditions to record on the product_images row (empty for non-bucket URLs,
+   *   or when image transformation isn't enabled)
+   */
+  async createRenditions(publicUrl: string, warm: boolean = true): Promise<ImageRendition[]> {
+    if (!IMAGE_TRANSFORMS_ENABLED || !publicUrl.startsWith(this.publicPrefix)) {
+      return [];
+    }
+
+    const filePath = decodeURIComponent(publicUrl.slice(this.publicPrefix.length));
+    const renditions = RENDITION_WIDTHS.map(width => {
+      const { data } = this.supabase.storage
+        .from(this.bucketName)
+        .getPublicUrl(filePath, { transform: { width, quality: 75, resize: 'contain' } });
+      return { width, url: data.publicUrl };
+    });
+
+    if (warm) {
+      await Promise.all(renditions.flatMap(rendition => WARM_ACCEPT_HEADERS.map(async accept => {
+        try {
+          const response = await fetch(rendition.url, { headers: { 'Accept': accept } });
+          await response.body?.cancel();
+        } catch (error) {
+          console.warn(`⚠️ Could not pre-generate ${rendition.width}w rendition (${accept}) for ${filePath}:`, error);
+        }
+      })));
+    }
+
+    return renditions;
+  }
+
+  /**
+   * Create renditions for several stored images at once
+   * @returns Map of public URL to its renditions
+   */
+  async createRenditionsFor(publicUrls: string[]): Promise<Map<string, ImageRendition[]>> {
+    const unique = Array.from(new Set(publicUrls));
+    const entries = await Promise.all(
+      unique.map(async url => [url, await this.createRenditions(url)] as [string, ImageRendition[]])
+    );
+    return new Map(entries);
+  }
+
+  // Lists a category folder once per isolate so existence checks don't cost a request per image
+  private listExistingObjects(prefix: string): Promise<Set<string>> {
+    let listing = this.existingObjects.get(prefix);
+    if (!listing) {
+      listing = (async () => {
+        const names = new Set<string>();
+        const pageSize = 1000;
+        for (let offset = 0; ; offset += pageSize) {
+          const { data: files, error } = await this.supabase.storage
+            .from(this.bucketName)
+            .list(prefix, { limit: pageSize, offset });
+
+          if (error) {
+            console.error(`⚠️ Could not list ${prefix}/ - uploads will not be skipped:`, error);
+            break;
+          }
+
+          (files || []).forEach((file: any) => names.add(file.name));
+          if (!files || files.length < pageSize) {
+            break;
+          }
+        }
+        return names;
+      })();
+      this.existingObjects.set(prefix, listing);
+    }
+    return listing;
+  }
+
   async downloadAndStoreImage(
     imageUrl: string, 
     fileName: string, 
@@ -46,22 +258,22 @@ export class ImageStorageManager {
       
       // Download the image
       const response = await fetch(imageUrl);
-      if (!response.ok) {
+      if (!response.ok || !response.body) {
         throw new Error(`Failed to download image: ${response.status}`);
       }
 
-      const imageData = await response.arrayBuffer();
       const contentType = response.headers.get('content-type') || 'image/jpeg';
       
       // Create file path with category organization
       const filePath = `${productCategory}/${fileName}`;
       
-      // Upload to Supabase Storage
+      // Stream the download straight into Supabase Storage instead of buffering it
       const { data, error } = await this.supabase.storage
         .from(this.bucketName)
-        .upload(filePath, imageData, {
+        .upload(filePath, response.body, {
           contentType,
           upsert: true, // Overwrite if exists
+          duplex: 'half',
         });
 
       if (error) {
@@ -0,0 +1,110 @@
+// Keyset (cursor) pagination helpers for admin list endpoints
+// Lists are ordered by (created_at DESC, id DESC) so every page is an index range scan,
+// regardless of how deep into the list the admin has scrolled
+
+export const DEFAULT_PAGE_SIZE = 50;
+export const MAX_PAGE_SIZE = 200;
+
+export const UUID_PATTERN = /^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$/i;
+
+// Timestamps as PostgREST returns them, e.g. 2025-09-08T12:34:56.123456+00:00
+const ISO_TIMESTAMP_PATTERN = /^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(\.\d{1,6})?(Z|[+-]\d{2}(:?\d{2})?)?$/;
+
+export interface KeysetCursor {
+  createdAt: string;
+  id: string;
+}
+
+/**
+ * Encode the last row of a page as an opaque cursor
+ * @param row - Row with created_at and id
+ * @returns Base64 cursor string
+ */
+export function encodeCursor(row: { created_at: string; id: string }): string {
+  return btoa(JSON.stringify({ c: row.created_at, i: row.id }));
+}
+
+/**
+ * Decode a cursor produced by encodeCursor. Both parts end up inside a PostgREST filter
+ * string, so anything other than a uuid and an ISO timestamp is rejected
+ * @param cursor - Cursor string from the client
+ * @returns Decoded cursor, or null when missing or malformed
+ */
+export function decodeCursor(cursor?: string | null): KeysetCursor | null {
+  if (!cursor) {
+    return null;
+  }
+
+  try {
+    const { c, i } = JSON.parse(atob(cursor));
+    if (typeof c !== 'string' || typeof i !== 'string') {
+      return null;
+    }
+    if (!UUID_PATTERN.test(i) || !ISO_TIMESTAMP_PATTERN.test(c) || Number.isNaN(Date.parse(c))) {
+      return null;
+    }
+    return { createdAt: c, id: i };
+  } catch {
+    return null;
+  }
+}
+
+/**
+ * Clamp a requested page size to a sane range
+ */
+export function clampPageSize(limit: unknown): number {
+  const value = Number(limit);
+  if (!Number.isFinite(value) || value <= 0) {
+    return DEFAULT_PAGE_SIZE;
+  }
+  return Math.min(Math.floor(value), MAX_PAGE_SIZE);
+}
+
+/**
+ * Strip characters that have meaning inside PostgREST `or=(...)` filters and LIKE patterns
+ * @param search - Raw search term
+ * @returns Sanitised term, or an empty string
+ */
+export function sanitizeSearchTerm(search?: string | null): string {
+  if (!search) {
+    return '';
+  }
+  return search.replace(/[,()*%_\\"]/g, ' ').trim().slice(0, 100);
+}
+
+/**
+ * Apply keyset ordering, the cursor predicate and the page size to a PostgREST query.
+ * Fetches one extra row so the caller can tell whether another page exists.
+ */
+export function applyKeyset(query: any, cursor: KeysetCursor | null, limit: number): any {
+  if (cursor) {
+    query = query.or(
+      `created_at.lt."${cursor.createdAt}",and(created_at.eq."${cursor.createdAt}",id.lt.${cursor.id})`
+    );
+  }
+
+  return query
+    .order('created_at', { ascending: false })
+    .order('id', { ascending: false })
+    .limit(limit + 1);
+}
+
+/**
+ * Split an over-fetched result into the page and the cursor for the next page
+ * @param rows - Rows returned by a query built with applyKeyset
+ * @param limit - Requested page size
+ */
+export function buildPage<T extends { created_at: string; id: string }>(
+  rows: T[] | null,
+  limit: number
+): { items: T[]; nextCursor: string | null; hasMore: boolean } {
+  const all = rows || [];
+  const hasMore = all.length > limit;
+  const items = hasMore ? all.slice(0, limit) : all;
+
+  return {
+    items,
+    nextCursor: hasMore ? encodeCursor(items[items.length - 1]) : null,
+    hasMore,
+  };
+}
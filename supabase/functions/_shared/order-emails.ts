@@ -0,0 +1,245 @@
+// Order confirmation emails sent through Resend
+// Shared by stripe-webhook2 (which enqueues them), order-outbox-worker (which sends them) and
+// send-order-email (which renders the customer confirmation on demand)
+
+import { defineTemplate, formatPence, renderTemplate } from './email-templates.ts';
+import { resendClient } from './resend.ts';
+
+export interface OrderEmailItem {
+  product_name: string;
+  quantity: number;
+  unit_price: number; // pence
+  variants: Record<string, string> | null;
+  image_url: string | null;
+}
+
+export interface OrderEmailData {
+  orderId: string;
+  customerEmail: string;
+  items: OrderEmailItem[];
+  shippingAddress: any;
+  orderDetails: {
+    subtotal: number;
+    shipping_cost: number;
+    total_amount: number;
+    readable_order_id: string;
+  };
+}
+
+const SUPPORT_EMAIL = 'support@backreform.co.uk';
+
+// View model shared by the customer and admin templates
+export interface OrderEmailView {
+  readableOrderId: string;
+  customerEmail: string;
+  greetingName: string;
+  items: Array<{
+    name: string;
+    variantsText: string;
+    quantity: number;
+    unitPrice: string;
+    lineTotal: string;
+  }>;
+  subtotal: string;
+  shipping: string;
+  total: string;
+  address: {
+    name: string;
+    line1: string;
+    line2: string;
+    city: string;
+    state: string;
+    postalCode: string;
+    country: string;
+  };
+}
+
+const ITEM_ROWS = `{{#each items}}
+    <tr>
+      <td style="padding: 12px; border-bottom: 1px solid #e5e7eb;">
+        <strong>{{name}}</strong>
+        {{#if variantsText}}<br><small style="color: #6b7280;">{{variantsText}}</small>{{/if}}
+      </td>
+      <td style="padding: 12px; border-bottom: 1px solid #e5e7eb; text-align: center; vertical-align: middle;">{{quantity}}</td>
+      <td style="padding: 12px; border-bottom: 1px solid #e5e7eb; text-align: right; vertical-align: middle;">£{{unitPrice}}</td>
+      <td style="padding: 12px; border-bottom: 1px solid #e5e7eb; text-align: right; vertical-align: middle;">£{{lineTotal}}</td>
+    </tr>
+  {{/each}}`;
+
+const ADDRESS_LINES = `{{address.name}}<br>
+      {{address.line1}}<br>
+      {{#if address.line2}}{{address.line2}}<br>{{/if}}
+      {{address.city}}, {{address.state}} {{address.postalCode}}<br>
+      {{address.country}}`;
+
+defineTemplate('order-confirmation', `
+<!DOCTYPE html>
+<html>
+<head>
+  <meta charset="utf-8">
+  <title>Order Confirmation - Reform UK Store</title>
+</head>
+<body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto; padding: 20px;">
+  <div style="background: linear-gradient(135deg, #009fe3 0%, #0066cc 100%); color: white; padding: 30px; text-align: center; border-radius: 10px 10px 0 0;">
+    <h1 style="margin: 0;">Order Confirmation</h1>
+    <p style="margin: 10px 0 0 0;">Thank you for your order!</p>
+  </div>
+  
+  <div style="background: #f9f9f9; padding: 30px; border-radius: 0 0 10px 10px;">
+    <h2>Order #{{readableOrderId}}</h2>
+    <p>Hi {{greetingName}},</p>
+    <p>We've received your order and it's being processed. You'll receive another email when your items ship.</p>
+    
+    <h3>Order Details:</h3>
+    <table style="width: 100%; border-collapse: collapse;">
+      <thead>
+        <tr style="background: #f3f4f6;">
+          <th style="padding: 12px; text-align: left;">Item</th>
+          <th style="padding: 12px; text-align: center;">Qty</th>
+          <th style="padding: 12px; text-align: right;">Price</th>
+          <th style="padding: 12px; text-align: right;">Total</th>
+        </tr>
+      </thead>
+      <tbody>
+        ${ITEM_ROWS}
+      </tbody>
+      <tfoot>
+        <tr>
+          <td colspan="3" style="padding: 12px; text-align: right;"><strong>Subtotal:</strong></td>
+          <td style="padding: 12px; text-align: right;">£{{subtotal}}</td>
+        </tr>
+        <tr>
+          <td colspan="3" style="padding: 12px; text-align: right;"><strong>Shipping:</strong></td>
+          <td style="padding: 12px; text-align: right;">£{{shipping}}</td>
+        </tr>
+        <tr style="background: #f3f4f6;">
+          <td colspan="3" style="padding: 12px; text-align: right;"><strong>Total:</strong></td>
+          <td style="padding: 12px; text-align: right;"><strong>£{{total}}</strong></td>
+        </tr>
+      </tfoot>
+    </table>
+    
+    <h3>Shipping Address:</h3>
+    <p style="background: white; padding: 15px; border-radius: 5px;">
+      ${ADDRESS_LINES}
+    </p>
+    
+    <p style="margin-top: 30px; padding-top: 20px; border-top: 1px solid #e5e7eb; text-align: center; color: #6b7280;">
+      If you have any questions, please contact us at support@backreform.co.uk
+    </p>
+  </div>
+</body>
+</html>
+`);
+
+defineTemplate('order-admin-notification', `
+<!DOCTYPE html>
+<html>
+<head>
+  <meta charset="utf-8">
+  <title>New Order - {{readableOrderId}}</title>
+</head>
+<body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
+  <h1>New Order Received</h1>
+  <p><strong>Order ID:</strong> {{readableOrderId}}</p>
+  <p><strong>Customer:</strong> {{customerEmail}}</p>
+  <p><strong>Total:</strong> £{{total}}</p>
+  
+  <h2>Items Ordered:</h2>
+  <table border="1" cellpadding="10" style="border-collapse: collapse;">
+    <tr>
+      <th>Item</th>
+      <th>Quantity</th>
+      <th>Price</th>
+      <th>Total</th>
+    </tr>
+    ${ITEM_ROWS}
+  </table>
+  
+  <h2>Shipping Details:</h2>
+  <p>
+    ${ADDRESS_LINES}
+  </p>
+</body>
+</html>
+`);
+
+/**
+ * Build the template view model for an order
+ * @param data - Order email payload (as stored in the outbox)
+ */
+export function buildOrderEmailView({ customerEmail, items, shippingAddress, orderDetails }: OrderEmailData): OrderEmailView {
+  const address = shippingAddress?.address || {};
+
+  return {
+    readableOrderId: orderDetails.readable_order_id,
+    customerEmail,
+    greetingName: shippingAddress?.name || customerEmail,
+    items: items.map(item => ({
+      name: item.product_name,
+      variantsText: item.variants ? formatVariants(item.variants) : '',
+      quantity: item.quantity,
+      unitPrice: formatPence(item.unit_price),
+      lineTotal: formatPence(item.unit_price * item.quantity),
+    })),
+    subtotal: orderDetails.subtotal.toFixed(2),
+    shipping: orderDetails.shipping_cost.toFixed(2),
+    total: orderDetails.total_amount.toFixed(2),
+    address: {
+      name: shippingAddress?.name || '',
+      line1: address.line1 || '',
+      line2: address.line2 || '',
+      city: address.city || '',
+      state: address.state || '',
+      postalCode: address.postal_code || '',
+      country: address.country || '',
+    },
+  };
+}
+
+export function renderCustomerOrderEmail(data: OrderEmailData): string {
+  return renderTemplate('order-confirmation', buildOrderEmailView(data));
+}
+
+export function renderAdminOrderEmail(data: OrderEmailData): string {
+  return renderTemplate('order-admin-notification', buildOrderEmailView(data));
+}
+
+/**
+ * Send one email through the shared Resend client.
+ * Throws on failure so callers (the outbox worker) can retry; the idempotency key
+ * stops a retried job from delivering the same email twice.
+ */
+async function sendOrderEmail(message: { to: string; subject: string; html: string }, idempotencyKey: string): Promise<void> {
+  const result = await resendClient.send({ from: SUPPORT_EMAIL, ...message }, idempotencyKey);
+  if (!result.ok) {
+    throw new Error(result.error);
+  }
+}
+
+export async function sendCustomerOrderEmail(data: OrderEmailData): Promise<void> {
+  await sendOrderEmail({
+    to: data.customerEmail,
+    subject: `Order Confirmation - ${data.orderDetails.readable_order_id}`,
+    html: renderCustomerOrderEmail(data),
+  }, `order-customer-email-${data.orderId}`);
+  console.log('Customer order confirmation email sent to:', data.customerEmail);
+}
+
+export async function sendAdminOrderEmail(data: OrderEmailData): Promise<void> {
+  await sendOrderEmail({
+    to: SUPPORT_EMAIL,
+    subject: `New Order: ${data.orderDetails.readable_order_id} - £${data.orderDetails.total_amount.toFixed(2)}`,
+    html: renderAdminOrderEmail(data),
+  }, `order-admin-email-${data.orderId}`);
+  console.log(`Admin notification email sent to ${SUPPORT_EMAIL}`);
+}
+
+// Format product variants for display
+function formatVariants(variants: any): string {
+  const parts = [];
+  if (variants.color) parts.push(`Color: ${variants.color}`);
+  if (variants.size) parts.push(`Size: ${variants.size}`);
+  if (variants.gender) parts.push(`Gender: ${variants.gender}`);
+  return parts.join(' | ');
+}
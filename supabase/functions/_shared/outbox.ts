@@ -0,0 +1,106 @@
+// Transactional outbox for post-payment side effects
+// Jobs are written in the same transaction as the order (create_order_with_outbox)
+// and drained by the order-outbox-worker function with retries and backoff
+
+export type OutboxJobKind = 'customer_email' | 'admin_email' | 'printful_fulfillment';
+
+export interface OutboxJobInput {
+  kind: OutboxJobKind;
+  payload: any;
+}
+
+export interface OutboxJob {
+  id: string;
+  order_id: string;
+  kind: OutboxJobKind;
+  payload: any;
+  attempts: number;
+  max_attempts: number;
+}
+
+// Backoff: 30s, 1m, 2m, 4m ... capped at 1h, with up to 20% jitter
+const BASE_BACKOFF_MS = 30_000;
+const MAX_BACKOFF_MS = 60 * 60 * 1000;
+
+export function computeBackoffMs(attempts: number): number {
+  const backoff = Math.min(BASE_BACKOFF_MS * 2 ** Math.max(attempts - 1, 0), MAX_BACKOFF_MS);
+  return Math.round(backoff * (1 + Math.random() * 0.2));
+}
+
+/**
+ * Claim up to `limit` due jobs. Rows are locked with SKIP LOCKED, so concurrent
+ * workers never pick up the same job; jobs whose lease expired are reclaimed.
+ */
+export async function claimOutboxJobs(
+  supabase: any,
+  limit: number,
+  leaseSeconds: number
+): Promise<OutboxJob[]> {
+  const { data, error } = await supabase.rpc('claim_order_outbox_jobs', {
+    p_limit: limit,
+    p_lease_seconds: leaseSeconds
+  });
+
+  if (error) {
+    throw new Error(`Failed to claim outbox jobs: ${error.message}`);
+  }
+
+  return data || [];
+}
+
+export async function completeOutboxJob(supabase: any, job: OutboxJob): Promise<void> {
+  const { error } = await supabase
+    .from('order_outbox')
+    .update({
+      status: 'done',
+      processed_at: new Date().toISOString(),
+      locked_until: null,
+      last_error: null
+    })
+    .eq('id', job.id);
+
+  if (error) {
+    console.error(`⚠️ Failed to mark outbox job ${job.id} done:`, error);
+  }
+}
+
+/**
+ * Record a failed attempt: reschedule with backoff, or park the job as
+ * `failed` once it has used all of its attempts
+ */
+export async function failOutboxJob(supabase: any, job: OutboxJob, message: string): Promise<void> {
+  const exhausted = job.attempts >= job.max_attempts;
+  const { error } = await supabase
+    .from('order_outbox')
+    .update({
+      status: exhausted ? 'failed' : 'pending',
+      available_at: new Date(Date.now() + computeBackoffMs(job.attempts)).toISOString(),
+      locked_until: null,
+      last_error: message.slice(0, 2000)
+    })
+    .eq('id', job.id);
+
+  if (error) {
+    console.error(`⚠️ Failed to reschedule outbox job ${job.id}:`, error);
+  }
+}
+
+/**
+ * Ask the worker to drain the outbox now. Best effort - scheduled runs pick up
+ * anything this misses.
+ */
+export async function triggerOutboxWorker(): Promise<void> {
+  try {
+    const response = await fetch(`${Deno.env.get('SUPABASE_URL')}/functions/v1/order-outbox-worker`, {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json',
+        'Authorization': `Bearer ${Deno.env.get('SUPABASE_SERVICE_ROLE_KEY')}`,
+      },
+      body: JSON.stringify({ trigger: 'order-created' }),
+    });
+    await response.body?.cancel();
+  } catch (error) {
+    console.error('⚠️ Failed to trigger outbox worker:', error);
+  }
+}
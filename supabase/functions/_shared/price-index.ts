@@ -0,0 +1,125 @@
+// Warm per-isolate variant price index for checkout
+// Resolves every cart line's price with one `in (...)` query and keeps results in memory
+// until the `product_variants` catalog version changes
+
+import { getFallbackPrice } from './variant-fallback.ts';
+
+// How often an isolate re-reads the catalog version (one primary-key lookup)
+const VERSION_CHECK_INTERVAL_MS = 5000;
+
+// Placeholder when a variant is neither in the database nor the fallback table. Prices with
+// source 'default' are unresolved: checkout refuses them rather than charge this amount
+export const DEFAULT_VARIANT_PRICE = 24.99;
+
+export interface ResolvedPrice {
+  price: number;
+  source: 'database' | 'fallback' | 'default';
+}
+
+// printful_variant_id -> database price (null = known to have no price)
+const priceIndex = new Map<string, number | null>();
+let indexVersion: number | null = null;
+let versionCheckedAt = 0;
+
+/**
+ * Drop the in-memory index. Called automatically when the catalog version changes;
+ * functions that update variants in this isolate can also call it directly.
+ */
+export function invalidatePriceIndex(): void {
+  priceIndex.clear();
+  indexVersion = null;
+  versionCheckedAt = 0;
+}
+
+async function syncIndexVersion(supabase: any): Promise<void> {
+  if (indexVersion !== null && Date.now() - versionCheckedAt < VERSION_CHECK_INTERVAL_MS) {
+    return;
+  }
+
+  const { data, error } = await supabase
+    .from('catalog_versions')
+    .select('version')
+    .eq('scope', 'product_variants')
+    .maybeSingle();
+
+  if (error) {
+    // Can't tell whether cached prices are current - start cold
+    console.warn('⚠️ Could not read catalog version, clearing price index:', error.message);
+    invalidatePriceIndex();
+    return;
+  }
+
+  const version = Number(data?.version ?? 0);
+  if (version !== indexVersion) {
+    priceIndex.clear();
+    indexVersion = version;
+  }
+  versionCheckedAt = Date.now();
+}
+
+/**
+ * Resolve prices for every variant in a cart with at most two round trips
+ * (catalog version check + one batched variant query), whatever the cart size
+ * @param supabase - Supabase client
+ * @param variantIds - Printful variant IDs from the cart
+ * @returns Map of printful_variant_id (as string) to resolved price
+ */
+export async function resolveVariantPrices(
+  supabase: any,
+  variantIds: Array<string | number>
+): Promise<Map<string, ResolvedPrice>> {
+  const ids = [...new Set(variantIds.filter(id => id !== null && id !== undefined && id !== '').map(String))];
+  const resolved = new Map<string, ResolvedPrice>();
+
+  if (ids.length === 0) {
+    return resolved;
+  }
+
+  try {
+    await syncIndexVersion(supabase);
+
+    const missing = ids.filter(id => !priceIndex.has(id));
+    if (missing.length > 0) {
+      const { data: variants, error } = await supabase
+        .from('product_variants')
+        .select('printful_variant_id, price')
+        .in('printful_variant_id', missing);
+
+      if (error) {
+        console.error('❌ Batched price lookup failed:', error);
+      } else {
+        const found = new Map<string, number>();
+        for (const variant of variants || []) {
+          const price = parseFloat(variant.price);
+          if (!isNaN(price) && price > 0) {
+            found.set(String(variant.printful_variant_id), price);
+          }
+        }
+        for (const id of missing) {
+          priceIndex.set(id, found.get(id) ?? null);
+        }
+      }
+    }
+  } catch (error) {
+    console.error('❌ Exception resolving variant prices:', error);
+  }
+
+  for (const id of ids) {
+    const databasePrice = priceIndex.get(id);
+    if (databasePrice) {
+      resolved.set(id, { price: databasePrice, source: 'database' });
+      continue;
+    }
+
+    const fallbackPrice = getFallbackPrice(id);
+    if (fallbackPrice) {
+      resolved.set(id, { price: fallbackPrice, source: 'fallback' });
+      continue;
+    }
+
+    console.warn(`Price not found for variant ${id}, using default`);
+    resolved.set(id, { price: DEFAULT_VARIANT_PRICE, source: 'default' });
+  }
+
+  return resolved;
+}
@@ -33,8 +33,61 @@ export interface PrintfulOrderResponse {
 }
 
 /**
- * Create a Printful order for fulfillment
- * This function handles the creation of orders in Printful's system for print-on-demand fulfillment
+ * Look up a Printful order by our external_id
+ * @returns The Printful order ID, or null if Printful has no such order
+ */
+async function findPrintfulOrder(externalId: string, headers: Record<string, string>): Promise<string | null> {
+  const response = await fetch(`https://api.printful.com/orders/@${encodeURIComponent(externalId)}`, { headers });
+
+  if (response.status === 404) {
+    await response.body?.cancel();
+    return null;
+  }
+
+  if (!response.ok) {
+    // Can't tell whether the order exists - fail the attempt rather than risk a duplicate
+    throw new Error(`Printful order lookup failed: ${response.status} - ${await response.text()}`);
+  }
+
+  const result = await response.json();
+  return result.result?.id ? result.result.id.toString() : null;
+}
+
+async function recordFulfillment(orderId: string, printfulOrderId: string): Promise<void> {
+  const supabase = createClient(
+    Deno.env.get('SUPABASE_URL')!,
+    Deno.env.get('SUPABASE_SERVICE_ROLE_KEY')!
+  );
+
+  const { data: existing } = await supabase
+    .from('fulfillments')
+    .select('id')
+    .eq('order_id', orderId)
+    .eq('printful_order_id', printfulOrderId)
+    .maybeSingle();
+
+  if (existing) {
+    return;
+  }
+
+  const { error: dbError } = await supabase
+    .from('fulfillments')
+    .insert({
+      order_id: orderId,
+      printful_order_id: printfulOrderId,
+      status: 'submitted',
+      created_at: new Date().toISOString()
+    });
+
+  if (dbError) {
+    console.error('Error recording fulfillment in database:', dbError);
+    // Don't fail the whole operation - Printful order was created successfully
+  }
+}
+
+/**
+ * Create a Printful order for fulfillment. Safe to retry: an order Printful already
+ * has for this external_id is returned instead of being created again
  * @param orderData - Order data from our system
  * @returns Promise with success status and Printful order ID
  */
@@ -103,6 +156,17 @@ export async function createPrintfulFulfillment(orderData: OrderData): Promise<P
       'Idempotency-Key': idempotencyKey
     };
 
+    // An earlier attempt may have reached Printful and then failed before it was recorded
+    const existingOrderId = await findPrintfulOrder(external_id, headers);
+    if (existingOrderId) {
+      console.log(`Printful order ${existingOrderId} already exists for ${external_id}, not creating another`);
+      await recordFulfillment(orderData.id, existingOrderId);
+      return {
+        success: true,
+        printful_order_id: existingOrderId
+      };
+    }
+
     const response = await fetch('https://api.printful.com/orders', {
       method: 'POST',
       headers,
@@ -140,24 +204,7 @@ export async function createPrintfulFulfillment(orderData: OrderData): Promise<P
     });
 
     // Record fulfillment in our database
-    const supabase = createClient(
-      Deno.env.get('SUPABASE_URL')!,
-      Deno.env.get('SUPABASE_SERVICE_ROLE_KEY')!
-    );
-
-    const { error: dbError } = await supabase
-      .from('fulfillments')
-      .insert({
-        order_id: orderData.id,
-        printful_order_id: printfulOrderId,
-        status: 'submitted',
-        created_at: new Date().toISOString()
-      });
-
-    if (dbError) {
-      console.error('Error recording fulfillment in database:', dbError);
-      // Don't fail the whole operation - Printful order was created successfully
-    }
+    await recordFulfillment(orderData.id, printfulOrderId);
 
     return {
       success: true,
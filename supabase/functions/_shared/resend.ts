@@ -0,0 +1,79 @@
+// Shared Resend client
+// One instance per isolate: the API key and headers are resolved once and the
+// underlying HTTP connection is kept alive and reused across sends
+
+export interface EmailMessage {
+  from: string;
+  to: string;
+  subject: string;
+  html: string;
+}
+
+export interface EmailSendResult {
+  ok: boolean;
+  id?: string;
+  error?: string;
+}
+
+const RESEND_EMAILS_URL = 'https://api.resend.com/emails';
+
+class ResendClient {
+  private headers: Record<string, string> | null = null;
+
+  isConfigured(): boolean {
+    return !!Deno.env.get('RESEND_API_KEY');
+  }
+
+  private getHeaders(): Record<string, string> {
+    if (!this.headers) {
+      const apiKey = Deno.env.get('RESEND_API_KEY');
+      if (!apiKey) {
+        throw new Error('RESEND_API_KEY not configured');
+      }
+      this.headers = {
+        'Authorization': `Bearer ${apiKey}`,
+        'Content-Type': 'application/json',
+      };
+    }
+    return this.headers;
+  }
+
+  /**
+   * Send one email. Never throws; failures are returned in the result.
+   * @param message - Email to send
+   * @param idempotencyKey - Optional key so retries don't deliver twice
+   */
+  async send(message: EmailMessage, idempotencyKey?: string): Promise<EmailSendResult> {
+    try {
+      const headers = idempotencyKey
+        ? { ...this.getHeaders(), 'Idempotency-Key': idempotencyKey }
+        : this.getHeaders();
+
+      const response = await fetch(RESEND_EMAILS_URL, {
+        method: 'POST',
+        headers,
+        body: JSON.stringify(message),
+      });
+
+      if (!response.ok) {
+        const error = await response.text();
+        return { ok: false, error: `Resend API error: ${response.status} - ${error}` };
+      }
+
+      const result = await response.json();
+      return { ok: true, id: result?.id };
+    } catch (error) {
+      return { ok: false, error: error instanceof Error ? error.message : String(error) };
+    }
+  }
+
+  /**
+   * Send several emails concurrently
+   * @returns Results in the same order as the messages
+   */
+  sendAll(messages: Array<{ message: EmailMessage; idempotencyKey?: string }>): Promise<EmailSendResult[]> {
+    return Promise.all(messages.map(({ message, idempotencyKey }) => this.send(message, idempotencyKey)));
+  }
+}
+
+export const resendClient = new ResendClient();
@@ -0,0 +1,152 @@
+// Content hashing helpers for incremental Printful sync
+// Lets sync functions detect unchanged products/variants and skip rewriting them
+
+/**
+ * Serialize a value to JSON with object keys sorted at every depth
+ * so that logically equal payloads always produce the same string
+ * @param value - Value to serialize
+ * @returns Stable JSON string
+ */
+export function stableStringify(value: any): string {
+  if (value === null || value === undefined) {
+    return 'null';
+  }
+
+  if (Array.isArray(value)) {
+    return `[${value.map(item => stableStringify(item)).join(',')}]`;
+  }
+
+  if (typeof value === 'object') {
+    const keys = Object.keys(value)
+      .filter(key => value[key] !== undefined)
+      .sort();
+    return `{${keys.map(key => `${JSON.stringify(key)}:${stableStringify(value[key])}`).join(',')}}`;
+  }
+
+  return JSON.stringify(value);
+}
+
+/**
+ * Create a SHA-256 hash of raw bytes
+ * @param data - Bytes to hash
+ * @returns Hex encoded hash
+ */
+export async function hashBytes(data: Uint8Array): Promise<string> {
+  const hashBuffer = await crypto.subtle.digest('SHA-256', data);
+  return Array.from(new Uint8Array(hashBuffer))
+    .map(b => b.toString(16).padStart(2, '0'))
+    .join('');
+}
+
+/**
+ * Create a SHA-256 content hash of any JSON-compatible value
+ * @param value - Value to hash
+ * @returns Hex encoded hash
+ */
+export function hashContent(value: any): Promise<string> {
+  return hashBytes(new TextEncoder().encode(stableStringify(value)));
+}
+
+/**
+ * Hash the fields of a Printful store product list entry that indicate its details changed.
+ * Accepts both the flat `/store/products` entry and the `{ sync_product }` detail shape
+ * so every sync function stores comparable hashes in `products.printful_sync_hash`.
+ */
+export function hashStoreProduct(product: any): Promise<string> {
+  const p = product?.sync_product ?? product;
+  return hashContent({
+    id: p.id,
+    external_id: p.external_id,
+    name: p.name,
+    variants: p.variants,
+    synced: p.synced,
+    thumbnail_url: p.thumbnail_url,
+    is_ignored: p.is_ignored,
+  });
+}
+
+/**
+ * Hash the fields of a Printful sync variant that we persist locally
+ * (ids, price, options, mockup image and ignore flag)
+ */
+export function hashSyncVariant(variant: any): Promise<string> {
+  return hashContent({
+    id: variant.id,
+    variant_id: variant.variant_id,
+    name: variant.name,
+    retail_price: variant.retail_price,
+    options: variant.options || [],
+    image: variant.product?.image,
+    is_ignored: variant.is_ignored,
+  });
+}
+
+/**
+ * Hash a Printful product detail (`{ sync_product, sync_variants }`) including each variant's
+ * price and options, which the store list entry doesn't carry
+ */
+export async function hashProductDetail(detail: any): Promise<string> {
+  const variants = (detail?.sync_variants || []).filter((v: any) => !v.is_ignored);
+  return hashContent({
+    product: await hashStoreProduct(detail),
+    variants: await Promise.all(variants.map((v: any) => hashSyncVariant(v))),
+  });
+}
+
+export interface SyncChangeReport {
+  mode: 'incremental' | 'full';
+  products: { created: string[]; updated: string[]; unchanged: number; deactivated: string[] };
+  // failed counts variant rows that couldn't be inserted, updated or removed; any failure fails the run
+  variants: { created: number; updated: number; unchanged: number; removed: number; failed: number };
+  images: { stored: number };
+  detailRequests: number;
+  durationMs: number;
+}
+
+export function createChangeReport(mode: 'incremental' | 'full'): SyncChangeReport {
+  return {
+    mode,
+    products: { created: [], updated: [], unchanged: 0, deactivated: [] },
+    variants: { created: 0, updated: 0, unchanged: 0, removed: 0, failed: 0 },
+    images: { stored: 0 },
+    detailRequests: 0,
+    durationMs: 0,
+  };
+}
+
+/**
+ * Persist a sync change report to `printful_sync_runs`.
+ * Failures are logged and swallowed - reporting must never fail a sync.
+ */
+export async function recordSyncRun(
+  supabase: any,
+  source: string,
+  report: SyncChangeReport,
+  status: 'success' | 'failed' = 'success'
+): Promise<void> {
+  try {
+    const { error } = await supabase
+      .from('printful_sync_runs')
+      .insert({
+        source,
+        mode: report.mode,
+        status,
+        products_created: report.products.created.length,
+        products_updated: report.products.updated.length,
+        products_unchanged: report.products.unchanged,
+        products_deactivated: report.products.deactivated.length,
+        variants_created: report.variants.created,
+        variants_updated: report.variants.updated,
+        variants_unchanged: report.variants.unchanged,
+        variants_removed: report.variants.removed,
+        duration_ms: Math.round(report.durationMs),
+        report,
+      });
+
+    if (error) {
+      console.error('⚠️ Failed to record sync run:', error);
+    }
+  } catch (error) {
+    console.error('⚠️ Exception recording sync run:', error);
+  }
+}
@@ -0,0 +1,274 @@
+// Set-based Printful variant resolution for order items
+// Plans a lookup for every item up front, loads all candidate variants for the order
+// with a single RPC call, then resolves each item in memory through prebuilt indexes
+
+const UUID_PATTERN = /^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$/i;
+
+// Map item ID product prefixes to catalog product names
+// t-shirts and hoodies default to DARK and fall back to LIGHT
+const PRODUCT_NAME_MAP: Record<string, string> = {
+  'hoodie': 'Unisex Hoodie DARK',
+  'tshirt': 'Unisex t-shirt DARK',
+  't-shirt': 'Unisex t-shirt DARK',
+  'cap': 'Reform UK Cap',
+  'mug': 'Reform UK Mug',
+  'totebag': 'Reform UK Tote Bag',
+  'tote': 'Reform UK Tote Bag',
+  'waterbottle': 'Reform UK Water Bottle',
+  'water-bottle': 'Reform UK Water Bottle',
+  'mousepad': 'Reform UK Mouse Pad',
+  'mouse-pad': 'Reform UK Mouse Pad',
+  // Also try to map numeric patterns
+  '301': 'Reform UK Cap',  // Common cap product ID
+  '302': 'Unisex t-shirt DARK',
+  '303': 'Unisex Hoodie DARK'
+};
+
+// Common frontend -> database colour translations
+const COLOR_MAPPING: Record<string, string[]> = {
+  'autumn': ['Autumn', 'Orange', 'Brown', 'Rust', 'Burnt Orange'],
+  'black': ['Black', 'Charcoal', 'Dark Grey'],
+  'white': ['White', 'Off White', 'Ivory', 'Natural'],
+  'blue': ['Blue', 'Navy', 'Light Blue', 'Royal Blue'],
+  'grey': ['Grey', 'Gray', 'Sport Grey', 'Ash'],
+  'gray': ['Grey', 'Gray', 'Sport Grey', 'Ash'],
+  'green': ['Green', 'Forest Green', 'Olive'],
+  'red': ['Red', 'Crimson', 'Burgundy'],
+  'pink': ['Pink', 'Light Pink', 'Hot Pink']
+};
+
+interface CandidateVariant {
+  id: string;
+  product_id: string;
+  product_name: string;
+  printful_variant_id: string | null;
+  size: string | null;
+  color: string | null;
+  value: string | null;
+}
+
+type LookupPlan =
+  | { kind: 'skip' }
+  | { kind: 'direct'; printfulVariantId: string }
+  | { kind: 'uuid'; variantId: string; itemId: string }
+  | { kind: 'numeric'; printfulVariantId: string; color: string; itemId: string }
+  | { kind: 'product'; productNames: string[]; size: string; color: string; itemId: string }
+  | { kind: 'value'; itemId: string };
+
+function hasVariantId(value: any): boolean {
+  return !!value && value !== 'null' && value !== 'undefined';
+}
+
+/**
+ * Decide how an item will be resolved without touching the database.
+ * Throws for bundle items that arrive without a variant selection.
+ */
+function planLookup(item: any): LookupPlan {
+  const itemId = String(item.id);
+
+  // Skip discount items and bundle discounts
+  if (item.id && itemId.includes('discount')) {
+    return { kind: 'skip' };
+  }
+
+  // If we already have a printful_variant_id from metadata, use it directly
+  if (hasVariantId(item.printful_variant_id)) {
+    return { kind: 'direct', printfulVariantId: String(item.printful_variant_id) };
+  }
+
+  // Bundle items (e.g. starter-bundle-tshirt-0) - the frontend must send the variant ID
+  if (item.id && itemId.includes('bundle')) {
+    const bundleMatch = itemId.match(/^(.*?)-bundle-(.*?)(?:-(\d+))?$/);
+    if (bundleMatch) {
+      const productType = bundleMatch[2];
+      console.error(`ERROR: No variant ID from frontend for ${productType} - THIS SHOULD NOT HAPPEN`);
+      console.error(`Item details: color=${item.color}, size=${item.size}`);
+      throw new Error(`Missing printful_variant_id for ${item.name || productType}. Frontend must provide variant selection.`);
+    }
+  }
+
+  if (UUID_PATTERN.test(itemId)) {
+    return { kind: 'uuid', variantId: itemId, itemId };
+  }
+
+  // Parse string format like "hoodie-2XL-White", "tshirt-M-Black", or "301-Black"
+  const parts = itemId.split('-');
+
+  if (parts.length >= 2 && /^\d+$/.test(parts[0])) {
+    return { kind: 'numeric', printfulVariantId: String(parseInt(parts[0])), color: parts[1], itemId };
+  }
+
+  if (parts.length >= 2) {
+    const productType = parts[0].toLowerCase();
+    const productName = PRODUCT_NAME_MAP[productType];
+
+    if (productName) {
+      // Format: product-size-color, or product-color for single-size items
+      const size = parts.length === 3 ? parts[1] : '';
+      const color = parts.length === 3 ? parts[2] : parts.length === 2 ? parts[1] : '';
+      const productNames = [productName];
+      if (productType === 'tshirt' || productType === 't-shirt' || productType === 'hoodie') {
+        productNames.push(productName.replace('DARK', 'LIGHT'));
+      }
+      return { kind: 'product', productNames, size, color, itemId };
+    }
+  }
+
+  return { kind: 'value', itemId };
+}
+
+function lower(value: string | null | undefined): string {
+  return (value || '').toLowerCase();
+}
+
+// Same precedence as the old per-item cascade: exact size/colour, colour mapping, value field,
+// then the only variant of a single-variant product
+function matchProductVariant(variants: CandidateVariant[], size: string, color: string): CandidateVariant | undefined {
+  const sizeMatches = (v: CandidateVariant) => !size || lower(v.size) === size.toLowerCase();
+
+  let variant = variants.find(v => sizeMatches(v) && (!color || lower(v.color) === color.toLowerCase()));
+
+  if (!variant && color) {
+    const possibleColors = COLOR_MAPPING[color.toLowerCase()] || [color];
+    variant = variants.find(v => sizeMatches(v) && possibleColors.some(pc =>
+      lower(v.color).includes(pc.toLowerCase()) || pc.toLowerCase().includes(lower(v.color))
+    ));
+    if (variant) {
+      console.log(`Found variant using color mapping: ${color} -> ${variant.color}`);
+    }
+  }
+
+  if (!variant) {
+    variant = variants.find(v => {
+      if (!v.value) return false;
+      const valueLower = v.value.toLowerCase();
+      return (!size || valueLower.includes(size.toLowerCase())) &&
+        (!color || valueLower.includes(color.toLowerCase()));
+    });
+  }
+
+  if (!variant && variants.length === 1) {
+    variant = variants[0];
+  }
+
+  return variant;
+}
+
+function pushIndex<T>(index: Map<string, T[]>, key: string | null | undefined, value: T) {
+  if (!key) return;
+  const list = index.get(key);
+  if (list) {
+    list.push(value);
+  } else {
+    index.set(key, [value]);
+  }
+}
+
+/**
+ * Resolve printful_variant_id for every order item with at most one database round trip
+ * @param supabase - Supabase client (service role)
+ * @param items - Items rebuilt from payment intent metadata
+ * @returns Items with printful_variant_id set (null where no variant could be found)
+ */
+export async function resolveOrderVariants(supabase: any, items: any[]): Promise<any[]> {
+  const plans = items.map(item => planLookup(item));
+
+  // Collect every candidate key for the whole order
+  const variantIds = new Set<string>();
+  const printfulIds = new Set<string>();
+  const values = new Set<string>();
+  const productNames = new Set<string>();
+  const colors = new Set<string>();
+
+  for (const plan of plans) {
+    if (plan.kind === 'skip' || plan.kind === 'direct') continue;
+
+    // Every unresolved item can fall back to a value-field match on its ID
+    values.add(plan.itemId);
+
+    if (plan.kind === 'uuid') {
+      variantIds.add(plan.variantId);
+    } else if (plan.kind === 'numeric') {
+      printfulIds.add(plan.printfulVariantId);
+      colors.add(plan.color.toLowerCase());
+    } else if (plan.kind === 'product') {
+      plan.productNames.forEach(name => productNames.add(name));
+    }
+  }
+
+  let candidates: CandidateVariant[] = [];
+  if (values.size > 0) {
+    const { data, error } = await supabase.rpc('get_order_variant_candidates', {
+      p_variant_ids: [...variantIds],
+      p_printful_variant_ids: [...printfulIds],
+      p_values: [...values],
+      p_product_names: [...productNames],
+      p_colors: [...colors]
+    });
+
+    if (error) {
+      console.error('❌ Failed to load candidate variants:', error);
+    } else {
+      candidates = data || [];
+    }
+    console.log(`🔍 Loaded ${candidates.length} candidate variants for ${values.size} unresolved items`);
+  }
+
+  // Build in-memory indexes once per order
+  const byId = new Map<string, CandidateVariant>();
+  const byPrintfulId = new Map<string, CandidateVariant[]>();
+  const byValue = new Map<string, CandidateVariant[]>();
+  const byColor = new Map<string, CandidateVariant[]>();
+  const byProductName = new Map<string, CandidateVariant[]>();
+
+  for (const candidate of candidates) {
+    byId.set(candidate.id, candidate);
+    pushIndex(byPrintfulId, candidate.printful_variant_id, candidate);
+    pushIndex(byValue, candidate.value, candidate);
+    pushIndex(byColor, candidate.color ? candidate.color.toLowerCase() : null, candidate);
+    pushIndex(byProductName, candidate.product_name, candidate);
+  }
+
+  const single = (list?: CandidateVariant[]) => (list && list.length === 1 ? list[0] : undefined);
+
+  return items.map((item, index) => {
+    const plan = plans[index];
+
+    if (plan.kind === 'skip') {
+      return { ...item, printful_variant_id: null };
+    }
+
+    if (plan.kind === 'direct') {
+      return { ...item, printful_variant_id: plan.printfulVariantId };
+    }
+
+    let variant: CandidateVariant | undefined;
+
+    if (plan.kind === 'uuid') {
+      variant = byId.get(plan.variantId);
+    } else if (plan.kind === 'numeric') {
+      variant = single(byPrintfulId.get(plan.printfulVariantId)) ||
+        single(byColor.get(plan.color.toLowerCase()));
+    } else if (plan.kind === 'product') {
+      // DARK product first; LIGHT only when the DARK product doesn't exist
+      const productName = plan.productNames.find(name => byProductName.has(name));
+      if (productName) {
+        variant = matchProductVariant(byProductName.get(productName)!, plan.size, plan.color);
+      } else {
+        console.log(`No product found for name: ${plan.productNames[0]}`);
+      }
+    }
+
+    // Final fallback: variant whose value field matches the item ID
+    if (!variant) {
+      variant = single(byValue.get(plan.itemId));
+    }
+
+    if (!variant) {
+      console.warn(`Could not find variant for item ${item.id}`);
+      return { ...item, printful_variant_id: null };
+    }
+
+    return { ...item, printful_variant_id: variant.printful_variant_id };
+  });
+}
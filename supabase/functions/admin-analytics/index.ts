@@ -55,35 +55,22 @@ serve(async (req) => {
       )
     }
 
-    const { action } = await req.json()
+    const { action, timeRange = '30d' } = await req.json()
 
     switch (action) {
       case 'get_dashboard_stats':
-        // Get basic dashboard statistics
-        const { data: ordersData, error: ordersError } = await supabaseClient
-          .from('orders')
-          .select('amount_total, created_at')
+        // Totals come from the trigger-maintained daily rollups, not from scanning orders
+        const { data: stats, error: statsError } = await supabaseClient
+          .rpc('get_dashboard_rollup_stats')
 
-        if (ordersError) throw ordersError
-
-        const { data: customersData, error: customersError } = await supabaseClient
-          .from('customer_profiles')
-          .select('created_at')
-
-        if (customersError) throw customersError
-
-        // Calculate stats
-        const totalOrders = ordersData?.length || 0
-        const totalRevenue = ordersData?.reduce((sum, order) => sum + (order.amount_total || 0), 0) || 0
-        const totalCustomers = customersData?.length || 0
-        const averageOrderValue = totalOrders > 0 ? totalRevenue / totalOrders : 0
+        if (statsError) throw statsError
 
         return new Response(
           JSON.stringify({ 
-            totalOrders,
-            totalRevenue,
-            totalCustomers,
-            averageOrderValue
+            totalOrders: Number(stats?.totalOrders ?? 0),
+            totalRevenue: Number(stats?.totalRevenue ?? 0),
+            totalCustomers: Number(stats?.totalCustomers ?? 0),
+            averageOrderValue: Number(stats?.averageOrderValue ?? 0)
           }),
           { 
             status: 200, 
@@ -92,60 +79,18 @@ serve(async (req) => {
         )
 
       case 'get_revenue_trends':
-        const { timeRange = '30d' } = await req.json()
-        
-        // Calculate date range
-        const now = new Date()
-        let startDate = new Date()
-        
-        switch (timeRange) {
-          case '7d':
-            startDate.setDate(now.getDate() - 7)
-            break
-          case '30d':
-            startDate.setDate(now.getDate() - 30)
-            break
-          case '90d':
-            startDate.setDate(now.getDate() - 90)
-            break
-          case '1y':
-            startDate.setFullYear(now.getFullYear() - 1)
-            break
-          default:
-            startDate.setDate(now.getDate() - 30)
-        }
-
         const { data: revenueData, error: revenueError } = await supabaseClient
-          .from('orders')
-          .select('amount_total, created_at')
-          .gte('created_at', startDate.toISOString())
-          .order('created_at', { ascending: true })
+          .rpc('get_monthly_rollups', { p_start_date: getStartDate(timeRange) })
 
         if (revenueError) throw revenueError
 
-        // Process revenue data by month
-        const monthlyData = new Map()
-        
-        revenueData?.forEach(order => {
-          const date = new Date(order.created_at)
-          const monthKey = `${date.getFullYear()}-${String(date.getMonth() + 1).padStart(2, '0')}`
-          
-          if (!monthlyData.has(monthKey)) {
-            monthlyData.set(monthKey, { count: 0, revenue: 0 })
-          }
-          
-          const monthData = monthlyData.get(monthKey)
-          monthData.count += 1
-          monthData.revenue += order.amount_total || 0
-        })
-
-        const revenueTrends = Array.from(monthlyData.entries())
-          .map(([month, data]) => ({
-            month: new Date(month + '-01').toLocaleDateString('en-GB', { month: 'short', year: 'numeric' }),
-            count: data.count,
-            revenue: data.revenue
+        const revenueTrends = (revenueData || [])
+          .filter(row => Number(row.order_count) > 0)
+          .map(row => ({
+            month: formatMonth(row.month_start),
+            count: Number(row.order_count),
+            revenue: Number(row.revenue)
           }))
-          .sort((a, b) => new Date(a.month).getTime() - new Date(b.month).getTime())
 
         return new Response(
           JSON.stringify({ 
@@ -158,53 +103,17 @@ serve(async (req) => {
         )
 
       case 'get_customer_growth':
-        const { timeRange: customerTimeRange = '30d' } = await req.json()
-        
-        // Calculate date range for customers
-        const customerNow = new Date()
-        let customerStartDate = new Date()
-        
-        switch (customerTimeRange) {
-          case '7d':
-            customerStartDate.setDate(customerNow.getDate() - 7)
-            break
-          case '30d':
-            customerStartDate.setDate(customerNow.getDate() - 30)
-            break
-          case '90d':
-            customerStartDate.setDate(customerNow.getDate() - 90)
-            break
-          case '1y':
-            customerStartDate.setFullYear(customerNow.getFullYear() - 1)
-            break
-          default:
-            customerStartDate.setDate(customerNow.getDate() - 30)
-        }
-
         const { data: customerGrowthData, error: customerGrowthError } = await supabaseClient
-          .from('customer_profiles')
-          .select('created_at')
-          .gte('created_at', customerStartDate.toISOString())
-          .order('created_at', { ascending: true })
+          .rpc('get_monthly_rollups', { p_start_date: getStartDate(timeRange) })
 
         if (customerGrowthError) throw customerGrowthError
 
-        // Process customer growth by month
-        const customerMonthlyData = new Map()
-        
-        customerGrowthData?.forEach(customer => {
-          const date = new Date(customer.created_at)
-          const monthKey = `${date.getFullYear()}-${String(date.getMonth() + 1).padStart(2, '0')}`
-          
-          customerMonthlyData.set(monthKey, (customerMonthlyData.get(monthKey) || 0) + 1)
-        })
-
-        const customerGrowth = Array.from(customerMonthlyData.entries())
-          .map(([month, count]) => ({
-            month: new Date(month + '-01').toLocaleDateString('en-GB', { month: 'short', year: 'numeric' }),
-            count
+        const customerGrowth = (customerGrowthData || [])
+          .filter(row => Number(row.new_customers) > 0)
+          .map(row => ({
+            month: formatMonth(row.month_start),
+            count: Number(row.new_customers)
           }))
-          .sort((a, b) => new Date(a.month).getTime() - new Date(b.month).getTime())
 
         return new Response(
           JSON.stringify({ 
@@ -256,3 +165,30 @@ serve(async (req) => {
     )
   }
 })
+
+
+// Start date (YYYY-MM-DD) for a dashboard time range
+function getStartDate(timeRange: string): string {
+  const startDate = new Date()
+
+  switch (timeRange) {
+    case '7d':
+      startDate.setDate(startDate.getDate() - 7)
+      break
+    case '90d':
+      startDate.setDate(startDate.getDate() - 90)
+      break
+    case '1y':
+      startDate.setFullYear(startDate.getFullYear() - 1)
+      break
+    case '30d':
+    default:
+      startDate.setDate(startDate.getDate() - 30)
+  }
+
+  return startDate.toISOString().slice(0, 10)
+}
+
+function formatMonth(monthStart: string): string {
+  return new Date(monthStart).toLocaleDateString('en-GB', { month: 'short', year: 'numeric' })
+}
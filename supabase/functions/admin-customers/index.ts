@@ -1,5 +1,6 @@
 import { serve } from "https://deno.land/std@0.168.0/http/server.ts"
 import { createClient } from 'https://esm.sh/@supabase/supabase-js@2'
+import { applyKeyset, buildPage, clampPageSize, decodeCursor, sanitizeSearchTerm } from '../_shared/keyset.ts'
 
 const corsHeaders = {
   'Access-Control-Allow-Origin': '*',
@@ -55,35 +56,79 @@ serve(async (req) => {
       )
     }
 
-    const { action } = await req.json()
+    const body = await req.json()
+    const { action } = body
 
     switch (action) {
       case 'get_customers':
-        const { page = 1, limit = 50, search } = await req.json()
+        const { cursor, search, email, dateFrom, dateTo } = body
+        const limit = clampPageSize(body.limit)
         
         let query = supabaseClient
           .from('customer_profiles')
           .select('*')
-          .order('created_at', { ascending: false })
 
-        // Apply search filter
-        if (search) {
-          query = query.or(`email.ilike.%${search}%,first_name.ilike.%${search}%,last_name.ilike.%${search}%`)
+        // Apply filters server-side. Emails live in auth.users, so they're matched to user ids first
+        if (email) {
+          const emailUserIds = await findUserIdsByEmail(supabaseClient, String(email).trim().replace(/[\\%_]/g, '\\$&'))
+          query = query.in('user_id', emailUserIds)
         }
 
-        // Apply pagination
-        const offset = (page - 1) * limit
-        query = query.range(offset, offset + limit - 1)
+        if (dateFrom) {
+          query = query.gte('created_at', dateFrom)
+        }
+
+        if (dateTo) {
+          query = query.lte('created_at', dateTo)
+        }
+
+        const searchTerm = sanitizeSearchTerm(search)
+        if (searchTerm) {
+          const searchUserIds = await findUserIdsByEmail(supabaseClient, `%${searchTerm}%`)
+          const emailMatch = searchUserIds.length > 0 ? `,user_id.in.(${searchUserIds.join(',')})` : ''
+          query = query.or(`first_name.ilike.%${searchTerm}%,last_name.ilike.%${searchTerm}%,phone.ilike.%${searchTerm}%${emailMatch}`)
+        }
+
+        // Keyset pagination on (created_at, id)
+        query = applyKeyset(query, decodeCursor(cursor), limit)
 
-        const { data: customers, error: customersError, count } = await query
+        const { data: customers, error: customersError } = await query
 
         if (customersError) throw customersError
 
+        const customersPage = buildPage(customers, limit)
+
+        // Emails and order aggregates for the whole page in one query
+        const userIds = customersPage.items.map((customer: any) => customer.user_id).filter(Boolean)
+        const aggregatesByUserId = new Map<string, any>()
+
+        if (userIds.length > 0) {
+          const { data: aggregates, error: aggregatesError } = await supabaseClient
+            .rpc('get_customer_order_aggregates', { p_user_ids: userIds })
+
+          if (aggregatesError) throw aggregatesError
+
+          for (const row of aggregates || []) {
+            aggregatesByUserId.set(row.user_id, row)
+          }
+        }
+
         return new Response(
           JSON.stringify({ 
-            customers: customers || [],
-            total: count || 0,
-            page,
+            customers: customersPage.items.map((customer: any) => {
+              const aggregate = aggregatesByUserId.get(customer.user_id)
+              return {
+                ...customer,
+                email: aggregate?.email ?? null,
+                order_stats: {
+                  orderCount: Number(aggregate?.order_count) || 0,
+                  totalSpent: Number(aggregate?.total_spent) || 0,
+                  lastOrderAt: aggregate?.last_order_at ?? null
+                }
+              }
+            }),
+            nextCursor: customersPage.nextCursor,
+            hasMore: customersPage.hasMore,
             limit
           }),
           { 
@@ -93,7 +138,7 @@ serve(async (req) => {
         )
 
       case 'get_customer_details':
-        const { customerId } = await req.json()
+        const { customerId, ordersCursor } = body
         
         const { data: customerDetails, error: detailsError } = await supabaseClient
           .from('customer_profiles')
@@ -103,19 +148,31 @@ serve(async (req) => {
 
         if (detailsError) throw detailsError
 
-        // Get customer's order history
-        const { data: customerOrders, error: ordersError } = await supabaseClient
-          .from('orders')
-          .select('*')
-          .eq('customer_email', customerDetails.email)
-          .order('created_at', { ascending: false })
+        const { data: detailAggregates, error: detailAggregatesError } = await supabaseClient
+          .rpc('get_customer_order_aggregates', { p_user_ids: [customerDetails.user_id] })
+
+        if (detailAggregatesError) throw detailAggregatesError
+
+        // Get one page of the customer's order history
+        const ordersLimit = clampPageSize(body.ordersLimit)
+        const { data: customerOrders, error: ordersError } = await applyKeyset(
+          supabaseClient
+            .from('orders')
+            .select('*')
+            .eq('user_id', customerDetails.user_id),
+          decodeCursor(ordersCursor),
+          ordersLimit
+        )
 
         if (ordersError) throw ordersError
 
+        const customerOrdersPage = buildPage(customerOrders, ordersLimit)
+
         return new Response(
           JSON.stringify({ 
-            customer: customerDetails,
-            orders: customerOrders || []
+            customer: { ...customerDetails, email: detailAggregates?.[0]?.email ?? null },
+            orders: customerOrdersPage.items,
+            ordersNextCursor: customerOrdersPage.nextCursor
           }),
           { 
             status: 200, 
@@ -124,7 +181,7 @@ serve(async (req) => {
         )
 
       case 'update_customer':
-        const { customerId: updateCustomerId, updates } = await req.json()
+        const { customerId: updateCustomerId, updates } = body
         
         const { data: updatedCustomer, error: updateError } = await supabaseClient
           .from('customer_profiles')
@@ -150,9 +207,10 @@ serve(async (req) => {
         )
 
       case 'get_customer_stats':
-        const { data: totalCustomers, error: totalError } = await supabaseClient
+        // Counts only - no rows are transferred
+        const { count: totalCustomers, error: totalError } = await supabaseClient
           .from('customer_profiles')
-          .select('created_at', { count: 'exact' })
+          .select('id', { count: 'exact', head: true })
 
         if (totalError) throw totalError
 
@@ -160,17 +218,17 @@ serve(async (req) => {
         const thirtyDaysAgo = new Date()
         thirtyDaysAgo.setDate(thirtyDaysAgo.getDate() - 30)
 
-        const { data: recentCustomers, error: recentError } = await supabaseClient
+        const { count: recentCustomers, error: recentError } = await supabaseClient
           .from('customer_profiles')
-          .select('created_at', { count: 'exact' })
+          .select('id', { count: 'exact', head: true })
           .gte('created_at', thirtyDaysAgo.toISOString())
 
         if (recentError) throw recentError
 
         return new Response(
           JSON.stringify({ 
-            totalCustomers: totalCustomers?.length || 0,
-            recentCustomers: recentCustomers?.length || 0
+            totalCustomers: totalCustomers || 0,
+            recentCustomers: recentCustomers || 0
           }),
           { 
             status: 200, 
@@ -198,3 +256,13 @@ serve(async (req) => {
     )
   }
 })
+
+// User ids whose auth email matches an ILIKE pattern; customer_profiles doesn't store emails
+async function findUserIdsByEmail(supabaseClient: any, pattern: string): Promise<string[]> {
+  const { data, error } = await supabaseClient
+    .rpc('find_user_ids_by_email', { p_pattern: pattern })
+
+  if (error) throw error
+
+  return (data || []).map((row: any) => row.user_id)
+}
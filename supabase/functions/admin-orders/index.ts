@@ -1,5 +1,6 @@
 import { serve } from "https://deno.land/std@0.168.0/http/server.ts"
 import { createClient } from 'https://esm.sh/@supabase/supabase-js@2'
+import { applyKeyset, buildPage, clampPageSize, decodeCursor, sanitizeSearchTerm, UUID_PATTERN } from '../_shared/keyset.ts'
 
 const corsHeaders = {
   'Access-Control-Allow-Origin': '*',
@@ -55,39 +56,58 @@ serve(async (req) => {
       )
     }
 
-    const { action } = await req.json()
+    const body = await req.json()
+    const { action } = body
 
     switch (action) {
       case 'get_orders':
-        const { page = 1, limit = 50, status, search } = await req.json()
+        const { cursor, status, email, search, dateFrom, dateTo } = body
+        const limit = clampPageSize(body.limit)
         
         let query = supabaseClient
           .from('orders')
           .select('*')
-          .order('created_at', { ascending: false })
 
-        // Apply filters
-        if (status && status !== 'all') {
-          query = query.eq('status', status)
+        // Apply filters server-side so only the requested page leaves the database
+        // ilike without wildcards: an exact match that ignores case, as the old client-side filter did
+        const statusFilter = sanitizeSearchTerm(status)
+        if (statusFilter && statusFilter.toLowerCase() !== 'all') {
+          query = query.ilike('status', statusFilter)
         }
 
-        if (search) {
-          query = query.or(`customer_email.ilike.%${search}%,readable_order_id.ilike.%${search}%`)
+        if (email) {
+          query = query.eq('customer_email', String(email).trim())
         }
 
-        // Apply pagination
-        const offset = (page - 1) * limit
-        query = query.range(offset, offset + limit - 1)
+        if (dateFrom) {
+          query = query.gte('created_at', dateFrom)
+        }
+
+        if (dateTo) {
+          query = query.lte('created_at', dateTo)
+        }
 
-        const { data: orders, error: ordersError, count } = await query
+        const searchTerm = sanitizeSearchTerm(search)
+        if (searchTerm) {
+          // A pasted order id matches the order itself
+          const idMatch = UUID_PATTERN.test(searchTerm) ? `,id.eq.${searchTerm}` : ''
+          query = query.or(`customer_email.ilike.%${searchTerm}%,readable_order_id.ilike.%${searchTerm}%${idMatch}`)
+        }
+
+        // Keyset pagination on (created_at, id)
+        query = applyKeyset(query, decodeCursor(cursor), limit)
+
+        const { data: orders, error: ordersError } = await query
 
         if (ordersError) throw ordersError
 
+        const ordersPage = buildPage(orders, limit)
+
         return new Response(
           JSON.stringify({ 
-            orders: orders || [],
-            total: count || 0,
-            page,
+            orders: ordersPage.items,
+            nextCursor: ordersPage.nextCursor,
+            hasMore: ordersPage.hasMore,
             limit
           }),
           { 
@@ -97,7 +117,7 @@ serve(async (req) => {
         )
 
       case 'update_order_status':
-        const { orderId, newStatus } = await req.json()
+        const { orderId, newStatus } = body
         
         const { data: updatedOrder, error: updateError } = await supabaseClient
           .from('orders')
@@ -123,7 +143,7 @@ serve(async (req) => {
         )
 
       case 'get_order_details':
-        const { orderId: orderIdForDetails } = await req.json()
+        const { orderId: orderIdForDetails } = body
         
         const { data: orderDetails, error: detailsError } = await supabaseClient
           .from('orders')
@@ -0,0 +1,86 @@
+import { serve } from "https://deno.land/std@0.168.0/http/server.ts"
+import { createClient } from 'https://esm.sh/@supabase/supabase-js@2'
+import { publishCatalogSnapshot } from '../_shared/catalog-snapshot.ts'
+
+// Catalog build stage: regenerates the static storefront catalog snapshot in Storage.
+// Called by the admin panel after product/image saves; printful-sync publishes directly.
+
+const corsHeaders = {
+  'Access-Control-Allow-Origin': '*',
+  'Access-Control-Allow-Headers': 'authorization, x-client-info, apikey, content-type',
+}
+
+serve(async (req) => {
+  // Handle CORS preflight requests
+  if (req.method === 'OPTIONS') {
+    return new Response('ok', { headers: corsHeaders })
+  }
+
+  try {
+    const supabaseUrl = Deno.env.get('SUPABASE_URL') ?? ''
+    const serviceRoleKey = Deno.env.get('SUPABASE_SERVICE_ROLE_KEY') ?? ''
+    const authHeader = req.headers.get('Authorization') ?? ''
+
+    // Service role callers (scheduled jobs, other functions) skip the admin check
+    if (authHeader.replace('Bearer ', '').trim() !== serviceRoleKey) {
+      const userClient = createClient(
+        supabaseUrl,
+        Deno.env.get('SUPABASE_ANON_KEY') ?? '',
+        {
+          global: {
+            headers: { Authorization: authHeader },
+          },
+        }
+      )
+
+      const { data: { user }, error: authError } = await userClient.auth.getUser()
+
+      if (authError || !user) {
+        return new Response(
+          JSON.stringify({ error: 'Unauthorized' }),
+          {
+            status: 401,
+            headers: { ...corsHeaders, 'Content-Type': 'application/json' }
+          }
+        )
+      }
+
+      const { data: adminRole, error: roleError } = await userClient
+        .from('admin_roles')
+        .select('id')
+        .eq('user_id', user.id)
+        .eq('is_active', true)
+        .single()
+
+      if (roleError || !adminRole) {
+        return new Response(
+          JSON.stringify({ error: 'Admin access required' }),
+          {
+            status: 403,
+            headers: { ...corsHeaders, 'Content-Type': 'application/json' }
+          }
+        )
+      }
+    }
+
+    const serviceClient = createClient(supabaseUrl, serviceRoleKey)
+    const result = await publishCatalogSnapshot(serviceClient)
+
+    return new Response(
+      JSON.stringify({ success: true, ...result }),
+      {
+        status: 200,
+        headers: { ...corsHeaders, 'Content-Type': 'application/json' }
+      }
+    )
+  } catch (error) {
+    console.error('❌ Catalog snapshot error:', error)
+    return new Response(
+      JSON.stringify({ success: false, error: error.message }),
+      {
+        status: 500,
+        headers: { ...corsHeaders, 'Content-Type': 'application/json' }
+      }
+    )
+  }
+})
@@ -3,8 +3,17 @@ import Stripe from 'npm:stripe@17.7.0';
 import { createClient } from 'npm:@supabase/supabase-js@2.49.1';
 // Temporarily removed performance monitoring to debug 500 error
 // import { createPerformanceMonitor, measureAsyncOperation } from '../_shared/performance.ts';
-import { generateCartIdempotencyKey } from '../_shared/idempotency.ts';
-import { getFallbackPrice, isVariantSupported } from '../_shared/variant-fallback.ts';
+import {
+  claimIdempotencyKey,
+  generateCartIdempotencyKey,
+  generateIdempotencyKey,
+  recordIdempotency,
+  releaseIdempotencyKey
+} from '../_shared/idempotency.ts';
+import { hashContent } from '../_shared/sync-hash.ts';
+import { isVariantSupported } from '../_shared/variant-fallback.ts';
+import { resolveVariantPrices } from '../_shared/price-index.ts';
+import { getBundleDiscountAmount } from '../_shared/bundle-pricing.ts';
 
 // Get environment variables
 const supabaseUrl = Deno.env.get('SUPABASE_URL') ?? 'http://127.0.0.1:54321';
@@ -95,63 +104,9 @@ interface PaymentIntentResponse {
   payment_intent_id: string;
 }
 
-// Function to get product prices from our database/variant system
-async function getProductPrice(printfulVariantId: string | number): Promise<number> {
-  try {
-    // Convert to string for database lookup (database stores as string)
-    const variantIdStr = String(printfulVariantId);
-    
-    // First try to get price from product_variants table
-    const { data: variant, error } = await supabase
-      .from('product_variants')
-      .select('price')
-      .eq('printful_variant_id', variantIdStr)
-      .single();
-    
-    if (!error && variant?.price) {
-      console.log(`✅ Found price in database: ${variantIdStr} = £${variant.price}`);
-      return parseFloat(variant.price);
-    }
-    
-    console.log(`⚠️ Database lookup failed for variant ${variantIdStr}, trying fallback...`);
-    
-    // Try fallback pricing system
-    const fallbackPrice = getFallbackPrice(variantIdStr);
-    if (fallbackPrice) {
-      console.log(`✅ Found fallback price: ${variantIdStr} = £${fallbackPrice}`);
-      return fallbackPrice;
-    }
-    
-    console.log(`❌ No fallback price found for variant ${variantIdStr}`);
-    
-    // Last resort: Return default prices based on product type
-    // This is a temporary fallback - in production you should have all prices in DB
-    const defaultPrices: { [key: string]: number } = {
-      // T-shirts
-      'tshirt': 24.99,
-      // Hoodies  
-      'hoodie': 39.99,
-      // Caps
-      'cap': 19.99,
-      // Mugs
-      'mug': 19.99,
-      // Tote bags
-      'tote': 24.99,
-      // Water bottles
-      'water': 24.99,
-      // Mouse pads
-      'mousepad': 14.99
-    };
-    
-    // Try to infer product type from variant ID or return default
-    console.warn(`Price not found for variant ${printfulVariantId}, using fallback`);
-    return defaultPrices['tshirt']; // Default fallback
-    
-  } catch (error) {
-    console.error('Error getting product price:', error);
-    return 24.99; // Safe fallback
-  }
-}
+// A repeated checkout submit for the same cart inside this window gets the payment intent
+// already created for it instead of a second one
+const DUPLICATE_CHECKOUT_WINDOW_SECONDS = 30;
 
 // Function to get shipping cost from Printful
 async function getShippingCost(items: CartItem[], shippingAddress: ShippingAddress): Promise<number> {
@@ -216,6 +171,8 @@ Deno.serve(async (req: Request) => {
     return new Response("ok", { headers });
   }
 
+  let claimedCheckoutKey: string | null = null;
+
   try {
     if (req.method !== 'POST') {
       return new Response(JSON.stringify({ error: 'Method not allowed' }), {
@@ -263,6 +220,33 @@ Deno.serve(async (req: Request) => {
       });
     }
 
+    // Claim the cart in one round trip, so a double submit doesn't create two payment intents
+    const checkoutKey = generateIdempotencyKey('pi', await hashContent({
+      customer_email,
+      currency,
+      shipping_address,
+      items: items.map(item => [item.id, item.printful_variant_id, item.quantity, item.price, !!item.isDiscount])
+    }));
+    const claim = await claimIdempotencyKey(supabase, checkoutKey, DUPLICATE_CHECKOUT_WINDOW_SECONDS);
+
+    if (!claim.claimed && claim.result) {
+      console.log(`Duplicate checkout submit, returning payment intent ${claim.result.payment_intent_id}`);
+      return new Response(JSON.stringify(claim.result), {
+        headers: { ...headers, "Content-Type": "application/json" },
+      });
+    }
+
+    if (!claim.claimed && !claim.error) {
+      return new Response(JSON.stringify({ error: 'A payment for this cart is already being created' }), {
+        status: 409,
+        headers: { ...headers, "Content-Type": "application/json" },
+      });
+    }
+
+    if (claim.claimed) {
+      claimedCheckoutKey = checkoutKey;
+    }
+
     // Get current user if authenticated
     let userId: string | null = null;
     const authHeader = req.headers.get('Authorization');
@@ -282,14 +266,53 @@ Deno.serve(async (req: Request) => {
     const regularItems = items.filter(item => !item.isDiscount);
     const discountItems = items.filter(item => item.isDiscount);
     
-    // Calculate subtotal with real-time pricing (regular items only)
+    // Resolve catalog prices for the whole cart in one batch, and quote shipping concurrently
+    // (regular items only, not discounts)
+    console.log('Getting shipping cost for items:', regularItems.length, 'regular items');
+    const [catalogPrices, shippingCost] = await Promise.all([
+      resolveVariantPrices(supabase, regularItems.map(item => item.printful_variant_id)),
+      getShippingCost(regularItems, shipping_address).catch((shippingError) => {
+        console.error('Error calculating shipping cost:', shippingError);
+        // Use default shipping cost if calculation fails
+        return 4.99;
+      })
+    ]);
+
+    // A 'default' price means neither the database nor the fallback table knows the variant.
+    // Charging the placeholder price (or trusting the client's) would be a guess, so the
+    // checkout is refused and the shopper is asked to refresh their cart
+    const unpricedVariants = regularItems
+      .map(item => String(item.printful_variant_id))
+      .filter(id => catalogPrices.get(id)?.source === 'default');
+
+    if (unpricedVariants.length > 0) {
+      console.warn('⚠️ Refusing checkout with unpriced variants:', unpricedVariants);
+      if (claimedCheckoutKey) {
+        await releaseIdempotencyKey(supabase, claimedCheckoutKey);
+      }
+      return new Response(JSON.stringify({
+        error: 'Some items in your cart are no longer available. Please refresh your cart and try again.',
+        unpriced_variants: unpricedVariants
+      }), {
+        status: 400,
+        headers: { ...headers, "Content-Type": "application/json" },
+      });
+    }
+
+    // Calculate subtotal (regular items only)
     let subtotal = 0;
     const enrichedItems = [];
     
     for (const item of regularItems) {
-      // Always trust the price from frontend since it includes any promotions/discounts
-      // The frontend has already validated prices through the product hooks
-      const realPrice = item.price;
+      const catalogPrice = catalogPrices.get(String(item.printful_variant_id))!;
+
+      // The catalog price is authoritative - promotions arrive as separate discount lines,
+      // so a different client price is a stale or tampered cart
+      const clientPrice = Number(item.price);
+      if (Math.abs(catalogPrice.price - clientPrice) >= 0.005) {
+        console.warn(`⚠️ Variant ${item.printful_variant_id} sent as ${item.price}, using catalog price ${catalogPrice.price}`);
+      }
+      const realPrice = catalogPrice.price;
         
       const itemTotal = realPrice * item.quantity;
       subtotal += itemTotal;
@@ -297,34 +320,31 @@ Deno.serve(async (req: Request) => {
       enrichedItems.push({
         ...item,
         real_price: realPrice,
+        catalog_price: catalogPrice.price,
         item_total: itemTotal
       });
     }
     
-    // Add discount items to enriched items (they already have their prices)
+    // Add discount items to enriched items. Bundle discounts are re-priced from the shared
+    // bundle table so the charge matches what the shop displayed; other discounts keep their price
     for (const discountItem of discountItems) {
-      const itemTotal = discountItem.price * discountItem.quantity;
+      const bundleDiscount = getBundleDiscountAmount(discountItem.printful_variant_id);
+      if (bundleDiscount !== null && Math.abs(bundleDiscount - Number(discountItem.price)) >= 0.005) {
+        console.warn(`⚠️ Bundle discount ${discountItem.printful_variant_id} sent as ${discountItem.price}, using ${bundleDiscount}`);
+      }
+      const discountPrice = bundleDiscount ?? discountItem.price;
+      const itemTotal = discountPrice * discountItem.quantity;
       subtotal += itemTotal; // This will reduce the subtotal since price is negative
       
       enrichedItems.push({
         ...discountItem,
-        real_price: discountItem.price,
+        price: discountPrice,
+        real_price: discountPrice,
         item_total: itemTotal,
         is_discount: true
       });
     }
 
-    // Get shipping cost from Printful (regular items only, not discounts)
-    console.log('Getting shipping cost for items:', regularItems.length, 'regular items');
-    let shippingCost = 4.99; // Default fallback
-    try {
-      shippingCost = await getShippingCost(regularItems, shipping_address);
-    } catch (shippingError) {
-      console.error('Error calculating shipping cost:', shippingError);
-      // Use default shipping cost if calculation fails
-      shippingCost = 4.99;
-    }
-
     // Calculate total
     const total = subtotal + shippingCost;
     const totalPence = Math.round(total * 100); // Convert to smallest currency unit
@@ -446,6 +466,10 @@ Deno.serve(async (req: Request) => {
       payment_intent_id: paymentIntent.id
     };
 
+    if (claimedCheckoutKey) {
+      await recordIdempotency(supabase, claimedCheckoutKey, response, DUPLICATE_CHECKOUT_WINDOW_SECONDS);
+    }
+
     return new Response(JSON.stringify(response), {
       headers: { ...headers, "Content-Type": "application/json" },
     });
@@ -453,6 +477,11 @@ Deno.serve(async (req: Request) => {
   } catch (error) {
     console.error('Payment intent creation error:', error);
     console.error('Error stack:', error.stack);
+
+    // Let the shopper retry straight away rather than hit the duplicate-submit guard
+    if (claimedCheckoutKey) {
+      await releaseIdempotencyKey(supabase, claimedCheckoutKey);
+    }
     // performanceMonitor.incrementErrorCount();
     
     // Include more error details for debugging
@@ -0,0 +1,95 @@
+// Merged storefront catalog in one response
+// Products, images, variants and colour/size facets come from a single snapshot query; the merged
+// result is kept per isolate and revalidated against the 'catalog' version (bumped by any product,
+// image or variant write, including Printful sync). Clients revalidate with ETag / If-None-Match.
+
+import { createClient } from 'npm:@supabase/supabase-js@2.49.1';
+import { loadMergedCatalog } from '../_shared/catalog-snapshot.ts';
+
+const supabaseUrl = Deno.env.get('SUPABASE_URL')!;
+const supabaseServiceKey = Deno.env.get('SUPABASE_SERVICE_ROLE_KEY')!;
+
+const supabase = createClient(supabaseUrl, supabaseServiceKey);
+
+const corsHeaders = {
+  'Access-Control-Allow-Origin': '*',
+  'Access-Control-Allow-Headers': 'authorization, x-client-info, apikey, content-type, if-none-match',
+  'Access-Control-Allow-Methods': 'GET, OPTIONS',
+  'Access-Control-Expose-Headers': 'etag',
+};
+
+// Browsers and CDNs may reuse a response briefly, then must revalidate with the ETag
+const CACHE_CONTROL = 'public, max-age=60, stale-while-revalidate=300';
+
+// Serialized catalog for the last version built in this isolate
+let cached: { version: number; etag: string; body: string } | null = null;
+
+function etagFor(version: number): string {
+  return `"catalog-v${version}"`;
+}
+
+async function getCatalogVersion(): Promise<number> {
+  const { data, error } = await supabase
+    .from('catalog_versions')
+    .select('version')
+    .eq('scope', 'catalog')
+    .maybeSingle();
+
+  if (error) {
+    throw new Error(`Failed to read catalog version: ${error.message}`);
+  }
+
+  return Number(data?.version ?? 0);
+}
+
+async function buildCatalog(): Promise<{ version: number; etag: string; body: string }> {
+  const catalog = await loadMergedCatalog(supabase);
+  console.log(`✅ Built merged catalog v${catalog.version}: ${catalog.products.length} products`);
+
+  return { version: catalog.version, etag: etagFor(catalog.version), body: JSON.stringify(catalog) };
+}
+
+Deno.serve(async (req: Request) => {
+  if (req.method === 'OPTIONS') {
+    return new Response('ok', { headers: corsHeaders });
+  }
+
+  if (req.method !== 'GET') {
+    return new Response(JSON.stringify({ error: 'Method not allowed' }), {
+      status: 405,
+      headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+    });
+  }
+
+  try {
+    const version = await getCatalogVersion();
+    const etag = etagFor(version);
+
+    if (req.headers.get('If-None-Match') === etag) {
+      return new Response(null, {
+        status: 304,
+        headers: { ...corsHeaders, 'ETag': etag, 'Cache-Control': CACHE_CONTROL },
+      });
+    }
+
+    if (!cached || cached.version !== version) {
+      cached = await buildCatalog();
+    }
+
+    return new Response(cached.body, {
+      status: 200,
+      headers: {
+        ...corsHeaders,
+        'Content-Type': 'application/json',
+        'ETag': cached.etag,
+        'Cache-Control': CACHE_CONTROL,
+      },
+    });
+  } catch (error) {
+    console.error('❌ Merged catalog error:', error);
+    return new Response(JSON.stringify({ error: error instanceof Error ? error.message : 'Failed to load catalog' }), {
+      status: 500,
+      headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+    });
+  }
+});
@@ -0,0 +1,129 @@
+// Drains order_outbox: order confirmation emails and Printful fulfilment
+// Invoked by stripe-webhook2 after each order and on a schedule; service role only
+
+import 'jsr:@supabase/functions-js/edge-runtime.d.ts';
+import { createClient } from "npm:@supabase/supabase-js@2.49.1";
+import { createPrintfulFulfillment } from '../_shared/printful-fulfillment.ts';
+import { sendAdminOrderEmail, sendCustomerOrderEmail } from '../_shared/order-emails.ts';
+import {
+  claimOutboxJobs,
+  completeOutboxJob,
+  failOutboxJob,
+  type OutboxJob,
+  type OutboxJobKind,
+} from '../_shared/outbox.ts';
+
+const supabaseUrl = Deno.env.get('SUPABASE_URL')!;
+const supabaseServiceKey = Deno.env.get('SUPABASE_SERVICE_ROLE_KEY')!;
+
+const supabase = createClient(supabaseUrl, supabaseServiceKey);
+
+// Jobs claimed per batch, jobs run at once, and how long a claimed job stays locked
+const BATCH_SIZE = 20;
+const CONCURRENCY = 4;
+const LEASE_SECONDS = 120;
+// Stop claiming new batches before the function's wall-clock limit
+const MAX_RUN_MS = 50_000;
+
+const handlers: Record<OutboxJobKind, (payload: any) => Promise<void>> = {
+  customer_email: (payload) => sendCustomerOrderEmail(payload),
+  admin_email: (payload) => sendAdminOrderEmail(payload),
+  printful_fulfillment: async (payload) => {
+    const result = await createPrintfulFulfillment(payload);
+    if (!result.success) {
+      throw new Error(result.error || 'Printful fulfillment failed');
+    }
+    console.log(`Printful fulfillment created successfully: ${result.printful_order_id}`);
+  },
+};
+
+async function runJob(job: OutboxJob): Promise<boolean> {
+  try {
+    const handler = handlers[job.kind];
+    if (!handler) {
+      throw new Error(`Unknown outbox job kind: ${job.kind}`);
+    }
+
+    await handler(job.payload);
+    await completeOutboxJob(supabase, job);
+    console.log(`✅ Outbox job ${job.kind} done for order ${job.order_id}`);
+    return true;
+  } catch (error) {
+    const message = error instanceof Error ? error.message : String(error);
+    console.error(`❌ Outbox job ${job.kind} failed for order ${job.order_id} (attempt ${job.attempts}/${job.max_attempts}):`, message);
+    await failOutboxJob(supabase, job, message);
+    return false;
+  }
+}
+
+// Run jobs with at most CONCURRENCY in flight
+async function runBatch(jobs: OutboxJob[]): Promise<{ succeeded: number; failed: number }> {
+  let next = 0;
+  let succeeded = 0;
+  let failed = 0;
+
+  const worker = async () => {
+    while (next < jobs.length) {
+      const job = jobs[next++];
+      if (await runJob(job)) {
+        succeeded++;
+      } else {
+        failed++;
+      }
+    }
+  };
+
+  await Promise.all(Array.from({ length: Math.min(CONCURRENCY, jobs.length) }, worker));
+  return { succeeded, failed };
+}
+
+Deno.serve(async (req: Request) => {
+  if (req.method !== 'POST') {
+    return new Response('Method not allowed', { status: 405 });
+  }
+
+  const token = (req.headers.get('Authorization') || '').replace('Bearer ', '').trim();
+  if (token !== supabaseServiceKey) {
+    return new Response(JSON.stringify({ error: 'Unauthorized' }), {
+      status: 401,
+      headers: { 'Content-Type': 'application/json' },
+    });
+  }
+
+  const startedAt = Date.now();
+  let claimed = 0;
+  let succeeded = 0;
+  let failed = 0;
+
+  try {
+    while (Date.now() - startedAt < MAX_RUN_MS) {
+      const jobs = await claimOutboxJobs(supabase, BATCH_SIZE, LEASE_SECONDS);
+      if (jobs.length === 0) {
+        break;
+      }
+
+      claimed += jobs.length;
+      const result = await runBatch(jobs);
+      succeeded += result.succeeded;
+      failed += result.failed;
+    }
+
+    console.log(`Outbox drained: ${claimed} claimed, ${succeeded} succeeded, ${failed} failed in ${Date.now() - startedAt}ms`);
+
+    return new Response(JSON.stringify({ claimed, succeeded, failed }), {
+      status: 200,
+      headers: { 'Content-Type': 'application/json' },
+    });
+  } catch (error) {
+    console.error('Outbox worker error:', error);
+    return new Response(JSON.stringify({
+      error: error instanceof Error ? error.message : String(error),
+      claimed,
+      succeeded,
+      failed,
+    }), {
+      status: 500,
+      headers: { 'Content-Type': 'application/json' },
+    });
+  }
+});
@@ -1,6 +1,7 @@
 // Printful Import All Function - Import all products from Printful and replace existing data
 import "jsr:@supabase/functions-js/edge-runtime.d.ts"
 import { createClient } from 'https://esm.sh/@supabase/supabase-js@2'
+import { hashProductDetail, createChangeReport, recordSyncRun } from '../_shared/sync-hash.ts'
 
 console.log("Printful Import All Function Started")
 
@@ -30,6 +31,7 @@ interface ImportResult {
   productsImported?: number;
   productsUpdated?: number;
   productsSkipped?: number;
+  productsUnchanged?: number;
   error?: string;
 }
 
@@ -208,8 +210,10 @@ Deno.serve(async (req) => {
       })
     }
 
+    const startedAt = performance.now()
+
     // Transform valid Printful products to match your database schema
-    const transformedProducts = validProducts.map((product: PrintfulProduct) => {
+    const transformedProducts = await Promise.all(validProducts.map(async (product: PrintfulProduct) => {
       const retailPrice = parseFloat(product.sync_product.retail_price)
       const name = product.sync_product.name
       
@@ -229,10 +233,12 @@ Deno.serve(async (req) => {
         rating: 0,
         price: retailPrice, // Use retail price as base price
         printful_cost: retailPrice * 0.7, // Estimate cost
+        printful_sync_hash: await hashProductDetail(product),
+        printful_synced_at: new Date().toISOString(),
         created_at: new Date().toISOString(),
         updated_at: new Date().toISOString()
       }
-    })
+    }))
 
     console.log(`Transformed ${transformedProducts.length} products`)
 
@@ -240,7 +246,7 @@ Deno.serve(async (req) => {
     console.log('Checking existing products...')
     const { data: existingProducts, error: fetchError } = await supabase
       .from('products')
-      .select('id, printful_product_id, name')
+      .select('id, printful_product_id, name, printful_sync_hash')
 
     if (fetchError) {
       console.error('Error fetching existing products:', fetchError)
@@ -249,15 +255,23 @@ Deno.serve(async (req) => {
 
     console.log(`Found ${existingProducts?.length || 0} existing products`)
 
-    // Separate new products from existing ones
+    const existingByPrintfulId = new Map(
+      (existingProducts || []).map(p => [String(p.printful_product_id), p])
+    )
+
+    // Separate new products from existing ones; existing products whose content hash
+    // matches the last import are left untouched
     const newProducts = []
     const productsToUpdate = []
     let skippedCount = 0
+    let unchangedCount = 0
 
     for (const printfulProduct of transformedProducts) {
-      const existingProduct = existingProducts?.find(p => p.printful_product_id === printfulProduct.printful_product_id)
+      const existingProduct = existingByPrintfulId.get(printfulProduct.printful_product_id)
       
-      if (existingProduct) {
+      if (existingProduct && existingProduct.printful_sync_hash === printfulProduct.printful_sync_hash) {
+        unchangedCount++
+      } else if (existingProduct) {
         // Product exists, add to update list
         productsToUpdate.push({
           id: existingProduct.id,
@@ -272,6 +286,7 @@ Deno.serve(async (req) => {
 
     console.log(`New products to insert: ${newProducts.length}`)
     console.log(`Existing products to update: ${productsToUpdate.length}`)
+    console.log(`Unchanged products skipped: ${unchangedCount}`)
 
     let insertResult = null
     let updateResult = null
@@ -313,6 +328,8 @@ Deno.serve(async (req) => {
             slug: product.slug,
             price: product.price,
             printful_cost: product.printful_cost,
+            printful_sync_hash: product.printful_sync_hash,
+            printful_synced_at: product.printful_synced_at,
             updated_at: product.updated_at
           })
           .eq('id', product.id)
@@ -326,12 +343,20 @@ Deno.serve(async (req) => {
       console.log(`Successfully updated ${productsToUpdate.length - skippedCount} products`)
     }
 
+    const report = createChangeReport('incremental')
+    report.products.created = (insertResult || []).map(p => p.name)
+    report.products.updated = productsToUpdate.map(p => p.name)
+    report.products.unchanged = unchangedCount
+    report.durationMs = performance.now() - startedAt
+    await recordSyncRun(supabase, 'printful-import-all', report)
+
     return new Response(JSON.stringify({
       success: true,
       message: `Successfully processed ${products.length} products from Printful`,
       productsImported: insertResult?.length || 0,
       productsUpdated: productsToUpdate.length - skippedCount,
-      productsSkipped: skippedCount
+      productsSkipped: skippedCount,
+      productsUnchanged: unchangedCount
     }), {
       status: 200,
       headers: { 
@@ -4,6 +4,14 @@ import { createClient } from "https://esm.sh/@supabase/supabase-js@2"
 // Import real Printful API client and image storage
 import { PrintfulAPIClient } from '../_shared/printful-api-client.ts'
 import { ImageStorageManager } from '../_shared/image-storage.ts'
+import {
+  hashProductDetail,
+  hashSyncVariant,
+  createChangeReport,
+  recordSyncRun,
+  SyncChangeReport,
+} from '../_shared/sync-hash.ts'
+import { publishCatalogSnapshot } from '../_shared/catalog-snapshot.ts'
 
 const corsHeaders = {
   'Access-Control-Allow-Origin': '*',
@@ -21,7 +29,12 @@ serve(async (req) => {
       Deno.env.get('SUPABASE_SERVICE_ROLE_KEY') ?? '',
     )
 
-    console.log('🚀 Starting REAL Printful API sync...')
+    // Incremental mode (default) compares each product's detail hash and writes only the diff.
+    // Pass ?mode=full or {"mode":"full"} to wipe and re-import.
+    const mode = await resolveSyncMode(req)
+    const startedAt = performance.now()
+
+    console.log(`🚀 Starting REAL Printful API sync (${mode})...`)
     
     // Initialize Printful API client
     const printfulClient = new PrintfulAPIClient()
@@ -32,6 +45,35 @@ serve(async (req) => {
       Deno.env.get('SUPABASE_SERVICE_ROLE_KEY') ?? ''
     )
 
+    const report = createChangeReport(mode)
+
+    if (mode === 'incremental') {
+      console.log('🪣 Setting up image storage...')
+      await imageManager.ensureBucketExists()
+
+      console.log('📡 Fetching Printful product list for incremental sync...')
+      await processIncrementalSync(supabaseClient, printfulClient, imageManager, report)
+
+      report.durationMs = performance.now() - startedAt
+      const failed = report.variants.failed > 0
+      await recordSyncRun(supabaseClient, 'printful-sync', report, failed ? 'failed' : 'success')
+      await publishSnapshotAfterSync(supabaseClient)
+
+      return new Response(
+        JSON.stringify({
+          success: !failed,
+          message: failed
+            ? `Printful incremental sync failed to write ${report.variants.failed} variant(s)`
+            : 'Printful incremental sync completed successfully',
+          report
+        }),
+        {
+          headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+          status: failed ? 500 : 200,
+        },
+      )
+    }
+
     // Step 1: Clean existing data
     console.log('🧹 Cleaning existing data...')
     await cleanExistingData(supabaseClient)
@@ -56,6 +98,14 @@ serve(async (req) => {
     console.log('✅ Verifying final state...')
     const verification = await verifySync(supabaseClient)
 
+    report.products.created = printfulProducts.map(p => p.sync_product.name)
+    report.variants.created = processedResults.totalVariants
+    report.images.stored = processedResults.totalImages
+    report.detailRequests = printfulProducts.length
+    report.durationMs = performance.now() - startedAt
+    await recordSyncRun(supabaseClient, 'printful-sync', report)
+    await publishSnapshotAfterSync(supabaseClient)
+
     return new Response(
       JSON.stringify({
         success: true,
@@ -87,6 +137,16 @@ serve(async (req) => {
   }
 })
 
+// A failed snapshot publish must not fail the sync: the storefront falls back to the live endpoint
+async function publishSnapshotAfterSync(supabase: any) {
+  try {
+    console.log('🗂️ Publishing catalog snapshot...')
+    await publishCatalogSnapshot(supabase)
+  } catch (error) {
+    console.warn('⚠️ Catalog snapshot publish failed:', error.message)
+  }
+}
+
 async function cleanExistingData(supabase: any) {
   // Clean existing Printful data only - PRESERVE CUSTOM DATA
   console.log('🧹 Cleaning existing Printful data (preserving custom images)...')
@@ -159,6 +219,8 @@ async function processRealProducts(
         category: category,
         price: basePrice,
         printful_product_id: syncProduct.id,
+        printful_sync_hash: await hashProductDetail(printfulProduct),
+        printful_synced_at: new Date().toISOString(),
         is_active: true
       })
       .select()
@@ -172,52 +234,56 @@ async function processRealProducts(
     totalProducts++
     console.log(`✅ Inserted product: ${syncProduct.name} (ID: ${insertedProduct.id})`)
 
-    // Process main product image - RESPECT EXISTING CUSTOM IMAGES
-    if (syncProduct.thumbnail_url) {
-      try {
-        // Check for existing custom images before inserting Printful images
-        const { data: existingCustomImages } = await supabase
+    // Check for existing custom images once per product - RESPECT EXISTING CUSTOM IMAGES
+    const { data: existingCustomImages } = await supabase
+      .from('product_images')
+      .select('id, is_thumbnail, is_primary, color, variant_type')
+      .eq('product_id', insertedProduct.id)
+      .eq('source', 'custom');
+
+    const hasCustomThumbnail = !!existingCustomImages?.some(img => img.is_thumbnail)
+    const hasCustomPrimary = !!existingCustomImages?.some(img => img.is_primary)
+    const hasCustomColorImages = !!existingCustomImages?.some(img => img.variant_type === 'color')
+    const customColors = new Set((existingCustomImages || []).map(img => img.color).filter(Boolean))
+
+    // Download and store every mockup this product needs up front, concurrently.
+    // Sizes of the same colour share one mockup, which is fetched and stored once.
+    const wantsMainImage = !!syncProduct.thumbnail_url && !hasCustomThumbnail && !hasCustomPrimary
+    const imageRequests = syncVariants
+      .filter(v => !v.is_ignored && v.product?.image && !hasCustomColorImages)
+      .map(v => ({ imageUrl: v.product.image, category }))
+    if (wantsMainImage) {
+      imageRequests.unshift({ imageUrl: syncProduct.thumbnail_url, category })
+    }
+    const storedImages = await imageManager.storeImages(imageRequests)
+    const renditions = await imageManager.createRenditionsFor(Array.from(storedImages.values()))
+
+    // Process main product image
+    if (wantsMainImage) {
+      const publicUrl = storedImages.get(syncProduct.thumbnail_url)
+      if (publicUrl) {
+        await supabase
           .from('product_images')
-          .select('id, is_thumbnail, is_primary')
-          .eq('product_id', insertedProduct.id)
-          .eq('source', 'custom');
-
-        // Check if custom thumbnail already exists
-        const hasCustomThumbnail = existingCustomImages && existingCustomImages.some(img => img.is_thumbnail);
-        
-        // Check if custom primary already exists
-        const hasCustomPrimary = existingCustomImages && existingCustomImages.some(img => img.is_primary);
-
-        // Only insert Printful image if no conflicting custom images exist
-        if (!hasCustomThumbnail && !hasCustomPrimary) {
-          const fileName = imageManager.generateFileName(syncProduct.name, 'main', 0)
-          const publicUrl = await imageManager.downloadAndStoreImage(
-            syncProduct.thumbnail_url,
-            fileName,
-            category
-          )
-
-          await supabase
-            .from('product_images')
-            .insert({
-              product_id: insertedProduct.id,
-              image_url: publicUrl,
-              alt_text: `${syncProduct.name} Printful image`,
-              is_primary: false, // Never set as primary to avoid overriding custom
-              is_thumbnail: false, // Never set as thumbnail to avoid overriding custom
-              source: 'printful' // Track source for future reference
-            })
-
-          totalImages++
-          console.log(`✅ Added Printful image for ${syncProduct.name} (no custom images exist)`)
-        } else {
-          console.log(`⚠️ Skipping Printful image for ${syncProduct.name} - custom images exist (thumbnail: ${hasCustomThumbnail}, primary: ${hasCustomPrimary})`)
-        }
-      } catch (error) {
-        console.error(`❌ Error processing main image for ${syncProduct.name}:`, error)
+          .insert({
+            product_id: insertedProduct.id,
+            image_url: publicUrl,
+            renditions: renditions.get(publicUrl) || [],
+            alt_text: `${syncProduct.name} Printful image`,
+            is_primary: false, // Never set as primary to avoid overriding custom
+            is_thumbnail: false, // Never set as thumbnail to avoid overriding custom
+            source: 'printful' // Track source for future reference
+          })
+
+        totalImages++
+        console.log(`✅ Added Printful image for ${syncProduct.name} (no custom images exist)`)
       }
+    } else if (syncProduct.thumbnail_url) {
+      console.log(`⚠️ Skipping Printful image for ${syncProduct.name} - custom images exist (thumbnail: ${hasCustomThumbnail}, primary: ${hasCustomPrimary})`)
     }
 
+    const variantImageRows: any[] = []
+    const colorsWithImage = new Set<string>()
+
     // Process variants
     for (const variant of syncVariants) {
       if (variant.is_ignored) {
@@ -260,7 +326,8 @@ async function processRealProducts(
           color: color || 'Default',
           size: size || 'One Size',
           in_stock: true,
-          is_available: true
+          is_available: true,
+          printful_sync_hash: await hashSyncVariant(variant)
         })
         .select()
         .single()
@@ -272,50 +339,43 @@ async function processRealProducts(
 
       totalVariants++
 
-      // Process variant image - RESPECT EXISTING CUSTOM IMAGES
-      if (variant.product?.image) {
-        try {
-          // Check for existing custom variant images for this specific variant
-          const { data: existingVariantImages } = await supabase
-            .from('product_images')
-            .select('id')
-            .eq('product_id', insertedProduct.id)
-            .eq('source', 'custom')
-            .or(`color.eq.${color},variant_type.eq.color`);
-
-          // Only add Printful variant image if no custom variant images exist for this color
-          if (!existingVariantImages || existingVariantImages.length === 0) {
-            const fileName = imageManager.generateFileName(syncProduct.name, variantName, totalImages)
-            const publicUrl = await imageManager.downloadAndStoreImage(
-              variant.product.image,
-              fileName,
-              category
-            )
-
-            await supabase
-              .from('product_images')
-              .insert({
-                product_id: insertedProduct.id,
-                image_url: publicUrl,
-                alt_text: `${variantName} Printful image`,
-                is_primary: false, // Never set as primary
-                is_thumbnail: false, // Never set as thumbnail
-                source: 'printful', // Track source
-                color: color, // Track variant color
-                variant_type: 'color' // Track variant type
-              })
-
-            totalImages++
-            console.log(`✅ Added Printful variant image for ${variantName}`)
-          } else {
-            console.log(`⚠️ Skipping Printful variant image for ${variantName} - custom variant images exist`)
-          }
-        } catch (error) {
-          console.error(`❌ Error processing variant image for ${variantName}:`, error)
+      // Process variant image - one row per colour, never over custom variant images
+      const imageKey = color || variant.product?.image
+      if (variant.product?.image && !colorsWithImage.has(imageKey)) {
+        const publicUrl = storedImages.get(variant.product.image)
+
+        if (hasCustomColorImages || (color && customColors.has(color))) {
+          console.log(`⚠️ Skipping Printful variant image for ${variantName} - custom variant images exist`)
+        } else if (publicUrl) {
+          colorsWithImage.add(imageKey)
+          variantImageRows.push({
+            product_id: insertedProduct.id,
+            image_url: publicUrl,
+            renditions: renditions.get(publicUrl) || [],
+            alt_text: `${variantName} Printful image`,
+            is_primary: false, // Never set as primary
+            is_thumbnail: false, // Never set as thumbnail
+            source: 'printful', // Track source
+            color: color, // Track variant color
+            variant_type: 'color' // Track variant type
+          })
         }
       }
     }
 
+    if (variantImageRows.length > 0) {
+      const { error: imagesError } = await supabase
+        .from('product_images')
+        .insert(variantImageRows)
+
+      if (imagesError) {
+        console.error(`❌ Error inserting variant images for ${syncProduct.name}:`, imagesError)
+      } else {
+        totalImages += variantImageRows.length
+        console.log(`✅ Added ${variantImageRows.length} Printful variant images for ${syncProduct.name}`)
+      }
+    }
+
     console.log(`✅ Processed ${syncProduct.name}: ${syncVariants.length} variants`)
   }
 
@@ -335,6 +395,363 @@ function generateSlug(name: string): string {
     .trim() || 'product' // Fallback if empty
 }
 
+async function resolveSyncMode(req: Request): Promise<'incremental' | 'full'> {
+  const url = new URL(req.url)
+  let mode = url.searchParams.get('mode')
+
+  if (!mode && req.method === 'POST') {
+    try {
+      const body = await req.json()
+      mode = body?.mode ?? null
+    } catch {
+      // Empty or non-JSON body - use default mode
+    }
+  }
+
+  return mode === 'full' ? 'full' : 'incremental'
+}
+
+function buildVariantRow(printfulClient: PrintfulAPIClient, variant: any, productId: string) {
+  const { color, size } = printfulClient.parseVariantOptions(variant)
+  const variantName = variant.name || `${color || 'Default'} - ${size || 'One Size'}`
+
+  return {
+    product_id: productId,
+    // Catalog variant ID is needed for shipping; fall back to the stable sync variant ID
+    printful_variant_id: variant.variant_id ? String(variant.variant_id) : String(variant.id),
+    name: variantName,
+    value: `${color || 'Default'} - ${size || 'One Size'}`,
+    color: color || 'Default',
+    size: size || 'One Size',
+    ...(Number.isFinite(parseFloat(variant.retail_price)) ? { price: parseFloat(variant.retail_price) } : {})
+    // in_stock / is_available are left to their column defaults on insert and never overwritten
+    // here - stock_updated webhooks own them
+  }
+}
+
+// Product detail requests in flight at once. The client already spaces each request by 600ms,
+// so two workers stay close to Printful's 120 requests/minute limit
+const DETAIL_CONCURRENCY = 2
+
+// Fetch details for many products with bounded concurrency. A failed fetch is logged and left
+// out of the result, so one bad product doesn't stop the sync
+async function fetchProductDetails(
+  printfulClient: PrintfulAPIClient,
+  productIds: number[],
+  report: SyncChangeReport
+): Promise<Map<number, any>> {
+  const details = new Map<number, any>()
+  let next = 0
+
+  const worker = async () => {
+    while (next < productIds.length) {
+      const productId = productIds[next++]
+      try {
+        details.set(productId, await printfulClient.getProductDetails(productId))
+        report.detailRequests++
+      } catch (error) {
+        console.error(`❌ Failed to fetch product ${productId}:`, error)
+      }
+    }
+  }
+
+  await Promise.all(Array.from({ length: Math.min(DETAIL_CONCURRENCY, productIds.length) }, worker))
+  return details
+}
+
+// Incremental sync: the list entry has no variant prices or options, and Printful doesn't change
+// it when only a price does, so what changed can't be told from the list. Every product's detail
+// is fetched (through a small pool) and hashed with its variants; only changed products and rows
+// are written back
+async function processIncrementalSync(
+  supabase: any,
+  printfulClient: PrintfulAPIClient,
+  imageManager: ImageStorageManager,
+  report: SyncChangeReport
+): Promise<void> {
+  const storeProducts = await printfulClient.getStoreProducts()
+
+  const { data: existingProducts, error: existingError } = await supabase
+    .from('products')
+    .select('id, name, printful_product_id, printful_sync_hash, is_active')
+    .not('printful_product_id', 'is', null)
+
+  if (existingError) {
+    throw new Error(`Failed to load existing products: ${existingError.message}`)
+  }
+
+  const existingByPrintfulId = new Map<string, any>(
+    (existingProducts || []).map((p: any) => [String(p.printful_product_id), p])
+  )
+  const seenPrintfulIds = new Set<string>()
+
+  const activeStoreProducts = storeProducts.filter((storeProduct: any) => !storeProduct.is_ignored)
+  const details = await fetchProductDetails(
+    printfulClient,
+    activeStoreProducts.map((storeProduct: any) => storeProduct.id),
+    report
+  )
+
+  // Writes stay sequential; only the Printful reads run concurrently
+  for (const storeProduct of activeStoreProducts) {
+    const printfulId = String(storeProduct.id)
+    seenPrintfulIds.add(printfulId)
+
+    const existing = existingByPrintfulId.get(printfulId)
+
+    const detail = details.get(storeProduct.id)
+    if (!detail) {
+      continue
+    }
+
+    const detailHash = await hashProductDetail(detail)
+
+    if (existing && existing.printful_sync_hash === detailHash && existing.is_active !== false) {
+      report.products.unchanged++
+      continue
+    }
+
+    const syncProduct = detail.sync_product
+    const syncVariants = (detail.sync_variants || []).filter((v: any) => !v.is_ignored)
+
+    if (syncVariants.length === 0) {
+      console.log(`⚠️ Skipping ${syncProduct.name} - no variants`)
+      continue
+    }
+
+    const category = printfulClient.categorizeProduct(detail)
+    const basePrice = parseFloat(syncVariants[0].retail_price) || 24.99
+    let productId: string
+
+    if (existing) {
+      // Keep slug and description stable - they may have been edited by an admin
+      const { error: updateError } = await supabase
+        .from('products')
+        .update({
+          name: syncProduct.name,
+          category: category,
+          price: basePrice,
+          is_active: true,
+          printful_sync_hash: detailHash,
+          printful_synced_at: new Date().toISOString()
+        })
+        .eq('id', existing.id)
+
+      if (updateError) {
+        console.error(`❌ Error updating product ${syncProduct.name}:`, updateError)
+        continue
+      }
+
+      productId = existing.id
+      report.products.updated.push(syncProduct.name)
+    } else {
+      const { data: insertedProduct, error: productError } = await supabase
+        .from('products')
+        .insert({
+          name: syncProduct.name,
+          slug: generateSlug(syncProduct.name),
+          description: `Premium ${category} with Reform UK branding`,
+          category: category,
+          price: basePrice,
+          printful_product_id: syncProduct.id,
+          printful_sync_hash: detailHash,
+          printful_synced_at: new Date().toISOString(),
+          is_active: true
+        })
+        .select('id')
+        .single()
+
+      if (productError) {
+        console.error(`❌ Error inserting product ${syncProduct.name}:`, productError)
+        continue
+      }
+
+      productId = insertedProduct.id
+      report.products.created.push(syncProduct.name)
+
+      if (syncProduct.thumbnail_url) {
+        try {
+          const publicUrl = await imageManager.storeImage(syncProduct.thumbnail_url, category)
+
+          const { error: imageError } = await supabase
+            .from('product_images')
+            .insert({
+              product_id: productId,
+              image_url: publicUrl,
+              renditions: await imageManager.createRenditions(publicUrl),
+              alt_text: `${syncProduct.name} Printful image`,
+              is_primary: false,
+              is_thumbnail: false,
+              source: 'printful'
+            })
+
+          if (imageError) {
+            console.error(`❌ Error inserting main image for ${syncProduct.name}:`, imageError)
+          } else {
+            report.images.stored++
+          }
+        } catch (error) {
+          console.error(`❌ Error processing main image for ${syncProduct.name}:`, error)
+        }
+      }
+    }
+
+    const failedBefore = report.variants.failed
+    await applyVariantDiff(supabase, printfulClient, imageManager, report, productId, syncProduct.name, category, syncVariants)
+
+    // Forget the hash if any variant write failed, so the next run retries the product instead of skipping it
+    if (report.variants.failed > failedBefore) {
+      await supabase.from('products').update({ printful_sync_hash: null }).eq('id', productId)
+    }
+  }
+
+  // Products removed from the Printful store are deactivated, not deleted, so order history stays intact
+  const removedProducts = (existingProducts || [])
+    .filter((p: any) => !seenPrintfulIds.has(String(p.printful_product_id)) && p.is_active !== false)
+
+  if (removedProducts.length > 0) {
+    const { error: deactivateError } = await supabase
+      .from('products')
+      .update({ is_active: false })
+      .in('id', removedProducts.map((p: any) => p.id))
+
+    if (deactivateError) {
+      console.error('⚠️ Error deactivating removed products:', deactivateError)
+    } else {
+      report.products.deactivated = removedProducts.map((p: any) => p.name)
+    }
+  }
+
+  console.log(`🎉 Incremental sync complete: ${report.products.created.length} created, ${report.products.updated.length} updated, ${report.products.unchanged} unchanged, ${report.products.deactivated.length} deactivated (${report.detailRequests} detail requests)`)
+}
+
+async function applyVariantDiff(
+  supabase: any,
+  printfulClient: PrintfulAPIClient,
+  imageManager: ImageStorageManager,
+  report: SyncChangeReport,
+  productId: string,
+  productName: string,
+  category: string,
+  syncVariants: any[]
+): Promise<void> {
+  const { data: existingVariants, error: variantsError } = await supabase
+    .from('product_variants')
+    .select('id, printful_variant_id, printful_sync_hash')
+    .eq('product_id', productId)
+
+  if (variantsError) {
+    console.error(`❌ Error loading variants for ${productName}:`, variantsError)
+    report.variants.failed += syncVariants.length
+    return
+  }
+
+  const existingByVariantId = new Map<string, any>(
+    (existingVariants || []).map((v: any) => [String(v.printful_variant_id), v])
+  )
+  const keptIds = new Set<string>()
+  const inserts: any[] = []
+  const updates: any[] = []
+  const changedImages = new Map<string, { url: string; name: string }>()
+
+  for (const variant of syncVariants) {
+    const row = buildVariantRow(printfulClient, variant, productId)
+    const hash = await hashSyncVariant(variant)
+    const existing = existingByVariantId.get(row.printful_variant_id)
+
+    if (existing) {
+      keptIds.add(existing.id)
+      if (existing.printful_sync_hash === hash) {
+        report.variants.unchanged++
+        continue
+      }
+      updates.push({ id: existing.id, ...row, printful_sync_hash: hash })
+    } else {
+      inserts.push({ ...row, printful_sync_hash: hash })
+    }
+
+    if (variant.product?.image && !changedImages.has(row.color)) {
+      changedImages.set(row.color, { url: variant.product.image, name: row.name })
+    }
+  }
+
+  if (inserts.length > 0) {
+    const { error } = await supabase.from('product_variants').insert(inserts)
+    if (error) {
+      console.error(`❌ Error inserting variants for ${productName}:`, error)
+      report.variants.failed += inserts.length
+    } else {
+      report.variants.created += inserts.length
+    }
+  }
+
+  if (updates.length > 0) {
+    const { error } = await supabase.from('product_variants').upsert(updates, { onConflict: 'id' })
+    if (error) {
+      console.error(`❌ Error updating variants for ${productName}:`, error)
+      report.variants.failed += updates.length
+    } else {
+      report.variants.updated += updates.length
+    }
+  }
+
+  const removed = (existingVariants || []).filter((v: any) => !keptIds.has(v.id))
+  if (removed.length > 0) {
+    const { error } = await supabase
+      .from('product_variants')
+      .delete()
+      .in('id', removed.map((v: any) => v.id))
+    if (error) {
+      console.error(`❌ Error removing variants for ${productName}:`, error)
+      report.variants.failed += removed.length
+    } else {
+      report.variants.removed += removed.length
+    }
+  }
+
+  if (changedImages.size === 0) {
+    return
+  }
+
+  // One image per colour; never override custom images and don't duplicate an existing Printful one
+  const { data: colorImages } = await supabase
+    .from('product_images')
+    .select('color, source')
+    .eq('product_id', productId)
+    .not('color', 'is', null)
+
+  const coveredColors = new Set((colorImages || []).map((img: any) => img.color))
+
+  const pendingImages = Array.from(changedImages).filter(([color]) => !coveredColors.has(color))
+  const storedImages = await imageManager.storeImages(
+    pendingImages.map(([, image]) => ({ imageUrl: image.url, category }))
+  )
+  const renditions = await imageManager.createRenditionsFor(Array.from(storedImages.values()))
+
+  const imageRows = pendingImages
+    .filter(([, image]) => storedImages.has(image.url))
+    .map(([color, image]) => ({
+      product_id: productId,
+      image_url: storedImages.get(image.url),
+      renditions: renditions.get(storedImages.get(image.url)!) || [],
+      alt_text: `${image.name} Printful image`,
+      is_primary: false,
+      is_thumbnail: false,
+      source: 'printful',
+      color: color,
+      variant_type: 'color'
+    }))
+
+  if (imageRows.length > 0) {
+    const { error } = await supabase.from('product_images').insert(imageRows)
+    if (error) {
+      console.error(`❌ Error inserting variant images for ${productName}:`, error)
+    } else {
+      report.images.stored += imageRows.length
+    }
+  }
+}
+
 // Old functions removed - now integrated into processRealProducts
 
 async function verifySync(supabase: any) {
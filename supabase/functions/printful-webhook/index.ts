@@ -1,5 +1,7 @@
 import { serve } from "https://deno.land/std@0.168.0/http/server.ts"
 import { createClient } from 'https://esm.sh/@supabase/supabase-js@2'
+import { claimWebhookEvent } from '../_shared/idempotency.ts'
+import { hashContent } from '../_shared/sync-hash.ts'
 
 const corsHeaders = {
   'Access-Control-Allow-Origin': '*',
@@ -42,33 +44,14 @@ serve(async (req) => {
 async function handlePrintfulWebhook(req: Request, supabase: any) {
   try {
     const body = await req.json()
-    console.log('Received Printful webhook:', body)
+    console.log('Received Printful webhook:', body?.type || 'unknown')
 
     // Handle different webhook types
     const { type, data } = body
     
     if (type === 'stock_updated' && data && data.variant_stock) {
-      // Handle stock_updated webhook
-      console.log('Processing stock_updated webhook')
-      
-      for (const [variantId, inStock] of Object.entries(data.variant_stock)) {
-        const isAvailable = inStock === true
-        
-        // Update variant availability in database
-        const { error } = await supabase
-          .from('product_variants')
-          .update({ 
-            in_stock: inStock,
-            is_available: isAvailable
-          })
-          .eq('printful_variant_id', variantId)
-
-        if (error) {
-          console.error(`Error updating variant ${variantId} from webhook:`, error)
-        } else {
-          console.log(`Updated variant ${variantId} availability via webhook: in_stock=${inStock}, is_available=${isAvailable}`)
-        }
-      }
+      // Store the raw event and acknowledge now; the stock map is applied in the background
+      return await acceptStockUpdated(body, supabase)
     } else if (type === 'product_updated' || type === 'product_synced') {
       // Handle product update webhooks
       console.log(`Processing ${type} webhook`)
@@ -141,3 +124,93 @@ async function handlePrintfulWebhook(req: Request, supabase: any) {
     )
   }
 }
+
+// Printful stock events carry no ID of their own, so an event is identified by a hash of
+// everything except `retries`, the only field a redelivery changes. `created` stays in: stock
+// events carry state, so a later event repeating an earlier map (out, in, out again) is new
+function hashPayload(body: any): Promise<string> {
+  const { retries: _retries, ...event } = body
+  return hashContent(event)
+}
+
+async function acceptStockUpdated(body: any, supabase: any) {
+  const eventId = `printful_stock_updated_${await hashPayload(body)}`
+  const variantCount = Object.keys(body.data.variant_stock).length
+  console.log(`Processing stock_updated webhook: ${variantCount} variants, event ${eventId}`)
+
+  const claim = await claimWebhookEvent(supabase, 'printful', { id: eventId, type: 'stock_updated' }, body)
+
+  if (!claim.isNew) {
+    // A redelivery of an event that was never applied (the background apply failed, or the
+    // isolate went away first) is retried rather than acked as a duplicate
+    const { data: stored, error: storedError } = await supabase
+      .from('webhook_events')
+      .select('processed, error')
+      .eq('event_id', eventId)
+      .maybeSingle()
+
+    if (!storedError && stored && !stored.processed) {
+      console.log(`Retrying unapplied stock_updated event ${eventId}${stored.error ? ` (last error: ${stored.error})` : ''}`)
+      EdgeRuntime.waitUntil(applyStoredStockEvent(supabase, eventId))
+      return new Response(
+        JSON.stringify({ success: true, message: 'Webhook accepted (retry)', webhook_type: 'stock_updated', event_id: eventId }),
+        { status: 200, headers: { ...corsHeaders, 'Content-Type': 'application/json' } }
+      )
+    }
+
+    console.log(`Duplicate stock_updated event ${eventId}, skipping`)
+    return new Response(
+      JSON.stringify({ success: true, message: 'Duplicate event', webhook_type: 'stock_updated' }),
+      { status: 200, headers: { ...corsHeaders, 'Content-Type': 'application/json' } }
+    )
+  }
+
+  // If the event couldn't be stored, apply the map directly rather than dropping it
+  EdgeRuntime.waitUntil(
+    claim.error
+      ? applyVariantStock(supabase, eventId, body.data.variant_stock)
+      : applyStoredStockEvent(supabase, eventId)
+  )
+
+  return new Response(
+    JSON.stringify({
+      success: true,
+      message: 'Webhook accepted',
+      webhook_type: 'stock_updated',
+      event_id: eventId,
+      variants_received: variantCount
+    }),
+    { status: 200, headers: { ...corsHeaders, 'Content-Type': 'application/json' } }
+  )
+}
+
+async function applyStoredStockEvent(supabase: any, eventId: string) {
+  const { data, error } = await supabase.rpc('apply_printful_stock_event', { p_event_id: eventId })
+
+  if (error) {
+    console.error(`Error applying stock_updated event ${eventId}:`, error)
+    await supabase
+      .from('webhook_events')
+      .update({ error: error.message })
+      .eq('event_id', eventId)
+    return
+  }
+
+  console.log(JSON.stringify({ metric: 'printful_stock_updated', event_id: eventId, ...data }))
+}
+
+async function applyVariantStock(supabase: any, eventId: string, variantStock: Record<string, unknown>) {
+  const { data: rowsChanged, error } = await supabase.rpc('apply_variant_stock', { p_stock: variantStock })
+
+  if (error) {
+    console.error(`Error applying stock_updated event ${eventId}:`, error)
+    return
+  }
+
+  console.log(JSON.stringify({
+    metric: 'printful_stock_updated',
+    event_id: eventId,
+    variants_received: Object.keys(variantStock).length,
+    rows_changed: rowsChanged
+  }))
+}
@@ -1,5 +1,9 @@
 import { serve } from "https://deno.land/std@0.168.0/http/server.ts"
 import { createClient } from 'https://esm.sh/@supabase/supabase-js@2'
+import { defineTemplate, formatPence, renderTemplate } from '../_shared/email-templates.ts'
+import { renderCustomerOrderEmail } from '../_shared/order-emails.ts'
+import type { OrderEmailData } from '../_shared/order-emails.ts'
+import { resendClient } from '../_shared/resend.ts'
 
 const corsHeaders = {
   'Access-Control-Allow-Origin': '*',
@@ -30,6 +34,125 @@ interface Order {
   items: OrderItem[];
 }
 
+// View model rendered by the templates below; every field is preformatted and escaped on render
+interface OrderEmailView {
+  displayOrderId: string;
+  orderDateTime: string;
+  customerEmail: string;
+  stripeSessionId: string;
+  contactName: string;
+  contactPhone: string;
+  noAddress: boolean;
+  customer: {
+    address: {
+      line1: string;
+      line2: string;
+      city: string;
+      state: string;
+      postalCode: string;
+      country: string;
+    } | null;
+  } | null;
+  items: Array<{
+    productName: string;
+    variantsText: string;
+    quantity: number;
+    unitPrice: string;
+    lineTotal: string;
+  }>;
+  total: string;
+  reason: string;
+}
+
+const FROM_ADDRESS = 'Reform UK Shop <support@backreform.co.uk>'
+
+// Templates are registered once per isolate and compiled on first render; the customer
+// confirmation is the shared one in _shared/order-emails.ts
+defineTemplate('order-internal-notification', `
+    <!DOCTYPE html>
+    <html>
+    <head>
+      <meta charset="utf-8">
+      <title>New Order Notification</title>
+    </head>
+    <body style="font-family: Arial, sans-serif; line-height: 1.4; color: #333; margin: 0; padding: 20px;">
+      <div style="max-width: 800px; margin: 0 auto;">
+        <h1 style="color: #1a1a1a; margin-bottom: 20px;">New Order Placed</h1>
+        
+        <div style="background-color: #f8f9fa; padding: 20px; border-radius: 6px; margin-bottom: 20px;">
+          <h2 style="color: #1a1a1a; margin-bottom: 15px;">Order Information</h2>
+          <p><strong>Order ID:</strong> {{displayOrderId}}</p>
+          <p><strong>Customer Email:</strong> {{customerEmail}}</p>
+          <p><strong>Order Date:</strong> {{orderDateTime}}</p>
+          <p><strong>Stripe Session ID:</strong> {{stripeSessionId}}</p>
+        </div>
+        
+        <div style="background-color: #f8f9fa; padding: 20px; border-radius: 6px; margin-bottom: 20px;">
+          <h2 style="color: #1a1a1a; margin-bottom: 15px;">Customer Details</h2>
+          <p><strong>Full Name:</strong> {{contactName}}</p>
+          <p><strong>Email:</strong> {{customerEmail}}</p>
+          <p><strong>Phone:</strong> {{contactPhone}}</p>
+          <p><strong>Shipping Address:</strong></p>
+          <div style="margin-left: 20px; color: #666;">
+            {{#if customer.address}}
+              <p>{{customer.address.line1}}</p>
+              {{#if customer.address.line2}}<p>{{customer.address.line2}}</p>{{/if}}
+              <p>{{customer.address.city}}, {{customer.address.state}} {{customer.address.postalCode}}</p>
+              <p>{{customer.address.country}}</p>
+            {{/if}}
+            {{#if noAddress}}Not provided{{/if}}
+          </div>
+        </div>
+        
+        <div style="background-color: #f8f9fa; padding: 20px; border-radius: 6px; margin-bottom: 20px;">
+          <h2 style="color: #1a1a1a; margin-bottom: 15px;">Ordered Items</h2>
+          <table style="width: 100%; border-collapse: collapse;">
+            <thead>
+              <tr style="background-color: #1a1a1a; color: white;">
+                <th style="padding: 8px; text-align: left;">Product</th>
+                <th style="padding: 8px; text-align: center;">Qty</th>
+                <th style="padding: 8px; text-align: right;">Unit Price</th>
+                <th style="padding: 8px; text-align: right;">Total</th>
+              </tr>
+            </thead>
+            <tbody>
+              {{#each items}}
+              <tr>
+                <td style="padding: 8px; border-bottom: 1px solid #ddd;">
+                  {{productName}}{{#if variantsText}}<br><small style="color: #666; font-style: italic;">{{variantsText}}</small>{{/if}}
+                </td>
+                <td style="padding: 8px; border-bottom: 1px solid #ddd; text-align: center;">{{quantity}}</td>
+                <td style="padding: 8px; border-bottom: 1px solid #ddd; text-align: right;">£{{unitPrice}}</td>
+                <td style="padding: 8px; border-bottom: 1px solid #ddd; text-align: right;">£{{lineTotal}}</td>
+              </tr>
+              {{/each}}
+              <tr style="background-color: #f0f0f0; font-weight: bold;">
+                <td colspan="3" style="padding: 8px; text-align: right;">Order Total:</td>
+                <td style="padding: 8px; text-align: right;">£{{total}}</td>
+              </tr>
+            </tbody>
+          </table>
+        </div>
+        
+        <div style="background-color: #e8f5e8; padding: 15px; border-radius: 6px; border-left: 4px solid #28a745;">
+          <p style="margin: 0; font-weight: bold;">Order Total: £{{total}}</p>
+        </div>
+      </div>
+    </body>
+    </html>
+`)
+
+defineTemplate('order-cancellation', `
+        <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
+          <h2 style="color: #009fe3;">Order Cancellation Confirmed</h2>
+          <p>Dear Customer,</p>
+          <p>Your order has been successfully cancelled.</p>
+          {{#if reason}}<p><strong>Cancellation Reason:</strong> {{reason}}</p>{{/if}}
+          <p>If you have any questions about this cancellation, please contact our support team.</p>
+          <p>Best regards,<br>Reform UK Team</p>
+        </div>
+`)
+
 serve(async (req) => {
   // Handle CORS preflight requests
   if (req.method === 'OPTIONS') {
@@ -340,33 +463,10 @@ serve(async (req) => {
       test_mode: orderData.stripe_session_id ? orderData.stripe_session_id.startsWith('cs_test_') : false
     });
 
-    // Determine email template based on action
-    let emailSubject: string;
-    let emailBody: string;
-    
-    if (action === 'cancelled') {
-      emailSubject = `Order Cancellation Confirmation - Reform UK`;
-      emailBody = `
-        <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
-          <h2 style="color: #009fe3;">Order Cancellation Confirmed</h2>
-          <p>Dear Customer,</p>
-          <p>Your order has been successfully cancelled.</p>
-          ${reason ? `<p><strong>Cancellation Reason:</strong> ${reason}</p>` : ''}
-          <p>If you have any questions about this cancellation, please contact our support team.</p>
-          <p>Best regards,<br>Reform UK Team</p>
-        </div>
-      `;
-    } else {
-      // Default order confirmation email - use the existing formatOrderEmail function
-      emailSubject = `Order Confirmation - ${orderData.readable_order_id || 'Processing...'}`;
-      emailBody = formatOrderEmail(orderData.readable_order_id || 'Processing...', orderItems, orderTotal, orderData.customer_details);
-    }
-
     // Load email configuration from environment variables
-    const resendApiKey = Deno.env.get('RESEND_API_KEY')
     const INTERNAL_EMAIL = Deno.env.get('INTERNAL_EMAIL') || 'support@backreform.co.uk'
     
-    if (!resendApiKey) {
+    if (!resendClient.isConfigured()) {
       console.error('Missing Resend API key')
       return new Response(
         JSON.stringify({ error: 'Email service not configured' }),
@@ -377,77 +477,52 @@ serve(async (req) => {
       )
     }
 
-    // Validate email addresses
-    if (!customerEmail) {
-      console.warn('⚠️ customerEmail is undefined')
-    }
-    if (!INTERNAL_EMAIL) {
-      console.warn('⚠️ INTERNAL_EMAIL is undefined')
-    }
+    // Build the view model once; both emails render from it
+    const view = buildEmailView(orderData, orderItems, orderTotal, reason)
 
-    // Send customer confirmation email
-    let customerEmailResult = null;
-    let customerEmailError = null;
-    try {
-      console.log('📧 Sending customer email to:', customerEmail);
-      const customerEmailResponse = await fetch('https://api.resend.com/emails', {
-        method: 'POST',
-        headers: {
-          'Authorization': `Bearer ${resendApiKey}`,
-          'Content-Type': 'application/json',
-        },
-        body: JSON.stringify({
-          from: 'Reform UK Shop <support@backreform.co.uk>',
+    // Determine email template based on action
+    const emailSubject = action === 'cancelled'
+      ? `Order Cancellation Confirmation - Reform UK`
+      : `Order Confirmation - ${view.displayOrderId}`
+    const emailBody = action === 'cancelled'
+      ? renderTemplate('order-cancellation', view)
+      : renderCustomerOrderEmail(buildConfirmationData(orderData, orderItems, orderTotal))
+
+    // Send customer confirmation and internal notification concurrently
+    console.log('📧 Sending customer email to:', customerEmail, 'and internal email to:', INTERNAL_EMAIL);
+    const [customerSend, internalSend] = await resendClient.sendAll([
+      {
+        message: {
+          from: FROM_ADDRESS,
           to: customerEmail,
           subject: emailSubject,
           html: emailBody,
-        }),
-      });
-
-      if (customerEmailResponse.ok) {
-        customerEmailResult = await customerEmailResponse.json();
-        console.log('Customer email sent successfully:', customerEmailResult);
-      } else {
-        const errorText = await customerEmailResponse.text();
-        customerEmailError = errorText;
-        console.error('Customer email failed:', errorText);
-      }
-    } catch (error) {
-      customerEmailError = error.message;
-      console.error('Customer email exception:', error);
-    }
-
-    // Send internal notification email
-    let internalEmailResult = null;
-    let internalEmailError = null;
-    try {
-      console.log('📧 Sending internal email to:', INTERNAL_EMAIL);
-      const internalEmailBody = formatInternalEmail(orderData, orderItems, orderTotal);
-      const internalEmailResponse = await fetch('https://api.resend.com/emails', {
-        method: 'POST',
-        headers: {
-          'Authorization': `Bearer ${resendApiKey}`,
-          'Content-Type': 'application/json',
         },
-        body: JSON.stringify({
-          from: 'Reform UK Shop <support@backreform.co.uk>',
+      },
+      {
+        message: {
+          from: FROM_ADDRESS,
           to: INTERNAL_EMAIL,
-          subject: `New Order Placed: ${orderData.readable_order_id || 'Processing...'}`,
-          html: internalEmailBody,
-        }),
-      });
+          subject: `New Order Placed: ${view.displayOrderId}`,
+          html: renderTemplate('order-internal-notification', view),
+        },
+      },
+    ])
 
-      if (internalEmailResponse.ok) {
-        internalEmailResult = await internalEmailResponse.json();
-        console.log('Internal email sent successfully:', internalEmailResult);
-      } else {
-        const errorText = await internalEmailResponse.text();
-        internalEmailError = errorText;
-        console.error('Internal email failed:', errorText);
-      }
-    } catch (error) {
-      internalEmailError = error.message;
-      console.error('Internal email exception:', error);
+    const customerEmailResult = customerSend.ok ? { id: customerSend.id } : null
+    const customerEmailError = customerSend.ok ? null : customerSend.error
+    const internalEmailResult = internalSend.ok ? { id: internalSend.id } : null
+    const internalEmailError = internalSend.ok ? null : internalSend.error
+
+    if (customerSend.ok) {
+      console.log('Customer email sent successfully:', customerEmailResult);
+    } else {
+      console.error('Customer email failed:', customerEmailError);
+    }
+    if (internalSend.ok) {
+      console.log('Internal email sent successfully:', internalEmailResult);
+    } else {
+      console.error('Internal email failed:', internalEmailError);
     }
 
     // Return success if at least one email was sent
@@ -497,235 +572,72 @@ serve(async (req) => {
   }
 })
 
-function formatOrderEmail(orderId: string, items: OrderItem[], total: number, customerDetails?: any): string {
-  // Handle fallback for missing readable order ID
-  const displayOrderId = orderId === 'Processing...' ? 'Processing...' : orderId
-  
-  const itemsHtml = items.map(item => {
-    const unitPrice = (item.unit_price / 100).toFixed(2) // Convert from pence to pounds
-    const itemTotal = ((item.unit_price * item.quantity) / 100).toFixed(2) // Convert from pence to pounds
-    
-    // Format variants if they exist
-    let variantsText = '';
-    if (item.variants && Object.keys(item.variants).length > 0) {
-      const variantPairs = Object.entries(item.variants)
-        .filter(([key, value]) => value && value !== '') // Only show non-empty variants
-        .map(([key, value]) => {
-          // Format the key names to be more readable
-          const keyName = key
-            .replace(/_/g, ' ')
-            .replace(/\b\w/g, l => l.toUpperCase());
-          return `${keyName}: ${value}`;
-        });
-      
-      if (variantPairs.length > 0) {
-        variantsText = `<br><small style="color: #666; font-style: italic;">${variantPairs.join(', ')}</small>`;
-      }
-    }
-    
-    return `
-      <tr>
-        <td style="padding: 12px; border-bottom: 1px solid #eee;">
-          ${item.product_name}${variantsText}
-        </td>
-        <td style="padding: 12px; border-bottom: 1px solid #eee; text-align: center;">${item.quantity}</td>
-        <td style="padding: 12px; border-bottom: 1px solid #eee; text-align: right;">£${unitPrice}</td>
-        <td style="padding: 12px; border-bottom: 1px solid #eee; text-align: right;">£${itemTotal}</td>
-      </tr>
-    `
-  }).join('')
-
-  // Add total row to the table
-  const totalRow = `
-    <tr style="background-color: #f8f9fa; font-weight: bold;">
-      <td colspan="3" style="padding: 12px; text-align: right; border-top: 2px solid #ddd;">Order Total:</td>
-      <td style="padding: 12px; text-align: right; border-top: 2px solid #ddd;">£${total.toFixed(2)}</td>
-    </tr>
-  `
-
-  return `
-    <!DOCTYPE html>
-    <html>
-    <head>
-      <meta charset="utf-8">
-      <meta name="viewport" content="width=device-width, initial-scale=1.0">
-      <title>Order Confirmation</title>
-    </head>
-    <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333; margin: 0; padding: 0;">
-      <div style="max-width: 600px; margin: 0 auto; background-color: #f8f9fa; padding: 20px;">
-        <div style="background-color: white; border-radius: 8px; overflow: hidden; box-shadow: 0 2px 10px rgba(0,0,0,0.1);">
-          <!-- Header -->
-          <div style="background-color: #1a1a1a; color: white; padding: 30px; text-align: center;">
-            <h1 style="margin: 0; font-size: 28px; font-weight: bold;">Order Confirmation</h1>
-          </div>
-          
-          <!-- Order Info -->
-          <div style="padding: 30px;">
-            <h2 style="color: #1a1a1a; margin-bottom: 20px; font-size: 24px;">Thank you for your order!</h2>
-            
-            <div style="background-color: #f8f9fa; padding: 20px; border-radius: 6px; margin-bottom: 25px;">
-              <p style="margin: 8px 0; font-size: 16px;"><strong>Order ID:</strong> <span style="color: #009fe3; font-weight: bold;">${displayOrderId}</span></p>
-              <p style="margin: 8px 0; font-size: 16px;"><strong>Date:</strong> <span style="font-weight: bold;">${new Date().toLocaleDateString('en-GB')}</span></p>
-            </div>
-            
-            <!-- Customer Information -->
-            ${customerDetails ? `
-            <div style="background-color: #f8f9fa; padding: 20px; border-radius: 6px; margin-bottom: 25px;">
-              <h3 style="color: #1a1a1a; margin-bottom: 15px; font-size: 20px;">Customer Information</h3>
-              <p style="margin: 8px 0; font-size: 16px;"><strong>Name:</strong> <span style="font-weight: bold;">${customerDetails.name || 'Not provided'}</span></p>
-              <p style="margin: 8px 0; font-size: 16px;"><strong>Email:</strong> <span style="font-weight: bold;">${customerDetails.email || 'Not provided'}</span></p>
-              ${customerDetails.phone ? `<p style="margin: 8px 0; font-size: 16px;"><strong>Phone:</strong> <span style="font-weight: bold;">${customerDetails.phone}</span></p>` : ''}
-              ${customerDetails.address ? `
-              <p style="margin: 8px 0; font-size: 16px;"><strong>Shipping Address:</strong></p>
-              <div style="margin-left: 20px; color: #666;">
-                <p style="margin: 4px 0;">${customerDetails.address.line1 || ''}</p>
-                ${customerDetails.address.line2 ? `<p style="margin: 4px 0;">${customerDetails.address.line2}</p>` : ''}
-                <p style="margin: 4px 0;">${customerDetails.address.city || ''}, ${customerDetails.address.state || ''} ${customerDetails.address.postal_code || ''}</p>
-                <p style="margin: 4px 0;">${customerDetails.address.country || ''}</p>
-              </div>
-              ` : ''}
-            </div>
-            ` : ''}
-            
-            <!-- Order Details Table -->
-            <h3 style="color: #1a1a1a; margin-bottom: 15px; font-size: 20px;">Order Details</h3>
-            <div style="overflow-x: auto;">
-              <table style="width: 100%; border-collapse: collapse; margin-bottom: 25px; min-width: 400px;">
-                <thead>
-                  <tr style="background-color: #1a1a1a; color: white;">
-                    <th style="padding: 12px; text-align: left; border-bottom: 2px solid #ddd;">Product</th>
-                    <th style="padding: 12px; text-align: center; border-bottom: 2px solid #ddd;">Qty</th>
-                    <th style="padding: 12px; text-align: right; border-bottom: 2px solid #ddd;">Unit Price</th>
-                    <th style="padding: 12px; text-align: right; border-bottom: 2px solid #ddd;">Total</th>
-                  </tr>
-                </thead>
-                <tbody>
-                  ${itemsHtml}
-                  ${totalRow}
-                </tbody>
-              </table>
-            </div>
-            
-            <!-- Next Steps -->
-            <div style="background-color: #f8f9fa; padding: 25px; border-radius: 6px; border-left: 4px solid #009fe3;">
-              <h3 style="color: #1a1a1a; margin-bottom: 15px; font-size: 18px;">What's Next?</h3>
-              <p style="margin-bottom: 10px; font-size: 16px;">We're processing your order and will send you a shipping confirmation email once your items are on their way.</p>
-              <p style="margin-bottom: 0; font-size: 16px;">If you have any questions about your order, please contact us at <strong>support@backreform.co.uk</strong></p>
-            </div>
-          </div>
-        </div>
-        
-        <!-- Footer -->
-        <div style="text-align: center; margin-top: 30px; color: #666; font-size: 14px;">
-          <p style="margin: 5px 0;">Thank you for supporting Reform UK!</p>
-          <p style="margin: 5px 0;">© 2024 Reform UK. All rights reserved.</p>
-        </div>
-      </div>
-    </body>
-    </html>
-  `
+// Format variants as "Key Name: value" pairs, skipping empty values
+function formatVariants(variants: any): string {
+  if (!variants || Object.keys(variants).length === 0) return ''
+  return Object.entries(variants)
+    .filter(([, value]) => value && value !== '')
+    .map(([key, value]) => {
+      const keyName = key
+        .replace(/_/g, ' ')
+        .replace(/\b\w/g, l => l.toUpperCase());
+      return `${keyName}: ${value}`;
+    })
+    .join(', ')
 }
 
-function formatInternalEmail(orderData: any, items: OrderItem[], total: number): string {
-  const itemsHtml = items.map(item => {
-    const unitPrice = (item.unit_price / 100).toFixed(2) // Convert from pence to pounds
-    const itemTotal = ((item.unit_price * item.quantity) / 100).toFixed(2) // Convert from pence to pounds
-    
-    // Format variants if they exist
-    let variantsText = '';
-    if (item.variants && Object.keys(item.variants).length > 0) {
-      const variantPairs = Object.entries(item.variants)
-        .filter(([key, value]) => value && value !== '') // Only show non-empty variants
-        .map(([key, value]) => {
-          // Format the key names to be more readable
-          const keyName = key
-            .replace(/_/g, ' ')
-            .replace(/\b\w/g, l => l.toUpperCase());
-          return `${keyName}: ${value}`;
-        });
-      
-      if (variantPairs.length > 0) {
-        variantsText = `<br><small style="color: #666; font-style: italic;">${variantPairs.join(', ')}</small>`;
-      }
-    }
-    
-    return `
-      <tr>
-        <td style="padding: 8px; border-bottom: 1px solid #ddd;">
-          ${item.product_name}${variantsText}
-        </td>
-        <td style="padding: 8px; border-bottom: 1px solid #ddd; text-align: center;">${item.quantity}</td>
-        <td style="padding: 8px; border-bottom: 1px solid #ddd; text-align: right;">£${unitPrice}</td>
-        <td style="padding: 8px; border-bottom: 1px solid #ddd; text-align: right;">£${itemTotal}</td>
-      </tr>
-    `
-  }).join('')
-
-  const totalRow = `
-    <tr style="background-color: #f0f0f0; font-weight: bold;">
-      <td colspan="3" style="padding: 8px; text-align: right;">Order Total:</td>
-      <td style="padding: 8px; text-align: right;">£${total.toFixed(2)}</td>
-    </tr>
-  `
-
-  return `
-    <!DOCTYPE html>
-    <html>
-    <head>
-      <meta charset="utf-8">
-      <title>New Order Notification</title>
-    </head>
-    <body style="font-family: Arial, sans-serif; line-height: 1.4; color: #333; margin: 0; padding: 20px;">
-      <div style="max-width: 800px; margin: 0 auto;">
-        <h1 style="color: #1a1a1a; margin-bottom: 20px;">New Order Placed</h1>
-        
-        <div style="background-color: #f8f9fa; padding: 20px; border-radius: 6px; margin-bottom: 20px;">
-          <h2 style="color: #1a1a1a; margin-bottom: 15px;">Order Information</h2>
-          <p><strong>Order ID:</strong> ${orderData.readable_order_id || 'Processing...'}</p>
-          <p><strong>Customer Email:</strong> ${orderData.customer_email}</p>
-          <p><strong>Order Date:</strong> ${new Date(orderData.created_at).toLocaleString('en-GB')}</p>
-          <p><strong>Stripe Session ID:</strong> ${orderData.stripe_session_id}</p>
-        </div>
-        
-        <div style="background-color: #f8f9fa; padding: 20px; border-radius: 6px; margin-bottom: 20px;">
-          <h2 style="color: #1a1a1a; margin-bottom: 15px;">Customer Details</h2>
-          <p><strong>Full Name:</strong> ${orderData.customer_details?.name || 'Not provided'}</p>
-          <p><strong>Email:</strong> ${orderData.customer_email}</p>
-          <p><strong>Phone:</strong> ${orderData.customer_details?.phone || 'Not provided'}</p>
-          <p><strong>Shipping Address:</strong></p>
-          <div style="margin-left: 20px; color: #666;">
-            ${orderData.customer_details?.address ? `
-              <p>${orderData.customer_details.address.line1 || ''}</p>
-              ${orderData.customer_details.address.line2 ? `<p>${orderData.customer_details.address.line2}</p>` : ''}
-              <p>${orderData.customer_details.address.city || ''}, ${orderData.customer_details.address.state || ''} ${orderData.customer_details.address.postal_code || ''}</p>
-              <p>${orderData.customer_details.address.country || ''}</p>
-            ` : 'Not provided'}
-          </div>
-        </div>
-        
-        <div style="background-color: #f8f9fa; padding: 20px; border-radius: 6px; margin-bottom: 20px;">
-          <h2 style="color: #1a1a1a; margin-bottom: 15px;">Ordered Items</h2>
-          <table style="width: 100%; border-collapse: collapse;">
-            <thead>
-              <tr style="background-color: #1a1a1a; color: white;">
-                <th style="padding: 8px; text-align: left;">Product</th>
-                <th style="padding: 8px; text-align: center;">Qty</th>
-                <th style="padding: 8px; text-align: right;">Unit Price</th>
-                <th style="padding: 8px; text-align: right;">Total</th>
-              </tr>
-            </thead>
-            <tbody>
-              ${itemsHtml}
-              ${totalRow}
-            </tbody>
-          </table>
-        </div>
-        
-        <div style="background-color: #e8f5e8; padding: 15px; border-radius: 6px; border-left: 4px solid #28a745;">
-          <p style="margin: 0; font-weight: bold;">Order Total: £${total.toFixed(2)}</p>
-        </div>
-      </div>
-    </body>
-    </html>
-  `
-}
\ No newline at end of file
+function buildEmailView(orderData: any, items: OrderItem[], total: number, reason?: string): OrderEmailView {
+  const details = orderData.customer_details
+  const address = details?.address
+
+  return {
+    displayOrderId: orderData.readable_order_id || 'Processing...',
+    orderDateTime: new Date(orderData.created_at).toLocaleString('en-GB'),
+    customerEmail: orderData.customer_email,
+    stripeSessionId: orderData.stripe_session_id,
+    contactName: details?.name || 'Not provided',
+    contactPhone: details?.phone || 'Not provided',
+    noAddress: !address,
+    customer: details ? {
+      address: address ? {
+        line1: address.line1 || '',
+        line2: address.line2 || '',
+        city: address.city || '',
+        state: address.state || '',
+        postalCode: address.postal_code || '',
+        country: address.country || '',
+      } : null,
+    } : null,
+    items: items.map(item => ({
+      productName: item.product_name,
+      variantsText: formatVariants(item.variants),
+      quantity: item.quantity,
+      unitPrice: formatPence(item.unit_price),
+      lineTotal: formatPence(item.unit_price * item.quantity),
+    })),
+    total: total.toFixed(2),
+    reason: reason || '',
+  }
+}
+
+// Map the order row onto the payload the shared confirmation template renders from
+function buildConfirmationData(orderData: any, items: OrderItem[], total: number): OrderEmailData {
+  return {
+    orderId: orderData.id,
+    customerEmail: orderData.customer_email,
+    items: items.map(item => ({
+      product_name: item.product_name,
+      quantity: item.quantity,
+      unit_price: item.unit_price,
+      variants: item.variants || null,
+      image_url: null,
+    })),
+    shippingAddress: orderData.customer_details || orderData.shipping_address,
+    orderDetails: {
+      subtotal: Number(orderData.subtotal ?? total),
+      shipping_cost: Number(orderData.shipping_cost ?? 0),
+      total_amount: Number(orderData.total_amount ?? total),
+      readable_order_id: orderData.readable_order_id || 'Processing...',
+    },
+  }
+}
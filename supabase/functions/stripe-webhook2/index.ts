@@ -4,7 +4,16 @@ import 'jsr:@supabase/functions-js/edge-runtime.d.ts';
 import Stripe from "npm:stripe@17.7.0";
 import { createClient } from "npm:@supabase/supabase-js@2.49.1";
 // Remove old serve import - using Deno.serve instead
-import { createPrintfulFulfillment, type OrderData } from '../_shared/printful-fulfillment.ts';
+import type { OrderData } from '../_shared/printful-fulfillment.ts';
+import { resolveOrderVariants } from '../_shared/variant-resolver.ts';
+import {
+  claimIdempotencyKey,
+  claimWebhookEvent,
+  recordIdempotency,
+  releaseIdempotencyKey
+} from '../_shared/idempotency.ts';
+import type { OrderEmailData } from '../_shared/order-emails.ts';
+import { triggerOutboxWorker, type OutboxJobInput } from '../_shared/outbox.ts';
 
 // Environment variables
 const supabaseUrl = Deno.env.get('SUPABASE_URL')!;
@@ -28,6 +37,10 @@ const corsHeaders = {
   'Access-Control-Allow-Headers': 'authorization, x-client-info, apikey, content-type',
 };
 
+// A claim on a payment intent's order lapses after this long if the delivery holding it dies,
+// so a later Stripe retry can create the order
+const ORDER_CLAIM_TTL_SECONDS = 5 * 60;
+
 // Generate readable order ID
 function generateReadableOrderId(): string {
   const timestamp = Date.now().toString();
@@ -35,199 +48,6 @@ function generateReadableOrderId(): string {
   return `RUK-${timestamp.slice(-6)}${random}`;
 }
 
-// Send order confirmation emails
-async function sendOrderEmails(
-  orderId: string,
-  customerEmail: string,
-  items: any[],
-  shippingAddress: any,
-  orderDetails: {
-    subtotal: number;
-    shipping_cost: number;
-    total_amount: number;
-    readable_order_id: string;
-  }
-): Promise<void> {
-  const resendApiKey = Deno.env.get('RESEND_API_KEY');
-  if (!resendApiKey) {
-    console.error('RESEND_API_KEY not configured - skipping email');
-    return;
-  }
-
-  // Format items for email (without images for simplicity)
-  const itemsHtml = items.map(item => `
-    <tr>
-      <td style="padding: 12px; border-bottom: 1px solid #e5e7eb;">
-        <strong>${item.product_name}</strong>
-        ${item.variants ? `<br><small style="color: #6b7280;">${formatVariants(item.variants)}</small>` : ''}
-      </td>
-      <td style="padding: 12px; border-bottom: 1px solid #e5e7eb; text-align: center; vertical-align: middle;">${item.quantity}</td>
-      <td style="padding: 12px; border-bottom: 1px solid #e5e7eb; text-align: right; vertical-align: middle;">£${(item.unit_price / 100).toFixed(2)}</td>
-      <td style="padding: 12px; border-bottom: 1px solid #e5e7eb; text-align: right; vertical-align: middle;">£${((item.unit_price * item.quantity) / 100).toFixed(2)}</td>
-    </tr>
-  `).join('');
-
-  // Customer email template
-  const customerEmailHtml = `
-<!DOCTYPE html>
-<html>
-<head>
-  <meta charset="utf-8">
-  <title>Order Confirmation - Reform UK Store</title>
-</head>
-<body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto; padding: 20px;">
-  <div style="background: linear-gradient(135deg, #009fe3 0%, #0066cc 100%); color: white; padding: 30px; text-align: center; border-radius: 10px 10px 0 0;">
-    <h1 style="margin: 0;">Order Confirmation</h1>
-    <p style="margin: 10px 0 0 0;">Thank you for your order!</p>
-  </div>
-  
-  <div style="background: #f9f9f9; padding: 30px; border-radius: 0 0 10px 10px;">
-    <h2>Order #${orderDetails.readable_order_id}</h2>
-    <p>Hi ${shippingAddress.name || customerEmail},</p>
-    <p>We've received your order and it's being processed. You'll receive another email when your items ship.</p>
-    
-    <h3>Order Details:</h3>
-    <table style="width: 100%; border-collapse: collapse;">
-      <thead>
-        <tr style="background: #f3f4f6;">
-          <th style="padding: 12px; text-align: left;">Item</th>
-          <th style="padding: 12px; text-align: center;">Qty</th>
-          <th style="padding: 12px; text-align: right;">Price</th>
-          <th style="padding: 12px; text-align: right;">Total</th>
-        </tr>
-      </thead>
-      <tbody>
-        ${itemsHtml}
-      </tbody>
-      <tfoot>
-        <tr>
-          <td colspan="3" style="padding: 12px; text-align: right;"><strong>Subtotal:</strong></td>
-          <td style="padding: 12px; text-align: right;">£${orderDetails.subtotal.toFixed(2)}</td>
-        </tr>
-        <tr>
-          <td colspan="3" style="padding: 12px; text-align: right;"><strong>Shipping:</strong></td>
-          <td style="padding: 12px; text-align: right;">£${orderDetails.shipping_cost.toFixed(2)}</td>
-        </tr>
-        <tr style="background: #f3f4f6;">
-          <td colspan="3" style="padding: 12px; text-align: right;"><strong>Total:</strong></td>
-          <td style="padding: 12px; text-align: right;"><strong>£${orderDetails.total_amount.toFixed(2)}</strong></td>
-        </tr>
-      </tfoot>
-    </table>
-    
-    <h3>Shipping Address:</h3>
-    <p style="background: white; padding: 15px; border-radius: 5px;">
-      ${shippingAddress.name}<br>
-      ${shippingAddress.address.line1}<br>
-      ${shippingAddress.address.line2 ? shippingAddress.address.line2 + '<br>' : ''}
-      ${shippingAddress.address.city}, ${shippingAddress.address.state || ''} ${shippingAddress.address.postal_code}<br>
-      ${shippingAddress.address.country}
-    </p>
-    
-    <p style="margin-top: 30px; padding-top: 20px; border-top: 1px solid #e5e7eb; text-align: center; color: #6b7280;">
-      If you have any questions, please contact us at support@backreform.co.uk
-    </p>
-  </div>
-</body>
-</html>
-  `;
-
-  // Admin notification email
-  const adminEmailHtml = `
-<!DOCTYPE html>
-<html>
-<head>
-  <meta charset="utf-8">
-  <title>New Order - ${orderDetails.readable_order_id}</title>
-</head>
-<body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-  <h1>New Order Received</h1>
-  <p><strong>Order ID:</strong> ${orderDetails.readable_order_id}</p>
-  <p><strong>Customer:</strong> ${customerEmail}</p>
-  <p><strong>Total:</strong> £${orderDetails.total_amount.toFixed(2)}</p>
-  
-  <h2>Items Ordered:</h2>
-  <table border="1" cellpadding="10" style="border-collapse: collapse;">
-    <tr>
-      <th>Item</th>
-      <th>Quantity</th>
-      <th>Price</th>
-      <th>Total</th>
-    </tr>
-    ${itemsHtml}
-  </table>
-  
-  <h2>Shipping Details:</h2>
-  <p>
-    ${shippingAddress.name}<br>
-    ${shippingAddress.address.line1}<br>
-    ${shippingAddress.address.line2 ? shippingAddress.address.line2 + '<br>' : ''}
-    ${shippingAddress.address.city}, ${shippingAddress.address.state || ''} ${shippingAddress.address.postal_code}<br>
-    ${shippingAddress.address.country}
-  </p>
-</body>
-</html>
-  `;
-
-  try {
-    // Send customer email
-    const customerEmailResponse = await fetch('https://api.resend.com/emails', {
-      method: 'POST',
-      headers: {
-        'Content-Type': 'application/json',
-        'Authorization': `Bearer ${resendApiKey}`,
-      },
-      body: JSON.stringify({
-        to: customerEmail,
-        from: 'support@backreform.co.uk',
-        subject: `Order Confirmation - ${orderDetails.readable_order_id}`,
-        html: customerEmailHtml,
-      }),
-    });
-
-    if (!customerEmailResponse.ok) {
-      const error = await customerEmailResponse.text();
-      console.error('Failed to send customer email:', error);
-    } else {
-      console.log('Customer order confirmation email sent to:', customerEmail);
-    }
-
-    // Send admin notification
-    const adminEmailResponse = await fetch('https://api.resend.com/emails', {
-      method: 'POST',
-      headers: {
-        'Content-Type': 'application/json',
-        'Authorization': `Bearer ${resendApiKey}`,
-      },
-      body: JSON.stringify({
-        to: 'support@backreform.co.uk',
-        from: 'support@backreform.co.uk',
-        subject: `New Order: ${orderDetails.readable_order_id} - £${orderDetails.total_amount.toFixed(2)}`,
-        html: adminEmailHtml,
-      }),
-    });
-
-    if (!adminEmailResponse.ok) {
-      const error = await adminEmailResponse.text();
-      console.error('Failed to send admin email:', error);
-    } else {
-      console.log('Admin notification email sent to support@backreform.co.uk');
-    }
-  } catch (error) {
-    console.error('Error sending emails:', error);
-    throw error;
-  }
-}
-
-// Format product variants for display
-function formatVariants(variants: any): string {
-  const parts = [];
-  if (variants.color) parts.push(`Color: ${variants.color}`);
-  if (variants.size) parts.push(`Size: ${variants.size}`);
-  if (variants.gender) parts.push(`Gender: ${variants.gender}`);
-  return parts.join(' | ');
-}
-
 const handler = async (req: Request) => {
   // Handle CORS preflight requests
   if (req.method === 'OPTIONS') {
@@ -272,30 +92,29 @@ const handler = async (req: Request) => {
   }
 
   try {
-    // Check if we've already processed this webhook to prevent duplicates
-    const { data: existingEvent } = await supabase
-      .from('webhook_events')
-      .select('id, processed')
-      .eq('event_id', event.id)
-      .single();
+    // Record the event and reject redeliveries in a single insert-on-conflict
+    const { isNew } = await claimWebhookEvent(supabase, 'stripe', event);
 
-    if (existingEvent) {
-      console.log(`Webhook ${event.id} already processed, skipping`);
-      return new Response(JSON.stringify({ received: true, already_processed: true }), { 
-        status: 200,
-        headers: { ...corsHeaders, 'Content-Type': 'application/json' }
-      });
-    }
+    if (!isNew) {
+      // Only events that were processed without error are skipped. A redelivery of one that failed,
+      // or got a 409 while another delivery was creating the order, is handled again - the order
+      // claim still stops two deliveries creating the same order
+      const { data: stored, error: storedError } = await supabase
+        .from('webhook_events')
+        .select('processed, error')
+        .eq('event_id', event.id)
+        .maybeSingle();
 
-    // Log the webhook event for audit trail
-    await supabase.from('webhook_events').insert({
-      source: 'stripe',
-      event_id: event.id,
-      event_type: event.type,
-      payload: event,
-      processed: false,
-      created_at: new Date().toISOString()
-    });
+      if (!storedError && stored?.processed && !stored.error) {
+        console.log(`Webhook ${event.id} already processed, skipping`);
+        return new Response(JSON.stringify({ received: true, already_processed: true }), { 
+          status: 200,
+          headers: { ...corsHeaders, 'Content-Type': 'application/json' }
+        });
+      }
+
+      console.log(`Webhook ${event.id} redelivered before it was processed${stored?.error ? ` (last error: ${stored.error})` : ''}, handling again`);
+    }
 
     console.log(`Processing Stripe event: ${event.type}`);
 
@@ -317,7 +136,8 @@ const handler = async (req: Request) => {
           .from('webhook_events')
           .update({ 
             processed: true, 
-            processed_at: new Date().toISOString() 
+            processed_at: new Date().toISOString(),
+            error: null
           })
           .eq('event_id', event.id);
           
@@ -356,6 +176,10 @@ const handler = async (req: Request) => {
 async function handlePaymentIntentSucceeded(event: Stripe.Event): Promise<Response> {
   const webhookPaymentIntent = event.data.object as Stripe.PaymentIntent;
   console.log(`Processing payment_intent.succeeded: ${webhookPaymentIntent.id}`);
+
+  // One order per payment intent, across concurrent deliveries of the same or different events
+  const orderKey = `order_${webhookPaymentIntent.id}`;
+  let orderClaimed = false;
   
   try {
     // Retrieve the full payment intent from Stripe to ensure we have all metadata
@@ -366,12 +190,32 @@ async function handlePaymentIntentSucceeded(event: Stripe.Event): Promise<Respon
     
     console.log('Retrieved full payment intent from Stripe');
     
-    // Check if order already exists to prevent duplicates (idempotency)
-    const { data: existingOrder } = await supabase
-      .from('orders')
-      .select('id, readable_order_id')
-      .eq('stripe_payment_intent_id', paymentIntent.id)
-      .single();
+    // Claim the order in one round trip. If the claim can't be made at all, fall through to the
+    // existing-order lookup - the order insert is still guarded by unique_payment_intent
+    const claim = await claimIdempotencyKey(supabase, orderKey, ORDER_CLAIM_TTL_SECONDS);
+    orderClaimed = claim.claimed;
+
+    if (!claim.claimed && !claim.error && !claim.result) {
+      // Another delivery is creating this order right now - have Stripe retry later
+      console.log(`Order for payment intent ${paymentIntent.id} is already being created`);
+      return new Response(JSON.stringify({ 
+        received: true,
+        message: 'Order creation in progress'
+      }), { 
+        status: 409,
+        headers: { ...corsHeaders, 'Content-Type': 'application/json' }
+      });
+    }
+
+    const existingOrder = claim.result?.order_id
+      ? { id: claim.result.order_id, readable_order_id: claim.result.readable_order_id }
+      : claim.claimed
+        ? null
+        : (await supabase
+            .from('orders')
+            .select('id, readable_order_id')
+            .eq('stripe_payment_intent_id', paymentIntent.id)
+            .maybeSingle()).data;
       
     if (existingOrder) {
       console.log(`Order already exists for payment intent ${paymentIntent.id}: ${existingOrder.readable_order_id}`);
@@ -381,7 +225,8 @@ async function handlePaymentIntentSucceeded(event: Stripe.Event): Promise<Respon
         .from('webhook_events')
         .update({ 
           processed: true, 
-          processed_at: new Date().toISOString() 
+          processed_at: new Date().toISOString(),
+          error: null
         })
         .eq('event_id', event.id);
       
@@ -494,299 +339,9 @@ async function handlePaymentIntentSucceeded(event: Stripe.Event): Promise<Respon
       throw new Error('Items must be an array');
     }
     
-    // Look up printful_variant_id for each item from the database
+    // Resolve printful_variant_id for every item with one bulk lookup
     // The item.id might be a string like "hoodie-2XL-White" or a UUID
-    const itemsWithPrintfulIds = await Promise.all(items.map(async (item) => {
-      console.log(`\n🔍 Processing item: ${item.name || item.id}`);
-      console.log(`   ID: ${item.id}`);
-      console.log(`   Color: ${item.color || 'not specified'}`);
-      console.log(`   Size: ${item.size || 'not specified'}`);
-      console.log(`   Printful Variant ID from metadata: ${item.printful_variant_id || 'not provided'}`);
-      
-      // Skip discount items and bundle discounts
-      if (item.id && (String(item.id).includes('discount') || String(item.id).includes('-discount'))) {
-        console.log(`   ➡️ Skipping discount item`);
-        return {
-          ...item,
-          printful_variant_id: null // Discounts don't have Printful IDs
-        };
-      }
-      
-      // If we already have a printful_variant_id from metadata, use it directly
-      if (item.printful_variant_id && item.printful_variant_id !== 'null' && item.printful_variant_id !== 'undefined') {
-        console.log(`   ✅ Using printful_variant_id from metadata: ${item.printful_variant_id}`);
-        return {
-          ...item,
-          printful_variant_id: String(item.printful_variant_id)
-        };
-      }
-      
-      // Handle bundle items (e.g., starter-bundle-tshirt-0, activist-bundle-hoodie-1)
-      if (item.id && String(item.id).includes('bundle')) {
-        const bundleMatch = String(item.id).match(/^(.*?)-bundle-(.*?)(?:-(\d+))?$/);
-        if (bundleMatch) {
-          const bundleType = bundleMatch[1]; // 'starter', 'champion', 'activist'
-          const productType = bundleMatch[2]; // 'tshirt', 'hoodie', 'cap', etc.
-          
-          console.log(`Bundle item detected: ${item.id} -> ${bundleType} bundle ${productType}`);
-          console.log(`Bundle item details: color=${item.color}, size=${item.size}, printful_variant_id=${item.printful_variant_id}`);
-          
-          // The frontend MUST send the variant ID - no more fallbacks
-          if (item.printful_variant_id) {
-            console.log(`Using customer-selected variant ID: ${item.printful_variant_id} (${item.color} ${item.size || ''})`);
-            return {
-              ...item,
-              printful_variant_id: item.printful_variant_id // Use the actual variant from frontend
-            };
-          }
-          
-          // NO FALLBACKS - The frontend must provide the variant ID
-          console.error(`ERROR: No variant ID from frontend for ${productType} - THIS SHOULD NOT HAPPEN`);
-          console.error(`Item details: color=${item.color}, size=${item.size}`);
-          throw new Error(`Missing printful_variant_id for ${item.name || productType}. Frontend must provide variant selection.`);
-        }
-      }
-      
-      // Parse the item ID to extract product type and variant details
-      const itemIdStr = String(item.id);
-      let variant = null;
-      let error = null;
-      
-      // Check if it's a UUID format (36 characters with dashes)
-      const isUuid = /^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$/i.test(itemIdStr);
-      
-      if (isUuid) {
-        // Try direct lookup by UUID
-        const result = await supabase
-          .from('product_variants')
-          .select('printful_variant_id')
-          .eq('id', item.id)
-          .single();
-        variant = result.data;
-        error = result.error;
-      } else {
-        // Parse string format like "hoodie-2XL-White", "tshirt-M-Black", or "301-Black"
-        const parts = itemIdStr.split('-');
-        let productType = '';
-        let size = '';
-        let color = '';
-        
-        // Check if first part is a number (like "301-Black")
-        if (parts.length >= 2 && /^\d+$/.test(parts[0])) {
-          // This might be a Printful catalog variant ID or sync variant ID
-          // Try to look up by the numeric ID directly
-          const numericId = parseInt(parts[0]);
-          console.log(`Trying to find variant with Printful ID: ${numericId}`);
-          
-          const { data: variantByPrintfulId } = await supabase
-            .from('product_variants')
-            .select('printful_variant_id')
-            .eq('printful_variant_id', numericId)
-            .single();
-          
-          if (variantByPrintfulId) {
-            variant = variantByPrintfulId;
-          } else {
-            // If not found, try parsing as color variant
-            // Format: number-color (e.g., "301-Black" might mean product 301 in Black)
-            color = parts[1];
-            // Try to find by color alone across all products
-            const { data: variantsByColor } = await supabase
-              .from('product_variants')
-              .select('printful_variant_id')
-              .ilike('color', color);
-            
-            if (variantsByColor && variantsByColor.length === 1) {
-              variant = variantsByColor[0];
-            }
-          }
-        } else if (parts.length >= 2) {
-          // Extract product type (first part)
-          productType = parts[0].toLowerCase();
-          
-          // Map product type to actual product name
-          const productNameMap: Record<string, string> = {
-            'hoodie': 'Unisex Hoodie DARK', // Default to DARK, will try LIGHT as fallback
-            'tshirt': 'Unisex t-shirt DARK', // Default to DARK, will try LIGHT as fallback  
-            't-shirt': 'Unisex t-shirt DARK',
-            'cap': 'Reform UK Cap',
-            'mug': 'Reform UK Mug',
-            'totebag': 'Reform UK Tote Bag',
-            'tote': 'Reform UK Tote Bag',
-            'waterbottle': 'Reform UK Water Bottle',
-            'water-bottle': 'Reform UK Water Bottle',
-            'mousepad': 'Reform UK Mouse Pad',
-            'mouse-pad': 'Reform UK Mouse Pad',
-            // Also try to map numeric patterns
-            '301': 'Reform UK Cap',  // Common cap product ID
-            '302': 'Unisex t-shirt DARK',
-            '303': 'Unisex Hoodie DARK'
-          };
-          
-          const productName = productNameMap[productType];
-          
-          // Extract size and color (remaining parts)
-          if (parts.length === 3) {
-            // Format: product-size-color
-            size = parts[1];
-            color = parts[2];
-          } else if (parts.length === 2) {
-            // Format: product-color (for single-size items)
-            color = parts[1];
-          }
-          
-          if (productName) {
-            // First, try to find the product (DARK variant first for t-shirts and hoodies)
-            let product = null;
-            const { data: darkProduct } = await supabase
-              .from('products')
-              .select('id')
-              .eq('name', productName)
-              .single();
-            
-            product = darkProduct;
-            
-            // If DARK variant not found and this is a t-shirt or hoodie, try LIGHT variant
-            if (!product && (productType === 'tshirt' || productType === 't-shirt' || productType === 'hoodie')) {
-              const lightProductName = productName.replace('DARK', 'LIGHT');
-              const { data: lightProduct } = await supabase
-                .from('products')
-                .select('id')
-                .eq('name', lightProductName)
-                .single();
-              product = lightProduct;
-            }
-            
-            if (product) {
-              console.log(`Found product: ${productName}, attempting variant lookup for size=${size}, color=${color}`);
-              
-              // Look up variant by product ID and attributes
-              const query = supabase
-                .from('product_variants')
-                .select('printful_variant_id, size, color, value')
-                .eq('product_id', product.id);
-              
-              if (size) query.ilike('size', size);
-              if (color) query.ilike('color', color);
-              
-              const result = await query.single();
-              variant = result.data;
-              error = result.error;
-              
-              console.log(`Direct variant query result: ${variant?.printful_variant_id || 'null'}, error: ${error?.message || 'none'}`);
-              
-              // If direct match failed, try fuzzy matching from all variants
-              if (error || !variant) {
-                const allResult = await supabase
-                  .from('product_variants')
-                  .select('printful_variant_id, size, color, value')
-                  .eq('product_id', product.id);
-                
-                console.log(`All variants for product: ${allResult.data?.length || 0} variants found`);
-                
-                if (allResult.data && allResult.data.length > 0) {
-                  // Create a color mapping for common frontend->database color translations
-                  const colorMapping: Record<string, string[]> = {
-                    'autumn': ['Autumn', 'Orange', 'Brown', 'Rust', 'Burnt Orange'],
-                    'black': ['Black', 'Charcoal', 'Dark Grey'],
-                    'white': ['White', 'Off White', 'Ivory', 'Natural'],
-                    'blue': ['Blue', 'Navy', 'Light Blue', 'Royal Blue'],
-                    'grey': ['Grey', 'Gray', 'Sport Grey', 'Ash'],
-                    'gray': ['Grey', 'Gray', 'Sport Grey', 'Ash'],
-                    'green': ['Green', 'Forest Green', 'Olive'],
-                    'red': ['Red', 'Crimson', 'Burgundy'],
-                    'pink': ['Pink', 'Light Pink', 'Hot Pink']
-                  };
-                  
-                  // Try to find variant by exact match first
-                  variant = allResult.data.find(v => {
-                    const sizeMatch = !size || v.size?.toLowerCase() === size.toLowerCase();
-                    const colorMatch = !color || v.color?.toLowerCase() === color.toLowerCase();
-                    return sizeMatch && colorMatch;
-                  });
-                  
-                  // If exact match failed, try color mapping
-                  if (!variant && color) {
-                    const possibleColors = colorMapping[color.toLowerCase()] || [color];
-                    variant = allResult.data.find(v => {
-                      const sizeMatch = !size || v.size?.toLowerCase() === size.toLowerCase();
-                      const colorMatch = possibleColors.some(pc => 
-                        v.color?.toLowerCase().includes(pc.toLowerCase()) ||
-                        pc.toLowerCase().includes(v.color?.toLowerCase() || '')
-                      );
-                      return sizeMatch && colorMatch;
-                    });
-                    
-                    if (variant) {
-                      console.log(`Found variant using color mapping: ${color} -> ${variant.color}`);
-                    }
-                  }
-                  
-                  // If still no match, try value field pattern matching
-                  if (!variant) {
-                    variant = allResult.data.find(v => {
-                      if (v.value) {
-                        const valueLower = v.value.toLowerCase();
-                        const sizeMatch = !size || valueLower.includes(size.toLowerCase());
-                        const colorMatch = !color || valueLower.includes(color.toLowerCase());
-                        return sizeMatch && colorMatch;
-                      }
-                      return false;
-                    });
-                    
-                    if (variant) {
-                      console.log(`Found variant using value field: ${variant.value}`);
-                    }
-                  }
-                  
-                  // If still no match and it's a single variant product, use the first one
-                  if (!variant && allResult.data.length === 1) {
-                    variant = allResult.data[0];
-                    console.log(`Using single available variant: ${variant.printful_variant_id}`);
-                  }
-                  
-                  // Log all available variants for debugging
-                  if (!variant) {
-                    console.log(`No variant found for ${productName}. Available variants:`);
-                    allResult.data.forEach(v => console.log(`  - Size: ${v.size}, Color: ${v.color}, Value: ${v.value}, Printful ID: ${v.printful_variant_id}`));
-                  }
-                }
-              }
-            } else {
-              console.log(`No product found for name: ${productName}`);
-            }
-          }
-        }
-      }
-      
-      // Final fallback: try to find by value field matching the item ID
-      if (!variant) {
-        const { data: variantByValue } = await supabase
-          .from('product_variants')
-          .select('printful_variant_id')
-          .eq('value', itemIdStr)
-          .single();
-        
-        if (variantByValue) {
-          variant = variantByValue;
-          console.log(`Found variant by value field: ${itemIdStr}`);
-        }
-      }
-      
-      if (error || !variant) {
-        console.warn(`Could not find variant for item ${item.id}:`, error);
-        console.warn(`Tried: UUID lookup, string parsing, numeric ID, value field`);
-        return {
-          ...item,
-          printful_variant_id: null
-        };
-      }
-      
-      return {
-        ...item,
-        printful_variant_id: variant.printful_variant_id
-      };
-    }));
+    const itemsWithPrintfulIds = await resolveOrderVariants(supabase, items);
     
     console.log('Items with Printful IDs:', itemsWithPrintfulIds.map(i => ({
       id: i.id,
@@ -794,8 +349,10 @@ async function handlePaymentIntentSucceeded(event: Stripe.Event): Promise<Respon
     })));
     
     // Create the order
+    const orderId = crypto.randomUUID();
     const readableOrderId = generateReadableOrderId();
     const orderData = {
+      id: orderId,
       stripe_payment_intent_id: paymentIntent.id,
       customer_email: customerEmail, // Use the variable we defined above
       user_id: metadata.user_id || null,
@@ -826,22 +383,6 @@ async function handlePaymentIntentSucceeded(event: Stripe.Event): Promise<Respon
       }
     });
     
-    console.log(`\nCreating order for payment intent ${paymentIntent.id}`);
-    
-    // Insert order into database
-    const { data: newOrder, error: orderError } = await supabase
-      .from('orders')
-      .insert(orderData)
-      .select('id, readable_order_id')
-      .single();
-      
-    if (orderError) {
-      console.error('Order creation failed:', orderError);
-      throw new Error(`Failed to create order: ${orderError.message}`);
-    }
-
-    console.log(`Order created successfully: ${newOrder.readable_order_id} (ID: ${newOrder.id})`);
-    
     // Transform shipping address to the format expected by email template
     // The metadata has flat structure (address1, city, etc.) but email expects nested (address.line1, etc.)
     const formattedShippingAddress = {
@@ -893,23 +434,24 @@ async function handlePaymentIntentSucceeded(event: Stripe.Event): Promise<Respon
       };
     });
     
-    // Send order confirmation emails (non-blocking)
-    sendOrderEmails(newOrder.id, customerEmail, formattedItems, formattedShippingAddress, {
-      subtotal: parseFloat(metadata.subtotal || '0'),
-      shipping_cost: parseFloat(metadata.shipping_cost || '0'),
-      total_amount: paymentIntent.amount / 100,
-      readable_order_id: newOrder.readable_order_id
-    }).then(() => {
-      console.log('Order confirmation emails sent successfully');
-    }).catch(error => {
-      console.error('Failed to send order emails:', error);
-      // Don't fail the webhook if email fails - order is already created
-    });
+    // Side effects go into the outbox in the same transaction as the order,
+    // so they survive the isolate being torn down after we respond
+    const emailData: OrderEmailData = {
+      orderId,
+      customerEmail,
+      items: formattedItems,
+      shippingAddress: formattedShippingAddress,
+      orderDetails: {
+        subtotal: parseFloat(metadata.subtotal || '0'),
+        shipping_cost: parseFloat(metadata.shipping_cost || '0'),
+        total_amount: paymentIntent.amount / 100,
+        readable_order_id: readableOrderId
+      }
+    };
     
-    // Queue Printful fulfillment asynchronously (non-blocking)
     const fulfillmentData: OrderData = {
-      id: newOrder.id,
-      readable_order_id: newOrder.readable_order_id, // Add readable_order_id for external_id
+      id: orderId,
+      readable_order_id: readableOrderId, // Add readable_order_id for external_id
       customer_email: customerEmail,
       items: itemsWithPrintfulIds, // Use items with Printful IDs for fulfillment
       shipping_address: shippingAddress,
@@ -918,23 +460,40 @@ async function handlePaymentIntentSucceeded(event: Stripe.Event): Promise<Respon
       total_amount: paymentIntent.amount / 100
     };
     
-    // Don't await - let fulfillment happen asynchronously
-    createPrintfulFulfillment(fulfillmentData).then(result => {
-      if (result.success) {
-        console.log(`Printful fulfillment created successfully: ${result.printful_order_id}`);
-      } else {
-        console.error(`Printful fulfillment failed: ${result.error}`);
-      }
-    }).catch(error => {
-      console.error('Printful fulfillment exception:', error);
+    const outboxJobs: OutboxJobInput[] = [
+      { kind: 'customer_email', payload: emailData },
+      { kind: 'admin_email', payload: emailData },
+      { kind: 'printful_fulfillment', payload: fulfillmentData }
+    ];
+    
+    console.log(`\nCreating order for payment intent ${paymentIntent.id}`);
+    
+    const { data: newOrder, error: orderError } = await supabase
+      .rpc('create_order_with_outbox', { p_order: orderData, p_jobs: outboxJobs });
+      
+    if (orderError) {
+      console.error('Order creation failed:', orderError);
+      throw new Error(`Failed to create order: ${orderError.message}`);
+    }
+
+    console.log(`Order created successfully: ${newOrder.readable_order_id} (ID: ${newOrder.id}) with ${outboxJobs.length} outbox jobs`);
+
+    await recordIdempotency(supabase, orderKey, {
+      order_id: newOrder.id,
+      readable_order_id: newOrder.readable_order_id
     });
+    orderClaimed = false;
+    
+    // Drain the outbox now rather than waiting for the next scheduled run
+    EdgeRuntime.waitUntil(triggerOutboxWorker());
     
     // Mark webhook as successfully processed
     await supabase
       .from('webhook_events')
       .update({ 
         processed: true, 
-        processed_at: new Date().toISOString() 
+        processed_at: new Date().toISOString(),
+        error: null
       })
       .eq('event_id', event.id);
 
@@ -950,6 +509,11 @@ async function handlePaymentIntentSucceeded(event: Stripe.Event): Promise<Respon
     
   } catch (error) {
     console.error('Error in handlePaymentIntentSucceeded:', error);
+
+    // Let Stripe's retry claim the order again rather than wait out the claim
+    if (orderClaimed) {
+      await releaseIdempotencyKey(supabase, orderKey);
+    }
     
     // Mark webhook as failed
     await supabase
@@ -974,7 +538,8 @@ async function handleLegacyCheckoutSession(event: Stripe.Event): Promise<Respons
     .from('webhook_events')
     .update({ 
       processed: true, 
-      processed_at: new Date().toISOString() 
+      processed_at: new Date().toISOString(),
+      error: null
     })
     .eq('event_id', event.id);
   
@@ -0,0 +1,54 @@
+-- Migration: Incremental Printful sync
+-- Stores a content hash per synced product/variant so unchanged Printful data can be skipped,
+-- and records a change report for every sync run
+
+ALTER TABLE public.products
+ADD COLUMN IF NOT EXISTS printful_sync_hash text,
+ADD COLUMN IF NOT EXISTS printful_synced_at timestamptz;
+
+ALTER TABLE public.product_variants
+ADD COLUMN IF NOT EXISTS printful_sync_hash text;
+
+COMMENT ON COLUMN public.products.printful_sync_hash IS
+'SHA-256 of the Printful store product list entry at last sync; used to skip unchanged products';
+
+COMMENT ON COLUMN public.product_variants.printful_sync_hash IS
+'SHA-256 of the Printful sync variant fields we persist; used to write only changed variants';
+
+-- Incremental sync loads every Printful product in one query
+CREATE INDEX IF NOT EXISTS idx_products_printful_sync
+ON public.products(printful_product_id)
+INCLUDE (printful_sync_hash)
+WHERE printful_product_id IS NOT NULL;
+
+CREATE INDEX IF NOT EXISTS idx_product_variants_product_sync
+ON public.product_variants(product_id, printful_variant_id);
+
+-- Change report for each sync run
+CREATE TABLE IF NOT EXISTS public.printful_sync_runs (
+  id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+  source text NOT NULL,
+  mode text NOT NULL CHECK (mode IN ('incremental', 'full')),
+  status text NOT NULL DEFAULT 'success' CHECK (status IN ('success', 'failed')),
+  products_created integer DEFAULT 0,
+  products_updated integer DEFAULT 0,
+  products_unchanged integer DEFAULT 0,
+  products_deactivated integer DEFAULT 0,
+  variants_created integer DEFAULT 0,
+  variants_updated integer DEFAULT 0,
+  variants_unchanged integer DEFAULT 0,
+  variants_removed integer DEFAULT 0,
+  duration_ms integer,
+  report jsonb,
+  created_at timestamptz DEFAULT timezone('utc', now())
+);
+
+CREATE INDEX IF NOT EXISTS idx_printful_sync_runs_created_at ON public.printful_sync_runs(created_at DESC);
+
+ALTER TABLE public.printful_sync_runs ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Users can view printful sync runs" ON public.printful_sync_runs
+  FOR SELECT USING (auth.role() = 'authenticated');
+
+GRANT SELECT ON public.printful_sync_runs TO authenticated;
+GRANT ALL ON public.printful_sync_runs TO service_role;
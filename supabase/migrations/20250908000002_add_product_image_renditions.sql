@@ -0,0 +1,12 @@
+-- Migration: Responsive image renditions
+-- Records fixed-width renditions (320/640/960/1280) per product image at ingestion time
+-- so the storefront can serve srcset instead of full-size Printful mockups
+
+ALTER TABLE public.product_images
+ADD COLUMN IF NOT EXISTS renditions jsonb NOT NULL DEFAULT '[]'::jsonb;
+
+COMMENT ON COLUMN public.product_images.renditions IS
+'Array of { width, url } renditions generated through Supabase Storage image transformation (served as WebP when the browser accepts it). Empty when transformation is disabled.';
+
+-- No backfill: render URLs only work where Storage image transformation is enabled, so
+-- existing rows stay empty and the storefront derives renditions itself when it is
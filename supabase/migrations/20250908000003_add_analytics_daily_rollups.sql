@@ -0,0 +1,176 @@
+-- Migration: Daily analytics rollups for the admin dashboard
+-- Keeps per-day order count, revenue and new customer totals up to date with triggers,
+-- so admin-analytics reads a few hundred rollup rows instead of every order
+
+-- up
+
+-- 1. Rollup table (one row per UTC day)
+CREATE TABLE IF NOT EXISTS public.analytics_daily_rollups (
+  day date PRIMARY KEY,
+  order_count integer NOT NULL DEFAULT 0,
+  revenue numeric NOT NULL DEFAULT 0,
+  new_customers integer NOT NULL DEFAULT 0,
+  updated_at timestamptz DEFAULT timezone('utc', now())
+);
+
+ALTER TABLE public.analytics_daily_rollups ENABLE ROW LEVEL SECURITY;
+
+-- Read through the SECURITY DEFINER functions below only
+GRANT ALL ON public.analytics_daily_rollups TO service_role;
+
+-- 2. Helper to apply a delta to a day
+CREATE OR REPLACE FUNCTION public.bump_analytics_daily_rollup(
+  p_day date,
+  p_orders integer,
+  p_revenue numeric,
+  p_customers integer
+)
+RETURNS void AS $$
+BEGIN
+  IF p_day IS NULL THEN
+    RETURN;
+  END IF;
+
+  INSERT INTO public.analytics_daily_rollups (day, order_count, revenue, new_customers)
+  VALUES (p_day, p_orders, p_revenue, p_customers)
+  ON CONFLICT (day) DO UPDATE SET
+    order_count = public.analytics_daily_rollups.order_count + EXCLUDED.order_count,
+    revenue = public.analytics_daily_rollups.revenue + EXCLUDED.revenue,
+    new_customers = public.analytics_daily_rollups.new_customers + EXCLUDED.new_customers,
+    updated_at = timezone('utc', now());
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+-- 3. Keep rollups in sync with orders
+CREATE OR REPLACE FUNCTION public.orders_analytics_rollup_trigger()
+RETURNS TRIGGER AS $$
+BEGIN
+  IF TG_OP IN ('UPDATE', 'DELETE') THEN
+    PERFORM public.bump_analytics_daily_rollup(
+      (OLD.created_at AT TIME ZONE 'utc')::date, -1, -COALESCE(OLD.total_amount, 0), 0
+    );
+  END IF;
+
+  IF TG_OP IN ('INSERT', 'UPDATE') THEN
+    PERFORM public.bump_analytics_daily_rollup(
+      (NEW.created_at AT TIME ZONE 'utc')::date, 1, COALESCE(NEW.total_amount, 0), 0
+    );
+  END IF;
+
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+DROP TRIGGER IF EXISTS orders_analytics_rollup ON public.orders;
+CREATE TRIGGER orders_analytics_rollup
+  AFTER INSERT OR DELETE OR UPDATE OF total_amount, created_at ON public.orders
+  FOR EACH ROW
+  EXECUTE FUNCTION public.orders_analytics_rollup_trigger();
+
+-- 4. Keep rollups in sync with customer profiles
+CREATE OR REPLACE FUNCTION public.customers_analytics_rollup_trigger()
+RETURNS TRIGGER AS $$
+BEGIN
+  IF TG_OP = 'DELETE' THEN
+    PERFORM public.bump_analytics_daily_rollup((OLD.created_at AT TIME ZONE 'utc')::date, 0, 0, -1);
+  ELSE
+    PERFORM public.bump_analytics_daily_rollup((NEW.created_at AT TIME ZONE 'utc')::date, 0, 0, 1);
+  END IF;
+
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+DROP TRIGGER IF EXISTS customers_analytics_rollup ON public.customer_profiles;
+CREATE TRIGGER customers_analytics_rollup
+  AFTER INSERT OR DELETE ON public.customer_profiles
+  FOR EACH ROW
+  EXECUTE FUNCTION public.customers_analytics_rollup_trigger();
+
+-- 5. Backfill from existing history
+TRUNCATE public.analytics_daily_rollups;
+
+INSERT INTO public.analytics_daily_rollups (day, order_count, revenue, new_customers)
+SELECT day, SUM(order_count), SUM(revenue), SUM(new_customers)
+FROM (
+  SELECT (created_at AT TIME ZONE 'utc')::date AS day, COUNT(*) AS order_count,
+         COALESCE(SUM(total_amount), 0) AS revenue, 0 AS new_customers
+  FROM public.orders
+  GROUP BY 1
+  UNION ALL
+  SELECT (created_at AT TIME ZONE 'utc')::date AS day, 0, 0, COUNT(*)
+  FROM public.customer_profiles
+  GROUP BY 1
+) history
+WHERE day IS NOT NULL
+GROUP BY day;
+
+-- 6. Dashboard read functions (admin only)
+CREATE OR REPLACE FUNCTION public.get_dashboard_rollup_stats()
+RETURNS jsonb AS $$
+DECLARE
+  result jsonb;
+BEGIN
+  IF NOT EXISTS (
+    SELECT 1 FROM public.admin_roles WHERE user_id = auth.uid() AND is_active = true
+  ) THEN
+    RAISE EXCEPTION 'Admin access required';
+  END IF;
+
+  SELECT jsonb_build_object(
+    'totalOrders', COALESCE(SUM(order_count), 0),
+    'totalRevenue', COALESCE(SUM(revenue), 0),
+    'totalCustomers', COALESCE(SUM(new_customers), 0),
+    'averageOrderValue', CASE WHEN COALESCE(SUM(order_count), 0) > 0
+                              THEN SUM(revenue) / SUM(order_count)
+                              ELSE 0 END
+  ) INTO result
+  FROM public.analytics_daily_rollups;
+
+  RETURN result;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER STABLE;
+
+CREATE OR REPLACE FUNCTION public.get_monthly_rollups(p_start_date date)
+RETURNS TABLE (
+  month_start date,
+  order_count bigint,
+  revenue numeric,
+  average_order_value numeric,
+  new_customers bigint
+) AS $$
+BEGIN
+  IF NOT EXISTS (
+    SELECT 1 FROM public.admin_roles WHERE user_id = auth.uid() AND is_active = true
+  ) THEN
+    RAISE EXCEPTION 'Admin access required';
+  END IF;
+
+  RETURN QUERY
+  SELECT
+    date_trunc('month', r.day)::date AS month_start,
+    SUM(r.order_count)::bigint AS order_count,
+    SUM(r.revenue) AS revenue,
+    CASE WHEN SUM(r.order_count) > 0 THEN SUM(r.revenue) / SUM(r.order_count) ELSE 0 END AS average_order_value,
+    SUM(r.new_customers)::bigint AS new_customers
+  FROM public.analytics_daily_rollups r
+  WHERE r.day >= p_start_date
+  GROUP BY 1
+  ORDER BY 1;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER STABLE;
+
+REVOKE EXECUTE ON FUNCTION public.bump_analytics_daily_rollup(date, integer, numeric, integer) FROM PUBLIC, anon, authenticated;
+
+GRANT EXECUTE ON FUNCTION public.get_dashboard_rollup_stats() TO authenticated;
+GRANT EXECUTE ON FUNCTION public.get_monthly_rollups(date) TO authenticated;
+
+-- down
+-- DROP FUNCTION IF EXISTS public.get_monthly_rollups(date);
+-- DROP FUNCTION IF EXISTS public.get_dashboard_rollup_stats();
+-- DROP TRIGGER IF EXISTS customers_analytics_rollup ON public.customer_profiles;
+-- DROP TRIGGER IF EXISTS orders_analytics_rollup ON public.orders;
+-- DROP FUNCTION IF EXISTS public.customers_analytics_rollup_trigger();
+-- DROP FUNCTION IF EXISTS public.orders_analytics_rollup_trigger();
+-- DROP FUNCTION IF EXISTS public.bump_analytics_daily_rollup(date, integer, numeric, integer);
+-- DROP TABLE IF EXISTS public.analytics_daily_rollups;
@@ -0,0 +1,98 @@
+-- Migration: Keyset pagination and server-side filtering for admin orders/customers
+-- Composite (created_at, id) indexes back the cursor queries in admin-orders and admin-customers,
+-- trigram indexes back the ILIKE search, and order aggregates are computed per page in one call.
+-- customer_profiles has no email column; emails live in auth.users and are read through the functions below
+
+-- up
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- 1. Keyset indexes
+CREATE INDEX IF NOT EXISTS idx_orders_created_at_id
+ON public.orders(created_at DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_orders_status_created_at_id
+ON public.orders(status, created_at DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_orders_user_id_created_at
+ON public.orders(user_id, created_at DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_customer_profiles_created_at_id
+ON public.customer_profiles(created_at DESC, id DESC);
+
+-- 2. Search indexes (ILIKE '%term%')
+CREATE INDEX IF NOT EXISTS idx_orders_customer_email_trgm
+ON public.orders USING gin (customer_email gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_orders_readable_order_id_trgm
+ON public.orders USING gin (readable_order_id gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_customer_profiles_first_name_trgm
+ON public.customer_profiles USING gin (first_name gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_customer_profiles_last_name_trgm
+ON public.customer_profiles USING gin (last_name gin_trgm_ops);
+
+-- 3. Email and order aggregates for a page of customers, keyed by user_id (admin only)
+CREATE OR REPLACE FUNCTION public.get_customer_order_aggregates(p_user_ids uuid[])
+RETURNS TABLE (
+  user_id uuid,
+  email text,
+  order_count bigint,
+  total_spent numeric,
+  last_order_at timestamptz
+) AS $$
+BEGIN
+  IF NOT EXISTS (
+    SELECT 1 FROM public.admin_roles ar WHERE ar.user_id = auth.uid() AND ar.is_active = true
+  ) THEN
+    RAISE EXCEPTION 'Admin access required';
+  END IF;
+
+  RETURN QUERY
+  SELECT
+    ids.user_id,
+    u.email::text AS email,
+    COUNT(o.id)::bigint AS order_count,
+    COALESCE(SUM(o.total_amount), 0)::numeric AS total_spent,
+    MAX(o.created_at)::timestamptz AS last_order_at
+  FROM unnest(p_user_ids) AS ids(user_id)
+  LEFT JOIN auth.users u ON u.id = ids.user_id
+  LEFT JOIN public.orders o ON o.user_id = ids.user_id
+  GROUP BY ids.user_id, u.email;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER STABLE SET search_path = public;
+
+-- 4. Users whose email matches an ILIKE pattern, for the customer email filter and search (admin only)
+CREATE OR REPLACE FUNCTION public.find_user_ids_by_email(p_pattern text, p_limit integer DEFAULT 100)
+RETURNS TABLE (user_id uuid) AS $$
+BEGIN
+  IF NOT EXISTS (
+    SELECT 1 FROM public.admin_roles ar WHERE ar.user_id = auth.uid() AND ar.is_active = true
+  ) THEN
+    RAISE EXCEPTION 'Admin access required';
+  END IF;
+
+  RETURN QUERY
+  SELECT u.id
+  FROM auth.users u
+  WHERE u.email ILIKE p_pattern
+  ORDER BY u.created_at DESC
+  LIMIT LEAST(GREATEST(p_limit, 1), 500);
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER STABLE SET search_path = public;
+
+GRANT EXECUTE ON FUNCTION public.get_customer_order_aggregates(uuid[]) TO authenticated;
+GRANT EXECUTE ON FUNCTION public.find_user_ids_by_email(text, integer) TO authenticated;
+
+-- down
+-- DROP FUNCTION IF EXISTS public.find_user_ids_by_email(text, integer);
+-- DROP FUNCTION IF EXISTS public.get_customer_order_aggregates(uuid[]);
+-- DROP INDEX IF EXISTS idx_customer_profiles_last_name_trgm;
+-- DROP INDEX IF EXISTS idx_customer_profiles_first_name_trgm;
+-- DROP INDEX IF EXISTS idx_orders_readable_order_id_trgm;
+-- DROP INDEX IF EXISTS idx_orders_customer_email_trgm;
+-- DROP INDEX IF EXISTS idx_customer_profiles_created_at_id;
+-- DROP INDEX IF EXISTS idx_orders_user_id_created_at;
+-- DROP INDEX IF EXISTS idx_orders_status_created_at_id;
+-- DROP INDEX IF EXISTS idx_orders_created_at_id;
@@ -0,0 +1,50 @@
+-- Migration: Catalog version counters
+-- Bumped by statement-level triggers whenever variants change, so edge function isolates
+-- can keep warm in-memory price indexes and drop them as soon as the catalog moves
+
+-- up
+
+CREATE TABLE IF NOT EXISTS public.catalog_versions (
+  scope text PRIMARY KEY,
+  version bigint NOT NULL DEFAULT 0,
+  updated_at timestamptz DEFAULT timezone('utc', now())
+);
+
+ALTER TABLE public.catalog_versions ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Enable read access for all users" ON public.catalog_versions
+  FOR SELECT USING (true);
+
+GRANT SELECT ON public.catalog_versions TO anon, authenticated;
+GRANT ALL ON public.catalog_versions TO service_role;
+
+INSERT INTO public.catalog_versions (scope, version)
+VALUES ('product_variants', 1)
+ON CONFLICT (scope) DO NOTHING;
+
+-- One bump per statement, so a bulk sync costs a single counter update
+CREATE OR REPLACE FUNCTION public.bump_catalog_version()
+RETURNS TRIGGER AS $$
+BEGIN
+  INSERT INTO public.catalog_versions (scope, version)
+  VALUES (TG_ARGV[0], 1)
+  ON CONFLICT (scope) DO UPDATE SET
+    version = public.catalog_versions.version + 1,
+    updated_at = timezone('utc', now());
+
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+DROP TRIGGER IF EXISTS product_variants_catalog_version ON public.product_variants;
+CREATE TRIGGER product_variants_catalog_version
+  AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON public.product_variants
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION public.bump_catalog_version('product_variants');
+
+REVOKE EXECUTE ON FUNCTION public.bump_catalog_version() FROM PUBLIC, anon, authenticated;
+
+-- down
+-- DROP TRIGGER IF EXISTS product_variants_catalog_version ON public.product_variants;
+-- DROP FUNCTION IF EXISTS public.bump_catalog_version();
+-- DROP TABLE IF EXISTS public.catalog_versions;
@@ -0,0 +1,49 @@
+-- Migration: Bulk variant candidates for order creation
+-- stripe-webhook2 loads every variant that could match an order's items in one call
+-- and resolves items in memory, instead of a cascade of queries per item
+
+-- up
+
+CREATE INDEX IF NOT EXISTS idx_product_variants_value
+ON public.product_variants(value);
+
+CREATE INDEX IF NOT EXISTS idx_product_variants_lower_color
+ON public.product_variants(lower(color));
+
+CREATE INDEX IF NOT EXISTS idx_products_name
+ON public.products(name);
+
+CREATE OR REPLACE FUNCTION public.get_order_variant_candidates(
+  p_variant_ids uuid[],
+  p_printful_variant_ids text[],
+  p_values text[],
+  p_product_names text[],
+  p_colors text[]
+)
+RETURNS TABLE (
+  id uuid,
+  product_id uuid,
+  product_name text,
+  printful_variant_id text,
+  size text,
+  color text,
+  value text
+) AS $$
+  SELECT v.id, v.product_id, p.name::text, v.printful_variant_id, v.size, v.color, v.value
+  FROM public.product_variants v
+  JOIN public.products p ON p.id = v.product_id
+  WHERE v.id = ANY(p_variant_ids)
+     OR v.printful_variant_id = ANY(p_printful_variant_ids)
+     OR v.value = ANY(p_values)
+     OR p.name = ANY(p_product_names)
+     OR lower(v.color) = ANY(p_colors);
+$$ LANGUAGE sql STABLE SECURITY DEFINER;
+
+REVOKE EXECUTE ON FUNCTION public.get_order_variant_candidates(uuid[], text[], text[], text[], text[]) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.get_order_variant_candidates(uuid[], text[], text[], text[], text[]) TO service_role;
+
+-- down
+-- DROP FUNCTION IF EXISTS public.get_order_variant_candidates(uuid[], text[], text[], text[], text[]);
+-- DROP INDEX IF EXISTS idx_products_name;
+-- DROP INDEX IF EXISTS idx_product_variants_lower_color;
+-- DROP INDEX IF EXISTS idx_product_variants_value;
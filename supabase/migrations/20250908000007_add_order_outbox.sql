@@ -0,0 +1,146 @@
+-- Migration: Transactional outbox for post-payment side effects
+-- stripe-webhook2 writes the order and its email/fulfilment jobs in one transaction;
+-- order-outbox-worker drains the jobs with retries, backoff and bounded concurrency
+
+-- up
+
+-- 1. Outbox table
+CREATE TABLE IF NOT EXISTS public.order_outbox (
+  id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+  order_id uuid NOT NULL REFERENCES public.orders(id) ON DELETE CASCADE,
+  kind text NOT NULL CHECK (kind IN ('customer_email', 'admin_email', 'printful_fulfillment')),
+  payload jsonb NOT NULL DEFAULT '{}'::jsonb,
+  status text NOT NULL DEFAULT 'pending' CHECK (status IN ('pending', 'processing', 'done', 'failed')),
+  attempts integer NOT NULL DEFAULT 0,
+  max_attempts integer NOT NULL DEFAULT 8,
+  available_at timestamptz NOT NULL DEFAULT timezone('utc', now()),
+  locked_until timestamptz,
+  last_error text,
+  created_at timestamptz DEFAULT timezone('utc', now()),
+  processed_at timestamptz,
+  UNIQUE (order_id, kind)
+);
+
+-- Worker scans only due, unfinished jobs
+CREATE INDEX IF NOT EXISTS idx_order_outbox_due
+ON public.order_outbox(available_at)
+WHERE status IN ('pending', 'processing');
+
+ALTER TABLE public.order_outbox ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Admins can view order outbox" ON public.order_outbox
+  FOR SELECT USING (
+    EXISTS (
+      SELECT 1 FROM public.admin_roles WHERE user_id = auth.uid() AND is_active = true
+    )
+  );
+
+GRANT SELECT ON public.order_outbox TO authenticated;
+GRANT ALL ON public.order_outbox TO service_role;
+
+-- 2. Create an order and its outbox jobs atomically
+CREATE OR REPLACE FUNCTION public.create_order_with_outbox(p_order jsonb, p_jobs jsonb)
+RETURNS jsonb AS $$
+DECLARE
+  v_order public.orders%ROWTYPE;
+BEGIN
+  INSERT INTO public.orders (
+    id, stripe_payment_intent_id, customer_email, user_id, readable_order_id, order_number,
+    status, total_amount, currency, items, shipping_address, shipping_cost, subtotal,
+    guest_checkout, created_at
+  )
+  SELECT
+    COALESCE(r.id, gen_random_uuid()), r.stripe_payment_intent_id, r.customer_email, r.user_id,
+    r.readable_order_id, r.order_number, r.status, r.total_amount, r.currency, r.items,
+    r.shipping_address, r.shipping_cost, r.subtotal, r.guest_checkout,
+    COALESCE(r.created_at, timezone('utc', now()))
+  FROM jsonb_populate_record(NULL::public.orders, p_order) r
+  RETURNING * INTO v_order;
+
+  INSERT INTO public.order_outbox (order_id, kind, payload)
+  SELECT v_order.id, job->>'kind', COALESCE(job->'payload', '{}'::jsonb)
+  FROM jsonb_array_elements(COALESCE(p_jobs, '[]'::jsonb)) job;
+
+  RETURN jsonb_build_object('id', v_order.id, 'readable_order_id', v_order.readable_order_id);
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+-- 3. Claim due jobs for a worker run
+-- A job is only claimed while it has attempts left. One whose worker died during its final
+-- attempt is dead-lettered here, since failOutboxJob never ran for it
+CREATE OR REPLACE FUNCTION public.claim_order_outbox_jobs(p_limit integer, p_lease_seconds integer)
+RETURNS SETOF public.order_outbox AS $$
+BEGIN
+  UPDATE public.order_outbox
+  SET status = 'failed',
+      locked_until = NULL,
+      last_error = COALESCE(last_error, 'Lease expired during the final attempt')
+  WHERE status IN ('pending', 'processing')
+    AND attempts >= max_attempts
+    AND (status = 'pending' OR locked_until < timezone('utc', now()));
+
+  RETURN QUERY
+  UPDATE public.order_outbox o
+  SET status = 'processing',
+      attempts = o.attempts + 1,
+      locked_until = timezone('utc', now()) + make_interval(secs => p_lease_seconds)
+  WHERE o.id IN (
+    SELECT id FROM public.order_outbox
+    WHERE available_at <= timezone('utc', now())
+      AND attempts < max_attempts
+      AND (
+        status = 'pending'
+        -- Reclaim jobs whose worker died mid-run
+        OR (status = 'processing' AND locked_until < timezone('utc', now()))
+      )
+    ORDER BY available_at
+    LIMIT p_limit
+    FOR UPDATE SKIP LOCKED
+  )
+  RETURNING o.*;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+REVOKE EXECUTE ON FUNCTION public.create_order_with_outbox(jsonb, jsonb) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION public.claim_order_outbox_jobs(integer, integer) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.create_order_with_outbox(jsonb, jsonb) TO service_role;
+GRANT EXECUTE ON FUNCTION public.claim_order_outbox_jobs(integer, integer) TO service_role;
+
+-- 4. Scheduled drain. The webhook triggers the worker right after each order; this schedule is
+-- what retries failed and timed-out jobs once their backoff is up. It runs every minute but only
+-- calls the worker while a job is due. The project URL and service role key are read from Vault
+-- (secrets 'project_url' and 'service_role_key'), so nothing secret lives in the migration.
+-- Skipped with a notice where pg_cron/pg_net aren't enabled (e.g. a bare local database)
+DO $do$
+BEGIN
+  IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron')
+     AND EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_net')
+     AND EXISTS (SELECT 1 FROM pg_namespace WHERE nspname = 'vault') THEN
+    PERFORM cron.schedule('drain-order-outbox', '* * * * *', $cron$
+      SELECT net.http_post(
+        url := (SELECT decrypted_secret FROM vault.decrypted_secrets WHERE name = 'project_url')
+               || '/functions/v1/order-outbox-worker',
+        headers := jsonb_build_object(
+          'Content-Type', 'application/json',
+          'Authorization', 'Bearer ' || (SELECT decrypted_secret FROM vault.decrypted_secrets WHERE name = 'service_role_key')
+        ),
+        body := '{}'::jsonb
+      )
+      WHERE EXISTS (
+        SELECT 1 FROM public.order_outbox
+        WHERE available_at <= timezone('utc', now())
+          AND attempts < max_attempts
+          AND (status = 'pending' OR (status = 'processing' AND locked_until < timezone('utc', now())))
+      );
+    $cron$);
+  ELSE
+    RAISE NOTICE 'pg_cron, pg_net or vault not available - order outbox drain not scheduled';
+  END IF;
+END
+$do$;
+
+-- down
+-- SELECT cron.unschedule('drain-order-outbox');
+-- DROP FUNCTION IF EXISTS public.claim_order_outbox_jobs(integer, integer);
+-- DROP FUNCTION IF EXISTS public.create_order_with_outbox(jsonb, jsonb);
+-- DROP TABLE IF EXISTS public.order_outbox;
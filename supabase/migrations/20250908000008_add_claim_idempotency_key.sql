@@ -0,0 +1,36 @@
+-- Migration: Atomic idempotency key claims
+-- One round trip replaces check-then-record: the key is inserted (or an expired key taken over),
+-- and if another caller already holds it the stored result is returned instead
+
+-- up
+
+CREATE OR REPLACE FUNCTION public.claim_idempotency_key(p_key text, p_ttl_seconds integer DEFAULT 86400)
+RETURNS TABLE (claimed boolean, result jsonb) AS $$
+DECLARE
+  v_id uuid;
+BEGIN
+  INSERT INTO public.idempotency_keys (key, result, created_at, expires_at)
+  VALUES (p_key, NULL, now(), now() + make_interval(secs => p_ttl_seconds))
+  ON CONFLICT (key) DO UPDATE SET
+    result = NULL,
+    created_at = EXCLUDED.created_at,
+    expires_at = EXCLUDED.expires_at
+  WHERE public.idempotency_keys.expires_at < now()
+  RETURNING id INTO v_id;
+
+  IF v_id IS NOT NULL THEN
+    RETURN QUERY SELECT true, NULL::jsonb;
+  ELSE
+    RETURN QUERY
+    SELECT false, k.result
+    FROM public.idempotency_keys k
+    WHERE k.key = p_key;
+  END IF;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+REVOKE EXECUTE ON FUNCTION public.claim_idempotency_key(text, integer) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.claim_idempotency_key(text, integer) TO service_role;
+
+-- down
+-- DROP FUNCTION IF EXISTS public.claim_idempotency_key(text, integer);
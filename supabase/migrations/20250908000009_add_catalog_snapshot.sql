@@ -0,0 +1,73 @@
+-- Migration: Single-query catalog snapshot for the merged-catalog endpoint
+-- Returns every active product with its images and available variants in one round trip, tagged with a
+-- 'catalog' version that any write to products, images or variants (including Printful sync) bumps
+
+-- up
+
+INSERT INTO public.catalog_versions (scope, version)
+VALUES ('catalog', 1)
+ON CONFLICT (scope) DO NOTHING;
+
+DROP TRIGGER IF EXISTS products_catalog_version ON public.products;
+CREATE TRIGGER products_catalog_version
+  AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON public.products
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION public.bump_catalog_version('catalog');
+
+DROP TRIGGER IF EXISTS product_images_catalog_version ON public.product_images;
+CREATE TRIGGER product_images_catalog_version
+  AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON public.product_images
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION public.bump_catalog_version('catalog');
+
+DROP TRIGGER IF EXISTS product_variants_catalog_snapshot_version ON public.product_variants;
+CREATE TRIGGER product_variants_catalog_snapshot_version
+  AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON public.product_variants
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION public.bump_catalog_version('catalog');
+
+-- Child lookups used by the snapshot
+CREATE INDEX IF NOT EXISTS idx_product_images_product_order
+ON public.product_images(product_id, image_order);
+
+CREATE INDEX IF NOT EXISTS idx_product_variants_product_color_size
+ON public.product_variants(product_id, color, size);
+
+-- Products, images and variants in one statement, so the version and rows are consistent
+CREATE OR REPLACE FUNCTION public.get_catalog_snapshot()
+RETURNS jsonb AS $$
+  SELECT jsonb_build_object(
+    'version', COALESCE((SELECT cv.version FROM public.catalog_versions cv WHERE cv.scope = 'catalog'), 0),
+    'products', COALESCE((
+      SELECT jsonb_agg(
+        to_jsonb(p) || jsonb_build_object(
+          'product_images', COALESCE((
+            SELECT jsonb_agg(to_jsonb(i) ORDER BY i.image_order NULLS LAST)
+            FROM public.product_images i
+            WHERE i.product_id = p.id
+          ), '[]'::jsonb),
+          'product_variants', COALESCE((
+            SELECT jsonb_agg(to_jsonb(v) ORDER BY v.color, v.size)
+            FROM public.product_variants v
+            WHERE v.product_id = p.id
+              AND v.is_available = true
+          ), '[]'::jsonb)
+        )
+        ORDER BY p.name
+      )
+      FROM public.products p
+      WHERE p.is_active = true
+    ), '[]'::jsonb)
+  );
+$$ LANGUAGE sql STABLE;
+
+GRANT EXECUTE ON FUNCTION public.get_catalog_snapshot() TO anon, authenticated, service_role;
+
+-- down
+-- DROP FUNCTION IF EXISTS public.get_catalog_snapshot();
+-- DROP INDEX IF EXISTS public.idx_product_variants_product_color_size;
+-- DROP INDEX IF EXISTS public.idx_product_images_product_order;
+-- DROP TRIGGER IF EXISTS product_variants_catalog_snapshot_version ON public.product_variants;
+-- DROP TRIGGER IF EXISTS product_images_catalog_version ON public.product_images;
+-- DROP TRIGGER IF EXISTS products_catalog_version ON public.products;
+-- DELETE FROM public.catalog_versions WHERE scope = 'catalog';
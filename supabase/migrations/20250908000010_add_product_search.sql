@@ -0,0 +1,349 @@
+-- Migration: Server-side product search with facets
+-- One row per storefront product (the same groups the merged catalog shows: hoodie, t-shirt,
+-- cap, then individual products) with a full-text vector, trigram-searchable text and
+-- precomputed colour/size/price aggregates. search_products() filters, ranks, paginates and
+-- returns facet counts in one call. The index is rebuilt lazily whenever the 'catalog'
+-- version moves (any product, image or variant write, including Printful sync).
+
+-- up
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- 1. Base table indexes (also back ILIKE lookups elsewhere, e.g. variant search)
+CREATE INDEX IF NOT EXISTS idx_products_search_fts
+ON public.products USING gin (
+  (setweight(to_tsvector('english', coalesce(name, '')), 'A') ||
+   setweight(to_tsvector('english', coalesce(description, '')), 'B'))
+);
+
+CREATE INDEX IF NOT EXISTS idx_products_name_trgm
+ON public.products USING gin (name gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_products_description_trgm
+ON public.products USING gin (description gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_product_variants_name_trgm
+ON public.product_variants USING gin (name gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_product_variants_value_trgm
+ON public.product_variants USING gin (value gin_trgm_ops);
+
+-- 2. Storefront grouping. Keep in sync with MERGE_RULES in supabase/functions/_shared/catalog-merge.ts
+CREATE OR REPLACE FUNCTION public.catalog_group_key(p_name text, p_id uuid)
+RETURNS text AS $$
+  SELECT CASE
+    WHEN lower(p_name) LIKE '%hoodie%' THEN 'hoodie'
+    WHEN lower(p_name) LIKE '%t-shirt%' OR lower(p_name) LIKE '%tshirt%' THEN 'tshirt'
+    WHEN lower(p_name) LIKE '%cap%' OR lower(p_name) LIKE '%hat%' THEN 'cap'
+    ELSE 'individual-' || p_id::text
+  END;
+$$ LANGUAGE sql IMMUTABLE;
+
+CREATE OR REPLACE FUNCTION public.catalog_group_name(p_group_key text, p_name text)
+RETURNS text AS $$
+  SELECT CASE p_group_key
+    WHEN 'hoodie' THEN 'LVN Clothing Hoodie'
+    WHEN 'tshirt' THEN 'LVN Clothing T-Shirt'
+    WHEN 'cap' THEN 'LVN Clothing Cap'
+    ELSE p_name
+  END;
+$$ LANGUAGE sql IMMUTABLE;
+
+-- Shop page category for a storefront product (mirrors getCategoryForProduct in ShopPage)
+CREATE OR REPLACE FUNCTION public.catalog_shop_category(p_name text, p_category text)
+RETURNS text AS $$
+  SELECT CASE
+    WHEN lower(p_name) ~ '(hoodie|t-shirt|tshirt|cap|hat)' THEN 'apparel'
+    WHEN lower(p_name) ~ '(mug|keychain|tote|bottle|pad|mouse)' THEN 'gear'
+    WHEN lower(coalesce(p_category, '')) LIKE '%apparel%' THEN 'apparel'
+    ELSE 'gear'
+  END;
+$$ LANGUAGE sql IMMUTABLE;
+
+-- 3. Search index table
+CREATE TABLE IF NOT EXISTS public.product_search_index (
+  group_key text PRIMARY KEY,
+  product_ids uuid[] NOT NULL,
+  name text NOT NULL,
+  description text,
+  shop_category text NOT NULL,
+  tags text[] NOT NULL DEFAULT '{}',
+  colors text[] NOT NULL DEFAULT '{}',
+  sizes text[] NOT NULL DEFAULT '{}',
+  min_price numeric(10,2) NOT NULL DEFAULT 0,
+  max_price numeric(10,2) NOT NULL DEFAULT 0,
+  variant_count integer NOT NULL DEFAULT 0,
+  search_text text NOT NULL DEFAULT '',
+  search_vector tsvector NOT NULL,
+  created_at timestamptz,
+  refreshed_at timestamptz DEFAULT timezone('utc', now())
+);
+
+CREATE INDEX IF NOT EXISTS idx_product_search_index_vector
+ON public.product_search_index USING gin (search_vector);
+
+CREATE INDEX IF NOT EXISTS idx_product_search_index_text_trgm
+ON public.product_search_index USING gin (search_text gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_product_search_index_colors
+ON public.product_search_index USING gin (colors);
+
+CREATE INDEX IF NOT EXISTS idx_product_search_index_sizes
+ON public.product_search_index USING gin (sizes);
+
+CREATE INDEX IF NOT EXISTS idx_product_search_index_tags
+ON public.product_search_index USING gin (tags);
+
+CREATE INDEX IF NOT EXISTS idx_product_search_index_category_price
+ON public.product_search_index(shop_category, min_price);
+
+ALTER TABLE public.product_search_index ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Enable read access for all users" ON public.product_search_index
+  FOR SELECT USING (true);
+
+GRANT SELECT ON public.product_search_index TO anon, authenticated;
+GRANT ALL ON public.product_search_index TO service_role;
+
+INSERT INTO public.catalog_versions (scope, version)
+VALUES ('search_index', 0)
+ON CONFLICT (scope) DO NOTHING;
+
+-- 4. Rebuild the index from the catalog
+CREATE OR REPLACE FUNCTION public.refresh_product_search_index()
+RETURNS integer AS $$
+DECLARE
+  v_catalog_version bigint;
+  v_rows integer;
+BEGIN
+  SELECT version INTO v_catalog_version FROM public.catalog_versions WHERE scope = 'catalog';
+
+  DELETE FROM public.product_search_index;
+
+  INSERT INTO public.product_search_index (
+    group_key, product_ids, name, description, shop_category, tags, colors, sizes,
+    min_price, max_price, variant_count, search_text, search_vector, created_at
+  )
+  WITH grouped AS (
+    SELECT
+      p.*,
+      public.catalog_group_key(p.name, p.id) AS group_key
+    FROM public.products p
+    -- Hidden from the shop page; same visibility rules as get_catalog_snapshot()
+    WHERE p.name NOT IN ('Reform UK Stickers', 'Reform UK Badge Set')
+      AND p.is_active = true
+  ),
+  variant_stats AS (
+    SELECT
+      g.group_key,
+      array_agg(DISTINCT v.color) FILTER (WHERE v.color IS NOT NULL) AS colors,
+      array_agg(DISTINCT v.size) FILTER (WHERE v.size IS NOT NULL) AS sizes,
+      min(v.price) FILTER (WHERE v.price > 0) AS min_price,
+      max(v.price) FILTER (WHERE v.price > 0) AS max_price,
+      count(v.id) AS variant_count
+    FROM grouped g
+    JOIN public.product_variants v ON v.product_id = g.id AND v.is_available = true
+    GROUP BY g.group_key
+  ),
+  tag_stats AS (
+    SELECT g.group_key, array_agg(DISTINCT lower(t)) AS tags
+    FROM grouped g, unnest(g.tags) t
+    GROUP BY g.group_key
+  ),
+  product_groups AS (
+    SELECT
+      g.group_key,
+      array_agg(g.id ORDER BY g.name) AS product_ids,
+      public.catalog_group_name(g.group_key, min(g.name)) AS name,
+      string_agg(g.description, ' | ' ORDER BY g.name) FILTER (WHERE g.description IS NOT NULL AND g.description <> '') AS description,
+      (array_agg(g.category ORDER BY g.name))[1] AS category,
+      string_agg(g.name, ' ' ORDER BY g.name) AS member_names,
+      min(g.created_at) AS created_at
+    FROM grouped g
+    GROUP BY g.group_key
+  )
+  SELECT
+    pg.group_key,
+    pg.product_ids,
+    pg.name,
+    pg.description,
+    public.catalog_shop_category(pg.name, pg.category),
+    coalesce(ts.tags, '{}'),
+    coalesce(vs.colors, '{}'),
+    coalesce(vs.sizes, '{}'),
+    coalesce(vs.min_price, 0),
+    coalesce(vs.max_price, 0),
+    coalesce(vs.variant_count, 0),
+    concat_ws(' ', pg.name, pg.member_names, pg.description),
+    setweight(to_tsvector('english', concat_ws(' ', pg.name, pg.member_names)), 'A') ||
+      setweight(to_tsvector('english', coalesce(pg.description, '')), 'B') ||
+      setweight(to_tsvector('simple', array_to_string(coalesce(ts.tags, '{}'), ' ')), 'C'),
+    pg.created_at
+  FROM product_groups pg
+  LEFT JOIN variant_stats vs ON vs.group_key = pg.group_key
+  LEFT JOIN tag_stats ts ON ts.group_key = pg.group_key;
+
+  GET DIAGNOSTICS v_rows = ROW_COUNT;
+
+  UPDATE public.catalog_versions
+  SET version = coalesce(v_catalog_version, 0),
+      updated_at = timezone('utc', now())
+  WHERE scope = 'search_index';
+
+  RETURN v_rows;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+-- Rebuild when the catalog has moved on; concurrent callers keep using the current rows
+CREATE OR REPLACE FUNCTION public.ensure_product_search_index()
+RETURNS void AS $$
+BEGIN
+  IF coalesce((SELECT version FROM public.catalog_versions WHERE scope = 'search_index'), -1)
+     < coalesce((SELECT version FROM public.catalog_versions WHERE scope = 'catalog'), 0)
+     AND pg_try_advisory_xact_lock(hashtext('product_search_index')) THEN
+    PERFORM public.refresh_product_search_index();
+  END IF;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+-- 5. Search with facets
+-- Facet counts for one dimension apply every other active filter, so a shopper can see
+-- how many results each alternative value would give
+CREATE OR REPLACE FUNCTION public.search_products(
+  p_query text DEFAULT NULL,
+  p_category text DEFAULT NULL,
+  p_colors text[] DEFAULT NULL,
+  p_sizes text[] DEFAULT NULL,
+  p_tags text[] DEFAULT NULL,
+  p_min_price numeric DEFAULT NULL,
+  p_max_price numeric DEFAULT NULL,
+  p_sort text DEFAULT 'relevance',
+  p_limit integer DEFAULT 24,
+  p_offset integer DEFAULT 0
+)
+RETURNS jsonb AS $$
+DECLARE
+  v_term text := nullif(btrim(p_query), '');
+  v_tsquery tsquery;
+  v_limit integer := least(greatest(coalesce(p_limit, 24), 1), 100);
+  v_offset integer := greatest(coalesce(p_offset, 0), 0);
+  v_category text := nullif(nullif(p_category, ''), 'all');
+  v_colors text[] := nullif(p_colors, '{}');
+  v_sizes text[] := nullif(p_sizes, '{}');
+  v_tags text[] := (SELECT nullif(array_agg(lower(t)), '{}') FROM unnest(p_tags) t);
+  v_result jsonb;
+BEGIN
+  PERFORM public.ensure_product_search_index();
+
+  IF v_term IS NOT NULL THEN
+    v_tsquery := websearch_to_tsquery('english', v_term);
+  END IF;
+
+  WITH matched AS (
+    SELECT
+      s.*,
+      CASE WHEN v_term IS NULL THEN 0
+        ELSE ts_rank(s.search_vector, v_tsquery) + word_similarity(v_term, s.search_text)
+      END AS rank
+    FROM public.product_search_index s
+    WHERE v_term IS NULL
+       OR s.search_vector @@ v_tsquery
+       OR s.search_text ILIKE '%' || v_term || '%'
+       -- Typo-tolerant fallback: the term is close to some word in the text
+       OR v_term <% s.search_text
+  ),
+  flagged AS (
+    SELECT
+      m.*,
+      (v_category IS NULL OR m.shop_category = v_category) AS f_category,
+      (v_colors IS NULL OR m.colors && v_colors) AS f_color,
+      (v_sizes IS NULL OR m.sizes && v_sizes) AS f_size,
+      (v_tags IS NULL OR m.tags && v_tags) AS f_tags,
+      ((p_min_price IS NULL OR m.max_price >= p_min_price)
+        AND (p_max_price IS NULL OR m.min_price <= p_max_price)) AS f_price,
+      CASE
+        WHEN m.min_price < 20 THEN '0-20'
+        WHEN m.min_price < 40 THEN '20-40'
+        WHEN m.min_price < 60 THEN '40-60'
+        ELSE '60+'
+      END AS price_bucket
+    FROM matched m
+  ),
+  results AS (
+    SELECT * FROM flagged
+    WHERE f_category AND f_color AND f_size AND f_tags AND f_price
+  ),
+  page AS (
+    SELECT * FROM results
+    ORDER BY
+      CASE WHEN p_sort = 'price-low' THEN min_price END ASC,
+      CASE WHEN p_sort = 'price-high' THEN max_price END DESC,
+      CASE WHEN p_sort = 'newest' THEN created_at END DESC NULLS LAST,
+      CASE WHEN p_sort = 'popularity' THEN variant_count END DESC,
+      rank DESC,
+      name ASC
+    LIMIT v_limit OFFSET v_offset
+  )
+  SELECT jsonb_build_object(
+    'total', (SELECT count(*) FROM results),
+    'limit', v_limit,
+    'offset', v_offset,
+    'items', coalesce((
+      SELECT jsonb_agg(jsonb_build_object(
+        'id', group_key,
+        'product_ids', product_ids,
+        'name', name,
+        'category', shop_category,
+        'colors', colors,
+        'sizes', sizes,
+        'min_price', min_price,
+        'max_price', max_price,
+        'rank', rank
+      ))
+      FROM page
+    ), '[]'::jsonb),
+    'facets', jsonb_build_object(
+      'categories', coalesce((
+        SELECT jsonb_agg(jsonb_build_object('value', shop_category, 'count', n) ORDER BY shop_category)
+        FROM (SELECT shop_category, count(*) AS n FROM flagged
+              WHERE f_color AND f_size AND f_tags AND f_price GROUP BY shop_category) c
+      ), '[]'::jsonb),
+      'colors', coalesce((
+        SELECT jsonb_agg(jsonb_build_object('value', color, 'count', n) ORDER BY n DESC, color)
+        FROM (SELECT color, count(*) AS n FROM flagged, unnest(colors) color
+              WHERE f_category AND f_size AND f_tags AND f_price GROUP BY color) c
+      ), '[]'::jsonb),
+      'sizes', coalesce((
+        SELECT jsonb_agg(jsonb_build_object('value', size, 'count', n) ORDER BY size)
+        FROM (SELECT size, count(*) AS n FROM flagged, unnest(sizes) size
+              WHERE f_category AND f_color AND f_tags AND f_price GROUP BY size) s
+      ), '[]'::jsonb),
+      'price_buckets', coalesce((
+        SELECT jsonb_agg(jsonb_build_object('value', price_bucket, 'count', n) ORDER BY min_bucket_price)
+        FROM (SELECT price_bucket, count(*) AS n, min(min_price) AS min_bucket_price FROM flagged
+              WHERE f_category AND f_color AND f_size AND f_tags GROUP BY price_bucket) b
+      ), '[]'::jsonb)
+    )
+  ) INTO v_result;
+
+  RETURN v_result;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+REVOKE EXECUTE ON FUNCTION public.refresh_product_search_index() FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION public.ensure_product_search_index() FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.refresh_product_search_index() TO service_role;
+GRANT EXECUTE ON FUNCTION public.search_products(text, text, text[], text[], text[], numeric, numeric, text, integer, integer) TO anon, authenticated, service_role;
+
+-- Build once now
+SELECT public.refresh_product_search_index();
+
+-- down
+-- DROP FUNCTION IF EXISTS public.search_products(text, text, text[], text[], text[], numeric, numeric, text, integer, integer);
+-- DROP FUNCTION IF EXISTS public.ensure_product_search_index();
+-- DROP FUNCTION IF EXISTS public.refresh_product_search_index();
+-- DROP TABLE IF EXISTS public.product_search_index;
+-- DROP FUNCTION IF EXISTS public.catalog_shop_category(text, text);
+-- DROP FUNCTION IF EXISTS public.catalog_group_name(text, text);
+-- DROP FUNCTION IF EXISTS public.catalog_group_key(text, uuid);
+-- DELETE FROM public.catalog_versions WHERE scope = 'search_index';
@@ -0,0 +1,32 @@
+-- Migration: Publish Printful sync monitoring tables over Supabase Realtime
+-- The admin PrintfulSyncMonitor subscribes to row changes instead of re-querying every table
+-- on a timer. Tables created in 20250127000006_printful_sync_monitoring.sql (sync_status was
+-- later recreated per product) are added to the supabase_realtime publication.
+
+-- up
+
+DO $$
+DECLARE
+  monitored_table text;
+BEGIN
+  IF NOT EXISTS (SELECT 1 FROM pg_publication WHERE pubname = 'supabase_realtime') THEN
+    CREATE PUBLICATION supabase_realtime;
+  END IF;
+
+  FOREACH monitored_table IN ARRAY ARRAY['sync_errors', 'inventory_changes', 'data_conflicts', 'sync_status']
+  LOOP
+    IF to_regclass(format('public.%I', monitored_table)) IS NOT NULL
+      AND NOT EXISTS (
+        SELECT 1 FROM pg_publication_tables
+        WHERE pubname = 'supabase_realtime'
+          AND schemaname = 'public'
+          AND tablename = monitored_table
+      )
+    THEN
+      EXECUTE format('ALTER PUBLICATION supabase_realtime ADD TABLE public.%I', monitored_table);
+    END IF;
+  END LOOP;
+END $$;
+
+-- down
+-- ALTER PUBLICATION supabase_realtime DROP TABLE public.sync_errors, public.inventory_changes, public.data_conflicts, public.sync_status;
@@ -0,0 +1,144 @@
+-- Migration: Transactional change sets for admin product and bundle edits
+-- The admin UI collects edits (image inserts, reorders, primary flags, bundle items, ...) client-side
+-- and commits them with one RPC. Everything applies in a single transaction behind one optimistic
+-- concurrency check on the edited product or bundle's updated_at, so saving a product with 40 images
+-- is one round trip and a concurrent save can't interleave with it.
+
+-- up
+
+CREATE OR REPLACE FUNCTION public.apply_admin_change_set(p_root jsonb, p_operations jsonb)
+RETURNS jsonb AS $$
+DECLARE
+  v_root_table text := p_root->>'table';
+  v_root_id uuid := NULLIF(p_root->>'id', '')::uuid;
+  v_expected timestamptz := NULLIF(p_root->>'version', '')::timestamptz;
+  v_current timestamptz;
+  v_version timestamptz;
+  v_operation jsonb;
+  v_op text;
+  v_table text;
+  v_values jsonb;
+  v_columns text;
+  v_select_list text;
+  v_set_list text;
+  v_unknown text;
+  v_row jsonb;
+  v_results jsonb := '[]'::jsonb;
+BEGIN
+  IF auth.role() <> 'service_role' AND NOT EXISTS (
+    SELECT 1 FROM public.admin_roles WHERE user_id = auth.uid() AND is_active = true
+  ) THEN
+    RAISE EXCEPTION 'Admin access required';
+  END IF;
+
+  IF v_root_table IS NOT NULL AND v_root_table NOT IN ('products', 'bundles') THEN
+    RAISE EXCEPTION 'Unsupported change set root: %', v_root_table;
+  END IF;
+
+  -- The one concurrency check: lock the root row and compare its version
+  IF v_root_table IS NOT NULL AND v_root_id IS NOT NULL THEN
+    EXECUTE format('SELECT updated_at FROM public.%I WHERE id = $1 FOR UPDATE', v_root_table)
+      INTO v_current
+      USING v_root_id;
+
+    IF v_expected IS NOT NULL AND v_current IS DISTINCT FROM v_expected THEN
+      RAISE EXCEPTION 'Stale change set: % % was modified at %', v_root_table, v_root_id, v_current
+        USING ERRCODE = '40001';
+    END IF;
+  END IF;
+
+  FOR v_operation IN SELECT value FROM jsonb_array_elements(COALESCE(p_operations, '[]'::jsonb))
+  LOOP
+    v_op := v_operation->>'op';
+    v_table := v_operation->>'table';
+    v_values := COALESCE(v_operation->'values', '{}'::jsonb);
+    v_row := NULL;
+
+    IF v_table NOT IN ('products', 'product_overrides', 'product_images', 'bundles',
+                       'bundle_items', 'bundle_images', 'bundle_reviews') THEN
+      RAISE EXCEPTION 'Unsupported change set table: %', v_table;
+    END IF;
+
+    IF v_op IN ('insert', 'update') THEN
+      -- Only real, writable columns may be set
+      SELECT string_agg(k.key, ', ')
+      INTO v_unknown
+      FROM jsonb_object_keys(v_values) AS k(key)
+      WHERE k.key IN ('id', 'created_at')
+         OR NOT EXISTS (
+           SELECT 1 FROM pg_attribute a
+           WHERE a.attrelid = format('public.%I', v_table)::regclass
+             AND a.attname = k.key
+             AND a.attnum > 0
+             AND NOT a.attisdropped
+         );
+
+      IF v_unknown IS NOT NULL THEN
+        RAISE EXCEPTION 'Invalid columns for %: %', v_table, v_unknown;
+      END IF;
+
+      SELECT string_agg(quote_ident(k.key), ', '),
+             string_agg(format('r.%I', k.key), ', '),
+             string_agg(format('%1$I = r.%1$I', k.key), ', ')
+      INTO v_columns, v_select_list, v_set_list
+      FROM jsonb_object_keys(v_values) AS k(key);
+    END IF;
+
+    IF v_op = 'insert' AND v_columns IS NULL THEN
+      EXECUTE format('INSERT INTO public.%1$I DEFAULT VALUES RETURNING to_jsonb(%1$I.*)', v_table)
+        INTO v_row;
+
+    ELSIF v_op = 'insert' THEN
+      EXECUTE format(
+        'INSERT INTO public.%1$I (%2$s) SELECT %3$s FROM jsonb_populate_record(NULL::public.%1$I, $1) AS r RETURNING to_jsonb(%1$I.*)',
+        v_table, v_columns, v_select_list
+      ) INTO v_row USING v_values;
+
+    ELSIF v_op = 'update' THEN
+      IF v_set_list IS NULL THEN
+        CONTINUE;
+      END IF;
+
+      EXECUTE format(
+        'UPDATE public.%1$I AS t SET %2$s FROM jsonb_populate_record(NULL::public.%1$I, $1) AS r WHERE t.id = $2 RETURNING to_jsonb(t.*)',
+        v_table, v_set_list
+      ) INTO v_row USING v_values, (v_operation->>'id')::uuid;
+
+      IF v_row IS NULL THEN
+        RAISE EXCEPTION 'Row not found: % %', v_table, v_operation->>'id'
+          USING ERRCODE = 'P0002';
+      END IF;
+
+    ELSIF v_op = 'delete' THEN
+      EXECUTE format('DELETE FROM public.%I WHERE id = $1', v_table)
+        USING (v_operation->>'id')::uuid;
+
+    ELSE
+      RAISE EXCEPTION 'Unsupported change set operation: %', v_op;
+    END IF;
+
+    v_results := v_results || jsonb_build_array(jsonb_build_object(
+      'op', v_op,
+      'table', v_table,
+      'id', COALESCE(v_row->>'id', v_operation->>'id'),
+      'ref', v_operation->'ref',
+      'row', v_row
+    ));
+  END LOOP;
+
+  -- Bump the root so the next change set has to start from this version
+  IF v_current IS NOT NULL THEN
+    EXECUTE format('UPDATE public.%I SET updated_at = now() WHERE id = $1 RETURNING updated_at', v_root_table)
+      INTO v_version
+      USING v_root_id;
+  END IF;
+
+  RETURN jsonb_build_object('version', v_version, 'results', v_results);
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+REVOKE EXECUTE ON FUNCTION public.apply_admin_change_set(jsonb, jsonb) FROM PUBLIC, anon;
+GRANT EXECUTE ON FUNCTION public.apply_admin_change_set(jsonb, jsonb) TO authenticated, service_role;
+
+-- down
+-- DROP FUNCTION IF EXISTS public.apply_admin_change_set(jsonb, jsonb);
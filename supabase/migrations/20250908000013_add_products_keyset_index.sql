@@ -0,0 +1,19 @@
+-- Migration: Keyset indexes for paged admin product loading
+-- The admin products screen loads products in (sort column, id) pages - newest first by default,
+-- or by name or price when the admin sorts the list
+
+-- up
+
+CREATE INDEX IF NOT EXISTS idx_products_created_at_id
+ON public.products(created_at DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_products_name_id
+ON public.products(name, id);
+
+CREATE INDEX IF NOT EXISTS idx_products_price_id
+ON public.products(price, id);
+
+-- down
+-- DROP INDEX IF EXISTS idx_products_price_id;
+-- DROP INDEX IF EXISTS idx_products_name_id;
+-- DROP INDEX IF EXISTS idx_products_created_at_id;
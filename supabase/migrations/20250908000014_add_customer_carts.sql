@@ -0,0 +1,62 @@
+-- Migration: Server copy of signed-in shoppers' carts
+-- The storefront keeps the cart in localStorage and syncs it here in the background, so a cart
+-- follows the shopper across devices. saved_at is the client's save time in ms; a save only
+-- lands if it's newer than the stored copy, so a stale tab can't overwrite a fresher cart.
+
+-- up
+
+CREATE TABLE IF NOT EXISTS public.customer_carts (
+  user_id uuid PRIMARY KEY REFERENCES auth.users(id) ON DELETE CASCADE,
+  schema_version integer NOT NULL DEFAULT 2,
+  items jsonb NOT NULL DEFAULT '[]'::jsonb,
+  saved_at bigint NOT NULL DEFAULT 0,
+  updated_at timestamptz DEFAULT timezone('utc', now())
+);
+
+ALTER TABLE public.customer_carts ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Users can view their own cart" ON public.customer_carts
+  FOR SELECT USING (auth.uid() = user_id);
+
+GRANT SELECT ON public.customer_carts TO authenticated;
+GRANT ALL ON public.customer_carts TO service_role;
+
+CREATE OR REPLACE FUNCTION public.save_customer_cart(
+  p_items jsonb,
+  p_saved_at bigint,
+  p_schema_version integer DEFAULT 2
+)
+RETURNS jsonb AS $$
+DECLARE
+  v_row public.customer_carts%ROWTYPE;
+BEGIN
+  IF auth.uid() IS NULL THEN
+    RAISE EXCEPTION 'Authentication required';
+  END IF;
+
+  INSERT INTO public.customer_carts AS c (user_id, schema_version, items, saved_at, updated_at)
+  VALUES (auth.uid(), p_schema_version, COALESCE(p_items, '[]'::jsonb), p_saved_at, timezone('utc', now()))
+  ON CONFLICT (user_id) DO UPDATE SET
+    schema_version = EXCLUDED.schema_version,
+    items = EXCLUDED.items,
+    saved_at = EXCLUDED.saved_at,
+    updated_at = EXCLUDED.updated_at
+  WHERE c.saved_at < EXCLUDED.saved_at;
+
+  -- Return whichever copy won, so the caller can adopt a newer cart from another device
+  SELECT * INTO v_row FROM public.customer_carts WHERE user_id = auth.uid();
+
+  RETURN jsonb_build_object(
+    'schema_version', v_row.schema_version,
+    'items', v_row.items,
+    'saved_at', v_row.saved_at
+  );
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+REVOKE EXECUTE ON FUNCTION public.save_customer_cart(jsonb, bigint, integer) FROM PUBLIC, anon;
+GRANT EXECUTE ON FUNCTION public.save_customer_cart(jsonb, bigint, integer) TO authenticated;
+
+-- down
+-- DROP FUNCTION IF EXISTS public.save_customer_cart(jsonb, bigint, integer);
+-- DROP TABLE IF EXISTS public.customer_carts;
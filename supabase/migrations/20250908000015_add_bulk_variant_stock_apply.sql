@@ -0,0 +1,77 @@
+-- Migration: Set-based stock apply for Printful stock_updated webhooks
+-- A catalog-wide stock event used to be one UPDATE per variant while Printful waited on the
+-- response. The webhook now stores the raw event, acknowledges it, and applies the whole
+-- variant_stock map with one UPDATE that only touches variants whose stock actually changed.
+
+-- up
+
+ALTER TABLE public.webhook_events ADD COLUMN IF NOT EXISTS result jsonb;
+
+-- Apply a { printful_variant_id: in_stock } map; returns the number of variants changed
+CREATE OR REPLACE FUNCTION public.apply_variant_stock(p_stock jsonb)
+RETURNS integer AS $$
+DECLARE
+  v_changed integer;
+BEGIN
+  WITH incoming AS (
+    SELECT s.key AS printful_variant_id, (s.value = 'true'::jsonb) AS in_stock
+    FROM jsonb_each(COALESCE(p_stock, '{}'::jsonb)) AS s
+  )
+  UPDATE public.product_variants pv
+  SET in_stock = i.in_stock,
+      is_available = i.in_stock
+  FROM incoming i
+  WHERE pv.printful_variant_id = i.printful_variant_id
+    AND (pv.in_stock IS DISTINCT FROM i.in_stock
+         OR pv.is_available IS DISTINCT FROM i.in_stock);
+
+  GET DIAGNOSTICS v_changed = ROW_COUNT;
+  RETURN v_changed;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- Apply a stored stock_updated event and mark it processed, in one transaction
+CREATE OR REPLACE FUNCTION public.apply_printful_stock_event(p_event_id text)
+RETURNS jsonb AS $$
+DECLARE
+  v_stock jsonb;
+  v_changed integer;
+  v_result jsonb;
+BEGIN
+  SELECT payload->'data'->'variant_stock'
+  INTO v_stock
+  FROM public.webhook_events
+  WHERE event_id = p_event_id
+  FOR UPDATE;
+
+  IF NOT FOUND THEN
+    RAISE EXCEPTION 'Webhook event not found: %', p_event_id
+      USING ERRCODE = 'P0002';
+  END IF;
+
+  v_changed := public.apply_variant_stock(v_stock);
+  v_result := jsonb_build_object(
+    'variants_received', (SELECT count(*) FROM jsonb_object_keys(COALESCE(v_stock, '{}'::jsonb))),
+    'rows_changed', v_changed
+  );
+
+  UPDATE public.webhook_events
+  SET processed = true,
+      processed_at = now(),
+      error = NULL,
+      result = v_result
+  WHERE event_id = p_event_id;
+
+  RETURN v_result;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+REVOKE EXECUTE ON FUNCTION public.apply_variant_stock(jsonb) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION public.apply_printful_stock_event(text) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.apply_variant_stock(jsonb) TO service_role;
+GRANT EXECUTE ON FUNCTION public.apply_printful_stock_event(text) TO service_role;
+
+-- down
+-- DROP FUNCTION IF EXISTS public.apply_printful_stock_event(text);
+-- DROP FUNCTION IF EXISTS public.apply_variant_stock(jsonb);
+-- ALTER TABLE public.webhook_events DROP COLUMN IF EXISTS result;
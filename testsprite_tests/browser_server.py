@@ -0,0 +1,281 @@
+"""
+Shared, pre-warmed Chromium servers for the testsprite cases.
+
+Launching Chromium is the most expensive part of a short case, and every case
+launches its own. BrowserServerPool starts one or more Playwright browser servers
+once, health-checks them in the background and restarts any that crash. Worker
+processes then connect over WebSocket instead of launching: inside
+connected_browsers(), BrowserType.launch is replaced by a connect to one of the
+running servers, so the TC*.py files run unmodified.
+
+Python Playwright has no BrowserType.launch_server, so the servers are started
+with the driver's own `launch-server` command, which prints the endpoint on start.
+
+The live endpoints are kept in a JSON file (tmp/browser-servers.json by default,
+or $TESTSPRITE_BROWSER_SERVERS), rewritten whenever a server restarts, so workers
+always pick up current endpoints. Run this file to keep servers up for every
+test process on the machine:
+
+    python testsprite_tests/browser_server.py --servers 2
+
+Or start a pool for one run, e.g. `network_matrix.py --servers 2 --workers 8`.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import queue
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from urllib.parse import urlparse
+
+from playwright import async_api
+
+TESTS_DIR = Path(__file__).resolve().parent
+ENDPOINTS_ENV = "TESTSPRITE_BROWSER_SERVERS"
+DEFAULT_ENDPOINTS_FILE = TESTS_DIR / "tmp" / "browser-servers.json"
+
+STARTUP_TIMEOUT_S = 30
+HEALTH_CHECK_INTERVAL_S = 2
+CONNECT_ATTEMPTS = 5
+
+# Same flags the cases launch with, minus --single-process, which a long-lived
+# server shouldn't use: one renderer crash would take every worker's pages down
+SERVER_ARGS = [
+    "--window-size=1280,720",
+    "--disable-dev-shm-usage",
+]
+
+
+def endpoints_file():
+    return Path(os.environ.get(ENDPOINTS_ENV) or DEFAULT_ENDPOINTS_FILE)
+
+
+def read_endpoints(path=None):
+    """Current server endpoints, or [] if no pool is running."""
+    try:
+        return json.loads((path or endpoints_file()).read_text())["endpoints"]
+    except (OSError, ValueError, KeyError):
+        return []
+
+
+def write_endpoints(path, endpoints):
+    # Write then rename, so a worker never reads a half-written file
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".browser-servers-")
+    with os.fdopen(fd, "w") as tmp:
+        json.dump({"pid": os.getpid(), "endpoints": endpoints}, tmp)
+    os.replace(tmp_path, path)
+
+
+class BrowserServer:
+    """One `playwright launch-server` process."""
+
+    def __init__(self, index, headless=True):
+        self.index = index
+        self.headless = headless
+        self.process = None
+        self.ws_endpoint = None
+        self.restarts = 0
+        self._config_path = None
+
+    def start(self):
+        fd, self._config_path = tempfile.mkstemp(prefix="pw-server-", suffix=".json")
+        with os.fdopen(fd, "w") as config:
+            json.dump({"headless": self.headless, "args": SERVER_ARGS}, config)
+
+        self.process = subprocess.Popen(
+            [sys.executable, "-m", "playwright", "launch-server", "--browser", "chromium", "--config", self._config_path],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            start_new_session=True,  # Ctrl+C in the terminal shouldn't kill servers before we stop them
+        )
+
+        # Read output on a thread so a silent server can't hang us, and keep
+        # draining it afterwards so the pipe never fills up
+        lines = queue.Queue()
+
+        def pump(stream):
+            for line in stream:
+                lines.put(line.strip())
+
+        threading.Thread(target=pump, args=(self.process.stdout,), daemon=True).start()
+
+        deadline = time.monotonic() + STARTUP_TIMEOUT_S
+        while time.monotonic() < deadline:
+            try:
+                line = lines.get(timeout=0.5)
+            except queue.Empty:
+                if self.process.poll() is not None:
+                    break
+                continue
+            if line.startswith("ws://"):
+                self.ws_endpoint = line
+                return self
+
+        self.stop()
+        raise RuntimeError(f"Browser server {self.index} did not start within {STARTUP_TIMEOUT_S}s")
+
+    def is_healthy(self):
+        if not self.process or self.process.poll() is not None or not self.ws_endpoint:
+            return False
+        url = urlparse(self.ws_endpoint)
+        try:
+            with socket.create_connection((url.hostname, url.port), timeout=1):
+                return True
+        except OSError:
+            return False
+
+    def restart(self):
+        self.stop()
+        self.restarts += 1
+        return self.start()
+
+    def stop(self):
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+        self.process = None
+        self.ws_endpoint = None
+        if self._config_path:
+            Path(self._config_path).unlink(missing_ok=True)
+            self._config_path = None
+
+
+class BrowserServerPool:
+    """
+    Start `count` browser servers for the session and keep them healthy.
+
+    Use as a context manager: servers start on entry, the endpoints file is
+    published (and exported in $TESTSPRITE_BROWSER_SERVERS for child processes),
+    and everything is stopped on exit.
+    """
+
+    def __init__(self, count=1, path=None, headless=True):
+        self.path = Path(path) if path else endpoints_file()
+        self.servers = [BrowserServer(index, headless) for index in range(count)]
+        self._stopping = threading.Event()
+        self._supervisor = None
+
+    def __enter__(self):
+        started = time.perf_counter()
+        try:
+            for server in self.servers:
+                server.start()
+        except Exception:
+            self.stop()
+            raise
+        self._publish()
+        os.environ[ENDPOINTS_ENV] = str(self.path)
+        print(f"🌐 {len(self.servers)} browser server(s) ready in {time.perf_counter() - started:.1f}s")
+
+        self._supervisor = threading.Thread(target=self._supervise, daemon=True)
+        self._supervisor.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _publish(self):
+        write_endpoints(self.path, [server.ws_endpoint for server in self.servers if server.ws_endpoint])
+
+    def _supervise(self):
+        while not self._stopping.wait(HEALTH_CHECK_INTERVAL_S):
+            for server in self.servers:
+                if self._stopping.is_set() or server.is_healthy():
+                    continue
+                print(f"⚠️ Browser server {server.index} is down, restarting")
+                try:
+                    server.restart()
+                except RuntimeError as exc:
+                    print(f"❌ {exc}")
+                self._publish()
+
+    def stop(self):
+        self._stopping.set()
+        if self._supervisor:
+            self._supervisor.join(timeout=HEALTH_CHECK_INTERVAL_S + 1)
+        for server in self.servers:
+            server.stop()
+        # Only remove the endpoints file if it's still ours
+        try:
+            owner = json.loads(self.path.read_text()).get("pid")
+        except (OSError, ValueError):
+            owner = None
+        if owner == os.getpid():
+            self.path.unlink(missing_ok=True)
+
+
+async def connect_to_server(browser_type, endpoints_path=None):
+    """
+    Connect to a running browser server, spreading workers across servers by pid.
+    Endpoints are re-read on every attempt, so a server the pool just restarted
+    is picked up instead of failing the case.
+    """
+    last_error = None
+    for attempt in range(CONNECT_ATTEMPTS):
+        endpoints = read_endpoints(endpoints_path)
+        if endpoints:
+            endpoint = endpoints[(os.getpid() + attempt) % len(endpoints)]
+            try:
+                return await browser_type.connect(endpoint, timeout=10000)
+            except async_api.Error as exc:
+                last_error = exc
+        await asyncio.sleep(HEALTH_CHECK_INTERVAL_S * (attempt + 1) / 2)
+    raise RuntimeError(f"No browser server reachable after {CONNECT_ATTEMPTS} attempts: {last_error}")
+
+
+@contextmanager
+def connected_browsers(endpoints_path=None):
+    """
+    Make chromium.launch() connect to the shared servers while active.
+    Falls back to a normal launch if no pool is running.
+    """
+    original_launch = async_api.BrowserType.launch
+
+    async def launch(browser_type, *args, **kwargs):
+        if browser_type.name != "chromium" or not read_endpoints(endpoints_path):
+            return await original_launch(browser_type, *args, **kwargs)
+        return await connect_to_server(browser_type, endpoints_path)
+
+    async_api.BrowserType.launch = launch
+    try:
+        yield
+    finally:
+        async_api.BrowserType.launch = original_launch
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Keep shared Chromium servers running for testsprite workers")
+    parser.add_argument("--servers", type=int, default=1, help="Number of browser servers")
+    parser.add_argument("--headed", action="store_true", help="Run servers with a visible browser")
+    parser.add_argument("--endpoints-file", type=Path, help=f"Where to publish endpoints (default {DEFAULT_ENDPOINTS_FILE})")
+    args = parser.parse_args(argv)
+
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+
+    with BrowserServerPool(args.servers, path=args.endpoints_file, headless=not args.headed) as pool:
+        print(f"📄 Endpoints published to {pool.path}")
+        print("Press Ctrl+C to stop")
+        try:
+            stop.wait()
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
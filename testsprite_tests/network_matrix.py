@@ -0,0 +1,386 @@
+"""
+Network-condition matrix runner for the testsprite cases.
+
+Reruns selected TC*.py cases under named network and CPU throttling profiles and
+records how long each case, and each page it loads, takes under every profile.
+Throttling is applied over CDP the same way `setNetworkConditions` does in
+tests/playwright/edge-cases-performance.spec.ts, so the profiles line up.
+
+The cases are run unmodified: Browser.new_context and BrowserContext.new_page are
+wrapped while a case runs, so every page it opens (popups included) is throttled
+before its first navigation.
+
+Usage:
+    python testsprite_tests/network_matrix.py
+    python testsprite_tests/network_matrix.py --profiles fast3g,mobile-slow3g --cases checkout
+    python testsprite_tests/network_matrix.py --repeat 3 --baseline test_results/network-matrix-previous.json
+
+Results are written to testsprite_tests/test_results/network-matrix-<timestamp>.json.
+With --baseline, the run exits non-zero if any case or page got slower than the
+baseline by more than --tolerance.
+
+--servers starts shared browser servers for the run (see browser_server.py) and
+--workers runs cases in parallel processes that connect to them. Parallel runs
+share CPU, so compare timings only between runs with the same --workers.
+--restore-db restores the database snapshot before each stateful case and keeps
+stateful cases from overlapping (see db_snapshot.py).
+"""
+
+import argparse
+import asyncio
+import json
+import runpy
+import statistics
+import sys
+import time
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import urlparse
+
+from playwright import async_api
+
+from browser_server import BrowserServerPool, connected_browsers
+
+TESTS_DIR = Path(__file__).resolve().parent
+RESULTS_DIR = TESTS_DIR / "test_results"
+
+
+@dataclass(frozen=True)
+class Profile:
+    name: str
+    download_kbps: float = -1   # -1 disables throttling, as in Network.emulateNetworkConditions
+    upload_kbps: float = -1
+    latency_ms: float = 0
+    cpu_slowdown: float = 1     # Emulation.setCPUThrottlingRate, 4 is roughly a mid-range phone
+    offline: bool = False
+    timeout_scale: float = 1    # Applied to context default timeouts so slow profiles measure rather than time out
+
+
+# Network numbers match setNetworkConditions in edge-cases-performance.spec.ts
+PROFILES = {
+    profile.name: profile
+    for profile in [
+        Profile("unthrottled"),
+        Profile("fast3g", download_kbps=1600, upload_kbps=750, latency_ms=150, timeout_scale=2),
+        Profile("slow3g", download_kbps=500, upload_kbps=500, latency_ms=400, timeout_scale=4),
+        Profile("mobile-fast3g", download_kbps=1600, upload_kbps=750, latency_ms=150, cpu_slowdown=4, timeout_scale=3),
+        Profile("mobile-slow3g", download_kbps=500, upload_kbps=500, latency_ms=400, cpu_slowdown=6, timeout_scale=6),
+        Profile("offline", offline=True),
+    ]
+}
+
+DEFAULT_PROFILES = ["unthrottled", "fast3g", "mobile-slow3g"]
+
+# Case groups that cover the flows most sensitive to slow networks
+CASE_GROUPS = {
+    "checkout": [
+        "TC011_Real_Time_Shipping_Quotes_and_Address_Validation.py",
+        "TC008_Checkout_Process_Failure_with_Invalid_Payment_Data.py",
+    ],
+    "shop": [
+        "TC005_Search_Products_by_Category_and_Filter.py",
+    ],
+    "product": [
+        "TC006_Add_and_Remove_Items_from_Cart.py",
+    ],
+}
+
+DEFAULT_CASES = ["checkout", "shop", "product"]
+
+NAVIGATION_TIMING_JS = """
+() => {
+    const [nav] = performance.getEntriesByType('navigation');
+    if (!nav) return null;
+    return {
+        ttfb: nav.responseStart,
+        domContentLoaded: nav.domContentLoadedEventEnd,
+        load: nav.loadEventEnd || performance.now(),
+        transferSize: nav.transferSize
+    };
+}
+"""
+
+
+async def apply_profile(page, profile):
+    """Throttle a page's network and CPU over CDP. Chromium only."""
+    if profile == PROFILES["unthrottled"]:
+        return
+    client = await page.context.new_cdp_session(page)
+    await client.send("Network.enable")
+    await client.send("Network.emulateNetworkConditions", {
+        "offline": profile.offline,
+        "downloadThroughput": profile.download_kbps * 1024 / 8 if profile.download_kbps > 0 else -1,
+        "uploadThroughput": profile.upload_kbps * 1024 / 8 if profile.upload_kbps > 0 else -1,
+        "latency": profile.latency_ms,
+    })
+    if profile.cpu_slowdown != 1:
+        await client.send("Emulation.setCPUThrottlingRate", {"rate": profile.cpu_slowdown})
+
+
+class CaseRecorder:
+    """Throttles every page a case opens and collects its page load timings."""
+
+    def __init__(self, profile):
+        self.profile = profile
+        self.started = time.perf_counter()
+        self.loads = []
+        self._attached = weakref.WeakKeyDictionary()
+
+    def attach(self, page):
+        """Throttle a page once, however many times it's reported. Returns the task doing it."""
+        task = self._attached.get(page)
+        if task is None:
+            task = asyncio.ensure_future(self._throttle(page))
+            self._attached[page] = task
+        return task
+
+    async def _throttle(self, page):
+        await apply_profile(page, self.profile)
+
+        async def on_load():
+            try:
+                timing = await page.evaluate(NAVIGATION_TIMING_JS)
+            except async_api.Error:
+                return  # Page closed or navigated away before we could read it
+            if timing:
+                self.loads.append({"path": urlparse(page.url).path or "/", **timing})
+
+        page.on("load", lambda _: asyncio.ensure_future(on_load()))
+
+    def on_context(self, context):
+        # Pages the case didn't open itself (target=_blank links, window.open)
+        context.on("page", self.attach)
+
+    @contextmanager
+    def installed(self):
+        recorder = self
+        original_new_context = async_api.Browser.new_context
+        original_new_page = async_api.BrowserContext.new_page
+        original_set_timeout = async_api.BrowserContext.set_default_timeout
+
+        async def new_context(browser, *args, **kwargs):
+            context = await original_new_context(browser, *args, **kwargs)
+            recorder.on_context(context)
+            return context
+
+        async def new_page(context, *args, **kwargs):
+            page = await original_new_page(context, *args, **kwargs)
+            await recorder.attach(page)
+            return page
+
+        def set_default_timeout(context, timeout):
+            return original_set_timeout(context, timeout * recorder.profile.timeout_scale)
+
+        async_api.Browser.new_context = new_context
+        async_api.BrowserContext.new_page = new_page
+        async_api.BrowserContext.set_default_timeout = set_default_timeout
+        try:
+            yield self
+        finally:
+            async_api.Browser.new_context = original_new_context
+            async_api.BrowserContext.new_page = original_new_page
+            async_api.BrowserContext.set_default_timeout = original_set_timeout
+
+
+def run_case(case_path, profile, restore_db=False):
+    """Run one TC file under a profile and return its result record."""
+    with ExitStack() as stack:
+        if restore_db:
+            # Imported here so psycopg is only needed when the database is restored
+            from db_snapshot import is_stateful, stateful_database
+            if is_stateful(case_path):
+                stack.enter_context(stateful_database())
+        return _run_case(case_path, profile)
+
+
+def _run_case(case_path, profile):
+    recorder = CaseRecorder(profile)
+    error = None
+
+    with recorder.installed():
+        try:
+            # The cases call asyncio.run(run_test()) at module level
+            runpy.run_path(str(case_path), run_name="__main__")
+        except SystemExit as exc:
+            if exc.code not in (None, 0):
+                error = f"exited with {exc.code}"
+        except Exception as exc:  # A failing case is a result, not a crash
+            error = f"{type(exc).__name__}: {exc}"
+
+    return {
+        "case": case_path.name,
+        "profile": profile.name,
+        "passed": error is None,
+        "error": error,
+        "duration_ms": round((time.perf_counter() - recorder.started) * 1000),
+        "loads": recorder.loads,
+    }
+
+
+def run_job(case_path, profile_name, restore_db=False):
+    """Worker process entry point: run a case against the shared browser servers."""
+    with connected_browsers():
+        return run_case(case_path, PROFILES[profile_name], restore_db)
+
+
+def resolve_cases(names):
+    cases = []
+    for name in names:
+        files = CASE_GROUPS.get(name, [name])
+        for file_name in files:
+            path = Path(file_name)
+            if not path.is_absolute():
+                path = TESTS_DIR / path
+            if not path.exists():
+                raise SystemExit(f"Unknown case or group: {name}")
+            if path not in cases:
+                cases.append(path)
+    return cases
+
+
+def summarize(runs):
+    """Median timings per (profile, case) and per (profile, path)."""
+    by_case = {}
+    by_path = {}
+    for run in runs:
+        by_case.setdefault((run["profile"], run["case"]), []).append(run)
+        for load in run["loads"]:
+            by_path.setdefault((run["profile"], load["path"]), []).append(load["load"])
+
+    cases = [
+        {
+            "profile": profile,
+            "case": case,
+            "runs": len(case_runs),
+            "passed": sum(run["passed"] for run in case_runs),
+            "median_ms": round(statistics.median(run["duration_ms"] for run in case_runs)),
+        }
+        for (profile, case), case_runs in by_case.items()
+    ]
+    paths = [
+        {
+            "profile": profile,
+            "path": path,
+            "loads": len(times),
+            "median_load_ms": round(statistics.median(times)),
+            "max_load_ms": round(max(times)),
+        }
+        for (profile, path), times in by_path.items()
+    ]
+    return {"cases": cases, "paths": paths}
+
+
+def find_regressions(summary, baseline, tolerance):
+    regressions = []
+
+    previous_cases = {(c["profile"], c["case"]): c["median_ms"] for c in baseline["summary"]["cases"]}
+    for case in summary["cases"]:
+        before = previous_cases.get((case["profile"], case["case"]))
+        if before and case["median_ms"] > before * (1 + tolerance):
+            regressions.append(f"{case['profile']} {case['case']}: {before}ms -> {case['median_ms']}ms")
+
+    previous_paths = {(p["profile"], p["path"]): p["median_load_ms"] for p in baseline["summary"]["paths"]}
+    for path in summary["paths"]:
+        before = previous_paths.get((path["profile"], path["path"]))
+        if before and path["median_load_ms"] > before * (1 + tolerance):
+            regressions.append(f"{path['profile']} {path['path']} load: {before}ms -> {path['median_load_ms']}ms")
+
+    return regressions
+
+
+def print_summary(summary):
+    print("\n📊 Case timings (median)")
+    for case in sorted(summary["cases"], key=lambda c: (c["case"], c["profile"])):
+        print(f"  {case['profile']:<15} {case['median_ms']:>8}ms  {case['passed']}/{case['runs']} passed  {case['case']}")
+
+    print("\n📊 Page loads (median / max)")
+    for path in sorted(summary["paths"], key=lambda p: (p["path"], p["profile"])):
+        print(f"  {path['profile']:<15} {path['median_load_ms']:>8}ms / {path['max_load_ms']:>6}ms  {path['path']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rerun testsprite cases under network and CPU throttling profiles")
+    parser.add_argument("--profiles", default=",".join(DEFAULT_PROFILES),
+                        help=f"Comma-separated profiles: {', '.join(PROFILES)}")
+    parser.add_argument("--cases", default=",".join(DEFAULT_CASES),
+                        help=f"Comma-separated case groups ({', '.join(CASE_GROUPS)}) or TC file names")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per case and profile")
+    parser.add_argument("--baseline", type=Path, help="Earlier results file to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed slowdown against the baseline, as a fraction (default 0.25)")
+    parser.add_argument("--output", type=Path, help="Where to write results")
+    parser.add_argument("--servers", type=int, default=0,
+                        help="Start this many shared browser servers instead of launching Chromium per case")
+    parser.add_argument("--workers", type=int, default=1, help="Parallel worker processes (needs --servers)")
+    parser.add_argument("--restore-db", action="store_true",
+                        help="Restore the database snapshot before each stateful case (see db_snapshot.py)")
+    args = parser.parse_args(argv)
+
+    unknown = [name for name in args.profiles.split(",") if name not in PROFILES]
+    if unknown:
+        parser.error(f"Unknown profile(s): {', '.join(unknown)}")
+    profiles = [PROFILES[name] for name in args.profiles.split(",")]
+    cases = resolve_cases(args.cases.split(","))
+    if args.workers > 1 and not args.servers:
+        parser.error("--workers needs --servers")
+
+    jobs = [
+        (case_path, profile.name)
+        for profile in profiles
+        for case_path in cases
+        for _ in range(args.repeat)
+    ]
+
+    def report(result):
+        status = "✅" if result["passed"] else f"❌ {result['error']}"
+        print(f"▶ {result['profile']} {result['case']}: {result['duration_ms']}ms {status}")
+
+    runs = []
+    with ExitStack() as stack:
+        if args.servers:
+            stack.enter_context(BrowserServerPool(args.servers))
+
+        if args.workers > 1:
+            with ProcessPoolExecutor(max_workers=args.workers) as executor:
+                futures = [executor.submit(run_job, *job, args.restore_db) for job in jobs]
+                for future in futures:
+                    runs.append(future.result())
+                    report(runs[-1])
+        else:
+            if args.servers:
+                stack.enter_context(connected_browsers())
+            for case_path, profile_name in jobs:
+                runs.append(run_case(case_path, PROFILES[profile_name], args.restore_db))
+                report(runs[-1])
+
+    summary = summarize(runs)
+    print_summary(summary)
+
+    output = args.output or RESULTS_DIR / f"network-matrix-{datetime.now():%Y%m%d-%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "profiles": [asdict(profile) for profile in profiles],
+        "runs": runs,
+        "summary": summary,
+    }, indent=2))
+    print(f"\n💾 Results written to {output}")
+
+    if args.baseline:
+        regressions = find_regressions(summary, json.loads(args.baseline.read_text()), args.tolerance)
+        if regressions:
+            print(f"\n⚠️ {len(regressions)} regression(s) beyond {args.tolerance:.0%} of baseline:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print("\n✅ No regressions against baseline")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,531 @@
+"""
+Bulk synthetic catalog, customer and order data for benchmarks and load tests.
+
+The seed data is a handful of rows, which hides anything that scales with the
+catalog or order history (admin-analytics, admin-customers, getProducts()). This
+fills the local database at the size we expect in two years, through COPY:
+
+    python testsprite_tests/synthetic_data.py generate --scale two-year
+    python testsprite_tests/synthetic_data.py generate --scale small      # quick local run
+    python testsprite_tests/synthetic_data.py purge
+
+The data is shaped like real traffic rather than uniform noise:
+- product popularity follows a Zipf curve, so a few products dominate orders
+- a minority of customers place most repeat orders, and some orders are guest checkouts
+- shipping postcodes follow UK population by postcode area, in valid GB format
+- order volume grows over the period and peaks at weekends
+
+Only columns that exist in the target table are written, so the generator keeps
+working as the schema moves. Row triggers are skipped while loading (the same
+session_replication_role switch db_snapshot.py uses), then the analytics rollups
+are rebuilt and catalog versions bumped in one pass each.
+
+Every generated id starts with SYNTHETIC_ID_PREFIX, which is how purge finds them.
+Generation is deterministic for a given --seed.
+"""
+
+import argparse
+import bisect
+import itertools
+import random
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import psycopg
+from psycopg import sql
+from psycopg.types.json import Jsonb
+
+from db_snapshot import connect
+
+SYNTHETIC_ID_PREFIX = "5e5e5e5e"
+ORDER_NUMBER_PREFIX = "SYN-"
+EMAIL_DOMAIN = "synthetic.example"
+
+SCALES = {
+    "small": {"products": 500, "customers": 5_000, "orders": 25_000},
+    "current": {"products": 2_000, "customers": 40_000, "orders": 200_000},
+    "two-year": {"products": 25_000, "customers": 400_000, "orders": 2_500_000},
+}
+
+ORDER_CHUNK_SIZE = 50_000
+
+CATEGORIES = {
+    "apparel": ["T-Shirt", "Hoodie", "Sweatshirt", "Polo", "Vest", "Long Sleeve Tee", "Jacket"],
+    "gear": ["Cap", "Beanie", "Tote Bag", "Backpack", "Umbrella", "Scarf"],
+    "home": ["Mug", "Water Bottle", "Mouse Pad", "Coaster Set", "Cushion", "Poster"],
+    "accessories": ["Badge", "Pin Set", "Keyring", "Lanyard", "Sticker Pack", "Wristband"],
+}
+
+COLOURS = [
+    ("Black", "#181717"), ("White", "#ffffff"), ("Navy", "#1f2a44"), ("Heather Grey", "#a8abb2"),
+    ("Royal Blue", "#1d4ed8"), ("Maroon", "#6b1d2e"), ("Forest Green", "#1e4d2b"), ("Red", "#c1272d"),
+    ("Light Blue", "#9ecae1"), ("Charcoal", "#36454f"),
+]
+SIZES = ["XS", "S", "M", "L", "XL", "2XL", "3XL"]
+SIZED_CATEGORIES = {"apparel"}
+
+FIRST_NAMES = [
+    "Oliver", "George", "Harry", "Jack", "Noah", "Leo", "Arthur", "Muhammad", "Oscar", "Charlie",
+    "Olivia", "Amelia", "Isla", "Ava", "Ivy", "Freya", "Lily", "Florence", "Mia", "Willow",
+    "David", "Paul", "Mark", "Susan", "Karen", "Margaret", "John", "Peter", "Linda", "Janet",
+]
+LAST_NAMES = [
+    "Smith", "Jones", "Williams", "Taylor", "Brown", "Davies", "Evans", "Wilson", "Thomas", "Johnson",
+    "Roberts", "Robinson", "Thompson", "Wright", "Walker", "White", "Edwards", "Hughes", "Green", "Hall",
+    "Lewis", "Harris", "Clarke", "Patel", "Jackson", "Wood", "Turner", "Martin", "Cooper", "Hill",
+]
+STREETS = ["High Street", "Station Road", "Church Lane", "Victoria Road", "Green Lane", "Manor Road",
+           "Park Avenue", "Queens Road", "New Road", "Mill Lane", "King Street", "The Crescent"]
+
+# (postcode area, post town, relative population weight, highest district number)
+POSTCODE_AREAS = [
+    ("B", "Birmingham", 42, 99), ("M", "Manchester", 28, 99), ("LS", "Leeds", 22, 29),
+    ("G", "Glasgow", 24, 84), ("E", "London", 26, 20), ("N", "London", 22, 22), ("SE", "London", 30, 28),
+    ("SW", "London", 28, 20), ("W", "London", 18, 14), ("NW", "London", 18, 11), ("BS", "Bristol", 17, 49),
+    ("S", "Sheffield", 16, 99), ("L", "Liverpool", 16, 75), ("NG", "Nottingham", 18, 34),
+    ("LE", "Leicester", 16, 67), ("CF", "Cardiff", 15, 91), ("EH", "Edinburgh", 14, 55),
+    ("NE", "Newcastle upon Tyne", 18, 71), ("BT", "Belfast", 17, 94), ("CV", "Coventry", 13, 47),
+    ("PO", "Portsmouth", 13, 41), ("SO", "Southampton", 12, 53), ("RG", "Reading", 13, 45),
+    ("CM", "Chelmsford", 14, 24), ("ME", "Rochester", 11, 20), ("TN", "Tonbridge", 10, 40),
+    ("KT", "Kingston upon Thames", 11, 24), ("CR", "Croydon", 9, 9), ("BN", "Brighton", 13, 91),
+    ("EX", "Exeter", 11, 39), ("PL", "Plymouth", 9, 35), ("NR", "Norwich", 12, 35),
+    ("CB", "Cambridge", 8, 25), ("OX", "Oxford", 9, 49), ("YO", "York", 10, 62), ("HU", "Hull", 9, 20),
+    ("DN", "Doncaster", 12, 41), ("ST", "Stoke-on-Trent", 11, 21), ("WV", "Wolverhampton", 8, 16),
+    ("DE", "Derby", 11, 75), ("PE", "Peterborough", 14, 38), ("AB", "Aberdeen", 7, 56),
+    ("DD", "Dundee", 4, 11), ("IV", "Inverness", 3, 63), ("SA", "Swansea", 10, 73), ("LL", "Llandudno", 6, 78),
+    ("TR", "Truro", 4, 27), ("LA", "Lancaster", 6, 23), ("CA", "Carlisle", 5, 28), ("IP", "Ipswich", 9, 33),
+]
+
+ORDER_LINE_WEIGHTS = [55, 28, 12, 5]        # 1-4 distinct items per order
+QUANTITY_WEIGHTS = [80, 14, 4, 2]           # 1-4 of each
+GUEST_CHECKOUT_RATE = 0.3
+FREE_SHIPPING_THRESHOLD = 50
+STANDARD_SHIPPING = 4.99
+
+
+def synthetic_id(rng):
+    return uuid.UUID(int=(int(SYNTHETIC_ID_PREFIX, 16) << 96) | rng.getrandbits(96))
+
+
+def zipf_cum_weights(count, exponent):
+    """Cumulative weights where item k (0-based) has weight 1 / (k + 1) ** exponent."""
+    return list(itertools.accumulate(1 / (rank + 1) ** exponent for rank in range(count)))
+
+
+def weighted_index(rng, cum_weights):
+    return bisect.bisect(cum_weights, rng.random() * cum_weights[-1])
+
+
+def money(value):
+    return round(value, 2)
+
+
+class Generator:
+    def __init__(self, products, customers, orders, days, seed):
+        self.rng = random.Random(seed)
+        self.product_count = products
+        self.customer_count = customers
+        self.order_count = orders
+        self.now = datetime.now(timezone.utc)
+        self.start = self.now - timedelta(days=days)
+        self.days = days
+
+        # Order volume grows ~2.5x over the period; Friday to Sunday are busiest
+        weekday_factor = [0.9, 0.85, 0.9, 0.95, 1.1, 1.25, 1.2]
+        self.day_cum_weights = list(itertools.accumulate(
+            (0.4 + 0.6 * day / max(days - 1, 1)) * weekday_factor[(self.start + timedelta(days=day)).weekday()]
+            for day in range(days)
+        ))
+        self.postcode_cum_weights = list(itertools.accumulate(area[2] for area in POSTCODE_AREAS))
+
+        self.products = []   # (id, name, category, base_price)
+        self.variants = []   # per product: [(id, printful_variant_id, name, price)]
+        self.customers = []  # (id, user_id, email, name, created_at)
+
+    # ===== shared helpers =====
+
+    def random_time(self):
+        day = weighted_index(self.rng, self.day_cum_weights)
+        return self.start + timedelta(days=day, seconds=self.rng.randrange(86_400))
+
+    def postcode(self):
+        area, town, _, districts = POSTCODE_AREAS[weighted_index(self.rng, self.postcode_cum_weights)]
+        letters = "ABDEFGHJLNPQRSTUWXYZ"  # Letters used in the inward code
+        inward = f"{self.rng.randrange(10)}{self.rng.choice(letters)}{self.rng.choice(letters)}"
+        return f"{area}{self.rng.randint(1, districts)} {inward}", town
+
+    def address(self, name):
+        postcode, town = self.postcode()
+        return {
+            "name": name,
+            "address1": f"{self.rng.randint(1, 240)} {self.rng.choice(STREETS)}",
+            "city": town,
+            "zip": postcode,
+            "country_code": "GB",
+        }
+
+    # ===== catalog =====
+
+    def product_rows(self):
+        category_names = list(CATEGORIES)
+        for n in range(self.product_count):
+            category = category_names[n % len(category_names)]
+            item = self.rng.choice(CATEGORIES[category])
+            price = money(self.rng.choice([6.99, 9.99, 12.99, 14.99, 19.99, 24.99, 29.99, 34.99, 39.99, 49.99]))
+            product_id = synthetic_id(self.rng)
+            name = f"Synthetic {item} {n + 1}"
+            created_at = self.start - timedelta(days=self.rng.randrange(365)) + timedelta(days=self.rng.randrange(self.days))
+            self.products.append((product_id, name, category, price))
+            yield {
+                "id": product_id,
+                "name": name,
+                "description": f"{item} from the synthetic {category} range, generated for load testing.",
+                "price": price,
+                "retail_price": price,
+                "printful_cost": money(price * self.rng.uniform(0.35, 0.55)),
+                "image_url": f"https://example.com/synthetic/{n + 1}.jpg",
+                "slug": f"synthetic-{item.lower().replace(' ', '-')}-{n + 1}",
+                "category": category,
+                "tags": [category, item.lower(), "synthetic"],
+                "rating": money(self.rng.uniform(3.5, 5)),
+                "reviews": int(self.rng.paretovariate(1.5)) - 1,
+                "in_stock": True,
+                "is_available": self.rng.random() > 0.02,
+                "stock_count": self.rng.randrange(500),
+                "printful_product_id": f"syn-{n + 1}",
+                "created_at": min(created_at, self.now),
+                "updated_at": self.now,
+            }
+
+    def variant_rows(self):
+        printful_ids = itertools.count(9_000_000_000)
+        for product_id, name, category, price in self.products:
+            colours = self.rng.sample(COLOURS, self.rng.randint(1, 4))
+            sizes = self.rng.sample(SIZES, self.rng.randint(3, len(SIZES))) if category in SIZED_CATEGORIES else [None]
+            sizes.sort(key=lambda size: SIZES.index(size) if size else 0)
+            product_variants = []
+            for (colour, colour_hex), size in itertools.product(colours, sizes):
+                variant_id = synthetic_id(self.rng)
+                printful_variant_id = next(printful_ids)
+                variant_name = f"{name} / {colour}" + (f" / {size}" if size else "")
+                variant_price = money(price + (2 if size in ("2XL", "3XL") else 0))
+                product_variants.append((variant_id, printful_variant_id, variant_name, variant_price))
+                yield {
+                    "id": variant_id,
+                    "product_id": product_id,
+                    "printful_variant_id": str(printful_variant_id),
+                    "name": variant_name,
+                    "value": f"{colour}-{size or 'One Size'}",
+                    "color": colour,
+                    "color_name": colour,
+                    "color_hex": colour_hex,
+                    "size": size or "One Size",
+                    "size_name": size or "One Size",
+                    "price": variant_price,
+                    "retail_price": variant_price,
+                    "in_stock": self.rng.random() > 0.05,
+                    "is_available": True,
+                    "created_at": self.now,
+                    "updated_at": self.now,
+                }
+            self.variants.append(product_variants)
+
+    # ===== customers =====
+
+    def customer_rows(self):
+        for n in range(self.customer_count):
+            first, last = self.rng.choice(FIRST_NAMES), self.rng.choice(LAST_NAMES)
+            customer_id, user_id = synthetic_id(self.rng), synthetic_id(self.rng)
+            email = f"{first.lower()}.{last.lower()}.{n + 1}@{EMAIL_DOMAIN}"
+            created_at = self.random_time()
+            self.customers.append((customer_id, user_id, email, f"{first} {last}", created_at))
+            yield {
+                "id": customer_id,
+                "user_id": user_id,
+                "email": email,
+                "first_name": first,
+                "last_name": last,
+                "phone": f"07{self.rng.randrange(10**9):09d}",
+                "marketing_consent": self.rng.random() < 0.4,
+                "created_at": created_at,
+                "updated_at": created_at,
+            }
+
+    # ===== orders =====
+
+    def order_chunks(self):
+        """Yield (order_rows, order_item_rows) in chunks of ORDER_CHUNK_SIZE orders."""
+        product_cum_weights = zipf_cum_weights(len(self.products), 1.1)
+        # Milder skew for customers: repeat buyers exist, but most people order once or twice
+        customer_cum_weights = zipf_cum_weights(len(self.customers), 0.6) if self.customers else None
+
+        for chunk_start in range(0, self.order_count, ORDER_CHUNK_SIZE):
+            orders, order_items = [], []
+            for n in range(chunk_start, min(chunk_start + ORDER_CHUNK_SIZE, self.order_count)):
+                order_id = synthetic_id(self.rng)
+                created_at = self.random_time()
+
+                if customer_cum_weights and self.rng.random() > GUEST_CHECKOUT_RATE:
+                    _, user_id, email, name, joined_at = self.customers[weighted_index(self.rng, customer_cum_weights)]
+                    if created_at < joined_at:
+                        created_at = min(joined_at + timedelta(minutes=self.rng.randrange(1, 600)), self.now)
+                else:
+                    user_id = None
+                    name = f"{self.rng.choice(FIRST_NAMES)} {self.rng.choice(LAST_NAMES)}"
+                    email = f"guest.{n + 1}@{EMAIL_DOMAIN}"
+
+                items = []
+                subtotal = 0
+                line_count = self.rng.choices(range(1, len(ORDER_LINE_WEIGHTS) + 1), ORDER_LINE_WEIGHTS)[0]
+                for product_index in {weighted_index(self.rng, product_cum_weights) for _ in range(line_count)}:
+                    product_id = self.products[product_index][0]
+                    variant_id, printful_variant_id, variant_name, price = self.rng.choice(self.variants[product_index])
+                    quantity = self.rng.choices(range(1, len(QUANTITY_WEIGHTS) + 1), QUANTITY_WEIGHTS)[0]
+                    subtotal += price * quantity
+                    items.append({
+                        "id": str(variant_id),
+                        "name": variant_name,
+                        "price": price,
+                        "quantity": quantity,
+                        "printful_variant_id": printful_variant_id,
+                    })
+                    order_items.append({
+                        "id": synthetic_id(self.rng),
+                        "order_id": order_id,
+                        "product_id": product_id,
+                        "variant_id": variant_id,
+                        "quantity": quantity,
+                        "unit_price": price,
+                        "total_price": money(price * quantity),
+                        "created_at": created_at,
+                        "updated_at": created_at,
+                    })
+
+                subtotal = money(subtotal)
+                shipping = 0 if subtotal >= FREE_SHIPPING_THRESHOLD else STANDARD_SHIPPING
+                total = money(subtotal + shipping)
+                status = self.order_status(created_at)
+                order_number = f"{ORDER_NUMBER_PREFIX}{n + 1:08d}"
+                orders.append({
+                    "id": order_id,
+                    "user_id": user_id,
+                    "customer_email": email,
+                    "order_number": order_number,
+                    "readable_order_id": order_number,
+                    "stripe_payment_intent_id": f"pi_synthetic_{n + 1}",
+                    "status": status,
+                    "payment_status": "refunded" if status == "refunded" else "paid",
+                    "total_amount": total,
+                    "subtotal": subtotal,
+                    "shipping_cost": shipping,
+                    "currency": "GBP",
+                    "items": Jsonb(items),
+                    "shipping_address": Jsonb(self.address(name)),
+                    "guest_checkout": user_id is None,
+                    "canceled_at": created_at + timedelta(hours=2) if status == "cancelled" else None,
+                    "created_at": created_at,
+                    "updated_at": created_at,
+                })
+            yield orders, order_items
+
+    def order_status(self, created_at):
+        age_days = (self.now - created_at).days
+        roll = self.rng.random()
+        if age_days > 14:
+            return "delivered" if roll < 0.92 else "cancelled" if roll < 0.97 else "refunded"
+        if age_days > 3:
+            return "shipped" if roll < 0.85 else "delivered" if roll < 0.95 else "cancelled"
+        return "paid" if roll < 0.6 else "processing"
+
+
+# ===== loading =====
+
+def table_columns(conn, table):
+    """(writable columns, required columns) for a public table, or None if it doesn't exist."""
+    rows = conn.execute(
+        """
+        SELECT a.attname,
+               a.attnotnull AND NOT a.atthasdef AND a.attidentity = '' AS required
+        FROM pg_attribute a
+        WHERE a.attrelid = to_regclass(%s) AND a.attnum > 0 AND NOT a.attisdropped AND a.attgenerated = ''
+        ORDER BY a.attnum
+        """,
+        (f"public.{table}",),
+    ).fetchall()
+    if not rows:
+        return None
+    return [name for name, _ in rows], {name for name, required in rows if required}
+
+
+class TableLoader:
+    """COPYs generated rows into the columns a table actually has."""
+
+    def __init__(self, conn, table, sample_row):
+        self.conn = conn
+        self.table = table
+        self.rows = 0
+        self.elapsed = 0.0
+
+        found = table_columns(conn, table)
+        if found is None:
+            self.columns = None
+            print(f"⏭️ No {table} table, skipping")
+            return
+
+        existing, required = found
+        self.columns = [column for column in existing if column in sample_row]
+        missing = required - set(self.columns)
+        if missing:
+            raise RuntimeError(f"{table} has required columns the generator doesn't fill: {', '.join(sorted(missing))}")
+
+    def copy(self, rows):
+        if self.columns is None:
+            return
+        started = time.perf_counter()
+        statement = sql.SQL("COPY {} ({}) FROM STDIN").format(
+            sql.Identifier("public", self.table),
+            sql.SQL(", ").join(map(sql.Identifier, self.columns)),
+        )
+        with self.conn.cursor() as cur, cur.copy(statement) as copy:
+            for row in rows:
+                copy.write_row([row.get(column) for column in self.columns])
+                self.rows += 1
+        self.elapsed += time.perf_counter() - started
+
+    def report(self):
+        if self.columns is not None and self.rows:
+            print(f"📦 {self.table}: {self.rows:,} rows in {self.elapsed:.1f}s ({self.rows / max(self.elapsed, 1e-9):,.0f}/s)")
+
+
+def load_all(conn, generator):
+    def load(table, rows):
+        rows = iter(rows)
+        first = next(rows, None)
+        if first is None:
+            return
+        loader = TableLoader(conn, table, first)
+        loader.copy(itertools.chain([first], rows))
+        loader.report()
+
+    load("products", generator.product_rows())
+    load("product_variants", generator.variant_rows())
+    load("customer_profiles", generator.customer_rows())
+
+    order_loader = item_loader = None
+    for orders, order_items in generator.order_chunks():
+        if order_loader is None:
+            order_loader = TableLoader(conn, "orders", orders[0])
+            item_loader = TableLoader(conn, "order_items", order_items[0])
+        order_loader.copy(orders)
+        item_loader.copy(order_items)
+        print(f"   … {order_loader.rows:,} / {generator.order_count:,} orders")
+    if order_loader:
+        order_loader.report()
+        item_loader.report()
+
+
+def refresh_derived_data(conn):
+    """Bring trigger-maintained tables up to date in one pass, since triggers were skipped."""
+    if table_columns(conn, "analytics_daily_rollups"):
+        conn.execute("TRUNCATE public.analytics_daily_rollups")
+        conn.execute(
+            """
+            INSERT INTO public.analytics_daily_rollups (day, order_count, revenue, new_customers)
+            SELECT day, SUM(order_count), SUM(revenue), SUM(new_customers)
+            FROM (
+              SELECT (created_at AT TIME ZONE 'utc')::date AS day, COUNT(*) AS order_count,
+                     COALESCE(SUM(total_amount), 0) AS revenue, 0 AS new_customers
+              FROM public.orders
+              GROUP BY 1
+              UNION ALL
+              SELECT (created_at AT TIME ZONE 'utc')::date AS day, 0, 0, COUNT(*)
+              FROM public.customer_profiles
+              GROUP BY 1
+            ) history
+            WHERE day IS NOT NULL
+            GROUP BY day
+            """
+        )
+        print("📈 Rebuilt analytics_daily_rollups")
+
+    if table_columns(conn, "catalog_versions"):
+        # Moves every cached catalog (variant price indexes, search index, snapshot) on
+        conn.execute("UPDATE public.catalog_versions SET version = version + 1, updated_at = timezone('utc', now())")
+        print("🔄 Bumped catalog versions")
+
+    for table in ("products", "product_variants", "customer_profiles", "orders", "order_items"):
+        if table_columns(conn, table):
+            conn.execute(sql.SQL("ANALYZE {}").format(sql.Identifier("public", table)))
+
+
+def generate(args):
+    counts = {**SCALES[args.scale]}
+    for key in counts:
+        if getattr(args, key) is not None:
+            counts[key] = getattr(args, key)
+
+    if counts["orders"] and not counts["products"]:
+        raise RuntimeError("Orders need at least one product")
+
+    started = time.perf_counter()
+    generator = Generator(days=args.days, seed=args.seed, **counts)
+    print(f"🏭 Generating {counts['products']:,} products, {counts['customers']:,} customers and "
+          f"{counts['orders']:,} orders over {args.days} days")
+
+    with connect() as conn:
+        with conn.transaction():
+            # Skip row triggers (rollups, profile hooks) and FK checks; derived data is rebuilt below
+            conn.execute("SET LOCAL session_replication_role = replica")
+            load_all(conn, generator)
+            refresh_derived_data(conn)
+
+    print(f"✅ Done in {time.perf_counter() - started:.1f}s")
+
+
+def purge(args):
+    started = time.perf_counter()
+    with connect() as conn:
+        with conn.transaction():
+            conn.execute("SET LOCAL session_replication_role = replica")
+            # Children first, since FK cascades don't fire in replica mode
+            for table in ("order_items", "orders", "customer_profiles", "product_variants", "products"):
+                if table_columns(conn, table):
+                    deleted = conn.execute(
+                        sql.SQL("DELETE FROM {} WHERE id::text LIKE %s").format(sql.Identifier("public", table)),
+                        (f"{SYNTHETIC_ID_PREFIX}-%",),
+                    ).rowcount
+                    print(f"🗑️ {table}: {deleted:,} rows")
+            refresh_derived_data(conn)
+    print(f"✅ Purged in {time.perf_counter() - started:.1f}s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk-load synthetic catalog, customer and order data")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    gen = commands.add_parser("generate", help="Generate and COPY synthetic data")
+    gen.add_argument("--scale", choices=SCALES, default="small", help="Preset row counts (default small)")
+    gen.add_argument("--products", type=int, help="Override the preset product count")
+    gen.add_argument("--customers", type=int, help="Override the preset customer count")
+    gen.add_argument("--orders", type=int, help="Override the preset order count")
+    gen.add_argument("--days", type=int, default=730, help="Order history length in days (default 730)")
+    gen.add_argument("--seed", type=int, default=1, help="Random seed (default 1)")
+
+    commands.add_parser("purge", help="Delete all synthetic rows")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == "generate":
+            generate(args)
+        else:
+            purge(args)
+    except (psycopg.Error, RuntimeError) as exc:
+        print(f"❌ {exc}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())